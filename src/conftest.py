@@ -1,6 +1,8 @@
 """Pytest configuration."""
 
 import logging
+import os
+import tempfile
 from unittest.mock import patch
 
 import pytest
@@ -8,6 +10,17 @@ from loguru import logger
 from peewee import SqliteDatabase
 
 
+def pytest_configure(config):
+    """Run the suite from a scratch directory.
+
+    Runtime paths (data/config.yaml, data/iwa.log, data/audit.log, config
+    backups, tenderly_<profile>.yaml) are relative to the working directory
+    and some are written as soon as iwa is imported, so without this a test
+    run leaves them in the repository.
+    """
+    os.chdir(tempfile.mkdtemp(prefix="iwa-tests-"))
+
+
 @pytest.fixture(autouse=True)
 def caplog(caplog):
     """Make loguru logs visible to pytest caplog."""
@@ -42,19 +55,31 @@ def isolate_test_database(tmp_path):
 
     # Swap the module-level database with the temporary one
     original_db = db_module.db
+    models = [
+        db_module.SentTransaction,
+        db_module.TransactionTag,
+        db_module.RewardsRollup,
+        db_module.RewardsRollupMonth,
+        db_module.DailyPrice,
+        db_module.IndexedLog,
+        db_module.LogCheckpoint,
+        db_module.MonitorCheckpoint,
+    ]
     db_module.db = test_db
-    db_module.SentTransaction._meta.database = test_db
+    for model in models:
+        model._meta.database = test_db
 
     # Create tables in the temp DB
     test_db.connect()
-    test_db.create_tables([db_module.SentTransaction])
+    test_db.create_tables(models)
 
     yield test_db
 
     # Restore the original database
     test_db.close()
     db_module.db = original_db
-    db_module.SentTransaction._meta.database = original_db
+    for model in models:
+        model._meta.database = original_db
 
 
 @pytest.fixture(autouse=True)
@@ -81,3 +106,91 @@ def mock_chainlist_enrichment():
         "iwa.core.chain.interface.ChainInterface._enrich_rpcs_from_chainlist"
     ):
         yield
+
+
+@pytest.fixture(autouse=True)
+def isolate_token_registry(tmp_path):
+    """Keep token metadata cached by one test from leaking into the next.
+
+    Points the persistent TokenRegistry at a temporary file so tests never
+    read or write data/cache/token_metadata.json.
+    """
+    from iwa.core.contracts.token_registry import TokenRegistry
+
+    registry = TokenRegistry()
+    original_path = registry.path
+    registry.path = tmp_path / "token_metadata.json"
+    registry.clear()
+
+    yield registry
+
+    registry.clear()
+    registry.path = original_path
+
+
+@pytest.fixture(autouse=True)
+def reset_olas_chain_contexts():
+    """Keep OLAS contracts resolved (or mocked) by one test out of the next."""
+    from iwa.plugins.olas.service_manager.base import ChainContextPool
+
+    ChainContextPool().invalidate()
+    yield
+    ChainContextPool().invalidate()
+
+
+@pytest.fixture(autouse=True)
+def reset_staking_locations():
+    """Keep staking contract lookups cached by one test out of the next."""
+    from iwa.plugins.olas.staking_locator import StakingLocator
+
+    StakingLocator().forget()
+    yield
+    StakingLocator().forget()
+
+
+@pytest.fixture(autouse=True)
+def reset_staking_availability():
+    """Drop staking availability snapshots and stop their background refresher."""
+    from iwa.plugins.olas.staking_availability import StakingAvailabilitySnapshot
+
+    StakingAvailabilitySnapshot().invalidate()
+    yield
+    StakingAvailabilitySnapshot().stop()
+    StakingAvailabilitySnapshot().invalidate()
+
+
+@pytest.fixture
+def serve_staking_availability():
+    """Serve staking availability from a canned list instead of the chain.
+
+    Append ``StakingAvailability`` entries to the yielded list; every
+    ``StakingAvailabilitySnapshot().get`` returns it.
+    """
+    from iwa.plugins.olas.staking_availability import (
+        StakingAvailability,
+        StakingAvailabilitySnapshot,
+    )
+
+    availability: list[StakingAvailability] = []
+    with patch.object(StakingAvailabilitySnapshot, "get", lambda self, chain_name: availability):
+        yield availability
+
+
+@pytest.fixture(autouse=True)
+def reset_nonce_allocators():
+    """Drop EOA nonce allocators built over one test's mocked chain interface."""
+    from iwa.core.services.transaction import TransactionService
+
+    TransactionService._nonce_allocators.clear()
+    yield
+    TransactionService._nonce_allocators.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_ethereum_clients():
+    """Drop per-chain EthereumClients built over mocked chain interfaces."""
+    from iwa.plugins.gnosis.safe import _ethereum_client_cache
+
+    _ethereum_client_cache.clear()
+    yield
+    _ethereum_client_cache.clear()
@@ -13,7 +13,9 @@ Import from `iwa.core.chain` to use these utilities.
 from typing import TypeVar
 
 # Re-export all public symbols for backward compatibility
+from iwa.core.chain.async_interface import AsyncChainInterface
 from iwa.core.chain.errors import (
+    RPCBatchError,
     TenderlyQuotaExceededError,
     sanitize_rpc_url,
 )
@@ -32,6 +34,7 @@ from iwa.core.chain.models import (
 from iwa.core.chain.rate_limiter import (
     RateLimitedEth,
     RateLimitedWeb3,
+    ReadEndpoint,
     RPCRateLimiter,
     get_rate_limiter,
 )
@@ -44,6 +47,7 @@ T = TypeVar("T")
 
 __all__ = [
     # Errors
+    "RPCBatchError",
     "TenderlyQuotaExceededError",
     "sanitize_rpc_url",
     "_sanitize_rpc_url",
@@ -51,6 +55,7 @@ __all__ = [
     "RPCRateLimiter",
     "RateLimitedEth",
     "RateLimitedWeb3",
+    "ReadEndpoint",
     "get_rate_limiter",
     # Models
     "SupportedChain",
@@ -60,6 +65,7 @@ __all__ = [
     "SupportedChains",
     # Interface
     "ChainInterface",
+    "AsyncChainInterface",
     "DEFAULT_RPC_TIMEOUT",
     # Manager
     "ChainInterfaces",
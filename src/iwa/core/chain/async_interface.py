@@ -0,0 +1,152 @@
+"""AsyncChainInterface: non-blocking RPC access for the web server's event loop."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from aiohttp import ClientTimeout
+from web3 import AsyncHTTPProvider, AsyncWeb3
+
+from iwa.core.chain.errors import RPCBatchError
+from iwa.core.chain.interface import DEFAULT_RPC_TIMEOUT, ChainInterface
+from iwa.core.chain.models import SupportedChain
+from iwa.core.models import EthereumAddress
+from iwa.core.rpc_monitor import RPCMonitor
+from iwa.core.utils import configure_logger
+
+logger = configure_logger()
+
+T = TypeVar("T")
+
+
+class AsyncChainInterface:
+    """AsyncWeb3 counterpart of a ChainInterface.
+
+    The RPC list, current RPC index, per-RPC backoff and rate limiter all live
+    on the wrapped ChainInterface, so a 429 seen by an async request rotates
+    the sync path too (and vice versa). Only the transport differs: requests
+    go out through AsyncWeb3 over aiohttp instead of blocking a worker thread.
+    """
+
+    def __init__(self, chain_interface: ChainInterface):
+        """Initialize AsyncChainInterface on top of *chain_interface*."""
+        self.chain_interface = chain_interface
+        self._web3_by_rpc: Dict[str, AsyncWeb3] = {}
+
+    @property
+    def chain(self) -> SupportedChain:
+        """Chain definition (shared with the sync interface)."""
+        return self.chain_interface.chain
+
+    @property
+    def web3(self) -> AsyncWeb3:
+        """AsyncWeb3 bound to the sync interface's current RPC."""
+        rpc_url = self.chain_interface.current_rpc
+        web3 = self._web3_by_rpc.get(rpc_url)
+        if web3 is None:
+            web3 = AsyncWeb3(
+                AsyncHTTPProvider(
+                    rpc_url, request_kwargs={"timeout": ClientTimeout(total=DEFAULT_RPC_TIMEOUT)}
+                )
+            )
+            self._web3_by_rpc[rpc_url] = web3
+        return web3
+
+    async def with_retry(
+        self,
+        operation: Callable[[], Awaitable[T]],
+        max_retries: Optional[int] = None,
+        operation_name: str = "operation",
+    ) -> T:
+        """Await an operation with rate limiting, retry and RPC rotation.
+
+        Errors are classified by ``ChainInterface.handle_rpc_error``, which
+        applies the same per-RPC backoff and rotation as the sync path.
+        """
+        ci = self.chain_interface
+        if max_retries is None:
+            max_retries = ci.DEFAULT_MAX_RETRIES
+
+        for attempt in range(max_retries + 1):
+            if not await ci.rate_limiter.acquire_async(timeout=30.0):
+                raise TimeoutError(f"Rate limit timeout for {operation_name}")
+            try:
+                return await operation()
+            except Exception as e:
+                result = ci.handle_rpc_error(e)
+
+                if not result["should_retry"] or attempt >= max_retries:
+                    logger.error(f"{operation_name} failed after {attempt + 1} attempts: {e}")
+                    raise
+
+                delay = min(ci.DEFAULT_RETRY_DELAY * (2**attempt), ci.MAX_RETRY_DELAY)
+                logger.info(
+                    f"{operation_name} attempt {attempt + 1} failed, retrying in {delay:.1f}s..."
+                )
+                await asyncio.sleep(delay)
+
+        raise RuntimeError(f"{operation_name} failed unexpectedly")
+
+    async def get_native_balance_wei(self, address: EthereumAddress) -> int:
+        """Get the native balance in wei."""
+
+        async def do_get():
+            RPCMonitor().increment(f"{self.chain.name.lower()}.eth_getBalance")
+            return await self.web3.eth.get_balance(address)
+
+        return await self.with_retry(do_get, operation_name=f"get_balance {address}")
+
+    async def batch(self, requests: List[Tuple[str, list]], allow_failure: bool = False) -> List[Any]:
+        """Async version of ``ChainInterface.batch`` (same chunking and fallback)."""
+        ci = self.chain_interface
+        results: List[Any] = []
+        for start in range(0, len(requests), ci.BATCH_MAX_SIZE):
+            chunk = requests[start : start + ci.BATCH_MAX_SIZE]
+            results.extend(
+                await self.with_retry(
+                    lambda chunk=chunk: self._send_batch(chunk),
+                    operation_name=f"batch({len(chunk)} calls)",
+                )
+            )
+
+        for result in results:
+            if isinstance(result, RPCBatchError) and not allow_failure:
+                raise result
+        return [None if isinstance(r, RPCBatchError) else r for r in results]
+
+    async def _send_batch(self, chunk: List[Tuple[str, list]]) -> List[Any]:
+        """Send one chunk, falling back to sequential calls if batches are rejected."""
+        ci = self.chain_interface
+        rpc_index = ci.current_rpc_index
+        provider = self.web3.provider
+
+        if ci.accepts_batches(rpc_index):
+            RPCMonitor().increment(f"{self.chain.name.lower()}.batch")
+            response = await provider.make_batch_request(chunk)
+            results = ci.batch_results(chunk, response, rpc_index)
+            if results is not None:
+                return results
+
+        results = []
+        for method, params in chunk:
+            RPCMonitor().increment(f"{self.chain.name.lower()}.{method}")
+            results.append(ci.batch_item_result(await provider.make_request(method, params)))
+        return results
+
+    async def get_native_balances_wei(
+        self, addresses: List[EthereumAddress]
+    ) -> List[Optional[int]]:
+        """Get native balances for many addresses in batched requests."""
+        results = await self.batch(
+            [("eth_getBalance", [address, "latest"]) for address in addresses],
+            allow_failure=True,
+        )
+        return [int(r, 16) if r is not None else None for r in results]
+
+    async def close(self) -> None:
+        """Close the aiohttp sessions opened for each RPC."""
+        for web3 in self._web3_by_rpc.values():
+            try:
+                await web3.provider.disconnect()
+            except Exception as e:
+                logger.debug(f"Error closing async provider: {e}")
+        self._web3_by_rpc.clear()
@@ -17,6 +17,20 @@ class TenderlyQuotaExceededError(Exception):
     pass
 
 
+class RPCBatchError(Exception):
+    """A single call inside a JSON-RPC batch returned an error object."""
+
+    def __init__(self, error):
+        """Build from a JSON-RPC error object (``{"code": ..., "message": ...}``)."""
+        if isinstance(error, dict):
+            self.code = error.get("code")
+            self.message = error.get("message", str(error))
+        else:
+            self.code = None
+            self.message = str(error)
+        super().__init__(f"RPC error {self.code}: {self.message}")
+
+
 def sanitize_rpc_url(url: str) -> str:
     """Remove API keys and sensitive data from RPC URLs for safe logging.
 
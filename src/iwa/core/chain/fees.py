@@ -0,0 +1,133 @@
+"""Per-block fee oracle shared by every transaction priced on a chain.
+
+Base fee and priority fee only change once per block, so a burst of
+transactions should not each pay extra round-trips to re-learn them. The
+oracle reads the base fee with ``eth_feeHistory`` (falling back to the
+latest block header on RPCs without it) and the default tip with
+``eth_maxPriorityFeePerGas``, and serves the cached values until a newer
+head is seen or the block time has elapsed. Percentile-based tips from
+recent blocks are opt-in through ``priority_fee()``.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from iwa.core.utils import configure_logger
+
+if TYPE_CHECKING:
+    from iwa.core.chain.interface import ChainInterface
+
+logger = configure_logger()
+
+FEE_CACHE_TTL = 5.0  # Seconds a snapshot is reused when no newer head is known
+DEFAULT_HISTORY_BLOCKS = 10  # Blocks sampled by priority_fee()
+
+
+@dataclass(frozen=True)
+class FeeSnapshot:
+    """Fee data of one block. ``base_fee`` is None on legacy (pre-EIP-1559) chains."""
+
+    block_number: Optional[int]
+    base_fee: Optional[int]
+    priority_fee: Optional[int]
+    gas_price: Optional[int] = None
+
+
+def _as_int(value) -> int:
+    """Strictly convert an RPC quantity, rejecting anything that is not one."""
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise ValueError(f"Unexpected fee value: {value!r}")
+    return int(value, 16) if isinstance(value, str) else value
+
+
+def _fee_history_fields(history) -> Tuple[int, list, list]:
+    """Return (oldest block, base fees, rewards) of an eth_feeHistory response."""
+    base_fees = history["baseFeePerGas"]
+    rewards = history.get("reward") or []
+    if not isinstance(base_fees, list) or not isinstance(rewards, list) or len(base_fees) < 2:
+        raise ValueError("Malformed eth_feeHistory response")
+    return _as_int(history["oldestBlock"]), base_fees, rewards
+
+
+class FeeOracle:
+    """Thread-safe per-block cache of base fee, priority fee and gas price."""
+
+    def __init__(self, chain_interface: "ChainInterface", ttl: float = FEE_CACHE_TTL):
+        """Initialize an empty oracle for *chain_interface*."""
+        self._chain_interface = chain_interface
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._snapshot: Optional[FeeSnapshot] = None
+        self._fetched_at = 0.0
+        self._priority_fees: Dict[Tuple[Optional[int], float, int], int] = {}
+
+    def _is_fresh(self) -> bool:
+        """Whether the cached snapshot still describes the chain head (caller holds the lock)."""
+        if self._snapshot is None or time.monotonic() - self._fetched_at >= self.ttl:
+            return False
+        best_head = self._chain_interface.health_tracker.best_head()
+        block = self._snapshot.block_number
+        return best_head is None or block is None or best_head <= block
+
+    def snapshot(self) -> FeeSnapshot:
+        """Fee data of the latest block, fetched at most once per head.
+
+        Concurrent callers wait for a single in-flight fetch instead of each
+        issuing their own.
+        """
+        with self._lock:
+            if not self._is_fresh():
+                self._snapshot = self._fetch()
+                self._fetched_at = time.monotonic()
+                self._priority_fees.clear()
+            return self._snapshot
+
+    def invalidate(self) -> None:
+        """Drop the cached snapshot, e.g. after a fee-too-low rejection."""
+        with self._lock:
+            self._snapshot = None
+            self._priority_fees.clear()
+
+    def priority_fee(
+        self, percentile: float, blocks: int = DEFAULT_HISTORY_BLOCKS
+    ) -> int:
+        """Median over the last *blocks* blocks of the *percentile* priority fee paid.
+
+        Cached per head like the snapshot. Returns at least 1 wei.
+        """
+        block = self.snapshot().block_number
+        key = (block, percentile, blocks)
+        with self._lock:
+            cached = self._priority_fees.get(key)
+        if cached is not None:
+            return cached
+
+        history = self._chain_interface.web3.eth.fee_history(blocks, "latest", [percentile])
+        _, _, rewards = _fee_history_fields(history)
+        tips = sorted(_as_int(r[0]) for r in rewards if r)
+        fee = max(tips[len(tips) // 2] if tips else 0, 1)
+        with self._lock:
+            self._priority_fees[key] = fee
+        return fee
+
+    def _fetch(self) -> FeeSnapshot:
+        """Fetch fee data of the latest block (caller holds the lock).
+
+        The tip is the RPC's ``eth_maxPriorityFeePerGas`` suggestion.
+        """
+        eth = self._chain_interface.web3.eth
+        try:
+            oldest, base_fees, _ = _fee_history_fields(eth.fee_history(1, "latest", []))
+            # baseFeePerGas[-1] is the base fee of the block being built
+            number, base_fee = oldest, _as_int(base_fees[-1])
+        except Exception as e:
+            logger.debug(f"eth_feeHistory unavailable ({e}), using latest block header")
+            block = eth.get_block("latest")
+            number = block.get("number")
+            number = number if isinstance(number, int) else None
+            base_fee = block.get("baseFeePerGas")
+            if base_fee is None:
+                return FeeSnapshot(number, None, None, int(eth.gas_price))
+        return FeeSnapshot(number, int(base_fee), int(eth.max_priority_fee))
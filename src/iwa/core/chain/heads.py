@@ -0,0 +1,198 @@
+"""Shared head-block tracker: one block-number watcher per chain.
+
+Monitors, workers and invalidators all need to react to new blocks. Rather
+than each polling ``eth_blockNumber`` on its own timer, they subscribe to
+the chain's ``HeadTracker``. It follows ``newHeads`` over a WebSocket RPC
+when one is known, polls the RPC once per ``POLL_INTERVAL`` otherwise, and
+publishes every new head to callbacks, asyncio queues and blocked waiters.
+The watcher thread only runs while someone is listening.
+"""
+
+import asyncio
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple
+
+from iwa.core.chain.errors import sanitize_rpc_url
+from iwa.core.utils import configure_logger
+
+if TYPE_CHECKING:
+    from iwa.core.chain.interface import ChainInterface
+
+logger = configure_logger()
+
+
+class HeadTracker:
+    """Publish new chain heads to every subscriber from one watcher thread."""
+
+    POLL_INTERVAL = 1.0  # Seconds between eth_blockNumber polls without WebSocket
+    WSS_IDLE_TIMEOUT = 30.0  # Fall back to polling when newHeads goes quiet this long
+    WSS_RETRY_INTERVAL = 300.0  # Seconds before retrying a failed WebSocket
+
+    def __init__(self, chain_interface: "ChainInterface", poll_interval: Optional[float] = None):
+        """Initialize an idle tracker for *chain_interface*."""
+        self._chain_interface = chain_interface
+        self.poll_interval = poll_interval if poll_interval is not None else self.POLL_INTERVAL
+        self._cond = threading.Condition()
+        self._callbacks: Dict[int, Callable[[int], None]] = {}
+        self._passive: Dict[int, Callable[[int], None]] = {}  # Never keep the watcher alive
+        self._next_id = 0
+        self._waiters = 0
+        self._latest: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+        self._wss_retry_at = 0.0
+
+    @property
+    def latest(self) -> Optional[int]:
+        """Most recent head seen, or None before the first one."""
+        return self._latest
+
+    def subscribe(
+        self, callback: Callable[[int], None], passive: bool = False
+    ) -> Callable[[], None]:
+        """Call *callback(head)* from the watcher thread on every new head.
+
+        Args:
+            callback: Called with each new head.
+            passive: Only see heads watched for other listeners: the
+                subscription neither starts the watcher nor keeps it running.
+
+        Returns:
+            A function that removes the subscription.
+
+        """
+        with self._cond:
+            sub_id = self._next_id
+            self._next_id += 1
+            if passive:
+                self._passive[sub_id] = callback
+            else:
+                self._callbacks[sub_id] = callback
+                self._ensure_running()
+
+        def unsubscribe() -> None:
+            with self._cond:
+                self._callbacks.pop(sub_id, None)
+                self._passive.pop(sub_id, None)
+
+        return unsubscribe
+
+    def subscribe_async(self) -> Tuple["asyncio.Queue[int]", Callable[[], None]]:
+        """Subscribe the running event loop: new heads are put on the returned queue.
+
+        Must be called from a coroutine.
+
+        Returns:
+            The queue and a function that removes the subscription.
+
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[int] = asyncio.Queue()
+
+        def publish(head: int) -> None:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, head)
+            except RuntimeError:
+                pass  # Loop closed; the subscriber is gone
+
+        return queue, self.subscribe(publish)
+
+    def wait_for_new_head(self, after: Optional[int], timeout: float) -> Optional[int]:
+        """Block until a head newer than *after* is seen.
+
+        Returns:
+            The new head, or None if none arrived within *timeout* seconds.
+
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._waiters += 1
+            self._ensure_running()
+            try:
+                while self._latest is None or (after is not None and self._latest <= after):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return None
+                    self._cond.wait(remaining)
+                return self._latest
+            finally:
+                self._waiters -= 1
+
+    def _ensure_running(self) -> None:
+        """Start the watcher thread if it is not running (caller holds the lock)."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"heads-{self._chain_interface.chain.name.lower()}",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _has_listeners(self) -> bool:
+        """Whether to keep watching; clears the thread slot when not (caller holds the lock)."""
+        if self._callbacks or self._waiters:
+            return True
+        self._thread = None
+        return False
+
+    def _publish(self, head: int) -> None:
+        """Record *head* and notify everyone if it is newer than the last one."""
+        with self._cond:
+            if self._latest is not None and head <= self._latest:
+                return
+            self._latest = head
+            self._cond.notify_all()
+            callbacks = list(self._callbacks.values()) + list(self._passive.values())
+
+        for callback in callbacks:
+            try:
+                callback(head)
+            except Exception as e:
+                logger.error(f"[{self._chain_interface.chain.name}] Head subscriber failed: {e}")
+
+    def _run(self) -> None:
+        """Watch the head over WebSocket when possible, polling otherwise."""
+        while True:
+            with self._cond:
+                if not self._has_listeners():
+                    return
+
+            wss_url = self._wss_url()
+            if wss_url is not None:
+                try:
+                    asyncio.run(self._follow_new_heads(wss_url))
+                except Exception as e:
+                    logger.info(
+                        f"[{self._chain_interface.chain.name}] newHeads over "
+                        f"{sanitize_rpc_url(wss_url)} unavailable ({e!r}), polling instead"
+                    )
+                    self._wss_retry_at = time.monotonic() + self.WSS_RETRY_INTERVAL
+                continue
+
+            try:
+                self._publish(self._chain_interface.web3.eth.block_number)
+            except Exception as e:
+                logger.debug(f"[{self._chain_interface.chain.name}] Head poll failed: {e}")
+            time.sleep(self.poll_interval)
+
+    def _wss_url(self) -> Optional[str]:
+        """WebSocket RPC to follow, unless one failed recently."""
+        if time.monotonic() < self._wss_retry_at:
+            return None
+        urls = self._chain_interface.wss_rpcs
+        return urls[0] if urls else None
+
+    async def _follow_new_heads(self, url: str) -> None:
+        """Publish newHeads until there are no listeners left or the stream stalls."""
+        from web3 import AsyncWeb3, WebSocketProvider
+
+        async with AsyncWeb3(WebSocketProvider(url)) as w3:
+            await w3.eth.subscribe("newHeads")
+            stream = w3.socket.process_subscriptions()
+            while True:
+                with self._cond:
+                    if not (self._callbacks or self._waiters):
+                        return
+                message = await asyncio.wait_for(anext(stream), timeout=self.WSS_IDLE_TIMEOUT)
+                number = message["result"]["number"]
+                self._publish(int(number, 16) if isinstance(number, str) else int(number))
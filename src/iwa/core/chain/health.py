@@ -0,0 +1,164 @@
+"""Per-RPC health scoring used to pick rotation targets.
+
+Every call through ``RateLimitedEth`` feeds the latency of the endpoint it
+hit, ``ChainInterface._handle_rpc_error`` feeds failures by error class, and
+``block_number`` reads feed the head each endpoint reports. Rotation picks
+the healthy endpoint with the lowest score instead of the next one in list
+order.
+"""
+
+import threading
+import time
+from collections import Counter, deque
+from typing import Dict, Optional
+
+LATENCY_ALPHA = 0.2  # EWMA weight of the newest latency sample
+ERROR_ALPHA = 0.2  # EWMA weight of the newest success/failure sample
+DEFAULT_LATENCY_MS = 1000.0  # Assumed latency of endpoints never measured
+ERROR_PENALTY = 4.0  # A 100% error rate scores like 5x the latency
+LAG_PENALTY_MS = 250.0  # Score added per block behind the best known head
+LATENCY_WINDOW = 64  # Recent latency samples kept for percentiles
+MIN_PERCENTILE_SAMPLES = 8  # Fewer samples than this give no percentile
+
+
+class RPCHealth:
+    """Rolling latency, error and head statistics of a single RPC endpoint."""
+
+    def __init__(self) -> None:
+        """Initialize an endpoint with no samples."""
+        self.latency_ms: Optional[float] = None
+        self.samples: deque = deque(maxlen=LATENCY_WINDOW)
+        self.error_rate = 0.0
+        self.errors: Counter = Counter()
+        self.head: Optional[int] = None
+        self.last_error_at: Optional[float] = None
+        self.last_probe_at: Optional[float] = None
+
+    def record_latency(self, latency_ms: float) -> None:
+        """Fold a successful call into the latency and error EWMAs."""
+        self.samples.append(latency_ms)
+        if self.latency_ms is None:
+            self.latency_ms = latency_ms
+        else:
+            self.latency_ms += LATENCY_ALPHA * (latency_ms - self.latency_ms)
+        self.error_rate *= 1 - ERROR_ALPHA
+
+    def record_error(self, error_class: str) -> None:
+        """Fold a failed call of *error_class* into the error EWMA."""
+        self.errors[error_class] += 1
+        self.error_rate += ERROR_ALPHA * (1 - self.error_rate)
+        self.last_error_at = time.monotonic()
+
+    def record_head(self, block: int) -> None:
+        """Remember the newest block this endpoint reported."""
+        if self.head is None or block > self.head:
+            self.head = block
+
+    def score(self, best_head: Optional[int]) -> float:
+        """Lower is better: latency inflated by error rate, plus head lag."""
+        latency = DEFAULT_LATENCY_MS if self.latency_ms is None else self.latency_ms
+        lag = 0 if best_head is None or self.head is None else max(best_head - self.head, 0)
+        return latency * (1 + ERROR_PENALTY * self.error_rate) + lag * LAG_PENALTY_MS
+
+
+class RPCHealthTracker:
+    """Thread-safe health table of the RPC endpoints of one chain, keyed by URL."""
+
+    def __init__(self) -> None:
+        """Initialize an empty table."""
+        self._health: Dict[str, RPCHealth] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, url: str) -> RPCHealth:
+        health = self._health.get(url)
+        if health is None:
+            health = self._health[url] = RPCHealth()
+        return health
+
+    def record_success(self, url: str, latency_ms: float, block: Optional[int] = None) -> None:
+        """Record a successful call to *url*, and the head it reported if known."""
+        if not url:
+            return
+        with self._lock:
+            health = self._get(url)
+            health.record_latency(latency_ms)
+            if block is not None:
+                health.record_head(block)
+
+    def record_error(self, url: str, error_class: str) -> None:
+        """Record a failed call to *url*."""
+        if not url:
+            return
+        with self._lock:
+            self._get(url).record_error(error_class)
+
+    def record_probe(self, url: str, latency_ms: float, block: int) -> None:
+        """Record an ``eth_blockNumber`` probe, starting the endpoint from a clean slate.
+
+        A successful probe is the evidence that a backed-off endpoint recovered,
+        so its error rate is reset rather than decayed.
+        """
+        with self._lock:
+            health = self._get(url)
+            health.record_latency(latency_ms)
+            health.record_head(block)
+            health.error_rate = 0.0
+            health.last_probe_at = time.monotonic()
+
+    def record_probe_failure(self, url: str) -> None:
+        """Record a failed probe of *url*."""
+        with self._lock:
+            health = self._get(url)
+            health.record_error("PROBE")
+            health.last_probe_at = time.monotonic()
+
+    def needs_probe(self, url: str) -> bool:
+        """Whether *url* failed after it was last probed."""
+        with self._lock:
+            health = self._health.get(url)
+            if health is None or health.last_error_at is None:
+                return False
+            return health.last_probe_at is None or health.last_probe_at < health.last_error_at
+
+    def latency_percentile(self, url: str, percentile: float) -> Optional[float]:
+        """Latency (ms) under which *percentile* (0-1) of recent calls to *url* finished.
+
+        Returns None until enough calls have been observed.
+        """
+        with self._lock:
+            health = self._health.get(url)
+            samples = sorted(health.samples) if health is not None else []
+        if len(samples) < MIN_PERCENTILE_SAMPLES:
+            return None
+        index = min(int(percentile * len(samples)), len(samples) - 1)
+        return samples[index]
+
+    def best_head(self) -> Optional[int]:
+        """Highest block reported by any endpoint."""
+        with self._lock:
+            heads = [h.head for h in self._health.values() if h.head is not None]
+        return max(heads) if heads else None
+
+    def score(self, url: str) -> float:
+        """Score of *url* (lower is better)."""
+        best = self.best_head()
+        with self._lock:
+            health = self._health.get(url)
+            if health is None:
+                return RPCHealth().score(best)
+            return health.score(best)
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Per-URL statistics, for status endpoints and debugging."""
+        best = self.best_head()
+        with self._lock:
+            return {
+                url: {
+                    "latency_ms": h.latency_ms,
+                    "error_rate": h.error_rate,
+                    "errors": dict(h.errors),
+                    "head": h.head,
+                    "score": h.score(best),
+                }
+                for url, h in self._health.items()
+            }
@@ -0,0 +1,86 @@
+"""Shared timer that launches hedged reads.
+
+Only when a read's primary request is still running after the hedge delay
+is a duplicate sent to a second RPC. Waiting out that delay on a pool worker
+would tie up one worker per read, so one timer thread per process keeps the
+pending hedges in a heap and launches the due ones. The hedge pool then only
+runs hedges that were actually sent.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Generic, List, Optional, Tuple, TypeVar
+
+from iwa.core.utils import configure_logger
+
+logger = configure_logger()
+
+T = TypeVar("T")
+
+
+class ScheduledHedge(Generic[T]):
+    """A hedge launch scheduled on the ``HedgeTimer``."""
+
+    def __init__(self, launch: Callable[[], Optional[T]]) -> None:
+        """Wrap *launch*, which sends the hedge and returns its handle (or ``None``)."""
+        self._launch = launch
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._launched: Optional[T] = None
+
+    def fire(self) -> None:
+        """Launch the hedge unless it was cancelled first."""
+        with self._lock:
+            if not self._cancelled:
+                self._launched = self._launch()
+                self._cancelled = True
+
+    @property
+    def launched(self) -> Optional[T]:
+        """Handle of the hedge if it has launched, without cancelling it."""
+        with self._lock:
+            return self._launched
+
+    def cancel(self) -> Optional[T]:
+        """Stop the hedge from launching; return its handle if it already launched."""
+        with self._lock:
+            self._cancelled = True
+            return self._launched
+
+
+class HedgeTimer:
+    """One background thread firing scheduled hedges when they fall due."""
+
+    def __init__(self) -> None:
+        """Start the timer thread."""
+        self._queue: List[Tuple[float, int, ScheduledHedge]] = []
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._thread = threading.Thread(target=self._run, name="rpc-hedge-timer", daemon=True)
+        self._thread.start()
+
+    def schedule(self, delay: float, launch: Callable[[], Optional[T]]) -> ScheduledHedge[T]:
+        """Call *launch* on the timer thread after *delay* seconds unless cancelled.
+
+        *launch* must not block: it should hand the hedged request to an
+        executor and return its future.
+        """
+        hedge = ScheduledHedge(launch)
+        with self._cond:
+            heapq.heappush(self._queue, (time.monotonic() + delay, next(self._seq), hedge))
+            self._cond.notify()
+        return hedge
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue or self._queue[0][0] > time.monotonic():
+                    timeout = self._queue[0][0] - time.monotonic() if self._queue else None
+                    self._cond.wait(timeout if timeout is None else max(timeout, 0.0))
+                _, _, hedge = heapq.heappop(self._queue)
+            try:
+                hedge.fire()
+            except Exception as e:
+                logger.debug(f"Hedge launch failed: {e}")
@@ -2,15 +2,31 @@
 
 import threading
 import time
-from typing import Callable, Dict, Optional, TypeVar, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+from urllib.parse import urlparse
 
 import requests
 from web3 import Web3
-
-from iwa.core.chain.errors import TenderlyQuotaExceededError, sanitize_rpc_url
+from web3._utils.method_formatters import block_result_formatter
+from web3.datastructures import AttributeDict
+
+from iwa.core.chain.errors import RPCBatchError, TenderlyQuotaExceededError, sanitize_rpc_url
+from iwa.core.chain.fees import FeeOracle
+from iwa.core.chain.heads import HeadTracker
+from iwa.core.chain.health import RPCHealthTracker
+from iwa.core.chain.hedging import HedgeTimer
+from iwa.core.chain.log_ranges import BlockRangeSizer, is_range_error, walk_log_ranges
 from iwa.core.chain.models import Gnosis, SupportedChain, SupportedChains
-from iwa.core.chain.rate_limiter import RateLimitedWeb3, get_rate_limiter
+from iwa.core.chain.rate_limiter import (
+    RateLimitedWeb3,
+    ReadEndpoint,
+    RPCRateLimiter,
+    get_rate_limiter,
+)
+from iwa.core.chain.receipts import ReceiptTracker
 from iwa.core.models import Config, EthereumAddress
+from iwa.core.rpc_monitor import RPCMonitor
 from iwa.core.utils import configure_logger
 
 logger = configure_logger()
@@ -33,6 +49,27 @@ class ChainInterface:
     QUOTA_EXCEEDED_BACKOFF = 300.0  # RPC quota exhausted (resets hourly/daily)
     CONNECTION_ERROR_BACKOFF = 30.0  # Timeout / connection refused / DNS
 
+    # Minimum time between background re-probes of RPCs coming out of backoff
+    REPROBE_INTERVAL_SECONDS = 60.0
+
+    # Multi-endpoint reads: token bucket of each read RPC unless configured per host
+    DEFAULT_ENDPOINT_RATE = 5.0
+
+    # Hedged reads
+    HEDGE_DEFAULT_DELAY = 2.0  # Seconds before hedging while latency samples are scarce
+    HEDGE_MIN_DELAY = 0.05  # Never hedge sooner than this
+    HEDGE_CREDIT_CAP = 5.0  # Max hedges that can be saved up during quiet periods
+    HEDGE_PRIMARY_WORKERS = 64  # Primaries run inline once this many are in flight
+    _hedge_executor: Optional[ThreadPoolExecutor] = None  # Runs hedges only
+    _primary_executor: Optional[ThreadPoolExecutor] = None  # Runs hedgeable primaries
+    _primary_slots = threading.BoundedSemaphore(HEDGE_PRIMARY_WORKERS)
+    _hedge_timer: Optional[HedgeTimer] = None
+    _hedge_executor_lock = threading.Lock()
+
+    # Max calls per JSON-RPC batch. Public RPCs cap batch size anywhere from
+    # 50 to 1000 items; stay at the strict end so no provider rejects us.
+    BATCH_MAX_SIZE = 50
+
     chain: SupportedChain
 
     def __init__(self, chain: Union[SupportedChain, str] = None):
@@ -47,6 +84,14 @@ class ChainInterface:
         self._current_rpc_index = 0
         self._rpc_backoff_until: Dict[int, float] = {}  # index -> monotonic expiry
         self._last_rotation_time = 0.0  # Monotonic timestamp of last rotation
+        self._batch_unsupported: set = set()  # RPC indices that reject batch requests
+        self._rpc_health = RPCHealthTracker()  # Latency / error / head-lag scores by URL
+        self._last_reprobe_time = 0.0  # Monotonic timestamp of last re-probe round
+        self.fee_oracle = FeeOracle(self)  # Per-block base / priority fee cache
+        self.receipt_tracker = ReceiptTracker(self)  # Shared receipt polling loop
+        self._log_range_sizers: Dict[str, BlockRangeSizer] = {}  # url -> learned getLogs span
+        self.head_tracker = HeadTracker(self)  # Shared new-head feed for all pollers
+        self.wss_rpcs: List[str] = []  # WebSocket RPCs from ChainList, for newHeads
 
         if self.chain.rpc and self.chain.rpc.startswith("http://"):
             logger.warning(
@@ -55,10 +100,19 @@ class ChainInterface:
             )
 
         self._initial_block = 0
+        self._block_limit_unsubscribe: Optional[Callable[[], None]] = None
         self._rotation_lock = threading.Lock()
-        self._session = self._create_session()
 
         core_config = Config().core
+        self._read_endpoint_count: int = core_config.rpc_read_endpoints
+        self._rpc_rate_limits: Dict[str, float] = dict(core_config.rpc_rate_limits)
+        self._read_backends: Dict[str, ReadEndpoint] = {}  # url -> read endpoint
+        self._read_cursor = 0
+        self._hedge_percentile: float = core_config.rpc_hedge_percentile
+        self._hedge_budget: float = core_config.rpc_hedge_budget
+        self._hedge_credit = 0.0
+        self._hedge_lock = threading.Lock()
+        self._session = self._create_session()
 
         # Enrich with public RPCs from ChainList (skip for Tenderly vNets and
         # when chainlist_enrichment is disabled, e.g. Anvil local fork testing)
@@ -75,10 +129,12 @@ class ChainInterface:
         within the pool but won't accumulate unboundedly.
         """
         session = requests.Session()
-        # Limit pool size: we only talk to one RPC at a time, but may rotate
-        # through multiple during the session lifetime. Keep modest limits.
+        # Limit pool size: we talk to one RPC at a time (plus the read endpoints
+        # when multi-endpoint reads are on), but may rotate through multiple
+        # during the session lifetime. Keep modest limits.
         adapter = requests.adapters.HTTPAdapter(
-            pool_connections=5,  # Max different hosts to keep connections to
+            # Max different hosts to keep connections to
+            pool_connections=max(5, self._read_endpoint_count + 1),
             pool_maxsize=10,  # Max connections per host
         )
         session.mount("https://", adapter)
@@ -93,6 +149,24 @@ class ChainInterface:
         """
         if hasattr(self, "_session") and self._session:
             self._session.close()
+        if hasattr(self, "_block_limit_unsubscribe") and self._block_limit_unsubscribe:
+            self._block_limit_unsubscribe()
+            self._block_limit_unsubscribe = None
+
+    @property
+    def current_rpc_index(self) -> int:
+        """Index of the current RPC in ``chain.rpcs``."""
+        return self._current_rpc_index
+
+    @property
+    def rate_limiter(self) -> RPCRateLimiter:
+        """Rate limiter shared by every request to this chain, sync or async."""
+        return self._rate_limiter
+
+    @property
+    def session(self) -> requests.Session:
+        """Pooled HTTP session behind every request to this chain's RPCs."""
+        return self._session
 
     @property
     def current_rpc(self) -> str:
@@ -140,24 +214,31 @@ class ChainInterface:
             if vnet and vnet.initial_block > 0:
                 self._initial_block = vnet.initial_block
                 logger.info(f"Tenderly block tracking enabled (genesis: {self._initial_block})")
+                # Re-check usage on the new blocks other listeners watch for. A
+                # passive subscription so Tenderly is never polled just for this.
+                if self._block_limit_unsubscribe is None:
+                    self._block_limit_unsubscribe = self.head_tracker.subscribe(
+                        lambda head: self.check_block_limit(head=head), passive=True
+                    )
             else:
                 logger.debug(f"Tenderly config exists but no initial_block for {self.chain.name}")
 
         except Exception as ex:
             logger.warning(f"Failed to load Tenderly config for block tracking: {ex}")
 
-    def check_block_limit(self, show_progress_bar: bool = False):
+    def check_block_limit(self, show_progress_bar: bool = False, head: Optional[int] = None):
         """Check if approaching block limit (heuristic).
 
         Args:
             show_progress_bar: If True, display a large ASCII progress bar (for startup).
+            head: Current block number when already known (e.g. from the head tracker).
 
         """
         if not self.is_tenderly or self._initial_block == 0:
             return
 
         try:
-            current = self.web3.eth.block_number
+            current = head if head is not None else self.web3.eth.block_number
             delta = current - self._initial_block
             limit = 20  # Tenderly free tier limit (updated Jan 2026)
             percentage = min(100, int((delta / limit) * 100))
@@ -346,10 +427,18 @@ class ChainInterface:
             )
             if extra:
                 self.chain.rpcs.extend(extra)
+                for url in extra:
+                    if url in chainlist.probe_results:
+                        latency_ms, block = chainlist.probe_results[url]
+                        self._rpc_health.record_probe(url, latency_ms, block)
                 logger.info(
                     f"Enriched {self.chain.name} with {len(extra)} "
                     f"ChainList RPCs (total: {len(self.chain.rpcs)})"
                 )
+            # Skip templated URLs that need an API key (e.g. "${INFURA_API_KEY}")
+            self.wss_rpcs = [
+                url for url in chainlist.get_wss_rpcs(self.chain.chain_id) if "${" not in url
+            ]
         except Exception as e:
             logger.debug(
                 f"ChainList enrichment failed for {self.chain.name}: {e}"
@@ -357,6 +446,11 @@ class ChainInterface:
 
     # -- Per-RPC health tracking ------------------------------------------
 
+    @property
+    def health_tracker(self) -> RPCHealthTracker:
+        """Latency, error and head-lag records of this chain's RPCs."""
+        return self._rpc_health
+
     def _mark_rpc_backoff(self, index: int, seconds: float) -> None:
         """Mark an RPC as temporarily unavailable for *seconds*."""
         self._rpc_backoff_until[index] = time.monotonic() + seconds
@@ -365,9 +459,62 @@ class ChainInterface:
         """Return True if the RPC at *index* is not in backoff."""
         return time.monotonic() >= self._rpc_backoff_until.get(index, 0.0)
 
+    def accepts_batches(self, rpc_index: int) -> bool:
+        """Return False once the RPC at *rpc_index* has rejected a JSON-RPC batch."""
+        return rpc_index not in self._batch_unsupported
+
+    def rpc_health(self) -> Dict[str, dict]:
+        """Latency, error and head-lag statistics of every RPC seen so far."""
+        return {sanitize_rpc_url(url): stats for url, stats in self._rpc_health.snapshot().items()}
+
+    def _maybe_reprobe_under_lock(self, now: float) -> None:
+        """Start a background re-probe of RPCs whose backoff expired since they failed.
+
+        Throttled to one round per ``REPROBE_INTERVAL_SECONDS``. Must be called
+        with ``_rotation_lock`` held.
+        """
+        if now - self._last_reprobe_time < self.REPROBE_INTERVAL_SECONDS:
+            return
+        due = [
+            url
+            for i, url in enumerate(self.chain.rpcs or [])
+            if self._is_rpc_healthy(i) and self._rpc_health.needs_probe(url)
+        ]
+        if not due:
+            return
+        self._last_reprobe_time = now
+        threading.Thread(target=self.reprobe_rpcs, args=(due,), daemon=True).start()
+
+    def reprobe_rpcs(self, urls: List[str]) -> None:
+        """Probe *urls* with ``eth_blockNumber`` and update their health.
+
+        A successful probe clears the endpoint's error history so rotation can
+        pick it again; a failed one puts it back in backoff.
+        """
+        from iwa.core.chainlist import PROBE_TIMEOUT, probe_rpc
+
+        for url in urls:
+            result = probe_rpc(url, PROBE_TIMEOUT, self._session)
+            if result is not None:
+                _, latency_ms, block = result
+                self._rpc_health.record_probe(url, latency_ms, block)
+                continue
+            self._rpc_health.record_probe_failure(url)
+            if url in self.chain.rpcs:
+                self._mark_rpc_backoff(self.chain.rpcs.index(url), self.CONNECTION_ERROR_BACKOFF)
+            logger.debug(f"[{self.chain.name}] Re-probe failed: {sanitize_rpc_url(url)}")
+
     # FD exhaustion backoff: wait for connections to drain
     FD_EXHAUSTION_BACKOFF = 60.0  # Long pause to let FDs drain
 
+    def handle_rpc_error(self, error: Exception) -> Dict[str, Union[bool, int]]:
+        """Classify *error*, apply backoff and rotation, and tell whether to retry.
+
+        For transports that run their own retry loop on this chain's RPC
+        state, such as ``AsyncChainInterface``.
+        """
+        return self._handle_rpc_error(error)
+
     def _handle_rpc_error(self, error: Exception) -> Dict[str, Union[bool, int]]:
         """Handle RPC errors with smart rotation and retry logic."""
         result: Dict[str, Union[bool, int]] = {
@@ -420,25 +567,14 @@ class ChainInterface:
             failed_rpc = sanitize_rpc_url(self.chain.rpcs[failed_index]) if self.chain.rpcs else "?"
 
             # Apply per-RPC backoff so smart rotation skips this RPC.
-            if result["is_quota_exceeded"]:
-                error_type = "QUOTA"
-                backoff = self.QUOTA_EXCEEDED_BACKOFF
-                self._mark_rpc_backoff(failed_index, backoff)
-            elif result["is_rate_limit"]:
-                error_type = "RATE_LIMIT"
-                backoff = self.RATE_LIMIT_BACKOFF
-                self._mark_rpc_backoff(failed_index, backoff)
+            error_type, backoff = self._classify_rpc_failure(result)
+            self._mark_rpc_backoff(failed_index, backoff)
+            if error_type == "RATE_LIMIT":
                 # Brief global backoff so other threads don't immediately flood
                 # the same (now backed-off) RPC before rotation takes effect.
                 self._rate_limiter.trigger_backoff(seconds=2.0)
-            elif result["is_server_error"]:
-                error_type = "SERVER_ERROR"
-                backoff = self.CONNECTION_ERROR_BACKOFF
-                self._mark_rpc_backoff(failed_index, backoff)
-            else:
-                error_type = "CONNECTION"
-                backoff = self.CONNECTION_ERROR_BACKOFF
-                self._mark_rpc_backoff(failed_index, backoff)
+
+            self._rpc_health.record_error(self.current_rpc, error_type)
 
             # Count healthy RPCs for visibility
             healthy_count = sum(1 for i in range(len(self.chain.rpcs)) if self._is_rpc_healthy(i))
@@ -468,8 +604,250 @@ class ChainInterface:
 
         return result
 
+    def _classify_rpc_failure(self, result: Dict[str, Union[bool, int]]) -> Tuple[str, float]:
+        """Return the error class and per-RPC backoff of a rotation-worthy failure."""
+        if result["is_quota_exceeded"]:
+            return "QUOTA", self.QUOTA_EXCEEDED_BACKOFF
+        if result["is_rate_limit"]:
+            return "RATE_LIMIT", self.RATE_LIMIT_BACKOFF
+        if result["is_server_error"]:
+            return "SERVER_ERROR", self.CONNECTION_ERROR_BACKOFF
+        return "CONNECTION", self.CONNECTION_ERROR_BACKOFF
+
+    # -- Multi-endpoint reads ----------------------------------------------
+
+    def read_endpoint(self) -> Optional[ReadEndpoint]:
+        """Pick the RPC that serves the next stateless read.
+
+        Reads rotate over the ``rpc_read_endpoints`` best-scoring healthy RPCs,
+        taking the first one whose own token bucket has a token free, so read
+        throughput grows with the number of endpoints. Writes never come here
+        and stay on the active (primary) RPC.
+
+        Returns:
+            The endpoint to use, or None when multi-endpoint reads are off or
+            fewer than two RPCs are healthy (the caller uses the primary RPC).
+
+        """
+        if self._read_endpoint_count <= 1 or self.is_tenderly:
+            return None
+
+        rpcs = list(self.chain.rpcs or [])
+        healthy = [i for i in range(len(rpcs)) if self._is_rpc_healthy(i)]
+        if len(healthy) < 2:
+            return None
+        healthy.sort(key=lambda i: self._rpc_health.score(rpcs[i]))
+        pool = [rpcs[i] for i in healthy[: self._read_endpoint_count]]
+
+        with self._rotation_lock:
+            start = self._read_cursor
+            self._read_cursor = (start + 1) % len(pool)
+        ordered = pool[start % len(pool) :] + pool[: start % len(pool)]
+        endpoints = [self._get_read_backend(url) for url in ordered]
+
+        for endpoint in endpoints:
+            if endpoint.rate_limiter.try_acquire():
+                return endpoint
+        # Every bucket is empty: queue on the next endpoint in turn
+        if endpoints[0].rate_limiter.acquire(timeout=30.0):
+            return endpoints[0]
+        return None
+
+    def report_read_failure(self, url: str, error: Exception) -> bool:
+        """Back off a read endpoint that failed with an RPC-level error.
+
+        Returns:
+            True if the error was the RPC's fault (rate limit, quota, server or
+            connection error) and the read should be retried on the primary
+            RPC; False if it should propagate to the caller (e.g. a revert).
+
+        """
+        result = {
+            "is_rate_limit": self._is_rate_limit_error(error),
+            "is_connection_error": self._is_connection_error(error),
+            "is_server_error": self._is_server_error(error),
+            "is_quota_exceeded": self._is_quota_exceeded_error(error),
+        }
+        if not any(result.values()):
+            return False
+
+        error_type, backoff = self._classify_rpc_failure(result)
+        if url in self.chain.rpcs:
+            self._mark_rpc_backoff(self.chain.rpcs.index(url), backoff)
+        self._rpc_health.record_error(url, error_type)
+        logger.debug(
+            f"[{self.chain.name}] Read endpoint {error_type} → backoff {int(backoff)}s | "
+            f"{sanitize_rpc_url(url)}: {str(error)[:100]}"
+        )
+        return True
+
+    def _get_read_backend(self, url: str) -> ReadEndpoint:
+        """Return the cached eth module and token bucket serving reads from *url*."""
+        with self._rotation_lock:
+            endpoint = self._read_backends.get(url)
+            if endpoint is None:
+                raw_web3 = Web3(
+                    Web3.HTTPProvider(
+                        url,
+                        request_kwargs={"timeout": DEFAULT_RPC_TIMEOUT},
+                        session=self._session,
+                    )
+                )
+                host = urlparse(url).hostname or ""
+                rate = self._rpc_rate_limits.get(host, self.DEFAULT_ENDPOINT_RATE)
+                limiter = get_rate_limiter(
+                    f"{self.chain.name}|{url}", rate=rate, burst=max(1, int(rate * 2))
+                )
+                endpoint = self._read_backends[url] = ReadEndpoint(url, raw_web3.eth, limiter)
+            return endpoint
+
+    # -- Hedged reads --------------------------------------------------------
+
+    @property
+    def hedging_enabled(self) -> bool:
+        """Whether slow reads on the active RPC are duplicated to a second RPC."""
+        return self._hedge_percentile > 0 and self._hedge_budget > 0
+
+    @classmethod
+    def _get_hedge_executor(cls) -> ThreadPoolExecutor:
+        with cls._hedge_executor_lock:
+            if cls._hedge_executor is None:
+                cls._hedge_executor = ThreadPoolExecutor(
+                    max_workers=16, thread_name_prefix="rpc-hedge"
+                )
+            return cls._hedge_executor
+
+    @classmethod
+    def _get_primary_executor(cls) -> ThreadPoolExecutor:
+        with cls._hedge_executor_lock:
+            if cls._primary_executor is None:
+                cls._primary_executor = ThreadPoolExecutor(
+                    max_workers=cls.HEDGE_PRIMARY_WORKERS, thread_name_prefix="rpc-read"
+                )
+            return cls._primary_executor
+
+    @classmethod
+    def _get_hedge_timer(cls) -> HedgeTimer:
+        with cls._hedge_executor_lock:
+            if cls._hedge_timer is None:
+                cls._hedge_timer = HedgeTimer()
+            return cls._hedge_timer
+
+    def _hedge_delay(self) -> float:
+        """Seconds to wait on the active RPC before hedging."""
+        latency_ms = self._rpc_health.latency_percentile(self.current_rpc, self._hedge_percentile)
+        if latency_ms is None:
+            return self.HEDGE_DEFAULT_DELAY
+        return max(latency_ms / 1000, self.HEDGE_MIN_DELAY)
+
+    def _take_hedge_credit(self) -> bool:
+        """Spend one hedge from the budget if the budget allows it."""
+        with self._hedge_lock:
+            if self._hedge_credit < 1.0:
+                return False
+            self._hedge_credit -= 1.0
+            return True
+
+    def _hedge_target(self) -> Optional[ReadEndpoint]:
+        """Best-scoring healthy RPC other than the active one, if it has a token free."""
+        rpcs = list(self.chain.rpcs or [])
+        candidates = [
+            i for i in range(len(rpcs)) if i != self._current_rpc_index and self._is_rpc_healthy(i)
+        ]
+        if not candidates:
+            return None
+        best = min(candidates, key=lambda i: self._rpc_health.score(rpcs[i]))
+        endpoint = self._get_read_backend(rpcs[best])
+        return endpoint if endpoint.rate_limiter.try_acquire() else None
+
+    def _call_hedge(self, endpoint: ReadEndpoint, method_name: str, args: tuple, kwargs: dict):
+        """Run a hedged read on *endpoint*, feeding its outcome to RPC health."""
+        start = time.monotonic()
+        try:
+            result = getattr(endpoint.eth, method_name)(*args, **kwargs)
+        except Exception as e:
+            self.report_read_failure(endpoint.url, e)
+            raise
+        self._rpc_health.record_success(endpoint.url, (time.monotonic() - start) * 1000)
+        return result
+
+    def hedged_call(
+        self, method_name: str, primary: Callable[[], T], args: tuple, kwargs: dict
+    ) -> T:
+        """Run a read on the active RPC, hedging it to the next-best RPC if slow.
+
+        *primary* (the read with its retries and rotation) runs on the primary
+        pool while the caller waits. If it is still running after the
+        configured latency percentile of the active RPC,
+        ``eth.<method_name>(*args, **kwargs)`` is sent once to the next-best
+        healthy RPC from the hedge pool, and the first successful answer is
+        returned. Every call earns ``rpc_hedge_budget`` of a hedge, so hedges
+        never exceed that fraction of read traffic. If both fail, the
+        primary's error is raised. When every primary worker is busy, the
+        primary runs on the caller's thread and the hedge can only stand in
+        for its failure.
+        """
+        with self._hedge_lock:
+            self._hedge_credit = min(self._hedge_credit + self._hedge_budget, self.HEDGE_CREDIT_CAP)
+
+        settled = threading.Event()
+
+        def launch() -> Optional[Future]:
+            target = self._hedge_target() if self._take_hedge_credit() else None
+            if target is None:
+                return None
+            RPCMonitor().increment(f"{self.chain.name.lower()}.hedge")
+            hedge = self._get_hedge_executor().submit(
+                self._call_hedge, target, method_name, args, kwargs
+            )
+            hedge.add_done_callback(lambda _: settled.set())
+            return hedge
+
+        scheduled = self._get_hedge_timer().schedule(self._hedge_delay(), launch)
+        primary_future = self._submit_primary(primary)
+        primary_future.add_done_callback(lambda _: settled.set())
+
+        while True:
+            settled.wait()
+            settled.clear()
+            if primary_future.done() and primary_future.exception() is None:
+                scheduled.cancel()
+                return primary_future.result()
+            hedge = scheduled.launched
+            if hedge is not None and hedge.done() and hedge.exception() is None:
+                RPCMonitor().increment(f"{self.chain.name.lower()}.hedge_won")
+                return hedge.result()
+            if primary_future.done():
+                hedge = scheduled.cancel()
+                if hedge is None or hedge.done():
+                    return primary_future.result()  # Raises the primary's error
+
+    def _submit_primary(self, primary: Callable[[], T]) -> "Future[T]":
+        """Start *primary* on the primary pool, or run it here if the pool is full."""
+        if self._primary_slots.acquire(blocking=False):
+
+            def run() -> T:
+                try:
+                    return primary()
+                finally:
+                    self._primary_slots.release()
+
+            return self._get_primary_executor().submit(run)
+
+        future: "Future[T]" = Future()
+        try:
+            future.set_result(primary())
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
     def rotate_rpc(self) -> bool:
-        """Rotate to the next healthy RPC, skipping those in backoff."""
+        """Rotate to the best-scoring healthy RPC, skipping those in backoff.
+
+        Healthy RPCs are ranked by their health score (latency EWMA inflated by
+        error rate, plus head lag). Ties, including RPCs never measured, keep
+        round-robin order from the current RPC.
+        """
         with self._rotation_lock:
             n = len(self.chain.rpcs) if self.chain.rpcs else 0
             if n <= 1:
@@ -480,13 +858,14 @@ class ChainInterface:
             if now - self._last_rotation_time < self.ROTATION_COOLDOWN_SECONDS:
                 return False
 
-            # Try each other RPC in round-robin order, preferring healthy ones.
+            self._maybe_reprobe_under_lock(now)
+
+            # Pick the best-scoring healthy RPC; min() keeps round-robin order on ties.
+            candidates = [(self._current_rpc_index + offset) % n for offset in range(1, n)]
+            healthy = [i for i in candidates if self._is_rpc_healthy(i)]
             best: Optional[int] = None
-            for offset in range(1, n):
-                candidate = (self._current_rpc_index + offset) % n
-                if self._is_rpc_healthy(candidate):
-                    best = candidate
-                    break
+            if healthy:
+                best = min(healthy, key=lambda i: self._rpc_health.score(self.chain.rpcs[i]))
 
             if best is None:
                 # All RPCs are in backoff — pick the one whose backoff expires soonest.
@@ -540,8 +919,13 @@ class ChainInterface:
         operation: Callable[[], T],
         max_retries: Optional[int] = None,
         operation_name: str = "operation",
+        passthrough: Optional[Callable[[Exception], bool]] = None,
     ) -> T:
-        """Execute an operation with retry logic."""
+        """Execute an operation with retry logic.
+
+        Errors for which *passthrough* returns True are the caller's to handle:
+        they are re-raised at once, without rotation, backoff or logging.
+        """
         if max_retries is None:
             max_retries = self.DEFAULT_MAX_RETRIES
 
@@ -551,6 +935,8 @@ class ChainInterface:
             try:
                 return operation()
             except Exception as e:
+                if passthrough is not None and passthrough(e):
+                    raise
                 last_error = e
                 result = self._handle_rpc_error(e)
 
@@ -568,6 +954,219 @@ class ChainInterface:
             raise last_error
         raise RuntimeError(f"{operation_name} failed unexpectedly")
 
+    def batch(self, requests: List[Tuple[str, list]], allow_failure: bool = False) -> List[Any]:
+        """Send raw JSON-RPC calls as JSON-RPC 2.0 batch requests.
+
+        Calls are split into chunks of ``BATCH_MAX_SIZE`` and each chunk is a
+        single HTTP POST over the pooled session. Rate-limit, quota, server and
+        connection errors (for the whole batch or any item in it) go through
+        ``with_retry``, so they back off and rotate like any other call. RPCs
+        that reject batches are remembered and served one call at a time.
+
+        Args:
+            requests: ``(method, params)`` tuples, e.g.
+                ``("eth_getBalance", [address, "latest"])``.
+            allow_failure: If True, failed calls return None instead of raising.
+
+        Returns:
+            Raw (unformatted) JSON-RPC results in request order.
+
+        Raises:
+            RPCBatchError: If a call fails and ``allow_failure`` is False.
+
+        """
+        results: List[Any] = []
+        for start in range(0, len(requests), self.BATCH_MAX_SIZE):
+            chunk = requests[start : start + self.BATCH_MAX_SIZE]
+            results.extend(
+                self.with_retry(
+                    lambda chunk=chunk: self._send_batch(chunk),
+                    operation_name=f"batch({len(chunk)} calls)",
+                )
+            )
+
+        for result in results:
+            if isinstance(result, RPCBatchError) and not allow_failure:
+                raise result
+        return [None if isinstance(r, RPCBatchError) else r for r in results]
+
+    def _send_batch(self, chunk: List[Tuple[str, list]]) -> List[Any]:
+        """Send one chunk, falling back to sequential calls if batches are rejected."""
+        rpc_index = self._current_rpc_index
+        provider = self.web3._web3.provider
+
+        if not self._rate_limiter.acquire(timeout=30.0):
+            raise TimeoutError("Rate limit timeout for batch request")
+
+        if self.accepts_batches(rpc_index):
+            RPCMonitor().increment(f"{self.chain.name.lower()}.batch")
+            results = self.batch_results(chunk, provider.make_batch_request(chunk), rpc_index)
+            if results is not None:
+                return results
+
+        results = []
+        for method, params in chunk:
+            RPCMonitor().increment(f"{self.chain.name.lower()}.{method}")
+            results.append(self.batch_item_result(provider.make_request(method, params)))
+        return results
+
+    def batch_results(
+        self, chunk: List[Tuple[str, list]], response: Any, rpc_index: int
+    ) -> Optional[List[Any]]:
+        """Map a batch response to per-call results, or None if the RPC rejected it."""
+        if isinstance(response, list) and len(response) == len(chunk):
+            return [self.batch_item_result(item) for item in response]
+
+        # A single error object (or a truncated list) means the RPC does not
+        # accept batches of this size. Retryable errors still go to with_retry.
+        if isinstance(response, dict):
+            error = RPCBatchError(response.get("error", response))
+            if self.is_retryable_batch_error(error):
+                raise error
+        logger.info(
+            f"[{self.chain.name}] RPC #{rpc_index} rejected batch request, "
+            f"falling back to sequential calls"
+        )
+        self._batch_unsupported.add(rpc_index)
+        return None
+
+    def batch_item_result(self, response: Dict) -> Any:
+        """Extract one call's result, raising retryable errors for with_retry."""
+        if response.get("error"):
+            error = RPCBatchError(response["error"])
+            if self.is_retryable_batch_error(error):
+                raise error
+            return error
+        return response.get("result")
+
+    def is_retryable_batch_error(self, error: Exception) -> bool:
+        """Return True for errors that handle_rpc_error backs off and retries."""
+        return (
+            self._is_rate_limit_error(error)
+            or self._is_quota_exceeded_error(error)
+            or self._is_server_error(error)
+            or self._is_connection_error(error)
+            or self._is_fd_exhaustion_error(error)
+        )
+
+    def get_native_balances_wei(self, addresses: List[EthereumAddress]) -> List[Optional[int]]:
+        """Get native balances for many addresses in batched requests.
+
+        Returns:
+            Balance in wei per address (None where the call failed).
+
+        """
+        results = self.batch(
+            [("eth_getBalance", [address, "latest"]) for address in addresses],
+            allow_failure=True,
+        )
+        return [int(r, 16) if r is not None else None for r in results]
+
+    def get_blocks(
+        self, block_numbers: List[int], full_transactions: bool = False
+    ) -> List[Optional[AttributeDict]]:
+        """Get many blocks in batched requests, formatted like ``eth.get_block``.
+
+        Returns:
+            Block per number (None where the call failed or the block is unknown).
+
+        """
+        results = self.batch(
+            [("eth_getBlockByNumber", [hex(n), full_transactions]) for n in block_numbers],
+            allow_failure=True,
+        )
+        return [
+            AttributeDict.recursive(block_result_formatter(r)) if r is not None else None
+            for r in results
+        ]
+
+    # -- Ranged eth_getLogs --------------------------------------------------
+
+    def log_range_sizer(self, url: str) -> BlockRangeSizer:
+        """Return the learned eth_getLogs block span of the RPC at *url*."""
+        with self._rotation_lock:
+            sizer = self._log_range_sizers.get(url)
+            if sizer is None:
+                sizer = self._log_range_sizers[url] = BlockRangeSizer()
+            return sizer
+
+    def get_logs_ranged(
+        self,
+        log_filter: Dict,
+        from_block: int,
+        to_block: int,
+        descending: bool = False,
+        on_chunk: Optional[Callable[[int, int, List], None]] = None,
+    ) -> List:
+        """eth_getLogs over [from_block, to_block] in chunks each RPC accepts.
+
+        Every chunk goes to a read endpoint (or the primary RPC) and is sized
+        by that RPC's own ``BlockRangeSizer``, so a year-long backfill uses
+        the widest span each provider allows and a strict provider only
+        slows down the chunks it serves.
+
+        Args:
+            log_filter: eth_getLogs filter (``address``, ``topics``) without
+                ``fromBlock``/``toBlock``.
+            from_block: First block, inclusive.
+            to_block: Last block, inclusive.
+            descending: Walk from *to_block* down instead of up.
+            on_chunk: Receives ``(chunk_start, chunk_end, logs)`` per chunk
+                instead of the logs being returned.
+
+        Returns:
+            The matching logs, or an empty list when *on_chunk* is given.
+
+        """
+        return walk_log_ranges(
+            self._log_source,
+            log_filter,
+            from_block,
+            to_block,
+            descending=descending,
+            on_chunk=on_chunk,
+            label=f"[{self.chain.name}] ",
+        )
+
+    def _log_source(self) -> Tuple[BlockRangeSizer, Callable[[Dict], List]]:
+        """Pick the RPC serving the next getLogs chunk, with its sizer."""
+        endpoint = self.read_endpoint()
+        if endpoint is not None:
+            return self.log_range_sizer(endpoint.url), lambda params: self._get_logs_on_endpoint(
+                endpoint, params
+            )
+        return self.log_range_sizer(self.current_rpc), self._get_logs_on_primary
+
+    def _get_logs_on_endpoint(self, endpoint: ReadEndpoint, params: Dict) -> List:
+        """eth_getLogs on a read endpoint, falling back to the primary on RPC faults."""
+        try:
+            start = time.monotonic()
+            logs = list(endpoint.eth.get_logs(params))
+            self._rpc_health.record_success(endpoint.url, (time.monotonic() - start) * 1000)
+            return logs
+        except Exception as e:
+            if is_range_error(e) or not self.report_read_failure(endpoint.url, e):
+                raise
+        return self._get_logs_on_primary(params)
+
+    def _get_logs_on_primary(self, params: Dict) -> List:
+        """eth_getLogs on the primary RPC, with rotation but no read fan-out."""
+
+        def fetch() -> List:
+            if not self._rate_limiter.acquire(timeout=30.0):
+                raise TimeoutError("Rate limit timeout for get_logs")
+            rpc = self.current_rpc
+            start = time.monotonic()
+            logs = list(self.web3._web3.eth.get_logs(params))
+            self._rpc_health.record_success(rpc, (time.monotonic() - start) * 1000)
+            return logs
+
+        return self.with_retry(
+            fetch,
+            operation_name=f"get_logs [{params['fromBlock']}-{params['toBlock']}]",
+            passthrough=is_range_error,
+        )
+
     def is_contract(self, address: EthereumAddress) -> bool:
         """Check if address is a contract"""
         code = self.web3.eth.get_code(address)
@@ -615,6 +1214,12 @@ class ChainInterface:
             Decimals as int, or None if error and fallback_to_18 is False.
 
         """
+        from iwa.core.contracts.token_registry import TokenRegistry
+
+        cached = TokenRegistry().get(self.chain.name, address)
+        if cached is not None:
+            return cached.decimals
+
         try:
             # Call decimals() directly without with_retry to avoid error logging
             # Use _web3 directly to ensure current provider after RPC rotation
@@ -709,15 +1314,18 @@ class ChainInterface:
         return params
 
     def get_suggested_fees(self) -> Dict[str, int]:
-        """Calculate suggested fees for a transaction (EIP-1559 or legacy)."""
+        """Calculate suggested fees for a transaction (EIP-1559 or legacy).
+
+        Fee data comes from ``fee_oracle``, so transactions priced within the
+        same block share one fetch.
+        """
         try:
-            # Check for EIP-1559 support
-            latest_block = self.web3.eth.get_block("latest")
-            base_fee = latest_block.get("baseFeePerGas")
+            fees = self.fee_oracle.snapshot()
+            base_fee = fees.base_fee
 
             if base_fee is not None:
                 # EIP-1559 logic
-                max_priority_fee = int(self.web3.eth.max_priority_fee)
+                max_priority_fee = int(fees.priority_fee or 0)
 
                 # Gnosis specific: ensure min priority fee (critical for validation)
                 if self.chain.name.lower() == "gnosis":
@@ -732,6 +1340,9 @@ class ChainInterface:
                 max_fee = int(base_fee * 1.5) + max_priority_fee
 
                 return {"maxFeePerGas": max_fee, "maxPriorityFeePerGas": max_priority_fee}
+
+            if fees.gas_price is not None:
+                return {"gasPrice": fees.gas_price}
         except Exception as e:
             logger.debug(f"Failed to calculate EIP-1559 fees: {e}, falling back to legacy")
 
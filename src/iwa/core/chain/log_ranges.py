@@ -0,0 +1,164 @@
+"""Adaptive block ranges for eth_getLogs.
+
+Every RPC caps eth_getLogs differently: by block span, by result count or
+by response size, and rarely says which in a machine-readable way. A
+``BlockRangeSizer`` learns one RPC's limit AIMD-style: it doubles while no
+range error has been seen, then grows additively and halves whenever the
+RPC refuses a span. ``walk_log_ranges`` splits a block range into chunks
+sized by whichever sizer serves each chunk.
+"""
+
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+INITIAL_CHUNK_SIZE = 1_000  # Blocks per eth_getLogs before any feedback
+MIN_CHUNK_SIZE = 10
+MAX_CHUNK_SIZE = 50_000
+
+# Substrings of RPC errors meaning "ask for fewer blocks / results"
+RANGE_ERROR_SIGNALS = (
+    "range",
+    "limit",
+    "10000",
+    "too large",
+    "too many",
+    "413",
+    "exceed",
+    "response size",
+)
+
+# Errors that match the signals above but are about request rate or quota
+NOT_RANGE_ERROR_SIGNALS = (
+    "429",
+    "rate limit",
+    "ratelimit",
+    "too many requests",
+    "quota",
+    "usage limit",
+)
+
+# Picks the sizer and the eth_getLogs implementation serving the next chunk
+LogSource = Callable[[], Tuple["BlockRangeSizer", Callable[[Dict], List]]]
+
+
+def is_range_error(error: Exception) -> bool:
+    """Whether *error* is an RPC refusing an eth_getLogs range as too large."""
+    error_msg = str(error).lower()
+    if any(signal in error_msg for signal in NOT_RANGE_ERROR_SIGNALS):
+        return False
+    return any(signal in error_msg for signal in RANGE_ERROR_SIGNALS)
+
+
+class BlockRangeSizer:
+    """AIMD eth_getLogs block span of one RPC.
+
+    Doubles after every full-size success until the first range error, then
+    grows by an eighth per success and halves on every further range error.
+    """
+
+    def __init__(
+        self,
+        initial: int = INITIAL_CHUNK_SIZE,
+        minimum: int = MIN_CHUNK_SIZE,
+        maximum: int = MAX_CHUNK_SIZE,
+    ):
+        """Initialize the sizer at *initial* blocks, bounded by [minimum, maximum]."""
+        self.minimum = minimum
+        self.maximum = maximum
+        self._size = max(minimum, min(initial, maximum))
+        self._limit_seen = False
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Current block span to request."""
+        return self._size
+
+    def record_success(self, span: int) -> None:
+        """Grow after a full-size range was served without complaint."""
+        with self._lock:
+            if span < self._size:
+                return
+            if self._limit_seen:
+                self._size = min(self._size + max(self.minimum, self._size // 8), self.maximum)
+            else:
+                self._size = min(self._size * 2, self.maximum)
+
+    def record_range_error(self, span: int) -> bool:
+        """Shrink below the rejected *span*. Returns False if already at the minimum."""
+        with self._lock:
+            self._limit_seen = True
+            if span <= self.minimum:
+                return False
+            self._size = max(self.minimum, min(self._size, span) // 2)
+            return True
+
+
+def walk_log_ranges(
+    source: LogSource,
+    log_filter: Dict,
+    from_block: int,
+    to_block: int,
+    descending: bool = False,
+    on_chunk: Optional[Callable[[int, int, List], None]] = None,
+    label: str = "",
+) -> List:
+    """Fetch the logs matching *log_filter* in [from_block, to_block] chunk by chunk.
+
+    Each chunk asks *source* for a sizer and a fetcher, so chunks follow the
+    limit of the RPC that serves them. A range error shrinks that sizer and
+    the chunk is retried; a served chunk lets it grow.
+
+    Args:
+        source: Picks the (sizer, get_logs) pair for the next chunk.
+        log_filter: eth_getLogs filter without ``fromBlock``/``toBlock``.
+        from_block: First block, inclusive.
+        to_block: Last block, inclusive.
+        descending: Walk from *to_block* down instead of up.
+        on_chunk: Receives ``(chunk_start, chunk_end, logs)`` for every chunk.
+            When given, logs are handed over there and not accumulated.
+        label: Log message prefix (e.g. ``"[gnosis] "``).
+
+    Returns:
+        The logs in walk order, or an empty list when *on_chunk* is given.
+
+    Raises:
+        Exception: The RPC error of a chunk that cannot be fetched, after
+            shrinking the range as far as the sizer allows.
+
+    """
+    result: List = []
+    low, high = from_block, to_block
+    while low <= high:
+        sizer, get_logs = source()
+        span = sizer.size
+        if descending:
+            chunk_start, chunk_end = max(low, high - span + 1), high
+        else:
+            chunk_start, chunk_end = low, min(high, low + span - 1)
+
+        params = {**log_filter, "fromBlock": chunk_start, "toBlock": chunk_end}
+        try:
+            logs = list(get_logs(params))
+        except Exception as e:
+            if is_range_error(e) and sizer.record_range_error(chunk_end - chunk_start + 1):
+                logger.debug(
+                    f"{label}getLogs range {chunk_end - chunk_start + 1} too large, "
+                    f"shrinking to {sizer.size}"
+                )
+                continue
+            raise
+
+        sizer.record_success(chunk_end - chunk_start + 1)
+        if on_chunk is not None:
+            on_chunk(chunk_start, chunk_end, logs)
+        else:
+            result.extend(logs)
+
+        if descending:
+            high = chunk_start - 1
+        else:
+            low = chunk_end + 1
+    return result
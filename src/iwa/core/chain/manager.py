@@ -2,6 +2,7 @@
 
 from typing import Dict
 
+from iwa.core.chain.async_interface import AsyncChainInterface
 from iwa.core.chain.interface import ChainInterface
 from iwa.core.chain.models import Base, Ethereum, Gnosis
 from iwa.core.utils import singleton
@@ -15,6 +16,10 @@ class ChainInterfaces:
     ethereum: ChainInterface = ChainInterface(Ethereum())
     base: ChainInterface = ChainInterface(Base())
 
+    def __init__(self):
+        """Initialize the per-chain AsyncChainInterface cache."""
+        self._async_interfaces: Dict[str, AsyncChainInterface] = {}
+
     def get(self, chain_name: str) -> ChainInterface:
         """Get ChainInterface by chain name"""
         chain_name = chain_name.strip().lower()
@@ -24,6 +29,16 @@ class ChainInterfaces:
 
         return getattr(self, chain_name)
 
+    def get_async(self, chain_name: str) -> AsyncChainInterface:
+        """Get the AsyncChainInterface sharing RPC state with ``get(chain_name)``."""
+        interface = self.get(chain_name)
+        chain_name = chain_name.strip().lower()
+        async_interface = self._async_interfaces.get(chain_name)
+        if async_interface is None or async_interface.chain_interface is not interface:
+            async_interface = AsyncChainInterface(interface)
+            self._async_interfaces[chain_name] = async_interface
+        return async_interface
+
     def items(self):
         """Iterate over all chain interfaces."""
         yield "gnosis", self.gnosis
@@ -44,3 +59,8 @@ class ChainInterfaces:
         """
         for _, interface in self.items():
             interface.close()
+
+    async def close_all_async(self) -> None:
+        """Close the aiohttp sessions of all async chain interfaces."""
+        for async_interface in self._async_interfaces.values():
+            await async_interface.close()
@@ -0,0 +1,115 @@
+"""Adapters that send third-party RPC traffic through a ChainInterface.
+
+Libraries such as safe-eth-py build their own ``Web3`` and HTTP session
+from a plain RPC URL. Their requests then skip the chain's rate limiter,
+retry and rotation logic, RPC health scoring and ``RPCMonitor`` counts, and
+every client opens its own connection pool. ``ChainInterfaceProvider`` (a
+web3 provider) and ``ChainInterfaceSession`` (for raw JSON-RPC batch posts)
+route that traffic through the ChainInterface instead, always against its
+current RPC and over its shared session.
+"""
+
+import time
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
+
+from web3.providers.base import BaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from iwa.core.chain.errors import RPCBatchError
+from iwa.core.rpc_monitor import RPCMonitor
+
+if TYPE_CHECKING:
+    from iwa.core.chain.interface import ChainInterface
+
+T = TypeVar("T")
+
+# Sends are not retried here: a signed transaction may already be in the
+# mempool, so the caller decides whether to resend after the RPC rotated.
+NO_RETRY_METHODS = {"eth_sendRawTransaction", "eth_sendTransaction"}
+
+
+def _send_via(
+    chain_interface: "ChainInterface",
+    metric: str,
+    send: Callable[[], T],
+    operation_name: str,
+    max_retries: Optional[int] = None,
+) -> T:
+    """Run *send* under the chain's rate limiter, retry/rotation and RPC monitoring."""
+
+    def attempt() -> T:
+        if not chain_interface.rate_limiter.acquire(timeout=30.0):
+            raise TimeoutError(f"Rate limit timeout for {operation_name}")
+        RPCMonitor().increment(f"{chain_interface.chain.name.lower()}.{metric}")
+        rpc = chain_interface.current_rpc
+        start = time.monotonic()
+        result = send()
+        chain_interface.health_tracker.record_success(rpc, (time.monotonic() - start) * 1000)
+        return result
+
+    return chain_interface.with_retry(
+        attempt, max_retries=max_retries, operation_name=operation_name
+    )
+
+
+class ChainInterfaceProvider(BaseProvider):
+    """Web3 provider that forwards every request to a ChainInterface's current RPC."""
+
+    def __init__(self, chain_interface: "ChainInterface"):
+        """Initialize the provider for *chain_interface*."""
+        super().__init__()
+        self._chain_interface = chain_interface
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Send one JSON-RPC request, backing off and rotating on RPC errors."""
+        ci = self._chain_interface
+
+        def send() -> RPCResponse:
+            response = ci.web3.provider.make_request(method, params)
+            error = response.get("error") if isinstance(response, dict) else None
+            if error:
+                # Rate limit / quota / server errors arrive as JSON-RPC error
+                # objects on some RPCs; raise them so with_retry rotates.
+                batch_error = RPCBatchError(error)
+                if ci.is_retryable_batch_error(batch_error):
+                    raise batch_error
+            return response
+
+        return _send_via(
+            ci,
+            method,
+            send,
+            operation_name=f"{method} via provider",
+            max_retries=0 if method in NO_RETRY_METHODS else None,
+        )
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        """Whether the chain's current RPC answers."""
+        return self._chain_interface.check_rpc_health()
+
+
+class ChainInterfaceSession:
+    """Minimal ``requests.Session`` stand-in for raw JSON-RPC batch posts.
+
+    The target URL is ignored: payloads always go to the chain's current RPC
+    over its pooled session, so rotations apply and no extra sockets open.
+    """
+
+    def __init__(self, chain_interface: "ChainInterface"):
+        """Initialize the session for *chain_interface*."""
+        self._chain_interface = chain_interface
+
+    def post(self, url: str, json: Any = None, timeout: Any = None, **kwargs):
+        """POST *json* to the current RPC, backing off and rotating on 429/5xx."""
+        ci = self._chain_interface
+
+        def send():
+            response = ci.session.post(ci.current_rpc, json=json, timeout=timeout, **kwargs)
+            if response.status_code == 429 or response.status_code >= 500:
+                response.raise_for_status()
+            return response
+
+        return _send_via(ci, "batch", send, operation_name="batch request via session")
+
+    def close(self) -> None:
+        """Do nothing: the ChainInterface owns the connection pool."""
@@ -1,8 +1,11 @@
 """RPC rate limiting classes for chain interactions."""
 
+import asyncio
 import threading
 import time
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Any, Dict, NamedTuple, Optional
+
+from web3.contract import Contract
 
 from iwa.core.utils import configure_logger
 
@@ -46,28 +49,53 @@ class RPCRateLimiter:
         deadline = time.monotonic() + timeout
 
         while True:
-            with self._lock:
-                now = time.monotonic()
-
-                if now < self._backoff_until:
-                    wait_time = self._backoff_until - now
-                    if now + wait_time > deadline:
-                        return False
-                else:
-                    elapsed = now - self.last_update
-                    self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
-                    self.last_update = now
-
-                    if self.tokens >= 1.0:
-                        self.tokens -= 1.0
-                        return True
-
-                    wait_time = (1.0 - self.tokens) / self.rate
-                    if now + wait_time > deadline:
-                        return False
-
+            wait_time = self._try_acquire()
+            if wait_time == 0.0:
+                return True
+            if time.monotonic() + wait_time > deadline:
+                return False
             time.sleep(min(wait_time, 0.1))
 
+    def try_acquire(self) -> bool:
+        """Take a token only if one is available right now."""
+        return self._try_acquire() == 0.0
+
+    async def acquire_async(self, timeout: float = 30.0) -> bool:
+        """Acquire a token, yielding to the event loop while waiting."""
+        deadline = time.monotonic() + timeout
+
+        while True:
+            wait_time = self._try_acquire()
+            if wait_time == 0.0:
+                return True
+            if time.monotonic() + wait_time > deadline:
+                return False
+            await asyncio.sleep(min(wait_time, 0.1))
+
+    def _try_acquire(self) -> float:
+        """Take a token if one is available.
+
+        Returns:
+            0.0 if a token was taken, otherwise the seconds to wait before
+            one can be (backoff remaining or time to refill one token).
+
+        """
+        with self._lock:
+            now = time.monotonic()
+
+            if now < self._backoff_until:
+                return self._backoff_until - now
+
+            elapsed = now - self.last_update
+            self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+            self.last_update = now
+
+            if self.tokens >= 1.0:
+                self.tokens -= 1.0
+                return 0.0
+
+            return (1.0 - self.tokens) / self.rate
+
     def trigger_backoff(self, seconds: float = 5.0):
         """Trigger rate limit backoff."""
         with self._lock:
@@ -105,6 +133,14 @@ def get_rate_limiter(chain_name: str, rate: float = None, burst: int = None) ->
         return _rate_limiters[chain_name]
 
 
+class ReadEndpoint(NamedTuple):
+    """An RPC serving multi-endpoint reads, with its own eth module and token bucket."""
+
+    url: str
+    eth: Any
+    rate_limiter: RPCRateLimiter
+
+
 class RateLimitedEth:
     """Wrapper around web3.eth that applies rate limiting transparently."""
 
@@ -119,12 +155,23 @@ class RateLimitedEth:
         "get_transaction_receipt",
         "call",
         "get_logs",
+        "fee_history",
     }
 
     WRITE_METHODS = {
         "send_raw_transaction",
     }
 
+    # Stateless reads that may be served by any healthy RPC. Nonces, gas
+    # estimates and receipts stay on the primary so they see our own writes.
+    FANOUT_METHODS = {
+        "call",
+        "get_balance",
+        "get_code",
+        "get_logs",
+        "get_block",
+    }
+
     # Helper sets for efficient lookup
     RPC_METHODS = READ_METHODS | WRITE_METHODS
 
@@ -171,14 +218,51 @@ class RateLimitedEth:
         "service unavailable",
     )
 
-    def __init__(self, web3_eth, rate_limiter: RPCRateLimiter, chain_interface: "ChainInterface"):
+    # Reads that may be hedged to a second RPC when the active one is slow.
+    # Nonces are excluded: another node may not have seen our pending txs.
+    HEDGE_METHODS = {
+        "call",
+        "get_balance",
+        "get_code",
+        "get_block",
+        "get_transaction",
+        "get_transaction_receipt",
+    }
+
+    def __init__(
+        self,
+        web3_eth,
+        rate_limiter: RPCRateLimiter,
+        chain_interface: "ChainInterface",
+        web3: Optional["RateLimitedWeb3"] = None,
+    ):
         """Initialize RateLimitedEth wrapper."""
         object.__setattr__(self, "_eth", web3_eth)
         object.__setattr__(self, "_rate_limiter", rate_limiter)
         object.__setattr__(self, "_chain_interface", chain_interface)
+        object.__setattr__(self, "_w3", web3)
+
+    def contract(self, address=None, **kwargs):
+        """Build a contract (or contract factory) bound to the rate-limited Web3.
+
+        ``Eth.contract`` would bind it to the raw Web3, so its eth_calls would
+        skip rate limiting, multi-endpoint reads and hedging. Bound to the
+        ``RateLimitedWeb3``, they go through this wrapper like any other read,
+        always against the current provider. Without a wrapping Web3 this
+        falls back to ``Eth.contract``.
+        """
+        if self._w3 is None:
+            return self._eth.contract(address, **kwargs)
+        factory_class = kwargs.pop("ContractFactoryClass", Contract)
+        factory = factory_class.factory(self._w3, **kwargs)
+        return factory(address) if address else factory
 
     def __getattr__(self, name):
         """Get attribute from underlying eth, wrapping RPC methods with rate limiting."""
+        if name == "wait_for_transaction_receipt":
+            # One shared polling loop per chain instead of one per waiting thread
+            return self._chain_interface.receipt_tracker.wait
+
         attr = getattr(self._eth, name)
 
         if name in self.RPC_METHODS and callable(attr):
@@ -214,10 +298,22 @@ class RateLimitedEth:
         """Wrap method with rate limiting, transient retry, and RPC rotation."""
 
         def wrapper(*args, **kwargs):
+            if method_name in self.FANOUT_METHODS:
+                served, result = self._try_read_endpoint(method_name, *args, **kwargs)
+                if served:
+                    return result
+
             if not self._rate_limiter.acquire(timeout=30.0):
                 raise TimeoutError(f"Rate limit timeout for {method_name}")
 
             is_write = method_name in self.WRITE_METHODS
+            if method_name in self.HEDGE_METHODS and self._chain_interface.hedging_enabled:
+                return self._chain_interface.hedged_call(
+                    method_name,
+                    lambda: self._execute_with_retry(method, method_name, *args, **kwargs),
+                    args,
+                    kwargs,
+                )
             return self._execute_with_retry(
                 method, method_name, *args, skip_transient=is_write, **kwargs
             )
@@ -238,17 +334,49 @@ class RateLimitedEth:
         """
         try:
             if skip_transient:
-                return method(*args, **kwargs)
+                return self._timed_call(method, method_name, *args, **kwargs)
             return self._try_transient(method, method_name, *args, **kwargs)
         except Exception as last_error:
             return self._try_rotation(last_error, method_name, *args, **kwargs)
 
+    def _try_read_endpoint(self, method_name, *args, **kwargs):
+        """Serve a read from one of the multi-endpoint read RPCs.
+
+        Returns:
+            ``(True, result)`` when a read endpoint answered, or ``(False, None)``
+            when multi-endpoint reads are off or the endpoint failed with an
+            RPC-level error, so the caller falls back to the primary RPC.
+
+        """
+        endpoint = self._chain_interface.read_endpoint()
+        if endpoint is None:
+            return False, None
+
+        try:
+            method = getattr(endpoint.eth, method_name)
+            return True, self._timed_call(method, method_name, *args, rpc=endpoint.url, **kwargs)
+        except Exception as e:
+            if not self._chain_interface.report_read_failure(endpoint.url, e):
+                raise
+            return False, None
+
+    def _timed_call(self, method, method_name, *args, rpc=None, **kwargs):
+        """Call *method* and feed its latency (and head, for block_number) to RPC health."""
+        if rpc is None:
+            rpc = self._chain_interface.current_rpc
+        start = time.monotonic()
+        result = method(*args, **kwargs)
+        latency_ms = (time.monotonic() - start) * 1000
+        block = result if method_name == "block_number" and isinstance(result, int) else None
+        self._chain_interface.health_tracker.record_success(rpc, latency_ms, block)
+        return result
+
     def _try_transient(self, method, method_name, *args, **kwargs):
         """Phase 1: retry transient (connection-level) errors on same RPC."""
         last_error = None
         for attempt in range(self.DEFAULT_READ_RETRIES + 1):
             try:
-                return method(*args, **kwargs)
+                return self._timed_call(method, method_name, *args, **kwargs)
             except Exception as e:
                 last_error = e
                 if attempt >= self.DEFAULT_READ_RETRIES:
@@ -284,7 +412,7 @@ class RateLimitedEth:
                 # Re-resolve method from updated _eth (new provider after rotation)
                 fresh = getattr(self._eth, method_name)
                 if callable(fresh):
-                    return fresh(*args, **kwargs)
+                    return self._timed_call(fresh, method_name, *args, **kwargs)
                 return fresh  # property (block_number, gas_price)
 
         raise last_error
@@ -319,7 +447,7 @@ class RateLimitedWeb3:
             object.__setattr__(self._eth_wrapper, "_eth", self._web3.eth)
         else:
             self._eth_wrapper = RateLimitedEth(
-                self._web3.eth, self._rate_limiter, self._chain_interface
+                self._web3.eth, self._rate_limiter, self._chain_interface, self
             )
 
     @property
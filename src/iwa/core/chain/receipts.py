@@ -0,0 +1,182 @@
+"""Shared receipt tracker: one polling loop per chain for every waiting caller.
+
+web3's ``wait_for_transaction_receipt`` polls ``eth_getTransactionReceipt``
+in a tight loop per transaction, so N concurrent senders run N polling
+loops. The tracker instead watches the chain head from a single background
+thread and, once per new block, fetches the receipts of every outstanding
+hash in one JSON-RPC batch (or with ``eth_getBlockReceipts`` when many are
+outstanding and the RPC supports it), resolving a future per hash.
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
+
+from hexbytes import HexBytes
+from web3._utils.method_formatters import receipt_formatter
+from web3.datastructures import AttributeDict
+from web3.exceptions import TimeExhausted
+
+from iwa.core.chain.errors import RPCBatchError
+from iwa.core.utils import configure_logger
+
+if TYPE_CHECKING:
+    from iwa.core.chain.interface import ChainInterface
+
+logger = configure_logger()
+
+DEFAULT_RECEIPT_TIMEOUT = 120.0  # Same default as web3's wait_for_transaction_receipt
+
+
+def _normalize_hash(tx_hash: Union[str, bytes]) -> str:
+    return HexBytes(tx_hash).to_0x_hex().lower()
+
+
+class _Waiter:
+    """Future for one transaction hash and the number of callers waiting on it."""
+
+    def __init__(self) -> None:
+        self.future: Future = Future()
+        self.count = 0
+
+
+class ReceiptTracker:
+    """Resolve transaction receipts for all callers from one head-watching thread."""
+
+    POLL_INTERVAL = 1.0  # Seconds between head checks while hashes are outstanding
+    BLOCK_RECEIPTS_MIN_PENDING = 10  # Use eth_getBlockReceipts from this many hashes
+    BLOCK_RECEIPTS_MAX_SPAN = 3  # ...and only when at most this many blocks are new
+
+    def __init__(self, chain_interface: "ChainInterface") -> None:
+        """Initialize an idle tracker for *chain_interface*."""
+        self._chain_interface = chain_interface
+        self._lock = threading.Lock()
+        self._waiters: Dict[str, _Waiter] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._last_head: Optional[int] = None
+        self._recheck = False  # New hashes arrived since the last check
+        self._block_receipts_supported = True
+
+    @property
+    def pending_count(self) -> int:
+        """Number of transaction hashes being waited on."""
+        with self._lock:
+            return len(self._waiters)
+
+    def wait(
+        self,
+        transaction_hash: Union[str, bytes],
+        timeout: float = DEFAULT_RECEIPT_TIMEOUT,
+        poll_latency: Optional[float] = None,
+    ) -> AttributeDict:
+        """Block until the receipt of *transaction_hash* is available.
+
+        Drop-in replacement for ``eth.wait_for_transaction_receipt``;
+        *poll_latency* is accepted for compatibility and ignored.
+
+        Raises:
+            TimeExhausted: If the transaction is not mined within *timeout* seconds.
+
+        """
+        key = _normalize_hash(transaction_hash)
+        with self._lock:
+            waiter = self._waiters.get(key)
+            if waiter is None:
+                waiter = self._waiters[key] = _Waiter()
+                self._recheck = True
+            waiter.count += 1
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=f"receipts-{self._chain_interface.chain.name.lower()}",
+                    daemon=True,
+                )
+                self._thread.start()
+
+        try:
+            return waiter.future.result(timeout=timeout)
+        except FutureTimeoutError:
+            raise TimeExhausted(
+                f"Transaction {key} is not in the chain after {timeout} seconds"
+            ) from None
+        finally:
+            with self._lock:
+                waiter.count -= 1
+                if waiter.count <= 0 and self._waiters.get(key) is waiter:
+                    del self._waiters[key]
+
+    def _run(self) -> None:
+        """Poll the head and check outstanding hashes once per new block."""
+        while True:
+            with self._lock:
+                if not self._waiters:
+                    self._thread = None
+                    return
+                recheck, self._recheck = self._recheck, False
+
+            try:
+                head = self._chain_interface.web3.eth.block_number
+                if recheck or self._last_head is None or head > self._last_head:
+                    self._check(head, recheck)
+                    self._last_head = head
+            except Exception as e:
+                logger.debug(f"[{self._chain_interface.chain.name}] Receipt check failed: {e}")
+
+            time.sleep(self.POLL_INTERVAL)
+
+    def _check(self, head: int, recheck: bool) -> None:
+        """Fetch receipts for every outstanding hash and resolve the mined ones."""
+        with self._lock:
+            hashes = list(self._waiters)
+        if not hashes:
+            return
+
+        receipts = None
+        new_blocks = head - self._last_head if self._last_head is not None else None
+        if (
+            not recheck
+            and self._block_receipts_supported
+            and len(hashes) >= self.BLOCK_RECEIPTS_MIN_PENDING
+            and new_blocks is not None
+            and 0 < new_blocks <= self.BLOCK_RECEIPTS_MAX_SPAN
+        ):
+            receipts = self._block_receipts(range(self._last_head + 1, head + 1))
+        if receipts is None:
+            receipts = self._transaction_receipts(hashes)
+
+        for key, raw in receipts.items():
+            with self._lock:
+                waiter = self._waiters.pop(key, None)
+            if waiter is not None and not waiter.future.done():
+                waiter.future.set_result(AttributeDict.recursive(receipt_formatter(raw)))
+
+    def _transaction_receipts(self, hashes: List[str]) -> Dict[str, dict]:
+        """One batch of eth_getTransactionReceipt for *hashes*."""
+        results = self._chain_interface.batch(
+            [("eth_getTransactionReceipt", [h]) for h in hashes], allow_failure=True
+        )
+        return {h: r for h, r in zip(hashes, results, strict=True) if r}
+
+    def _block_receipts(self, blocks: range) -> Optional[Dict[str, dict]]:
+        """All receipts of *blocks* via eth_getBlockReceipts, or None if unavailable."""
+        try:
+            results = self._chain_interface.batch(
+                [("eth_getBlockReceipts", [hex(n)]) for n in blocks]
+            )
+        except RPCBatchError as e:
+            logger.info(
+                f"[{self._chain_interface.chain.name}] eth_getBlockReceipts unavailable ({e}), "
+                f"fetching receipts by hash"
+            )
+            self._block_receipts_supported = False
+            return None
+
+        if any(block_receipts is None for block_receipts in results):
+            return None  # Node has not indexed the block yet; ask by hash instead
+        receipts: Dict[str, dict] = {}
+        for block_receipts in results:
+            for receipt in block_receipts:
+                receipts[receipt["transactionHash"].lower()] = receipt
+        return receipts
@@ -181,6 +181,8 @@ class ChainlistRPC:
     def __init__(self) -> None:
         """Initialize the ChainlistRPC instance."""
         self._data: List[Dict[str, Any]] = []
+        # url -> (latency_ms, block_number) of the last successful probe
+        self.probe_results: Dict[str, Tuple[float, int]] = {}
 
     def fetch_data(self, force_refresh: bool = False) -> None:
         """Fetches the RPC data from Chainlist with local caching."""
@@ -281,6 +283,9 @@ class ChainlistRPC:
         3. Probe the top candidates in parallel with ``eth_blockNumber``.
         4. Discard RPCs that are stale (block number lagging behind majority).
         5. Return up to *max_results* URLs sorted by latency (fastest first).
+
+        Latency and block height of every successful probe are kept in
+        ``probe_results`` so callers can seed their RPC health scores.
         """
         nodes = self.get_rpcs(chain_id)
         if not nodes:
@@ -294,6 +299,7 @@ class ChainlistRPC:
         results = _probe_candidates(candidates)
         if not results:
             return []
+        self.probe_results.update({url: (latency, block) for url, latency, block in results})
 
         selected = _rank_and_select(results, candidates, chain_id, max_results)
         return selected
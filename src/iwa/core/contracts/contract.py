@@ -8,6 +8,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from eth_abi import decode
 from web3 import Web3
 from web3.contract import Contract
+from web3.contract.contract import ContractFunction
 from web3.exceptions import ContractCustomError
 
 from iwa.core.chain import ChainInterfaces
@@ -59,6 +60,7 @@ class ContractInstance:
         """Initialize contract instance."""
         self.address = EthereumAddress(address)
         self.abi = None
+        self.chain_name = chain_name
         self.chain_interface = ChainInterfaces().get(chain_name)
 
         # Check global cache first
@@ -79,23 +81,31 @@ class ContractInstance:
             # Store in global cache
             _ABI_CACHE[cache_key] = {"abi": self.abi, "selectors": self.error_selectors}
 
-        self._contract_cache = None
+        self._contract_cache: Optional[Contract] = None
+        self._contract_web3: Any = None
+        self._async_contract_cache: Optional[Tuple[Any, Any]] = None  # (AsyncWeb3, AsyncContract)
 
     @property
     def contract(self) -> Contract:
-        """Get contract instance using the current Web3 provider.
-
-        This property ensures that after an RPC rotation, contract calls
-        use the updated provider instead of the original one.
-
-        Note: We use _web3 directly (not the RateLimitedWeb3 wrapper) to ensure
-        the contract is bound to the current provider. The wrapper's set_backend()
-        updates _web3, but contracts created via the wrapper may cache old providers.
+        """Get the contract instance bound to the chain's rate-limited Web3.
+
+        The contract is bound to the RateLimitedWeb3 wrapper rather than its
+        current backend, so its eth_calls are rate limited, may be served by
+        the multi-endpoint read RPCs and are hedged like any other read. After
+        an RPC rotation the wrapper's set_backend() swaps the provider
+        underneath, so the same Contract keeps using the current one and is
+        built only once per wrapper. Building a Contract re-parses the ABI into
+        function/event classes, which is too expensive to repeat on every call.
         """
-        # Always create a fresh contract to use the current Web3 provider
-        # This is necessary because RPC rotation changes the underlying provider
-        # Access _web3 directly to ensure we get the current provider
-        return self.chain_interface.web3._web3.eth.contract(address=self.address, abi=self.abi)
+        web3 = self.chain_interface.web3
+        cached = self._contract_cache
+        if cached is not None and self._contract_web3 is web3:
+            return cached
+
+        contract = web3.eth.contract(address=self.address, abi=self.abi)
+        self._contract_cache = contract
+        self._contract_web3 = web3
+        return contract
 
     def load_error_selectors(self) -> Dict[str, Any]:
         """Load error selectors from the contract ABI."""
@@ -255,6 +265,58 @@ class ContractInstance:
                     )
             raise
 
+    async def call_async(self, method_name: str, *args) -> Any:
+        """Async version of ``call`` for use on the web server's event loop.
+
+        Goes through the chain's AsyncChainInterface, which shares RPC
+        rotation, backoff and rate limiting with the sync path.
+        """
+        async_interface = ChainInterfaces().get_async(self.chain_name)
+
+        async def do_call():
+            # Resolve on each retry so a rotation switches to the new RPC
+            method = getattr(self._async_contract(async_interface.web3).functions, method_name)
+            RPCMonitor().increment(f"{self.name}.{method_name}")
+            return await method(*self._sanitize_for_web3(args)).call()
+
+        try:
+            return await async_interface.with_retry(
+                do_call,
+                operation_name=f"call {method_name} on {self.name}",
+            )
+        except Exception as e:
+            error_data = self._extract_error_data(e)
+            if error_data:
+                decoded = self.decode_error(error_data)
+                if decoded:
+                    error_name, error_msg = decoded
+                    logger.error(
+                        f"Contract call '{method_name}' on {self.name}[{self.address}] "
+                        f"failed: {error_name}: {error_msg}"
+                    )
+            raise
+
+    def _async_contract(self, web3: Any) -> Any:
+        """Get an AsyncContract bound to *web3*, rebuilt only when it changes."""
+        cached = self._async_contract_cache
+        if cached is not None and cached[0] is web3:
+            return cached[1]
+        contract = web3.eth.contract(address=self.address, abi=self.abi)
+        self._async_contract_cache = (web3, contract)
+        return contract
+
+    def get_function(self, method_name: str, *args) -> ContractFunction:
+        """Get the web3 function *method_name* bound to *args* (resolves overloads)."""
+        return getattr(self.contract.functions, method_name)(*self._sanitize_for_web3(args))
+
+    def encode_call(self, method_name: str, *args) -> str:
+        """ABI-encode a call to *method_name* as 0x-prefixed calldata.
+
+        Used to batch calls into a single request (e.g. Multicall3) without
+        sending them.
+        """
+        return self.contract.encode_abi(method_name, args=list(self._sanitize_for_web3(args)))
+
     def _sanitize_for_web3(self, value: Any) -> Any:
         """Convert EthereumAddress subclass to pure str for eth_abi encoding.
 
@@ -4,6 +4,7 @@ from typing import Dict, Optional
 
 from iwa.core.constants import ABI_PATH
 from iwa.core.contracts.contract import ContractInstance
+from iwa.core.contracts.token_registry import TokenRegistry
 from iwa.core.types import EthereumAddress
 
 
@@ -14,13 +15,31 @@ class ERC20Contract(ContractInstance):
     abi_path = ABI_PATH / "erc20.json"
 
     def __init__(self, address: EthereumAddress, chain_name: str = "gnosis"):
-        """Initialize ERC20 contract instance."""
+        """Initialize ERC20 contract instance.
+
+        Immutable metadata (decimals, symbol, name) comes from the persistent
+        TokenRegistry, so only the first construction per token hits the RPC.
+        """
         super().__init__(address, chain_name)
+        self.chain_name = chain_name
+
+        metadata = TokenRegistry().get_or_fetch(self)
+        self.decimals = metadata.decimals
+        self.symbol = metadata.symbol
+        self.name = metadata.name
+
+    @classmethod
+    def without_metadata(cls, address: EthereumAddress, chain_name: str = "gnosis"):
+        """Create an instance without loading metadata (used for batched reads)."""
+        instance = cls.__new__(cls)
+        ContractInstance.__init__(instance, address, chain_name)
+        instance.chain_name = chain_name
+        return instance
 
-        self.decimals = self.call("decimals")
-        self.symbol = self.call("symbol")
-        self.name = self.call("name")
-        self.total_supply = self.call("totalSupply")
+    @property
+    def total_supply(self) -> int:
+        """Total supply (fetched on demand; it changes with mints/burns)."""
+        return self.call("totalSupply")
 
     def allowance_wei(self, owner: EthereumAddress, spender: EthereumAddress) -> int:
         """Allowance"""
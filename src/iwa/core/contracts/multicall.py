@@ -0,0 +1,304 @@
+"""Multicall3 batching for read-only contract calls.
+
+Collects ``ContractInstance`` reads and executes them as a single
+``aggregate3`` eth_call per chunk, so a dashboard refresh that needs a dozen
+view functions costs one RPC request instead of a dozen.
+
+Usage::
+
+    with MulticallBatch("gnosis") as batch:
+        period = batch.add(staking, "livenessPeriod")
+        state = batch.add(staking, "getStakingState", service_id)
+
+    period.value, state.value
+
+Every call is sent with ``allowFailure=True`` unless requested otherwise, so
+one reverting call does not poison the rest of the batch; its handle carries
+the decoded revert reason instead of a value.
+"""
+
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+from eth_utils.abi import get_abi_output_types
+from web3._utils.abi import map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+
+from iwa.core.constants import ABI_PATH
+from iwa.core.contracts.contract import ContractInstance
+from iwa.core.rpc_monitor import RPCMonitor
+from iwa.core.types import EthereumAddress
+from iwa.core.utils import configure_logger
+
+logger = configure_logger()
+
+# Multicall3 is deployed at the same address on every supported chain
+MULTICALL3_ADDRESS = EthereumAddress("0xcA11bde05977b3631167028862bE2a173976CA11")
+
+
+class Multicall3Contract(ContractInstance):
+    """Class to interact with the Multicall3 contract."""
+
+    name = "multicall3"
+    abi_path = ABI_PATH / "multicall3.json"
+
+
+@dataclass
+class MulticallResult:
+    """Outcome of a single call inside a Multicall3 batch."""
+
+    success: bool
+    value: Any = None
+    error: Optional[str] = None
+
+
+class MulticallCall:
+    """Handle for a call queued in a ``MulticallBatch``.
+
+    The result is available after the batch has been executed.
+    """
+
+    def __init__(
+        self,
+        contract: ContractInstance,
+        method_name: str,
+        args: tuple,
+        allow_failure: bool = True,
+    ):
+        """Initialize the call handle."""
+        self.contract = contract
+        self.method_name = method_name
+        self.args = args
+        self.allow_failure = allow_failure
+        self.result: Optional[MulticallResult] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the batch holding this call has been executed."""
+        return self.result is not None
+
+    @property
+    def success(self) -> bool:
+        """Whether the call succeeded (False until executed)."""
+        return self.result is not None and self.result.success
+
+    @property
+    def value(self) -> Any:
+        """Decoded return value.
+
+        Raises:
+            RuntimeError: If the batch was not executed yet.
+            ValueError: If the call reverted.
+
+        """
+        if self.result is None:
+            raise RuntimeError(
+                f"{self.contract.name}.{self.method_name} has not been executed yet"
+            )
+        if not self.result.success:
+            raise ValueError(
+                f"{self.contract.name}.{self.method_name} failed: {self.result.error}"
+            )
+        return self.result.value
+
+    def value_or(self, default: Any) -> Any:
+        """Return the decoded value, or *default* if the call failed."""
+        return self.result.value if self.success else default
+
+
+class MulticallBatch:
+    """Aggregate read-only contract calls into Multicall3 ``aggregate3`` requests.
+
+    Calls from any ``ContractInstance`` subclass on the same chain can be
+    mixed in one batch. Large batches are split into chunks of
+    ``chunk_size`` calls; each chunk is one eth_call that goes through
+    ``ChainInterface.with_retry`` and therefore benefits from rate limiting
+    and RPC rotation.
+
+    If the aggregate call itself cannot be executed (e.g. Multicall3 is not
+    available on a custom RPC), the chunk falls back to individual
+    ``ContractInstance.call`` requests so callers always get results.
+    """
+
+    DEFAULT_CHUNK_SIZE = 100
+
+    def __init__(
+        self,
+        chain_name: str = "gnosis",
+        chunk_size: Optional[int] = None,
+        multicall_address: EthereumAddress = MULTICALL3_ADDRESS,
+    ):
+        """Initialize an empty batch for *chain_name*."""
+        self.chain_name = chain_name
+        self.chunk_size = chunk_size or self.DEFAULT_CHUNK_SIZE
+        self.multicall_address = multicall_address
+        self._calls: List[MulticallCall] = []
+
+    def __len__(self) -> int:
+        """Number of queued calls."""
+        return len(self._calls)
+
+    def __enter__(self) -> "MulticallBatch":
+        """Start collecting calls."""
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Execute pending calls when the block exits cleanly."""
+        if exc_type is None:
+            self.execute()
+
+    def add(
+        self,
+        contract: ContractInstance,
+        method_name: str,
+        *args,
+        allow_failure: bool = True,
+    ) -> MulticallCall:
+        """Queue ``contract.method_name(*args)`` and return its handle."""
+        call = MulticallCall(contract, method_name, args, allow_failure=allow_failure)
+        self._calls.append(call)
+        return call
+
+    def execute(self) -> List[MulticallResult]:
+        """Execute all pending calls and return their results in order.
+
+        Raises:
+            ValueError: If a call queued with ``allow_failure=False`` reverted.
+
+        """
+        pending = [c for c in self._calls if not c.done]
+        for start in range(0, len(pending), self.chunk_size):
+            self._execute_chunk(pending[start : start + self.chunk_size])
+        return self._collect(pending)
+
+    async def execute_async(self) -> List[MulticallResult]:
+        """Async version of ``execute`` using the chain's AsyncChainInterface."""
+        pending = [c for c in self._calls if not c.done]
+        for start in range(0, len(pending), self.chunk_size):
+            await self._execute_chunk_async(pending[start : start + self.chunk_size])
+        return self._collect(pending)
+
+    def _collect(self, pending: List[MulticallCall]) -> List[MulticallResult]:
+        """Check required calls succeeded and return all results in order."""
+        for call in pending:
+            if not call.allow_failure and not call.success:
+                raise ValueError(
+                    f"Multicall '{call.contract.name}.{call.method_name}' failed: "
+                    f"{call.result.error if call.result else 'not executed'}"
+                )
+
+        return [c.result for c in self._calls]
+
+    def _execute_chunk(self, calls: List[MulticallCall]) -> None:
+        """Execute one aggregate3 request and fill in the call results."""
+        if not calls:
+            return
+
+        multicall = Multicall3Contract(self.multicall_address, chain_name=self.chain_name)
+        chain_interface = multicall.chain_interface
+
+        try:
+
+            def do_aggregate():
+                # Encode against the current provider so retries after an RPC
+                # rotation use the new endpoint.
+                call_data = self._encode_calls(calls)
+                RPCMonitor().increment(f"{multicall.name}.aggregate3")
+                return multicall.contract.functions.aggregate3(call_data).call()
+
+            raw_results = chain_interface.with_retry(
+                do_aggregate,
+                operation_name=f"multicall aggregate3 ({len(calls)} calls) on {self.chain_name}",
+            )
+        except Exception as e:
+            logger.warning(
+                f"Multicall3 aggregate3 failed on {self.chain_name}, "
+                f"falling back to {len(calls)} individual calls: {e}"
+            )
+            self._execute_sequential(calls)
+            return
+
+        self._apply_results(calls, raw_results)
+
+    async def _execute_chunk_async(self, calls: List[MulticallCall]) -> None:
+        """Async version of ``_execute_chunk``."""
+        if not calls:
+            return
+
+        multicall = Multicall3Contract(self.multicall_address, chain_name=self.chain_name)
+        try:
+            raw_results = await multicall.call_async(
+                "aggregate3", self._encode_calls(calls)
+            )
+        except Exception as e:
+            logger.warning(
+                f"Multicall3 aggregate3 failed on {self.chain_name}, "
+                f"falling back to {len(calls)} individual calls: {e}"
+            )
+            for call in calls:
+                try:
+                    value = await call.contract.call_async(call.method_name, *call.args)
+                    call.result = MulticallResult(success=True, value=value)
+                except Exception as call_error:
+                    call.result = MulticallResult(success=False, error=str(call_error))
+            return
+
+        self._apply_results(calls, raw_results)
+
+    def _encode_calls(self, calls: List[MulticallCall]) -> list:
+        """Build the aggregate3 ``(target, allowFailure, callData)`` argument."""
+        return [
+            (
+                EthereumAddress(call.contract.address),
+                call.allow_failure,
+                call.contract.encode_call(call.method_name, *call.args),
+            )
+            for call in calls
+        ]
+
+    def _apply_results(self, calls: List[MulticallCall], raw_results: list) -> None:
+        """Decode aggregate3 ``(success, returnData)`` pairs into call results."""
+        for call, (success, return_data) in zip(calls, raw_results, strict=True):
+            if success:
+                try:
+                    call.result = MulticallResult(
+                        success=True, value=self._decode_output(call, return_data)
+                    )
+                except Exception as e:
+                    call.result = MulticallResult(success=False, error=f"decode failed: {e}")
+            else:
+                call.result = MulticallResult(
+                    success=False, error=self._decode_revert(call, return_data)
+                )
+
+    def _execute_sequential(self, calls: List[MulticallCall]) -> None:
+        """Fallback: run each call as its own eth_call."""
+        for call in calls:
+            try:
+                value = call.contract.call(call.method_name, *call.args)
+                call.result = MulticallResult(success=True, value=value)
+            except Exception as e:
+                call.result = MulticallResult(success=False, error=str(e))
+
+    def _decode_output(self, call: MulticallCall, return_data: bytes) -> Any:
+        """Decode raw return data the same way ``ContractFunction.call()`` does."""
+        fn = call.contract.get_function(call.method_name, *call.args)
+        output_types = get_abi_output_types(fn.abi)
+        codec = call.contract.chain_interface.web3.codec
+        decoded = codec.decode(output_types, bytes(return_data))
+        normalized = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, decoded)
+        if len(normalized) == 1:
+            return normalized[0]
+        return normalized
+
+    @staticmethod
+    def _decode_revert(call: MulticallCall, return_data: bytes) -> str:
+        """Turn revert data into a readable message using the contract's errors."""
+        if not return_data:
+            return "reverted"
+        error_hex = "0x" + bytes(return_data).hex()
+        decoded = call.contract.decode_error(error_hex)
+        if decoded:
+            return decoded[1]
+        return f"reverted ({error_hex[:10]})"
+
@@ -0,0 +1,203 @@
+"""Persistent registry of ERC20 token metadata.
+
+Token ``decimals``, ``symbol`` and ``name`` never change once a token is
+deployed, so they are fetched once (in a single Multicall3 batch) and kept in
+``data/cache/token_metadata.json``. ``ERC20Contract`` reads them from here
+instead of issuing three RPCs on every construction.
+"""
+
+import json
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+from iwa.core.constants import CACHE_DIR
+from iwa.core.models import Token, atomic_write
+from iwa.core.types import EthereumAddress
+from iwa.core.utils import configure_logger
+
+if TYPE_CHECKING:
+    from iwa.core.contracts.erc20 import ERC20Contract
+
+logger = configure_logger()
+
+TOKEN_METADATA_PATH = CACHE_DIR / "token_metadata.json"
+
+# Metadata functions read for every token, in batch order
+METADATA_METHODS = ("decimals", "symbol", "name")
+
+
+class TokenRegistry:
+    """Singleton registry mapping (chain, token address) to token metadata.
+
+    Entries are persisted to ``path`` and loaded lazily on first access.
+    Lookups that miss are fetched with one Multicall3 batch per chain; the
+    chain's default tokens (``SupportedChain.tokens``) ride along in the
+    first batch so they never need a request of their own.
+    """
+
+    _instance = None
+    _lock = Lock()
+
+    path: Path
+    _tokens: Dict[str, Dict[str, Token]]
+    _loaded: bool
+    _seeded: set
+
+    def __new__(cls) -> "TokenRegistry":
+        """Ensure singleton instance."""
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(TokenRegistry, cls).__new__(cls)
+                cls._instance.path = TOKEN_METADATA_PATH
+                cls._instance._tokens = {}
+                cls._instance._loaded = False
+                cls._instance._seeded = set()
+        return cls._instance
+
+    def get(self, chain_name: str, address: str) -> Optional[Token]:
+        """Return cached metadata for a token, or None if unknown."""
+        with self._lock:
+            self._ensure_loaded()
+            return self._tokens.get(chain_name.lower(), {}).get(address.lower())
+
+    def set(self, chain_name: str, token: Token) -> None:
+        """Store metadata for a token and persist the registry."""
+        with self._lock:
+            self._ensure_loaded()
+            self._tokens.setdefault(chain_name.lower(), {})[token.address.lower()] = token
+            self._save()
+
+    def get_or_fetch(self, contract: "ERC20Contract") -> Token:
+        """Return metadata for *contract*, fetching it on a cache miss.
+
+        Raises:
+            ValueError: If the token's metadata functions revert (not an ERC20).
+
+        """
+        chain_name = contract.chain_name.lower()
+        cached = self.get(chain_name, contract.address)
+        if cached is not None:
+            return cached
+
+        fetched = self._fetch(chain_name, [contract], seed=self._claim_seed(chain_name))
+        token = fetched.get(contract.address.lower())
+        if token is None:
+            raise ValueError(f"Could not read ERC20 metadata for {contract.address}")
+        return token
+
+    def prefetch(self, chain_name: str, addresses: Iterable[str]) -> Dict[str, Token]:
+        """Ensure metadata for *addresses* is cached, using one batched read.
+
+        Returns:
+            Mapping of lowercase address to Token for every address that
+            could be resolved. Non-ERC20 addresses are silently skipped.
+
+        """
+        from iwa.core.contracts.erc20 import ERC20Contract
+
+        chain_name = chain_name.lower()
+        result: Dict[str, Token] = {}
+        missing: List["ERC20Contract"] = []
+        for address in dict.fromkeys(a for a in addresses if a):
+            cached = self.get(chain_name, address)
+            if cached is not None:
+                result[address.lower()] = cached
+            else:
+                missing.append(ERC20Contract.without_metadata(address, chain_name))
+
+        if missing:
+            fetched = self._fetch(chain_name, missing, seed=self._claim_seed(chain_name))
+            for contract in missing:
+                token = fetched.get(contract.address.lower())
+                if token is not None:
+                    result[contract.address.lower()] = token
+        return result
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (the file on disk is left untouched)."""
+        with self._lock:
+            self._tokens.clear()
+            self._seeded.clear()
+            self._loaded = False
+
+    def _claim_seed(self, chain_name: str) -> bool:
+        """Return True for the one caller that should seed *chain_name*'s default tokens."""
+        with self._lock:
+            if chain_name in self._seeded:
+                return False
+            self._seeded.add(chain_name)
+            return True
+
+    def _fetch(
+        self, chain_name: str, contracts: List["ERC20Contract"], seed: bool = False
+    ) -> Dict[str, Token]:
+        """Read metadata for *contracts* in one Multicall3 batch and store it."""
+        from iwa.core.contracts.erc20 import ERC20Contract
+        from iwa.core.contracts.multicall import MulticallBatch
+
+        contracts = list(contracts)
+        if seed:
+            requested = {c.address.lower() for c in contracts}
+            for address in contracts[0].chain_interface.chain.tokens.values():
+                if address.lower() not in requested and self.get(chain_name, address) is None:
+                    contracts.append(ERC20Contract.without_metadata(address, chain_name))
+
+        batch = MulticallBatch(chain_name)
+        handles = [
+            (contract, [batch.add(contract, method) for method in METADATA_METHODS])
+            for contract in contracts
+        ]
+        batch.execute()
+
+        fetched: Dict[str, Token] = {}
+        with self._lock:
+            self._ensure_loaded()
+            chain_tokens = self._tokens.setdefault(chain_name, {})
+            for contract, (decimals, symbol, name) in handles:
+                if not (decimals.success and symbol.success and name.success):
+                    logger.debug(f"Skipping non-ERC20 metadata for {contract.address}")
+                    continue
+                token = Token(
+                    address=EthereumAddress(contract.address),
+                    decimals=decimals.value,
+                    symbol=symbol.value,
+                    name=name.value,
+                )
+                chain_tokens[contract.address.lower()] = token
+                fetched[contract.address.lower()] = token
+            if fetched:
+                self._save()
+        return fetched
+
+    def _ensure_loaded(self) -> None:
+        """Load the registry file once (caller holds the lock)."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.path.exists():
+            return
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+            for chain_name, tokens in data.items():
+                chain_tokens = self._tokens.setdefault(chain_name, {})
+                for address, entry in tokens.items():
+                    chain_tokens[address] = Token(address=EthereumAddress(address), **entry)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable token metadata cache {self.path}: {e}")
+
+    def _save(self) -> None:
+        """Persist the registry atomically (caller holds the lock)."""
+        data = {
+            chain_name: {
+                address: token.model_dump(mode="json", exclude={"address"})
+                for address, token in tokens.items()
+            }
+            for chain_name, tokens in self._tokens.items()
+        }
+        try:
+            atomic_write(self.path, lambda f: json.dump(data, f), suffix=".json.tmp")
+        except OSError as e:
+            logger.debug(f"Could not persist token metadata cache: {e}")
+
@@ -5,11 +5,15 @@ from datetime import datetime
 
 from loguru import logger
 from peewee import (
+    BooleanField,
     CharField,
+    DateField,
     DateTimeField,
     FloatField,
+    IntegerField,
     Model,
     SqliteDatabase,
+    TextField,
 )
 from playhouse.migrate import SqliteMigrator, migrate
 
@@ -60,6 +64,135 @@ class SentTransaction(BaseModel):
     gas_value_eur = FloatField(null=True)
     tags = CharField(null=True)  # JSON-encoded list of strings
     extra_data = CharField(null=True)  # JSON-encoded dictionary for arbitrary metadata
+    amount_wei_real = FloatField(null=True)  # amount_wei as REAL, for SQL aggregation
+
+    class Meta:
+        """Meta configuration."""
+
+        indexes = (
+            (("chain", "timestamp"), False),
+            (("from_address", "timestamp"), False),
+        )
+
+
+class TransactionTag(BaseModel):
+    """One row per (transaction, tag), mirroring SentTransaction.tags for indexed lookups."""
+
+    tx_hash = CharField(index=True)
+    tag = CharField()
+
+    class Meta:
+        """Meta configuration."""
+
+        table_name = "transaction_tag"
+        indexes = ((("tag", "tx_hash"), True),)
+
+
+class RewardsRollup(BaseModel):
+    """Rewards totals per account and month, materialized from SentTransaction.
+
+    ``account`` is the trader multisig for claims and mech costs, the sender
+    for EURe withdrawals and the called contract for checkpoint gas.
+    Maintained by iwa.core.rewards_rollup.
+    """
+
+    year = IntegerField()
+    month = IntegerField()
+    account = CharField()
+    tag = CharField(null=True)
+    olas = FloatField(default=0.0)
+    eur = FloatField(default=0.0)
+    claims = IntegerField(default=0)
+    price_sum = FloatField(default=0.0)  # Sum and count of claim prices, for averages
+    price_count = IntegerField(default=0)
+    gas_eur = FloatField(default=0.0)
+    eure_withdrawn = FloatField(default=0.0)
+    mech_cost_eur = FloatField(default=0.0)
+
+    class Meta:
+        """Meta configuration."""
+
+        table_name = "rewards_rollup"
+        indexes = ((("year", "month", "account"), True),)
+
+
+class RewardsRollupMonth(BaseModel):
+    """Build state of one month in the rewards rollup."""
+
+    year = IntegerField()
+    month = IntegerField()
+    built = BooleanField(default=False)  # Transaction-derived columns are up to date
+    mech_final = BooleanField(default=False)  # Mech costs use the closed month's average price
+
+    class Meta:
+        """Meta configuration."""
+
+        table_name = "rewards_rollup_month"
+        indexes = ((("year", "month"), True),)
+
+
+class DailyPrice(BaseModel):
+    """Historical daily token price (UTC day), filled by PriceService."""
+
+    token_id = CharField()  # CoinGecko ID
+    currency = CharField()
+    day = DateField()
+    price = FloatField(null=True)  # Rows written by older versions may hold None
+
+    class Meta:
+        """Meta configuration."""
+
+        table_name = "daily_price"
+        indexes = ((("token_id", "currency", "day"), True),)
+
+
+class IndexedLog(BaseModel):
+    """Raw event log stored by the log indexer (iwa.core.log_indexer)."""
+
+    subscription = CharField()  # LogSubscription.key
+    block_number = IntegerField()
+    log_index = IntegerField()
+    tx_hash = CharField()
+    tx_index = IntegerField()
+    block_hash = CharField()
+    address = CharField()
+    topics = TextField()  # JSON-encoded list of 0x-prefixed topics
+    data = TextField()  # 0x-prefixed hex
+
+    class Meta:
+        """Meta configuration."""
+
+        table_name = "indexed_log"
+        indexes = ((("subscription", "block_number", "log_index"), True),)
+
+
+class LogCheckpoint(BaseModel):
+    """Contiguous block range [first_block, last_block] indexed for a subscription."""
+
+    subscription = CharField(primary_key=True)
+    chain = CharField()
+    first_block = IntegerField()
+    last_block = IntegerField()
+    updated_at = DateTimeField(default=datetime.now)
+
+    class Meta:
+        """Meta configuration."""
+
+        table_name = "log_checkpoint"
+
+
+class MonitorCheckpoint(BaseModel):
+    """Last block scanned by an EventMonitor (iwa.core.monitor) for one address set."""
+
+    key = CharField(primary_key=True)  # chain + digest of the watched addresses
+    chain = CharField()
+    last_block = IntegerField()
+    updated_at = DateTimeField(default=datetime.now)
+
+    class Meta:
+        """Meta configuration."""
+
+        table_name = "monitor_checkpoint"
 
 
 def _migration_drop_deprecated_columns(migrator: SqliteMigrator, columns: list[str]) -> None:
@@ -116,6 +249,47 @@ def _migration_add_extra_data_column(migrator: SqliteMigrator, columns: list[str
             logger.warning(f"Migration (extra_data) failed: {e}")
 
 
+def _migration_add_amount_real_column(migrator: SqliteMigrator, columns: list[str]) -> None:
+    """Add the numeric amount column and backfill it from amount_wei."""
+    if "amount_wei_real" not in columns:
+        try:
+            migrate(migrator.add_column("senttransaction", "amount_wei_real", FloatField(null=True)))
+            migrator.database.execute_sql(
+                "UPDATE senttransaction SET amount_wei_real = CAST(amount_wei AS REAL)"
+            )
+        except Exception as e:
+            logger.warning(f"Migration (amount_wei_real) failed: {e}")
+
+
+def _migration_add_query_indexes(migrator: SqliteMigrator, columns: list[str]) -> None:
+    """Create the composite (chain, timestamp) and (from_address, timestamp) indexes."""
+    try:
+        for name, fields in (
+            ("senttransaction_chain_timestamp", "chain, timestamp"),
+            ("senttransaction_from_address_timestamp", "from_address, timestamp"),
+        ):
+            migrator.database.execute_sql(
+                f"CREATE INDEX IF NOT EXISTS {name} ON senttransaction ({fields})"
+            )
+    except Exception as e:
+        logger.warning(f"Migration (indexes) failed: {e}")
+
+
+def _migration_backfill_transaction_tags(migrator: SqliteMigrator, columns: list[str]) -> None:
+    """Populate transaction_tag from the JSON tags column if it is still empty."""
+    try:
+        database = migrator.database
+        if database.execute_sql("SELECT 1 FROM transaction_tag LIMIT 1").fetchone():
+            return
+        database.execute_sql(
+            "INSERT OR IGNORE INTO transaction_tag (tx_hash, tag) "
+            "SELECT s.tx_hash, j.value FROM senttransaction s, json_each(s.tags) j "
+            "WHERE json_valid(s.tags) AND json_type(s.tags) = 'array'"
+        )
+    except Exception as e:
+        logger.warning(f"Migration (transaction_tag backfill) failed: {e}")
+
+
 def run_migrations(columns: list[str]) -> None:
     """Run database migrations."""
     migrator = SqliteMigrator(db)
@@ -126,6 +300,9 @@ def run_migrations(columns: list[str]) -> None:
         _migration_add_pricing_columns,
         _migration_add_tags_column,
         _migration_add_extra_data_column,
+        _migration_add_amount_real_column,
+        _migration_add_query_indexes,
+        _migration_backfill_transaction_tags,
     ]
 
     for migration in migrations:
@@ -136,7 +313,19 @@ def init_db():
     """Initialize the database."""
     if db.is_closed():
         db.connect()
-    db.create_tables([SentTransaction], safe=True)
+    db.create_tables(
+        [
+            SentTransaction,
+            TransactionTag,
+            RewardsRollup,
+            RewardsRollupMonth,
+            DailyPrice,
+            IndexedLog,
+            LogCheckpoint,
+            MonitorCheckpoint,
+        ],
+        safe=True,
+    )
 
     # Simple migration: check if columns exist, if not add them
     try:
@@ -246,6 +435,7 @@ def _prepare_transaction_record(
         "token": final_token,
         "status": "Confirmed",
         "amount_wei": final_amount_wei,
+        "amount_wei_real": float(final_amount_wei or 0),
         "chain": chain,
         "price_eur": final_price_eur
         if final_price_eur is not None
@@ -269,6 +459,14 @@ def _prepare_transaction_record(
     return record
 
 
+def _sync_transaction_tags(tx_hash: str, tags: list) -> None:
+    """Mirror a transaction's tags into the indexed transaction_tag table."""
+    if tags:
+        TransactionTag.insert_many(
+            [{"tx_hash": tx_hash, "tag": tag} for tag in tags]
+        ).on_conflict_ignore().execute()
+
+
 def log_transaction(
     tx_hash,
     from_addr,
@@ -318,6 +516,11 @@ def log_transaction(
             )
 
             SentTransaction.insert(**data).on_conflict_replace().execute()
+            _sync_transaction_tags(data["tx_hash"], merged_tags)
+
+            from iwa.core.rewards_rollup import on_transaction_logged
+
+            on_transaction_logged(data, merged_tags, existing)
 
     except Exception as e:
         logger.error(f"Failed to log transaction: {e}")
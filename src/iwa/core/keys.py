@@ -5,7 +5,6 @@ import fcntl
 import json
 import os
 import sys
-import tempfile
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple, Union
 
@@ -30,8 +29,11 @@ from iwa.core.models import (
     StoredAccount,
     StoredSafeAccount,
     _rotate_backup,
+    atomic_write,
 )
+from iwa.core.rpc_monitor import RPCMonitor
 from iwa.core.secrets import secrets
+from iwa.core.signer_cache import SignerCache
 from iwa.core.utils import (
     configure_logger,
 )
@@ -88,6 +90,7 @@ class EncryptedAccount(StoredAccount, EncryptedData):
         length: int = SCRYPT_LEN,
     ) -> bytes:
         """Derive key"""
+        RPCMonitor().increment("keys.kdf")
         kdf = Scrypt(
             salt=salt,
             length=length,
@@ -166,6 +169,7 @@ class KeyStorage(BaseModel):
     _path: Path = PrivateAttr()  # not stored nor validated
     _password: str = PrivateAttr()
     _pending_mnemonic: Optional[str] = PrivateAttr(default=None)  # Temp storage for display
+    _signer_cache: SignerCache = PrivateAttr(default_factory=SignerCache)
 
     def __init__(self, path: Path = Path(WALLET_PATH), password: Optional[str] = None):
         """Initialize key storage."""
@@ -260,24 +264,12 @@ class KeyStorage(BaseModel):
                 # save_config(). This replaces the inline ad-hoc backup logic.
                 _rotate_backup(self._path, keep=30)
 
-                # Atomic write: temp file + fsync + os.replace to prevent partial writes
-                fd, tmp_path = tempfile.mkstemp(
-                    dir=self._path.parent, prefix=".save_", suffix=".wallet.tmp"
+                # Atomic write: temp file + fsync + os.replace to prevent partial writes.
+                # Use mode='json' to ensure all types (EthereumAddress) are correctly serialized
+                data = self.model_dump(mode="json")
+                atomic_write(
+                    self._path, lambda f: json.dump(data, f, indent=4), suffix=".wallet.tmp"
                 )
-                try:
-                    os.fchmod(fd, 0o600)
-                    with os.fdopen(fd, "w", encoding="utf-8") as f:
-                        # Use mode='json' to ensure all types (EthereumAddress) are correctly serialized
-                        json.dump(self.model_dump(mode="json"), f, indent=4)
-                        f.flush()
-                        os.fsync(f.fileno())  # Force write to disk (critical for Docker volumes)
-                    os.replace(tmp_path, self._path)
-                except BaseException:
-                    try:
-                        os.unlink(tmp_path)
-                    except OSError:
-                        pass
-                    raise
             finally:
                 fcntl.flock(_lock_file, fcntl.LOCK_UN)
 
@@ -291,10 +283,8 @@ class KeyStorage(BaseModel):
     @staticmethod
     def _encrypt_mnemonic(mnemonic: str, password: str) -> dict:
         """Encrypt a mnemonic with AES-GCM using a scrypt-derived key."""
-        password_b = password.encode("utf-8")
         salt = os.urandom(SALT_LEN)
-        kdf = Scrypt(salt=salt, length=SCRYPT_LEN, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P)
-        key = kdf.derive(password_b)
+        key = EncryptedAccount.derive_key(password, salt)
         aesgcm = AESGCM(key)
         nonce = os.urandom(AES_NONCE_LEN)
         ct = aesgcm.encrypt(nonce, mnemonic.encode("utf-8"), None)
@@ -327,8 +317,7 @@ class KeyStorage(BaseModel):
         p = encobj.get("kdf_p", SCRYPT_P)
         length = encobj.get("kdf_len", SCRYPT_LEN)
 
-        kdf = Scrypt(salt=salt, length=length, n=n, r=r, p=p)
-        key = kdf.derive(password.encode("utf-8"))
+        key = EncryptedAccount.derive_key(password, salt, n=n, r=r, p=p, length=length)
         aesgcm = AESGCM(key)
         pt = aesgcm.decrypt(nonce, ct, None)
         return pt.decode("utf-8")
@@ -477,6 +466,7 @@ class KeyStorage(BaseModel):
             return
 
         del self.accounts[account.address]
+        self._signer_cache.discard(account.address)
         self.save()
 
     def rename_account(self, address_or_tag: str, new_tag: str):
@@ -505,7 +495,42 @@ class KeyStorage(BaseModel):
         if isinstance(account, StoredSafeAccount):
             raise ValueError(f"Cannot get private key for Safe account {address}")
 
-        return account.decrypt_private_key(self._password)
+        private_key = self._signer_cache.get(account.address)
+        if private_key is None:
+            private_key = account.decrypt_private_key(self._password)
+            self._signer_cache.put(account.address, private_key)
+        return private_key
+
+    def unlock(
+        self,
+        duration: Optional[float] = None,
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ) -> None:
+        """Keep decrypted keys in memory so signing skips the scrypt KDF.
+
+        Args:
+            duration: Seconds until the wallet locks itself again.
+                None keeps it unlocked until ``lock()`` is called.
+            ttl: How long each decrypted key stays cached, in seconds.
+            max_entries: Maximum number of keys held at once (LRU eviction).
+
+        """
+        self._signer_cache.unlock(duration, ttl=ttl, max_entries=max_entries)
+        logger.info(
+            "[KeyStorage] Signer cache unlocked"
+            + (f" for {duration:.0f}s" if duration is not None else "")
+        )
+
+    def lock(self) -> None:
+        """Wipe all cached decrypted keys and stop caching."""
+        self._signer_cache.lock()
+        logger.info("[KeyStorage] Signer cache locked")
+
+    @property
+    def is_unlocked(self) -> bool:
+        """Whether decrypted keys are currently cached between signatures."""
+        return self._signer_cache.is_unlocked
 
     # NOTE: get_private_key_unsafe() was removed for security reasons.
     # Use sign_transaction(), sign_message(), or get_signer() instead.
@@ -0,0 +1,286 @@
+"""Persistent eth_getLogs indexer with per-subscription checkpoints.
+
+Callers describe what they want with a ``LogSubscription`` (contract
+addresses plus an ``eth_getLogs`` topics filter). The indexer fetches the
+matching logs in adaptively sized block ranges, stores them in the
+``indexed_log`` table and records the contiguous range it has covered in
+``log_checkpoint``, so a block range is only ever fetched once and an
+interrupted backfill resumes where it stopped.
+
+Only blocks at least ``confirmations`` deep are stored, which keeps reorged
+logs out of the store. Queries reaching past that depth get the newer
+blocks fetched live on every call.
+"""
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from hexbytes import HexBytes
+from loguru import logger
+from peewee import chunked
+from web3.datastructures import AttributeDict
+
+from iwa.core.chain.log_ranges import BlockRangeSizer, walk_log_ranges
+from iwa.core.db import IndexedLog, LogCheckpoint
+from iwa.core.types import EthereumAddress
+
+DEFAULT_CONFIRMATIONS = 10  # Blocks behind head before logs are stored
+INSERT_BATCH_SIZE = 100  # Rows per INSERT, well under SQLite's bound-variable limit
+
+
+@dataclass(frozen=True)
+class LogSubscription:
+    """Declarative description of the logs to index.
+
+    ``topics`` is an ``eth_getLogs`` topics filter: one entry per position,
+    each a topic, a tuple of alternatives, or None for "any".
+    """
+
+    name: str
+    addresses: Tuple[str, ...]
+    topics: Tuple[Any, ...] = ()
+    confirmations: int = DEFAULT_CONFIRMATIONS
+
+    @property
+    def key(self) -> str:
+        """Store key: the name plus a digest of the filter, so edits start a fresh index."""
+        spec = json.dumps(
+            [sorted(a.lower() for a in self.addresses), _normalize_topics(self.topics)]
+        )
+        return f"{self.name}-{hashlib.sha256(spec.encode()).hexdigest()[:12]}"
+
+    @property
+    def log_filter(self) -> Dict:
+        """eth_getLogs filter (addresses and topics) without the block range."""
+        params: Dict = {"address": [EthereumAddress(a) for a in self.addresses]}
+        if self.topics:
+            params["topics"] = _normalize_topics(self.topics)
+        return params
+
+
+def _normalize_topics(topics) -> list:
+    def one(topic):
+        return None if topic is None else HexBytes(topic).to_0x_hex().lower()
+
+    return [
+        [one(t) for t in entry] if isinstance(entry, (list, tuple)) else one(entry)
+        for entry in topics
+    ]
+
+
+def _log_to_row(key: str, log) -> Dict:
+    return {
+        "subscription": key,
+        "block_number": int(log["blockNumber"]),
+        "log_index": int(log["logIndex"]),
+        "tx_hash": HexBytes(log["transactionHash"]).to_0x_hex(),
+        "tx_index": int(log["transactionIndex"]),
+        "block_hash": HexBytes(log["blockHash"]).to_0x_hex(),
+        "address": EthereumAddress(log["address"]),
+        "topics": json.dumps([HexBytes(t).to_0x_hex() for t in log["topics"]]),
+        "data": HexBytes(log["data"]).to_0x_hex(),
+    }
+
+
+def _row_to_log(row: IndexedLog) -> AttributeDict:
+    """Rebuild the web3 log shape, so contract events can ``process_log`` it."""
+    return AttributeDict(
+        {
+            "address": row.address,
+            "topics": [HexBytes(t) for t in json.loads(row.topics)],
+            "data": HexBytes(row.data),
+            "blockNumber": row.block_number,
+            "transactionHash": HexBytes(row.tx_hash),
+            "transactionIndex": row.tx_index,
+            "blockHash": HexBytes(row.block_hash),
+            "logIndex": row.log_index,
+            "removed": False,
+        }
+    )
+
+
+class LogIndexer:
+    """Fetches, stores and serves the logs of LogSubscriptions on one chain."""
+
+    def __init__(
+        self,
+        chain_name: str,
+        get_logs: Optional[Callable[[Dict], List]] = None,
+        get_block_number: Optional[Callable[[], int]] = None,
+        sizer: Optional[BlockRangeSizer] = None,
+    ):
+        """Initialize the indexer.
+
+        Args:
+            chain_name: Chain identifier (e.g. "gnosis").
+            get_logs: eth_getLogs implementation. Defaults to the chain's
+                ChainInterface ``get_logs_ranged``, which sizes ranges per RPC.
+            get_block_number: Head block lookup. Defaults to the chain's
+                ChainInterface through with_retry (rotation, backoff).
+            sizer: Block span controller for an injected *get_logs*.
+                Defaults to a fresh BlockRangeSizer.
+
+        """
+        self.chain_name = chain_name
+        self._get_logs = get_logs
+        self._get_block_number = get_block_number or self._chain_block_number
+        self.sizer = sizer or BlockRangeSizer()
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    def _chain_interface(self):
+        from iwa.core.chain import ChainInterfaces
+
+        return ChainInterfaces().get(self.chain_name)
+
+    def _chain_block_number(self) -> int:
+        chain_interface = self._chain_interface()
+        return chain_interface.with_retry(
+            lambda: chain_interface.web3.eth.block_number, operation_name="block_number"
+        )
+
+    def _lock_for(self, key: str) -> threading.Lock:
+        with self._locks_lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def checkpoint(self, subscription: LogSubscription) -> Optional[Tuple[int, int]]:
+        """The (first_block, last_block) range stored for *subscription*, if any."""
+        row = LogCheckpoint.get_or_none(LogCheckpoint.subscription == subscription.key)
+        return (row.first_block, row.last_block) if row else None
+
+    def sync(
+        self,
+        subscription: LogSubscription,
+        from_block: int,
+        to_block: Optional[int] = None,
+        head: Optional[int] = None,
+    ) -> Optional[int]:
+        """Index [from_block, to_block] (capped at the confirmed head) into the store.
+
+        Only the blocks not yet covered by the checkpoint are fetched. Each
+        chunk is committed together with the checkpoint, so an interrupted
+        sync resumes from the last committed chunk.
+
+        Returns:
+            The last confirmed block requested, or None if nothing is confirmed yet.
+
+        """
+        if head is None:
+            head = self._get_block_number()
+        safe_block = head - subscription.confirmations
+        end = safe_block if to_block is None else min(to_block, safe_block)
+        if end < from_block:
+            return None
+
+        with self._lock_for(subscription.key):
+            checkpoint = self.checkpoint(subscription)
+            if checkpoint is None:
+                self._index_range(subscription, from_block, end, descending=False)
+            else:
+                first, last = checkpoint
+                if from_block < first:
+                    self._index_range(subscription, from_block, first - 1, descending=True)
+                if end > last:
+                    self._index_range(subscription, last + 1, end, descending=False)
+        return end
+
+    def get_logs(
+        self,
+        subscription: LogSubscription,
+        from_block: int,
+        to_block: Optional[int] = None,
+    ) -> List[AttributeDict]:
+        """Logs of *subscription* in [from_block, to_block], oldest first.
+
+        Confirmed blocks are served from the store (indexing them first if
+        needed); blocks newer than the confirmation depth are fetched live.
+        """
+        head = self._get_block_number()
+        if to_block is None:
+            to_block = head
+
+        synced_to = self.sync(subscription, from_block, to_block, head=head)
+        logs: List[AttributeDict] = []
+        if synced_to is not None:
+            rows = (
+                IndexedLog.select()
+                .where(
+                    (IndexedLog.subscription == subscription.key)
+                    & (IndexedLog.block_number >= from_block)
+                    & (IndexedLog.block_number <= synced_to)
+                )
+                .order_by(IndexedLog.block_number, IndexedLog.log_index)
+            )
+            logs = [_row_to_log(row) for row in rows]
+
+        live_from = from_block if synced_to is None else synced_to + 1
+        if live_from <= to_block:
+            logs.extend(self._fetch_range(subscription, live_from, to_block))
+        return logs
+
+    def _index_range(
+        self, subscription: LogSubscription, start: int, end: int, descending: bool
+    ) -> None:
+        """Fetch [start, end] into the store, growing the checkpoint after every chunk."""
+        key = subscription.key
+
+        def store(chunk_start: int, chunk_end: int, logs: List) -> None:
+            with IndexedLog._meta.database.atomic():
+                for batch in chunked([_log_to_row(key, log) for log in logs], INSERT_BATCH_SIZE):
+                    IndexedLog.insert_many(batch).on_conflict_ignore().execute()
+                row = LogCheckpoint.get_or_none(LogCheckpoint.subscription == key)
+                if row is None:
+                    LogCheckpoint.create(
+                        subscription=key,
+                        chain=self.chain_name,
+                        first_block=chunk_start,
+                        last_block=chunk_end,
+                    )
+                else:
+                    row.first_block = min(row.first_block, chunk_start)
+                    row.last_block = max(row.last_block, chunk_end)
+                    row.updated_at = datetime.now()
+                    row.save()
+
+        logger.debug(f"[{self.chain_name}] Indexing {subscription.name} logs [{start}-{end}]")
+        self._fetch_range(subscription, start, end, descending=descending, on_chunk=store)
+
+    def _fetch_range(
+        self,
+        subscription: LogSubscription,
+        start: int,
+        end: int,
+        descending: bool = False,
+        on_chunk: Optional[Callable[[int, int, List], None]] = None,
+    ) -> List:
+        """Fetch [start, end] in adaptively sized chunks (see ``walk_log_ranges``)."""
+        if self._get_logs is None:
+            return self._chain_interface().get_logs_ranged(
+                subscription.log_filter, start, end, descending=descending, on_chunk=on_chunk
+            )
+        return walk_log_ranges(
+            lambda: (self.sizer, self._get_logs),
+            subscription.log_filter,
+            start,
+            end,
+            descending=descending,
+            on_chunk=on_chunk,
+            label=f"[{self.chain_name}] ",
+        )
+
+
+# One indexer per chain, shared by every subscriber
+_indexers: Dict[str, LogIndexer] = {}
+_indexers_lock = threading.Lock()
+
+
+def get_log_indexer(chain_name: str) -> LogIndexer:
+    """Get or create the log indexer for a chain."""
+    with _indexers_lock:
+        if chain_name not in _indexers:
+            _indexers[chain_name] = LogIndexer(chain_name)
+        return _indexers[chain_name]
@@ -1,22 +1,23 @@
 """Core models"""
 
+import contextlib
 import json
 import os
 import shutil
 import tempfile
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Type, TypeVar
+from typing import Callable, Dict, List, Optional, TextIO, Tuple, Type, TypeVar
 
 import tomli
 import tomli_w
-from pydantic import BaseModel, Field, PrivateAttr, model_validator
+from pydantic import BaseModel, Field, PositiveFloat, PrivateAttr, model_validator
 from pydantic_core import core_schema
 from ruamel.yaml import YAML
 
 from iwa.core.constants import BACKUP_DIR
 from iwa.core.types import EthereumAddress  # noqa: F401 - re-exported for backwards compatibility
-from iwa.core.utils import singleton
 
 
 def _update_yaml_recursive(target: Dict, source: Dict) -> None:
@@ -149,34 +150,36 @@ def _rotate_backup(path: Path, keep: int = 30) -> None:
     _write_audit_log(path.parent, ts, audit_entry)
 
 
-def _atomic_yaml_write(path: Path, data: dict, ryaml: YAML) -> None:
-    """Write YAML data to path atomically using temp file + rename.
+def atomic_write(path: Path, dump: Callable[[TextIO], None], suffix: str = ".tmp") -> None:
+    """Write a file atomically using temp file + rename.
 
     Ensures no data loss if the process is killed mid-write:
-    - Writes to a temp file in the same directory (same filesystem)
+    - Calls *dump* on a temp file in the same directory (same filesystem)
     - Sets restrictive permissions (0o600) on the temp file
     - Calls fsync to flush data to disk before renaming
     - Uses os.replace for atomic rename
     - Cleans up temp file on any failure
     """
     path.parent.mkdir(parents=True, exist_ok=True)
-    fd, tmp_path = tempfile.mkstemp(
-        dir=path.parent, prefix=".save_", suffix=".yaml.tmp"
-    )
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".save_", suffix=suffix)
     try:
         os.fchmod(fd, 0o600)
         with os.fdopen(fd, "w", encoding="utf-8") as f:
-            ryaml.dump(data, f)
+            dump(f)
             f.flush()
             os.fsync(f.fileno())
         os.replace(tmp_path, path)
     except BaseException:
-        import contextlib
         with contextlib.suppress(OSError):
             os.unlink(tmp_path)
         raise
 
 
+def _atomic_yaml_write(path: Path, data: dict, ryaml: YAML) -> None:
+    """Write YAML data to path atomically (see ``atomic_write``)."""
+    atomic_write(path, lambda f: ryaml.dump(data, f), suffix=".yaml.tmp")
+
+
 class EncryptedData(BaseModel):
     """Encrypted data structure with explicit KDF parameters."""
 
@@ -248,12 +251,50 @@ class CoreConfig(BaseModel):
             self.chainlist_enrichment = False
         return self
 
+    # Multi-endpoint reads: spread stateless reads (eth_call, getBalance, getLogs,
+    # getBlock) over the N best healthy RPCs, each with its own token bucket.
+    # 1 keeps every call on the single active RPC.
+    rpc_read_endpoints: int = Field(
+        default=1, ge=1, description="Number of healthy RPCs that share read-only calls"
+    )
+    rpc_rate_limits: Dict[str, PositiveFloat] = Field(
+        default_factory=dict,
+        description="Requests per second allowed by each RPC host for multi-endpoint reads",
+    )
+
+    # Hedged reads: when a read on the active RPC is slower than this percentile
+    # (0-1) of its recent latency, send it to the next-best RPC as well and use
+    # whichever answers first. 0 disables hedging.
+    rpc_hedge_percentile: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1.0,
+        description="Latency percentile after which reads are hedged (0 = off)",
+    )
+    rpc_hedge_budget: float = Field(
+        default=0.1,
+        ge=0.0,
+        le=1.0,
+        description="Maximum fraction of extra read requests sent as hedges",
+    )
+
     # Safe Transaction Retry System
     safe_tx_max_retries: int = Field(default=15, description="Maximum retries for Safe transactions")
     safe_tx_gas_buffer: float = Field(
         default=1.5, description="Gas buffer multiplier for Safe transactions"
     )
 
+    # Signer cache: keep decrypted keys in memory to skip the scrypt KDF per signature
+    signer_cache_enabled: bool = Field(
+        default=False, description="Cache decrypted private keys between signatures"
+    )
+    signer_cache_ttl: float = Field(
+        default=900.0, description="Seconds a decrypted key stays cached"
+    )
+    signer_cache_max_entries: int = Field(
+        default=32, description="Maximum number of decrypted keys cached at once"
+    )
+
 
 T = TypeVar("T", bound="StorableModel")
 
@@ -398,7 +439,54 @@ class StorableModel(BaseModel):
             raise ValueError(f"Unsupported file extension: {extension}")
 
 
-@singleton
+# Guards creation and reloads of the Config singleton
+_config_lock = threading.RLock()
+
+
+def _config_file_stamp() -> Optional[Tuple[str, int, int]]:
+    """Return (path, mtime_ns, size) of config.yaml, or None if it is missing."""
+    from iwa.core.constants import CONFIG_PATH
+
+    try:
+        stat = CONFIG_PATH.stat()
+    except OSError:
+        return None
+    return (str(CONFIG_PATH), stat.st_mtime_ns, stat.st_size)
+
+
+def _merge_model(current, new):
+    """Copy *new*'s fields into *current* if both are the same model type.
+
+    Keeps the identity of models other code already holds a reference to.
+    """
+    if type(current) is not type(new) or not isinstance(new, BaseModel):
+        return new
+    for field_name in type(new).model_fields:
+        setattr(current, field_name, getattr(new, field_name))
+    return current
+
+
+def _reloading_singleton(cls):
+    """Singleton decorator that refreshes the instance when config.yaml changes.
+
+    Like ``iwa.core.utils.singleton``, but each later call stats the config
+    file and reloads the shared instance in place if its mtime or size
+    differs from the last load or save. An unchanged file costs one stat.
+    """
+    instances = {}
+
+    def get_instance(*args, **kwargs):
+        with _config_lock:
+            if cls not in instances:
+                instances[cls] = cls(*args, **kwargs)
+            else:
+                instances[cls].reload_if_changed()
+            return instances[cls]
+
+    return get_instance
+
+
+@_reloading_singleton
 class Config(StorableModel):
     """Config with auto-loading and plugin support."""
 
@@ -407,6 +495,8 @@ class Config(StorableModel):
 
     _initialized: bool = PrivateAttr(default=False)
     _plugin_models: Dict[str, type] = PrivateAttr(default_factory=dict)
+    _file_stamp: Optional[Tuple[str, int, int]] = PrivateAttr(default=None)
+    _reload_listeners: List[Callable[["Config"], None]] = PrivateAttr(default_factory=list)
 
     def model_post_init(self, __context) -> None:
         """Load config from file after initialization."""
@@ -425,30 +515,22 @@ class Config(StorableModel):
             self.core = CoreConfig()
             CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
             self.save_yaml(CONFIG_PATH)
+            self._file_stamp = _config_file_stamp()
             logger.info(f"Created default config file: {CONFIG_PATH}")
             return
 
         try:
+            # Stamp before reading: a write racing the read triggers a reload later
+            stamp = _config_file_stamp()
             ryaml = YAML()
             with CONFIG_PATH.open("r", encoding="utf-8") as f:
                 data = ryaml.load(f) or {}
 
-            # Load core config
-            if "core" in data:
-                self.core = CoreConfig(**data["core"])
-
-            # Load plugin configs - will be hydrated when plugins register
-            if "plugins" in data:
-                for plugin_name, plugin_data in data["plugins"].items():
-                    # Store raw data until plugin model is registered
-                    if plugin_name in self._plugin_models:
-                        self.plugins[plugin_name] = self._plugin_models[plugin_name](**plugin_data)
-                    else:
-                        # Store as dict temporarily, will hydrate on register
-                        self.plugins[plugin_name] = plugin_data
+            self._apply_file_data(data)
 
             self._path = CONFIG_PATH
             self._storage_format = "yaml"
+            self._file_stamp = stamp
         except Exception as e:
             logger.warning(f"Failed to load config from {CONFIG_PATH}: {e}")
 
@@ -456,6 +538,91 @@ class Config(StorableModel):
         if self.core is None:
             self.core = CoreConfig()
 
+    def _apply_file_data(self, data: dict) -> None:
+        """Hydrate core and plugin configs from parsed YAML data.
+
+        Models that already exist are updated in place rather than replaced.
+        """
+        # Load core config
+        if "core" in data:
+            self.core = _merge_model(self.core, CoreConfig(**data["core"]))
+
+        # Load plugin configs - will be hydrated when plugins register
+        if "plugins" in data:
+            for plugin_name, plugin_data in data["plugins"].items():
+                # Store raw data until plugin model is registered
+                if plugin_name in self._plugin_models:
+                    self.plugins[plugin_name] = _merge_model(
+                        self.plugins.get(plugin_name),
+                        self._plugin_models[plugin_name](**plugin_data),
+                    )
+                else:
+                    # Store as dict temporarily, will hydrate on register
+                    self.plugins[plugin_name] = plugin_data
+
+    def reload_if_changed(self) -> bool:
+        """Reload config.yaml if its mtime or size changed since the last load or save.
+
+        Returns:
+            True if the file was re-read.
+
+        """
+        with _config_lock:
+            stamp = _config_file_stamp()
+            if stamp is None or stamp == self._file_stamp:
+                return False
+            return self.reload()
+
+    def reload(self) -> bool:
+        """Re-read config.yaml into this instance and notify reload listeners.
+
+        Core and plugin models are updated in place, so objects taken from
+        this config earlier (e.g. an ``OlasConfig``) see the new values.
+        A file that fails to parse leaves the current values untouched.
+
+        Returns:
+            True if the file was re-read.
+
+        """
+        from loguru import logger
+
+        from iwa.core.constants import CONFIG_PATH
+
+        with _config_lock:
+            stamp = _config_file_stamp()
+            try:
+                ryaml = YAML()
+                with CONFIG_PATH.open("r", encoding="utf-8") as f:
+                    data = ryaml.load(f) or {}
+                self._apply_file_data(data)
+            except Exception as e:
+                logger.warning(f"Failed to reload config from {CONFIG_PATH}: {e}")
+                # Don't retry a broken file on every access; wait for the next change
+                self._file_stamp = stamp
+                return False
+            self._file_stamp = stamp
+            listeners = list(self._reload_listeners)
+
+        logger.info(f"Reloaded config from {CONFIG_PATH}")
+        for listener in listeners:
+            try:
+                listener(self)
+            except Exception as e:
+                logger.warning(f"Config reload listener {listener!r} failed: {e}")
+        return True
+
+    def add_reload_listener(self, callback: Callable[["Config"], None]) -> None:
+        """Call *callback* with this config after each reload from disk."""
+        with _config_lock:
+            if callback not in self._reload_listeners:
+                self._reload_listeners.append(callback)
+
+    def remove_reload_listener(self, callback: Callable[["Config"], None]) -> None:
+        """Stop notifying *callback* of reloads."""
+        with _config_lock:
+            if callback in self._reload_listeners:
+                self._reload_listeners.remove(callback)
+
     def register_plugin_config(self, plugin_name: str, model_class: type) -> None:
         """Register a plugin's config model class.
 
@@ -567,6 +734,8 @@ class Config(StorableModel):
                 # Rotating timestamped backup before overwriting (30 snapshots kept)
                 _rotate_backup(CONFIG_PATH, keep=30)
                 _atomic_yaml_write(CONFIG_PATH, data, ryaml)
+                # Our own write is not a change that needs reloading
+                self._file_stamp = _config_file_stamp()
             finally:
                 fcntl.flock(_lock_file, fcntl.LOCK_UN)
 
@@ -1,14 +1,24 @@
 """Event Monitor for Iwa TUI"""
 
-import time
-from typing import Any, Callable, Dict, List
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
 
 from iwa.core.chain import ChainInterfaces
+from iwa.core.db import MonitorCheckpoint
 from iwa.core.types import EthereumAddress
 from iwa.core.utils import configure_logger
 
 logger = configure_logger()
 
+CATCHUP_WINDOW = 500  # Blocks scanned (and checkpointed) per step while catching up
+MAX_CATCHUP_BLOCKS = 50_000  # Older gaps are skipped with a warning (~3 days on Gnosis)
+BLOCK_BATCH_SIZE = 50  # Full blocks per eth_getBlockByNumber batch request
+SCAN_WORKERS = 4  # Concurrent block batches / log queries per monitor
+HEAD_WAIT_TIMEOUT = 5.0  # Max seconds between checks of the running flag
+TRANSFER_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+
 
 class EventMonitor:
     """Monitors chain for events affecting specific addresses."""
@@ -16,14 +26,29 @@ class EventMonitor:
     def __init__(
         self, addresses: List[str], callback: Callable, chain_name: str = "gnosis"
     ) -> None:
-        """Initialize events monitor."""
+        """Initialize events monitor.
+
+        Resumes from the block persisted for this chain and address set, so
+        transfers made while the app was closed are reported on restart.
+        """
         self.chain_name = chain_name
         self.addresses = [EthereumAddress(addr) for addr in addresses]
         self.callback = callback
         self.chain_interface = ChainInterfaces().get(chain_name)
         self.web3 = self.chain_interface.web3
         self.running = False
-        if self.chain_interface.current_rpc:
+        self.lag_blocks = 0  # Blocks between the chain head and the last scanned block
+        self._pool = ThreadPoolExecutor(
+            max_workers=SCAN_WORKERS, thread_name_prefix=f"monitor-{chain_name}"
+        )
+
+        digest = hashlib.sha256(",".join(sorted(a.lower() for a in self.addresses)).encode())
+        self.checkpoint_key = f"{chain_name}-{digest.hexdigest()[:12]}"
+
+        saved = self._load_checkpoint()
+        if saved is not None:
+            self.last_checked_block = saved
+        elif self.chain_interface.current_rpc:
             try:
                 self.last_checked_block = self.web3.eth.block_number
             except Exception:
@@ -47,41 +72,64 @@ class EventMonitor:
 
         logger.info(f"Monitoring addresses: {self.addresses}")
 
+        # Woken by the chain's shared head tracker instead of polling on a timer
+        head_tracker = self.chain_interface.head_tracker
+        seen_head = None
         while self.running:
+            head = head_tracker.wait_for_new_head(seen_head, timeout=HEAD_WAIT_TIMEOUT)
+            if head is None or not self.running:
+                continue
+            seen_head = head
             try:
-                self.check_activity()
+                self.check_activity(head)
             except Exception as e:
                 logger.error(f"Error in EventMonitor: {e}")
 
-            time.sleep(6)
-
     def stop(self):
         """Stop monitoring."""
         self.running = False
+        self._pool.shutdown(wait=False, cancel_futures=True)
 
-    def check_activity(self):
-        """Check for new blocks and logs."""
-        try:
-            latest_block = self.web3.eth.block_number
-        except Exception as e:
-            logger.error(f"Failed to get block number: {e}")
-            return
+    def check_activity(self, latest_block: Optional[int] = None):
+        """Scan every block since the last check, in checkpointed windows.
+
+        Args:
+            latest_block: Current head when already known (e.g. from the head
+                tracker); fetched from the RPC otherwise.
+
+        """
+        if latest_block is None:
+            try:
+                latest_block = self.web3.eth.block_number
+            except Exception as e:
+                logger.error(f"Failed to get block number: {e}")
+                return
 
+        self.lag_blocks = max(0, latest_block - self.last_checked_block)
         if not self._should_check(latest_block):
             return
 
         logger.info(f"New block detected: {latest_block} (Last: {self.last_checked_block})")
 
         from_block, to_block = self._get_block_range(latest_block)
-
-        found_txs = []
-        found_txs.extend(self._check_native_transfers(from_block, to_block))
-        found_txs.extend(self._check_erc20_transfers(from_block, to_block))
-
-        self.last_checked_block = to_block
-
-        if found_txs:
-            self.callback(found_txs)
+        while from_block <= to_block:
+            window_end = min(to_block, from_block + CATCHUP_WINDOW - 1)
+            try:
+                found_txs = self._scan(from_block, window_end)
+            except Exception as e:
+                # Keep the checkpoint: the window is retried on the next check
+                logger.warning(f"Failed to scan blocks {from_block}-{window_end}: {e}")
+                return
+
+            self._advance(window_end)
+            self.lag_blocks = latest_block - window_end
+            if self.lag_blocks:
+                logger.info(
+                    f"[{self.chain_name}] Monitor catching up: {self.lag_blocks} blocks behind"
+                )
+            if found_txs:
+                self.callback(found_txs)
+            from_block = window_end + 1
 
     def _should_check(self, latest_block: int) -> bool:
         return latest_block > self.last_checked_block
@@ -90,44 +138,97 @@ class EventMonitor:
         from_block = self.last_checked_block + 1
         to_block = latest_block
 
-        if to_block - from_block > 100:
-            from_block = to_block - 100
+        if to_block - from_block >= MAX_CATCHUP_BLOCKS:
+            skipped_to = to_block - MAX_CATCHUP_BLOCKS
+            logger.warning(
+                f"[{self.chain_name}] Monitor is {to_block - from_block + 1} blocks behind; "
+                f"skipping blocks {from_block}-{skipped_to}"
+            )
+            from_block = skipped_to + 1
         return from_block, to_block
 
+    def _load_checkpoint(self) -> Optional[int]:
+        try:
+            row = MonitorCheckpoint.get_or_none(MonitorCheckpoint.key == self.checkpoint_key)
+        except Exception as e:
+            logger.warning(f"Failed to load monitor checkpoint: {e}")
+            return None
+        return row.last_block if row else None
+
+    def _advance(self, block: int) -> None:
+        """Mark blocks up to *block* as scanned and persist it."""
+        self.last_checked_block = block
+        try:
+            MonitorCheckpoint.insert(
+                key=self.checkpoint_key,
+                chain=self.chain_name,
+                last_block=block,
+                updated_at=datetime.now(),
+            ).on_conflict_replace().execute()
+        except Exception as e:
+            logger.warning(f"Failed to save monitor checkpoint: {e}")
+
+    def _scan(self, from_block: int, to_block: int) -> List[Dict[str, Any]]:
+        """Find native and ERC-20 transfers in [from_block, to_block].
+
+        The Transfer log queries and the block batches run concurrently on
+        the monitor's worker pool. Any failure raises, so no block is skipped.
+        """
+        erc20_future = self._pool.submit(self._check_erc20_transfers, from_block, to_block)
+        found_txs = self._check_native_transfers(from_block, to_block)
+        found_txs.extend(erc20_future.result())
+        return found_txs
+
+    def _fetch_blocks(self, block_nums: List[int]) -> List:
+        """Full blocks for *block_nums*, fetched as concurrent batch requests."""
+        batches = [
+            block_nums[i : i + BLOCK_BATCH_SIZE]
+            for i in range(0, len(block_nums), BLOCK_BATCH_SIZE)
+        ]
+        futures = [self._pool.submit(self._fetch_block_batch, batch) for batch in batches]
+        return [block for future in futures for block in future.result()]
+
+    def _fetch_block_batch(self, block_nums: List[int]) -> List:
+        blocks = self.chain_interface.get_blocks(block_nums, full_transactions=True)
+        # Items a batch failed to serve are fetched one by one rather than skipped
+        return [
+            block if block is not None else self.web3.eth.get_block(n, full_transactions=True)
+            for n, block in zip(block_nums, blocks, strict=True)
+        ]
+
     def _check_native_transfers(self, from_block: int, to_block: int) -> List[Dict[str, Any]]:
         found_txs = []
         my_addrs = set(a.lower() for a in self.addresses)
 
-        for block_num in range(from_block, to_block + 1):
-            try:
-                block = self.web3.eth.get_block(block_num, full_transactions=True)
-                for tx in block.transactions:
-                    # Handle case where RPC returns hash despite full_transactions=True
-                    if isinstance(tx, (str, bytes)):
-                        logger.debug(f"Got tx hash {tx}, fetching details...")
-                        tx = self.web3.eth.get_transaction(tx)
-
-                    # Normalize tx addresses to lower, handling None for contract creation
-                    tx_from = tx.get("from", "").lower() if tx.get("from") else None
-                    tx_to = tx.get("to", "").lower() if tx.get("to") else None
-
-                    if (tx_from and tx_from in my_addrs) or (tx_to and tx_to in my_addrs):
-                        logger.info(
-                            f"Native activity detected in block {block_num} tx {tx['hash'].hex()}"
-                        )
-                        found_txs.append(
-                            {
-                                "hash": tx["hash"].hex(),
-                                "from": EthereumAddress(tx_from) if tx_from else None,
-                                "to": EthereumAddress(tx_to) if tx_to else None,
-                                "value": tx.get("value", 0),
-                                "token": "NATIVE",
-                                "timestamp": block.timestamp,
-                                "chain": self.chain_name,
-                            }
-                        )
-            except Exception as e:
-                logger.warning(f"Failed to fetch/process block {block_num}: {e}")
+        block_nums = list(range(from_block, to_block + 1))
+        blocks = self._fetch_blocks(block_nums)
+
+        for block_num, block in zip(block_nums, blocks, strict=True):
+            for tx in block.transactions:
+                # Handle case where RPC returns hash despite full_transactions=True
+                if isinstance(tx, (str, bytes)):
+                    logger.debug(f"Got tx hash {tx}, fetching details...")
+                    tx = self.web3.eth.get_transaction(tx)
+
+                # Normalize tx addresses to lower, handling None for contract creation
+                tx_from = tx.get("from", "").lower() if tx.get("from") else None
+                tx_to = tx.get("to", "").lower() if tx.get("to") else None
+
+                if (tx_from and tx_from in my_addrs) or (tx_to and tx_to in my_addrs):
+                    logger.info(
+                        f"Native activity detected in block {block_num} tx {tx['hash'].hex()}"
+                    )
+                    found_txs.append(
+                        {
+                            "hash": tx["hash"].hex(),
+                            "from": EthereumAddress(tx_from) if tx_from else None,
+                            "to": EthereumAddress(tx_to) if tx_to else None,
+                            "value": tx.get("value", 0),
+                            "token": "NATIVE",
+                            "timestamp": block.timestamp,
+                            "chain": self.chain_name,
+                        }
+                    )
 
         return found_txs
 
@@ -135,73 +236,60 @@ class EventMonitor:
         found_txs = []
         my_addrs = set(a.lower() for a in self.addresses)
 
-        transfer_topic = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
         padded_addresses = [
             "0x000000000000000000000000" + addr.lower().replace("0x", "") for addr in self.addresses
         ]
 
-        try:
-            # Efficiently Query 1: Transfers FROM our addresses (Topic 1)
-            logs_sent = self.web3.eth.get_logs(
-                {
-                    "fromBlock": from_block,
-                    "toBlock": to_block,
-                    "topics": [transfer_topic, padded_addresses],
-                }
-            )
-
-            # Efficiently Query 2: Transfers TO our addresses (Topic 2)
-            logs_received = self.web3.eth.get_logs(
-                {
-                    "fromBlock": from_block,
-                    "toBlock": to_block,
-                    "topics": [transfer_topic, None, padded_addresses],
-                }
-            )
-
-            all_logs = logs_sent + logs_received
-
-            for log in all_logs:
-                if len(log["topics"]) < 3:
-                    continue
-                # topic[1] is from, topic[2] is to. (32 bytes)
-                t_from = "0x" + log["topics"][1].hex()[-40:]
-                t_to = "0x" + log["topics"][2].hex()[-40:]
-
-                # Check for uniqueness? Hash is unique key in UI anyway.
-
-                # Double check (though RPC filter should have ensured it)
-                t_from_lower = t_from.lower()
-                t_to_lower = t_to.lower()
-
-                is_related = False
-                for my_addr in my_addrs:
-                    if my_addr in t_from_lower or my_addr in t_to_lower:
-                        is_related = True
-                        break
+        # Efficiently Query 1: Transfers FROM our addresses (Topic 1)
+        logs_sent = self.chain_interface.get_logs_ranged(
+            {"topics": [TRANSFER_TOPIC, padded_addresses]}, from_block, to_block
+        )
 
-                if is_related:
-                    found_txs.append(
-                        {
-                            "hash": log["transactionHash"].hex(),
-                            "from": EthereumAddress(t_from),
-                            "to": EthereumAddress(t_to),
-                            "value": int(
-                                log["data"].hex()
-                                if isinstance(log["data"], bytes)
-                                else log["data"],
-                                16,
-                            )
-                            if log.get("data")
-                            else 0,
-                            "token": "TOKEN",
-                            "contract_address": log["address"],
-                            "timestamp": 0,  # Would require block fetch
-                            "chain": self.chain_name,
-                        }
-                    )
+        # Efficiently Query 2: Transfers TO our addresses (Topic 2)
+        logs_received = self.chain_interface.get_logs_ranged(
+            {"topics": [TRANSFER_TOPIC, None, padded_addresses]}, from_block, to_block
+        )
 
-        except Exception as e:
-            logger.warning(f"Failed to fetch logs: {e}")
+        all_logs = logs_sent + logs_received
+
+        for log in all_logs:
+            if len(log["topics"]) < 3:
+                continue
+            # topic[1] is from, topic[2] is to. (32 bytes)
+            t_from = "0x" + log["topics"][1].hex()[-40:]
+            t_to = "0x" + log["topics"][2].hex()[-40:]
+
+            # Check for uniqueness? Hash is unique key in UI anyway.
+
+            # Double check (though RPC filter should have ensured it)
+            t_from_lower = t_from.lower()
+            t_to_lower = t_to.lower()
+
+            is_related = False
+            for my_addr in my_addrs:
+                if my_addr in t_from_lower or my_addr in t_to_lower:
+                    is_related = True
+                    break
+
+            if is_related:
+                found_txs.append(
+                    {
+                        "hash": log["transactionHash"].hex(),
+                        "from": EthereumAddress(t_from),
+                        "to": EthereumAddress(t_to),
+                        "value": int(
+                            log["data"].hex()
+                            if isinstance(log["data"], bytes)
+                            else log["data"],
+                            16,
+                        )
+                        if log.get("data")
+                        else 0,
+                        "token": "TOKEN",
+                        "contract_address": log["address"],
+                        "timestamp": 0,  # Would require block fetch
+                        "chain": self.chain_name,
+                    }
+                )
 
         return found_txs
@@ -1,8 +1,8 @@
 """Pricing service module."""
 
 import time
-from datetime import datetime, timedelta
-from typing import Dict, Optional
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional
 
 from loguru import logger
 
@@ -14,6 +14,9 @@ _PRICE_CACHE: Dict[str, Dict] = {}
 _CACHE_TTL = timedelta(minutes=30)
 _NEGATIVE_CACHE_TTL = timedelta(minutes=5)
 
+# Daily prices of days that are not settled yet (never persisted), same TTLs
+_RECENT_DAY_CACHE: Dict[str, Dict] = {}
+
 
 class PriceService:
     """Service to fetch token prices from CoinGecko."""
@@ -61,12 +64,25 @@ class PriceService:
 
     def _fetch_price_from_api(self, token_id: str, vs_currency: str) -> Optional[float]:
         """Fetch price from API with retries and key fallback."""
+        data = self._get_json(
+            "/simple/price", {"ids": token_id, "vs_currencies": vs_currency}, token_id
+        )
+        if data is None:
+            return None
+
+        if token_id in data and vs_currency in data[token_id]:
+            return float(data[token_id][vs_currency])
+
+        # If we got response but price not found, it's likely a wrong ID
+        logger.debug(f"Price for {token_id} in {vs_currency} not found in response: {data}")
+        return None
+
+    def _get_json(self, path: str, params: dict, token_id: str) -> Optional[dict]:
+        """GET a CoinGecko endpoint with retries, 429 backoff and API key fallback."""
         max_retries = 2
         for attempt in range(max_retries + 1):
             try:
-                base_url = self.BASE_URL
-                url = f"{base_url}/simple/price"
-                params = {"ids": token_id, "vs_currencies": vs_currency}
+                url = f"{self.BASE_URL}{path}"
                 headers = {}
                 if self.api_key:
                     headers["x-cg-demo-api-key"] = self.api_key
@@ -78,8 +94,6 @@ class PriceService:
                     logger.warning("CoinGecko API key invalid (401). Retrying without key...")
                     self.api_key = None
                     headers.pop("x-cg-demo-api-key", None)
-                    # Re-run with base URL
-                    url = f"{self.BASE_URL}/simple/price"
                     response = self.session.get(url, params=params, headers=headers, timeout=10)
 
                 if response.status_code == 429:
@@ -93,14 +107,7 @@ class PriceService:
                     return None
 
                 response.raise_for_status()
-                data = response.json()
-
-                if token_id in data and vs_currency in data[token_id]:
-                    return float(data[token_id][vs_currency])
-
-                # If we got response but price not found, it's likely a wrong ID
-                logger.debug(f"Price for {token_id} in {vs_currency} not found in response: {data}")
-                return None
+                return response.json()
 
             except Exception as e:
                 # Only log error on last attempt to avoid spamming
@@ -110,3 +117,228 @@ class PriceService:
                     time.sleep(1)
                     continue
         return None
+
+    def get_price_at(
+        self, token_id: str, day: date, vs_currency: str = "eur"
+    ) -> Optional[float]:
+        """Get the price of a token on a given (UTC) day.
+
+        Closed days are read from the daily price store, which is filled
+        from CoinGecko once. Today (or later) uses the spot price, falling
+        back to the most recent stored day if the spot request fails.
+
+        Args:
+            token_id: CoinGecko token ID.
+            day: Day to price.
+            vs_currency: Target currency (default 'eur').
+
+        Returns:
+            Price as float, or None if unavailable.
+
+        """
+        if day >= _utc_today():
+            price = self.get_token_price(token_id, vs_currency)
+            if price is None:
+                price = _latest_stored_price(token_id, vs_currency)
+            return price
+        return self.get_prices(token_id, day, day + timedelta(days=1), vs_currency).get(day)
+
+    def get_avg_price(
+        self, token_id: str, start: date, end: date, vs_currency: str = "eur"
+    ) -> Optional[float]:
+        """Get the average daily price over [start, end).
+
+        Only closed days are averaged. A range with no closed day (e.g. one
+        starting today) uses the spot price instead.
+        """
+        prices = list(self.get_prices(token_id, start, end, vs_currency).values())
+        if prices:
+            return sum(prices) / len(prices)
+        return self.get_price_at(token_id, start, vs_currency)
+
+    def get_prices(
+        self, token_id: str, start: date, end: date, vs_currency: str = "eur"
+    ) -> Dict[date, float]:
+        """Get daily prices for the closed days in [start, end).
+
+        Days missing from the store are fetched with one range request. Only
+        settled days (see ``_is_settled``) with real data points are
+        persisted, so each of those is fetched at most once. Days that are
+        not settled yet are kept in memory for ``_CACHE_TTL`` instead. Gaps
+        in the returned mapping are filled with the previous day's price,
+        but those guesses are never stored.
+        """
+        end = min(end, _utc_today())
+        if start >= end:
+            return {}
+
+        stored = _stored_prices(token_id, vs_currency, start, end)
+        recent = _recent_day_prices(token_id, vs_currency, start, end)
+        missing = [day for day in _days(start, end) if day not in stored and day not in recent]
+        prices = {**stored, **recent}
+        if missing:
+            fetched = self._fetch_range_from_api(
+                token_id, vs_currency, missing[0], missing[-1] + timedelta(days=1)
+            )
+            if fetched is not None:
+                self.store_prices(
+                    token_id,
+                    vs_currency,
+                    {day: price for day, price in fetched.items() if _is_settled(day)},
+                )
+                known = {day: price for day, price in prices.items() if price is not None}
+                filled = _fill_gaps(missing, fetched, known)
+                prices.update(filled)
+            else:
+                filled = dict.fromkeys(missing)
+            _cache_recent_day_prices(token_id, vs_currency, filled)
+
+        return {day: price for day, price in sorted(prices.items()) if price is not None}
+
+    def store_prices(self, token_id: str, vs_currency: str, prices: Dict[date, float]) -> None:
+        """Persist daily prices."""
+        from iwa.core.db import DailyPrice
+
+        rows = [
+            {"token_id": token_id, "currency": vs_currency, "day": day, "price": price}
+            for day, price in prices.items()
+        ]
+        if not rows:
+            return
+        try:
+            with DailyPrice._meta.database.atomic():
+                for start in range(0, len(rows), 100):
+                    DailyPrice.insert_many(rows[start : start + 100]).on_conflict_replace().execute()
+        except Exception as e:
+            logger.warning(f"Failed to store daily prices for {token_id}: {e}")
+
+    def _fetch_range_from_api(
+        self, token_id: str, vs_currency: str, start: date, end: date
+    ) -> Optional[Dict[date, float]]:
+        """Fetch daily prices for [start, end) from market_chart/range.
+
+        CoinGecko returns several points per day for short ranges; they are
+        averaged per UTC day. Returns None if the request failed.
+        """
+        data = self._get_json(
+            f"/coins/{token_id}/market_chart/range",
+            {
+                "vs_currency": vs_currency,
+                "from": int(_utc_midnight(start).timestamp()),
+                "to": int(_utc_midnight(end).timestamp()),
+            },
+            token_id,
+        )
+        if data is None:
+            return None
+
+        points: Dict[date, list] = {}
+        for ts_ms, price in data.get("prices", []):
+            day = datetime.fromtimestamp(ts_ms / 1000, tz=timezone.utc).date()
+            if start <= day < end:
+                points.setdefault(day, []).append(float(price))
+        return {day: sum(values) / len(values) for day, values in points.items()}
+
+
+def _utc_today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+def _is_settled(day: date) -> bool:
+    """Whether *day*'s price is final: the day has ended and the source had a day to publish it."""
+    return day < _utc_today() - timedelta(days=1)
+
+
+def _utc_midnight(day: date) -> datetime:
+    return datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+
+
+def _days(start: date, end: date) -> List[date]:
+    return [start + timedelta(days=i) for i in range((end - start).days)]
+
+
+def _stored_prices(token_id: str, vs_currency: str, start: date, end: date) -> Dict[date, float]:
+    """Read stored daily prices for [start, end)."""
+    from iwa.core.db import DailyPrice
+
+    try:
+        query = DailyPrice.select(DailyPrice.day, DailyPrice.price).where(
+            (DailyPrice.token_id == token_id)
+            & (DailyPrice.currency == vs_currency)
+            & (DailyPrice.day >= start)
+            & (DailyPrice.day < end)
+            & DailyPrice.price.is_null(False)
+        )
+        return {row.day: row.price for row in query}
+    except Exception as e:
+        logger.warning(f"Failed to read stored prices for {token_id}: {e}")
+        return {}
+
+
+def _recent_day_prices(
+    token_id: str, vs_currency: str, start: date, end: date
+) -> Dict[date, Optional[float]]:
+    """Cached prices of unsettled days in [start, end) that are still fresh."""
+    now = datetime.now()
+    prices: Dict[date, Optional[float]] = {}
+    for day in _days(start, end):
+        entry = _RECENT_DAY_CACHE.get(f"{token_id}_{vs_currency}_{day.isoformat()}")
+        if entry is None:
+            continue
+        ttl = _CACHE_TTL if entry["price"] is not None else _NEGATIVE_CACHE_TTL
+        if now - entry["timestamp"] < ttl:
+            prices[day] = entry["price"]
+    return prices
+
+
+def _cache_recent_day_prices(
+    token_id: str, vs_currency: str, prices: Dict[date, Optional[float]]
+) -> None:
+    """Remember the prices of unsettled days (None if unavailable) in memory."""
+    now = datetime.now()
+    for day, price in prices.items():
+        if not _is_settled(day):
+            _RECENT_DAY_CACHE[f"{token_id}_{vs_currency}_{day.isoformat()}"] = {
+                "price": price,
+                "timestamp": now,
+            }
+
+
+def _latest_stored_price(token_id: str, vs_currency: str) -> Optional[float]:
+    """Most recent stored daily price, if any."""
+    from iwa.core.db import DailyPrice
+
+    try:
+        row = (
+            DailyPrice.select(DailyPrice.price)
+            .where(
+                (DailyPrice.token_id == token_id)
+                & (DailyPrice.currency == vs_currency)
+                & DailyPrice.price.is_null(False)
+            )
+            .order_by(DailyPrice.day.desc())
+            .first()
+        )
+        return row.price if row else None
+    except Exception:
+        return None
+
+
+def _fill_gaps(
+    missing: List[date],
+    fetched: Dict[date, float],
+    stored: Dict[date, float],
+) -> Dict[date, Optional[float]]:
+    """Resolve prices for *missing* days, carrying the previous day's price over gaps.
+
+    Days before the first known price stay None.
+    """
+    known = {**stored, **fetched}
+    wanted = set(missing)
+    filled: Dict[date, Optional[float]] = {}
+    previous: Optional[float] = None
+    for day in _days(min([*known, missing[0]]), missing[-1] + timedelta(days=1)):
+        previous = known.get(day, previous)
+        if day in wanted:
+            filled[day] = previous
+    return filled
@@ -0,0 +1,277 @@
+"""Monthly rewards rollup: per-account totals materialized from SentTransaction.
+
+Rewards reports read months from the ``rewards_rollup`` table instead of
+re-aggregating raw transactions on every request. A month is built from
+SentTransaction the first time it is read, then kept current by
+``log_transaction`` re-aggregating the month of every claim, checkpoint or
+EURe transfer it records. Mech costs depend on config and prices rather
+than on logged transactions, so callers store them with ``set_mech_costs``
+and only the current (still open) month is ever recomputed.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from loguru import logger
+from peewee import fn
+
+from iwa.core.db import (
+    RewardsRollup,
+    RewardsRollupMonth,
+    SentTransaction,
+    TransactionTag,
+)
+
+CLAIM_TAG = "olas_claim_rewards"
+CHECKPOINT_TAG = "olas_call_checkpoint"
+
+# EURe token field values: symbol, bridged contract, Monerium native contract (lowercase)
+EURE_TOKENS = (
+    "eure",
+    "0xcB444e90D8198415266c6a2724b7900fb12FC56E".lower(),
+    "0x420CA0f9B9b604cE0fd9C18EF134C705e5Fa3430".lower(),
+)
+
+# Columns rebuilt from SentTransaction (mech_cost_eur is owned by set_mech_costs)
+_TX_COLUMNS = (
+    "olas",
+    "eur",
+    "claims",
+    "price_sum",
+    "price_count",
+    "gas_eur",
+    "eure_withdrawn",
+)
+
+
+def period_bounds(year: int, month: Optional[int] = None) -> tuple[datetime, datetime]:
+    """Return the [start, end) datetimes of a year, or of one month in it."""
+    if month and 1 <= month <= 12:
+        start = datetime(year, month, 1)
+        end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+        return start, end
+    return datetime(year, 1, 1), datetime(year + 1, 1, 1)
+
+
+def in_period(year: int, month: Optional[int] = None):
+    """SentTransaction timestamp filter for a year (and optional month)."""
+    start, end = period_bounds(year, month)
+    return (SentTransaction.timestamp >= start) & (SentTransaction.timestamp < end)
+
+
+def tagged(*tags: str):
+    """Filter transactions carrying any of *tags*, via the indexed transaction_tag table."""
+    tagged_hashes = TransactionTag.select(TransactionTag.tx_hash).where(TransactionTag.tag.in_(tags))
+    return SentTransaction.tx_hash.in_(tagged_hashes)
+
+
+def _months(month: Optional[int] = None) -> range:
+    return range(month, month + 1) if month and 1 <= month <= 12 else range(1, 13)
+
+
+def _rollup_filter(year: int, month: Optional[int] = None):
+    condition = RewardsRollup.year == year
+    if month and 1 <= month <= 12:
+        condition &= RewardsRollup.month == month
+    return condition
+
+
+def _aggregate_month(year: int, month: int) -> dict[str, dict]:
+    """Aggregate one month of SentTransaction rows per account."""
+    rows: dict[str, dict] = {}
+
+    def row(account: str) -> dict:
+        return rows.setdefault(account, {"tag": None})
+
+    claims = (
+        SentTransaction.select(
+            SentTransaction.to_address,
+            fn.MAX(SentTransaction.to_tag),
+            fn.SUM(SentTransaction.amount_wei_real),
+            fn.SUM(SentTransaction.value_eur),
+            fn.COUNT(SentTransaction.tx_hash),
+            fn.SUM(SentTransaction.price_eur),
+            fn.COUNT(SentTransaction.price_eur),
+        )
+        .where(tagged(CLAIM_TAG) & in_period(year, month))
+        .group_by(SentTransaction.to_address)
+        .tuples()
+    )
+    for account, tag, wei, eur, count, price_sum, price_count in claims:
+        row(account).update(
+            tag=tag,
+            olas=float(wei or 0) / 1e18,
+            eur=float(eur or 0),
+            claims=count,
+            price_sum=float(price_sum or 0),
+            price_count=price_count,
+        )
+
+    gas = (
+        SentTransaction.select(SentTransaction.to_address, fn.SUM(SentTransaction.gas_value_eur))
+        .where(tagged(CLAIM_TAG, CHECKPOINT_TAG) & in_period(year, month))
+        .group_by(SentTransaction.to_address)
+        .tuples()
+    )
+    for account, gas_eur in gas:
+        row(account)["gas_eur"] = float(gas_eur or 0)
+
+    withdrawals = (
+        SentTransaction.select(
+            SentTransaction.from_address, fn.SUM(SentTransaction.amount_wei_real)
+        )
+        .where(in_period(year, month) & fn.LOWER(SentTransaction.token).in_(EURE_TOKENS))
+        .group_by(SentTransaction.from_address)
+        .tuples()
+    )
+    for account, wei in withdrawals:
+        row(account)["eure_withdrawn"] = float(wei or 0) / 1e18
+
+    return rows
+
+
+def refresh_month(year: int, month: int) -> None:
+    """Rebuild the transaction-derived rollup columns of one month."""
+    rows = _aggregate_month(year, month)
+    with RewardsRollup._meta.database.atomic():
+        RewardsRollup.update({getattr(RewardsRollup, name): 0 for name in _TX_COLUMNS}).where(
+            _rollup_filter(year, month)
+        ).execute()
+        for account, values in rows.items():
+            RewardsRollup.insert(year=year, month=month, account=account, **values).on_conflict(
+                conflict_target=[RewardsRollup.year, RewardsRollup.month, RewardsRollup.account],
+                update={getattr(RewardsRollup, name): value for name, value in values.items()},
+            ).execute()
+        RewardsRollupMonth.insert(year=year, month=month, built=True).on_conflict(
+            conflict_target=[RewardsRollupMonth.year, RewardsRollupMonth.month],
+            update={RewardsRollupMonth.built: True},
+        ).execute()
+
+
+def _built_months(year: int) -> set[int]:
+    return {
+        m.month
+        for m in RewardsRollupMonth.select(RewardsRollupMonth.month).where(
+            (RewardsRollupMonth.year == year) & RewardsRollupMonth.built
+        )
+    }
+
+
+def ensure_rollup(year: int, month: Optional[int] = None) -> None:
+    """Build any month of the period that is not in the rollup yet."""
+    built = _built_months(year)
+    for m in _months(month):
+        if m not in built:
+            refresh_month(year, m)
+
+
+def on_transaction_logged(record: dict, tags: list, existing: Optional[SentTransaction]) -> None:
+    """Re-aggregate the rollup month(s) touched by a just-logged transaction.
+
+    Months that were never built are left alone; they are built in full the
+    first time they are read.
+    """
+    relevant = CLAIM_TAG in tags or CHECKPOINT_TAG in tags
+    if not relevant and str(record.get("token") or "").lower() not in EURE_TOKENS:
+        return
+
+    timestamps = [record.get("timestamp") or datetime.now()]
+    if existing is not None and isinstance(existing.timestamp, datetime):
+        timestamps.append(existing.timestamp)
+
+    for year, month in {(ts.year, ts.month) for ts in timestamps}:
+        if month in _built_months(year):
+            try:
+                refresh_month(year, month)
+            except Exception as e:
+                logger.warning(f"Failed to refresh rewards rollup for {year}-{month:02d}: {e}")
+
+
+def mech_final_months(year: int) -> set[int]:
+    """Months of *year* whose mech costs are final."""
+    return {
+        m.month
+        for m in RewardsRollupMonth.select(RewardsRollupMonth.month).where(
+            (RewardsRollupMonth.year == year) & RewardsRollupMonth.mech_final
+        )
+    }
+
+
+def set_mech_costs(year: int, month: int, costs: dict[str, float], final: bool) -> None:
+    """Store per-account mech costs (EUR) for one month.
+
+    Args:
+        year: Year of the month.
+        month: Month number (1-12).
+        costs: Mech cost in EUR per trader multisig address.
+        final: Whether the month is closed, so the costs never need recomputing.
+
+    """
+    with RewardsRollup._meta.database.atomic():
+        RewardsRollup.update(mech_cost_eur=0).where(_rollup_filter(year, month)).execute()
+        for account, cost in costs.items():
+            RewardsRollup.insert(
+                year=year, month=month, account=account, mech_cost_eur=cost
+            ).on_conflict(
+                conflict_target=[RewardsRollup.year, RewardsRollup.month, RewardsRollup.account],
+                update={RewardsRollup.mech_cost_eur: cost},
+            ).execute()
+        RewardsRollupMonth.insert(year=year, month=month, mech_final=final).on_conflict(
+            conflict_target=[RewardsRollupMonth.year, RewardsRollupMonth.month],
+            update={RewardsRollupMonth.mech_final: final},
+        ).execute()
+
+
+def monthly_totals(year: int, month: Optional[int] = None) -> dict[int, dict]:
+    """Totals per month across all accounts.
+
+    Returns:
+        {month_num: {"olas", "eur", "claims", "gas_eur", "mech_cost_eur"}} for
+        months that have rollup rows.
+
+    """
+    ensure_rollup(year, month)
+    rows = (
+        RewardsRollup.select(
+            RewardsRollup.month,
+            fn.SUM(RewardsRollup.olas),
+            fn.SUM(RewardsRollup.eur),
+            fn.SUM(RewardsRollup.claims),
+            fn.SUM(RewardsRollup.gas_eur),
+            fn.SUM(RewardsRollup.mech_cost_eur),
+        )
+        .where(_rollup_filter(year, month))
+        .group_by(RewardsRollup.month)
+        .tuples()
+    )
+    return {
+        m: {
+            "olas": float(olas or 0),
+            "eur": float(eur or 0),
+            "claims": int(claims or 0),
+            "gas_eur": float(gas or 0),
+            "mech_cost_eur": float(mech or 0),
+        }
+        for m, olas, eur, claims, gas, mech in rows
+    }
+
+
+def trader_month_totals(year: int, month: Optional[int] = None) -> list[RewardsRollup]:
+    """Rollup rows with at least one claim, ordered by month."""
+    ensure_rollup(year, month)
+    return list(
+        RewardsRollup.select()
+        .where(_rollup_filter(year, month) & (RewardsRollup.claims > 0))
+        .order_by(RewardsRollup.month, RewardsRollup.account)
+    )
+
+
+def eure_withdrawn(accounts: list[str], year: int, month: Optional[int] = None) -> float:
+    """Total EURe sent by *accounts* in the period."""
+    ensure_rollup(year, month)
+    total = (
+        RewardsRollup.select(fn.SUM(RewardsRollup.eure_withdrawn))
+        .where(_rollup_filter(year, month) & RewardsRollup.account.in_(accounts))
+        .scalar()
+    )
+    return float(total or 0.0)
@@ -1,17 +1,24 @@
 """Balance service module."""
 
-from typing import TYPE_CHECKING, Optional, Union
+import asyncio
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
+from web3 import Web3
 from web3.types import Wei
 
 from iwa.core.chain import ChainInterfaces
 from iwa.core.contracts.erc20 import ERC20Contract
+from iwa.core.contracts.multicall import MulticallBatch
+from iwa.core.contracts.token_registry import TokenRegistry
+from iwa.core.utils import configure_logger
 
 if TYPE_CHECKING:
     from iwa.core.keys import KeyStorage
     from iwa.core.services_pkg.account import AccountService
     from iwa.core.wallet import Wallet
 
+logger = configure_logger()
+
 
 class BalanceService:
     """Service for fetching native and ERC20 balances."""
@@ -88,3 +95,124 @@ class BalanceService:
 
         contract = ERC20Contract(chain_name=chain_name, address=token_address)
         return contract.balance_of_wei(account.address)
+
+    def get_balances_eth(
+        self, addresses: List[str], token_names: List[str], chain_name: str = "gnosis"
+    ) -> Dict[str, Dict[str, Optional[float]]]:
+        """Get native and ERC20 balances for many accounts with batched reads.
+
+        Native balances go out as JSON-RPC batches and ERC20 balances as a
+        Multicall3 batch, instead of one request per (account, token) pair.
+        Balances that cannot be read are reported as 0.0; unknown tokens as None.
+        """
+        chain_interface = ChainInterfaces().get(chain_name)
+        tokens, balances = self._prepare_balances(chain_interface, addresses, token_names)
+
+        if "native" in token_names:
+            try:
+                balances_wei = chain_interface.get_native_balances_wei(addresses)
+            except Exception as e:
+                logger.error(f"Error fetching native balances: {e}")
+                balances_wei = [None] * len(addresses)
+            self._fill_native_balances(balances, addresses, balances_wei)
+
+        if tokens:
+            try:
+                metadata = TokenRegistry().prefetch(chain_name, tokens.values())
+                batch, handles = self._queue_erc20_balances(chain_name, addresses, tokens, metadata)
+                batch.execute()
+            except Exception as e:
+                logger.error(f"Error fetching token balances: {e}")
+                handles = None
+            self._fill_erc20_balances(balances, addresses, tokens, handles)
+        return balances
+
+    async def get_balances_eth_async(
+        self, addresses: List[str], token_names: List[str], chain_name: str = "gnosis"
+    ) -> Dict[str, Dict[str, Optional[float]]]:
+        """Async version of ``get_balances_eth`` for the web server's event loop."""
+        chain_interface = ChainInterfaces().get(chain_name)
+        async_interface = ChainInterfaces().get_async(chain_name)
+        tokens, balances = self._prepare_balances(chain_interface, addresses, token_names)
+
+        if "native" in token_names:
+            try:
+                balances_wei = await async_interface.get_native_balances_wei(addresses)
+            except Exception as e:
+                logger.error(f"Error fetching native balances: {e}")
+                balances_wei = [None] * len(addresses)
+            self._fill_native_balances(balances, addresses, balances_wei)
+
+        if tokens:
+            try:
+                registry = TokenRegistry()
+                metadata = {
+                    address.lower(): registry.get(chain_name, address) for address in tokens.values()
+                }
+                if None in metadata.values():
+                    # First sight of a token: fetch (and persist) its metadata off the loop
+                    metadata = await asyncio.to_thread(
+                        registry.prefetch, chain_name, tokens.values()
+                    )
+                batch, handles = self._queue_erc20_balances(chain_name, addresses, tokens, metadata)
+                await batch.execute_async()
+            except Exception as e:
+                logger.error(f"Error fetching token balances: {e}")
+                handles = None
+            self._fill_erc20_balances(balances, addresses, tokens, handles)
+        return balances
+
+    def _prepare_balances(
+        self, chain_interface, addresses: List[str], token_names: List[str]
+    ) -> Tuple[Dict[str, str], Dict[str, Dict[str, Optional[float]]]]:
+        """Resolve ERC20 token addresses and mark unknown tokens as None."""
+        balances: Dict[str, Dict[str, Optional[float]]] = {addr: {} for addr in addresses}
+        tokens = {}
+        for t_name in token_names:
+            if t_name == "native":
+                continue
+            token_address = self.account_service.get_token_address(t_name, chain_interface.chain)
+            if token_address:
+                tokens[t_name] = token_address
+            else:
+                for addr in addresses:
+                    balances[addr][t_name] = None
+        return tokens, balances
+
+    @staticmethod
+    def _fill_native_balances(balances: dict, addresses: List[str], balances_wei: list) -> None:
+        """Store native balances in ETH (0.0 where the read failed)."""
+        for addr, wei in zip(addresses, balances_wei, strict=True):
+            balances[addr]["native"] = Web3.from_wei(wei, "ether") if wei is not None else 0.0
+
+    @staticmethod
+    def _queue_erc20_balances(
+        chain_name: str, addresses: List[str], tokens: Dict[str, str], metadata: dict
+    ) -> Tuple[MulticallBatch, list]:
+        """Queue balanceOf for every (account, token) pair in one Multicall3 batch."""
+        batch = MulticallBatch(chain_name)
+        handles = []
+        for t_name, token_address in tokens.items():
+            token = metadata.get(token_address.lower())
+            contract = ERC20Contract.without_metadata(token_address, chain_name)
+            for addr in addresses:
+                handles.append((addr, t_name, token, batch.add(contract, "balanceOf", addr)))
+        return batch, handles
+
+    @staticmethod
+    def _fill_erc20_balances(
+        balances: dict, addresses: List[str], tokens: Dict[str, str], handles: Optional[list]
+    ) -> None:
+        """Store ERC20 balances in token units (0.0 where the read failed)."""
+        if handles is None:
+            for t_name in tokens:
+                for addr in addresses:
+                    balances[addr][t_name] = 0.0
+            return
+
+        for addr, t_name, token, handle in handles:
+            if token is None or not handle.success:
+                logger.error(f"Error fetching {t_name} balance for {addr}")
+                balances[addr][t_name] = 0.0
+            else:
+                balances[addr][t_name] = handle.value / (10**token.decimals)
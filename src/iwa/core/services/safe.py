@@ -30,6 +30,7 @@ except ImportError:
     pass
 
 _NONCE_STUCK_ALERT_SECONDS = 120
+_SAFE_NONCE_SELECTOR = "0xaffed0e0"  # nonce()
 
 
 class NonceAllocatorBlockedError(RuntimeError):
@@ -421,15 +422,10 @@ class SafeService:
         return owner_addresses
 
     def _get_ethereum_client(self, chain_name: str) -> EthereumClient:
-        from iwa.core.chain import ChainInterfaces
         from iwa.plugins.gnosis.safe import get_ethereum_client
 
-        # Use ChainInterface which has proper RPC rotation and parsing
-        chain_interface = ChainInterfaces().get(chain_name)
-        rpc_url = chain_interface.current_rpc
-
-        # Use shared cache to prevent FD exhaustion
-        return get_ethereum_client(rpc_url)
+        # Shared per-chain client routed through the ChainInterface
+        return get_ethereum_client(chain_name)
 
     def _deploy_safe_contract(
         self,
@@ -687,18 +683,22 @@ class SafeService:
 
         Wraps the RPC call with chain_interface.with_retry() to respect the
         RPC rotator rule — never make raw RPC calls without with_retry().
+        The ``nonce()`` eth_call goes through the ChainInterface web3, so it
+        is hedged to a second RPC when the active one is slow.
         """
         from iwa.core.chain import ChainInterfaces
-        from iwa.plugins.gnosis.safe import SafeMultisig
 
         safe_account = self.key_storage.find_stored_account(safe_address_or_tag)
         if not safe_account or not isinstance(safe_account, StoredSafeAccount):
             raise ValueError(f"Safe account '{safe_address_or_tag}' not found.")
 
-        ethereum_client = self._get_ethereum_client(chain_name)
-        safe = SafeMultisig(safe_account, chain_name, ethereum_client=ethereum_client)
         chain_interface = ChainInterfaces().get(chain_name)
-        return chain_interface.with_retry(lambda: safe.get_nonce())
+        raw = chain_interface.with_retry(
+            lambda: chain_interface.web3.eth.call(
+                {"to": safe_account.address, "data": _SAFE_NONCE_SELECTOR}
+            )
+        )
+        return int.from_bytes(bytes(raw), "big")
 
     def get_eoa_nonce_pair(
         self, safe_address_or_tag: str, chain_name: str
@@ -146,6 +146,9 @@ class SafeTransactionExecutor:
                 safe_tx = updated_tx
 
                 # Bump fee multiplier on fee-related errors (base fee > max fee)
+                if is_fee_error:
+                    # The cached fee was too low for the chain: refetch it
+                    self.chain_interface.fee_oracle.invalidate()
                 if is_fee_error and fee_bump_factor < self.MAX_FEE_BUMP_FACTOR:
                     fee_bump_factor *= self.FEE_BUMP_PERCENTAGE
                     fee_bump_factor = min(fee_bump_factor, self.MAX_FEE_BUMP_FACTOR)
@@ -453,9 +456,8 @@ class SafeTransactionExecutor:
         """Recreate Safe with current (possibly rotated) RPC."""
         from iwa.plugins.gnosis.safe import get_ethereum_client
 
-        rpc_url = self.chain_interface.current_rpc
-        # Use shared cache to prevent FD exhaustion
-        ethereum_client = get_ethereum_client(rpc_url)
+        # The shared client always talks to the current (possibly rotated) RPC
+        ethereum_client = get_ethereum_client(self.chain_interface.chain.name)
         return Safe(safe_address, ethereum_client)
 
     def _is_nonce_error(self, error: Exception) -> bool:
@@ -659,20 +661,19 @@ class SafeTransactionExecutor:
 
         """
         try:
-            web3 = self.chain_interface.web3
-            latest_block = web3.eth.get_block("latest")
-            base_fee = latest_block.get("baseFeePerGas")
+            # Per-block cached: a burst of Safe txs re-uses one fee fetch
+            fees = self.chain_interface.fee_oracle.snapshot()
+            base_fee = fees.base_fee
 
             if base_fee is not None:
                 # EIP-1559 chain: calculate bumped max fee
                 # base_fee * bump_factor * 1.5 (extra buffer) + priority fee
-                priority_fee = max(int(web3.eth.max_priority_fee), 1)
+                priority_fee = max(int(fees.priority_fee or 0), 1)
                 bumped_fee = int(base_fee * bump_factor * 1.5) + priority_fee
                 return bumped_fee
             else:
                 # Legacy chain: bump the gas price directly
-                gas_price = web3.eth.gas_price
-                return int(gas_price * bump_factor)
+                return int(fees.gas_price * bump_factor)
         except Exception as e:
             logger.debug(f"Failed to calculate bumped gas price: {e}")
             return None
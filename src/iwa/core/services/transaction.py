@@ -1,6 +1,7 @@
 """Transaction service module."""
 
 import threading
+import time
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from loguru import logger
@@ -12,6 +13,7 @@ from iwa.core.db import log_transaction
 from iwa.core.keys import KeyStorage
 from iwa.core.models import StoredSafeAccount
 from iwa.core.services.account import AccountService
+from iwa.core.services.safe import NonceAllocatorBlockedError
 from iwa.core.types import EthereumAddress
 
 if TYPE_CHECKING:
@@ -219,12 +221,166 @@ class TransferLogger:
         return f"{token_addr[:6]}...{token_addr[-4:]}"
 
 
+class EOANonceAllocator:
+    """Pre-assigns nonces for one EOA so its transactions can be pipelined.
+
+    EOA counterpart of the Safe ``NonceAllocator``: the next nonce is kept
+    locally and advanced on every allocation, so a new transaction can be
+    broadcast while earlier ones are still waiting to be mined. The on-chain
+    ``pending`` nonce is only fetched at startup and after a failure
+    (invalidate), never once per transaction.
+
+    Callers must release() every allocated nonce once its transaction is
+    mined or has failed, and invalidate() when a nonce was allocated but
+    never broadcast, so the next allocation refetches and fills the gap.
+    """
+
+    def __init__(
+        self,
+        chain_interface: "ChainInterface",
+        address: str,
+        gap_alert_threshold: int = 0,
+    ):
+        """Initialize allocator for the given EOA.
+
+        Args:
+            chain_interface: ChainInterface used for on-chain nonce queries.
+            address: Address of the EOA.
+            gap_alert_threshold: If > 0, blocks allocation on refetch when the
+                EOA has more than this many unconfirmed TXs in the mempool.
+                0 = disabled.
+
+        """
+        self._chain_interface = chain_interface
+        self._address = address
+        self._gap_alert_threshold = gap_alert_threshold
+        self._lock = threading.Lock()
+        self._next: int | None = None
+        self._invalidated = True
+        self._last_advance_ts: float = 0.0
+        # In-flight tracking: nonces allocated but not yet released
+        self._in_flight_nonces: set[int] = set()
+        self._in_flight_txs: dict[int, str] = {}
+        # Counters for observability
+        self._allocate_count = 0
+        self._invalidate_count = 0
+        self._refetch_count = 0
+
+    def allocate(self) -> int:
+        """Allocate and return the next nonce atomically.
+
+        Raises:
+            NonceAllocatorBlockedError: if, on refetch, the EOA mempool gap
+                exceeds gap_alert_threshold. Caller should retry later.
+
+        """
+        with self._lock:
+            if self._invalidated:
+                self._next = self._refetch()
+                self._invalidated = False
+            n = self._next
+            self._next = n + 1
+            self._last_advance_ts = time.monotonic()
+            self._allocate_count += 1
+            self._in_flight_nonces.add(n)
+        return n
+
+    def register_broadcast(self, nonce: int, tx_hash: str) -> None:
+        """Record that the TX with the given nonce has reached the mempool."""
+        with self._lock:
+            if nonce in self._in_flight_nonces:
+                self._in_flight_txs[nonce] = tx_hash
+
+    def release(self, nonce: int) -> None:
+        """Mark a nonce as finalized (TX mined, failed or never sent)."""
+        with self._lock:
+            self._in_flight_nonces.discard(nonce)
+            self._in_flight_txs.pop(nonce, None)
+
+    def invalidate(self, reason: str = "unspecified") -> None:
+        """Mark allocator as needing refetch on next allocation.
+
+        Idempotent and thread-safe.
+        """
+        with self._lock:
+            self._invalidated = True
+            self._invalidate_count += 1
+        logger.debug(f"EOANonceAllocator({self._address[:10]}) invalidated: {reason}")
+
+    def stats(self) -> dict:
+        """Return a snapshot of allocator counters for observability."""
+        with self._lock:
+            return {
+                "allocate_count": self._allocate_count,
+                "invalidate_count": self._invalidate_count,
+                "refetch_count": self._refetch_count,
+                "in_flight_count": len(self._in_flight_nonces),
+                "next_nonce": self._next,
+            }
+
+    def _refetch(self) -> int:
+        """Fetch the next usable nonce from the chain. Called under self._lock.
+
+        TXs this allocator already broadcast may not be visible yet on the RPC
+        that answers (e.g. right after a rotation), so the chain value never
+        moves the counter below the highest broadcast in-flight nonce.
+        """
+        self._refetch_count += 1
+        eth = self._chain_interface.web3.eth
+        pending = int(
+            self._chain_interface.with_retry(
+                lambda: eth.get_transaction_count(self._address, "pending"),
+                operation_name="get_transaction_count(pending)",
+            )
+        )
+
+        if self._gap_alert_threshold:
+            confirmed = int(
+                self._chain_interface.with_retry(
+                    lambda: eth.get_transaction_count(self._address, "latest"),
+                    operation_name="get_transaction_count(latest)",
+                )
+            )
+            gap = pending - confirmed
+            if gap > self._gap_alert_threshold:
+                # Stay invalidated so the gap is re-checked on the next allocation
+                logger.error(
+                    f"eoa_nonce_gap: {self._address[:10]} confirmed={confirmed} "
+                    f"pending={pending} gap={gap} > threshold={self._gap_alert_threshold}"
+                )
+                raise NonceAllocatorBlockedError(
+                    f"EOA gap {gap} > threshold {self._gap_alert_threshold}"
+                    f" for {self._address[:10]}"
+                )
+
+        if self._in_flight_txs:
+            highest_broadcast = max(self._in_flight_txs) + 1
+            if pending < highest_broadcast:
+                logger.debug(
+                    f"EOANonceAllocator({self._address[:10]}) RPC pending nonce {pending} "
+                    f"behind in-flight TXs, using {highest_broadcast}"
+                )
+                return highest_broadcast
+        if self._next is not None and pending > self._next:
+            logger.info(
+                f"EOANonceAllocator({self._address[:10]}) nonce advanced externally "
+                f"({self._next} -> {pending})"
+            )
+        return pending
+
+
 class TransactionService:
     """Manages transaction lifecycle: signing, sending, retrying."""
 
+    MAX_NONCE_REFRESHES = 3  # Fresh nonces tried per send after "nonce too low"
+
     # Class-level lock for managing per-address locks
     _locks_lock = threading.Lock()
     _address_locks: Dict[str, threading.Lock] = {}
+    # EOA nonce allocators keyed by (lowercase address, chain_name), shared like
+    # the address locks so every TransactionService hands out the same nonces
+    _nonce_allocators_lock = threading.Lock()
+    _nonce_allocators: Dict[Tuple[str, str], EOANonceAllocator] = {}
 
     def __init__(self, key_storage: KeyStorage, account_service: AccountService, safe_service=None):
         """Initialize TransactionService."""
@@ -245,6 +401,19 @@ class TransactionService:
                 cls._address_locks[address_lower] = threading.Lock()
             return cls._address_locks[address_lower]
 
+    @classmethod
+    def get_nonce_allocator(
+        cls, address: str, chain_name: str, chain_interface: Optional["ChainInterface"] = None
+    ) -> EOANonceAllocator:
+        """Get or create the EOANonceAllocator for this (EOA, chain) pair."""
+        key = (address.lower(), chain_name)
+        with cls._nonce_allocators_lock:
+            if key not in cls._nonce_allocators:
+                cls._nonce_allocators[key] = EOANonceAllocator(
+                    chain_interface or ChainInterfaces().get(chain_name), address
+                )
+            return cls._nonce_allocators[key]
+
     def _resolve_label(self, address: str, chain_name: str = "gnosis") -> str:
         """Resolve address to human-readable label."""
         if not address:
@@ -275,8 +444,9 @@ class TransactionService:
         Uses ChainInterface.with_retry() for consistent RPC rotation and retry logic.
         Gas errors are handled by increasing gas and retrying within the same mechanism.
 
-        Note: Uses per-address locking to prevent nonce collisions when multiple
-        transactions are sent from the same address concurrently.
+        Note: EOA nonces come from a per-address EOANonceAllocator and the
+        per-address lock is only held until broadcast, so several transactions
+        from the same address can be in flight while their receipts are awaited.
         """
         chain_interface = ChainInterfaces().get(chain_name)
         tx = dict(transaction)
@@ -297,61 +467,121 @@ class TransactionService:
                 return False, {}
             return self._execute_via_safe(tx, signer_account, chain_interface, chain_name, tags)
 
-        # Acquire lock for this address to prevent nonce collisions
+        # Nonces come from the allocator unless the caller pinned one, so the
+        # address lock only covers allocate -> sign -> broadcast and the receipt
+        # is awaited outside it, letting the next TX from this EOA go out meanwhile.
+        allocator = (
+            None
+            if "nonce" in tx
+            else self.get_nonce_allocator(signer_account.address, chain_name, chain_interface)
+        )
         address_lock = self._get_address_lock(signer_account.address)
-        with address_lock:
-            if not self._prepare_transaction(tx, signer_address_or_tag, chain_interface):
-                return False, {}
-
-            # Mutable state for retry attempts
-            state = {"gas_retries": 0, "max_gas_retries": 5}
-
-            def _do_sign_send_wait() -> Tuple[bool, Dict, bytes]:
-                """Inner operation wrapped by with_retry."""
+        nonce = None
+
+        # Mutable state for retry attempts
+        state = {"gas_retries": 0, "max_gas_retries": 5, "nonce_refreshes": 0}
+
+        def _refresh_nonce(reason: str) -> None:
+            """Swap a nonce the chain has already used for a freshly fetched one."""
+            nonlocal nonce
+            allocator.release(nonce)
+            allocator.invalidate(f"nonce too low: {reason}")
+            nonce = tx["nonce"] = allocator.allocate()
+            state["nonce_refreshes"] += 1
+
+        def _abandon_nonce(reason: str) -> None:
+            """Hand back a nonce that was never broadcast. Called under the address lock.
+
+            Doing it before the lock is released makes the next sender from this
+            EOA refetch and reuse the nonce instead of broadcasting past the gap.
+            """
+            nonlocal nonce
+            allocator.invalidate(reason)
+            allocator.release(nonce)
+            nonce = None
+
+        def _do_sign_send() -> bytes:
+            """Inner operation wrapped by with_retry."""
+            while True:
                 try:
                     signed_txn = self.key_storage.sign_transaction(tx, signer_address_or_tag)
-                    txn_hash = chain_interface.web3.eth.send_raw_transaction(
+                    return chain_interface.web3.eth.send_raw_transaction(
                         signed_txn.raw_transaction
                     )
-                    receipt = chain_interface.web3.eth.wait_for_transaction_receipt(txn_hash)
-
-                    status = getattr(receipt, "status", None)
-                    if status is None and isinstance(receipt, dict):
-                        status = receipt.get("status")
-
-                    if receipt and status == 1:
-                        return True, receipt, txn_hash
-                    # Transaction mined but reverted - don't retry
-                    logger.error("Transaction failed (status 0).")
-                    raise ValueError("Transaction reverted")
-
                 except web3_exceptions.Web3RPCError as e:
+                    # Another sender used our nonce: refetch it and send again
+                    if (
+                        allocator is not None
+                        and state["nonce_refreshes"] < self.MAX_NONCE_REFRESHES
+                        and self._is_nonce_too_low_error(str(e))
+                    ):
+                        _refresh_nonce(str(e))
+                        continue
                     # Handle gas errors by increasing gas and re-raising
                     self._handle_gas_retry(e, tx, state)
                     raise  # Re-raise to trigger with_retry's retry mechanism
 
-            try:
-                success, receipt, txn_hash = chain_interface.with_retry(
-                    _do_sign_send_wait,
-                    operation_name=f"sign_and_send to {tx.get('to', 'unknown')[:10]}...",
-                )
-                if success:
-                    chain_interface.wait_for_no_pending_tx(signer_account.address)
-                    logger.info(f"Transaction sent successfully. Tx Hash: {txn_hash.hex()}")
-                    self._log_successful_transaction(
-                        receipt, tx, signer_account, chain_name, txn_hash, tags, chain_interface
-                    )
-                    return True, receipt
-                return False, {}
-            except ValueError as e:
-                # Transaction reverted - already logged
-                if "reverted" in str(e).lower():
+        def _do_wait(txn_hash: bytes) -> Dict:
+            receipt = chain_interface.web3.eth.wait_for_transaction_receipt(txn_hash)
+
+            status = getattr(receipt, "status", None)
+            if status is None and isinstance(receipt, dict):
+                status = receipt.get("status")
+
+            if receipt and status == 1:
+                return receipt
+            # Transaction mined but reverted - don't retry
+            logger.error("Transaction failed (status 0).")
+            raise ValueError("Transaction reverted")
+
+        try:
+            with address_lock:
+                if allocator is not None:
+                    nonce = tx["nonce"] = allocator.allocate()
+                try:
+                    prepared = self._prepare_transaction(tx, signer_address_or_tag, chain_interface)
+                    if prepared:
+                        txn_hash = chain_interface.with_retry(
+                            _do_sign_send,
+                            operation_name=f"sign_and_send to {tx.get('to', 'unknown')[:10]}...",
+                        )
+                except Exception as e:
+                    if nonce is not None:
+                        _abandon_nonce(f"send failed: {e}")
+                    raise
+                if not prepared:
+                    if nonce is not None:
+                        _abandon_nonce("prepare failed")
                     return False, {}
-                logger.exception(f"Transaction failed: {e}")
-                return False, {}
-            except Exception as e:
-                logger.exception(f"Transaction failed after retries: {e}")
+                if allocator is not None:
+                    allocator.register_broadcast(nonce, txn_hash.hex())
+
+            receipt = chain_interface.with_retry(
+                lambda: _do_wait(txn_hash),
+                operation_name=f"wait_for_receipt {txn_hash.hex()[:10]}...",
+            )
+            logger.info(f"Transaction sent successfully. Tx Hash: {txn_hash.hex()}")
+            self._log_successful_transaction(
+                receipt, tx, signer_account, chain_name, txn_hash, tags, chain_interface
+            )
+            return True, receipt
+        except ValueError as e:
+            # Transaction reverted - already logged
+            if "reverted" in str(e).lower():
                 return False, {}
+            logger.exception(f"Transaction failed: {e}")
+            if nonce is not None:
+                allocator.invalidate(f"send failed: {e}")
+            return False, {}
+        except Exception as e:
+            logger.exception(f"Transaction failed after retries: {e}")
+            if nonce is not None:
+                # Broadcast but never mined: refetch so the nonce is not skipped
+                allocator.invalidate(f"send failed: {e}")
+            return False, {}
+        finally:
+            if nonce is not None:
+                allocator.release(nonce)
 
     def _prepare_transaction(self, tx: dict, signer_tag: str, chain_interface) -> bool:
         """Ensure nonce and chainId are set."""
@@ -540,6 +770,11 @@ class TransactionService:
 
             return False, {}
 
+    def _is_nonce_too_low_error(self, err_text: str) -> bool:
+        """Check if error is due to a nonce the chain has already used."""
+        text = (err_text or "").lower()
+        return "nonce too low" in text or "oldnonce" in text
+
     def _is_gas_too_low_error(self, err_text: str) -> bool:
         """Check if error is due to low gas."""
         low_gas_signals = [
@@ -1,5 +1,6 @@
 """Transfer service base module."""
 
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Optional
 
 from loguru import logger
@@ -150,7 +151,8 @@ class TransferServiceBase:
                 return None, None
 
             price_service = PriceService()
-            price_eur = price_service.get_token_price(cg_id, "eur")
+            # Falls back to the last stored daily price if the spot request fails
+            price_eur = price_service.get_price_at(cg_id, datetime.now(timezone.utc).date(), "eur")
 
             if price_eur is None:
                 return None, None
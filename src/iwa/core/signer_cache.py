@@ -0,0 +1,144 @@
+"""In-memory cache of decrypted private keys.
+
+Decrypting a stored account runs a full scrypt KDF, which costs hundreds of
+milliseconds. Long-running workers that sign many transactions can unlock
+the cache so each key is decrypted once and reused for a bounded time.
+
+The cache is opt-in and locked by default. Python strings cannot be wiped,
+so keys are held in ``bytearray`` buffers that are overwritten with zeros
+on eviction, expiry and ``lock()``. This is best effort: the ``str`` handed
+to eth_account for each signature is an ordinary immutable copy.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from iwa.core.rpc_monitor import RPCMonitor
+
+DEFAULT_SIGNER_CACHE_TTL = 900.0  # seconds a decrypted key stays cached
+DEFAULT_SIGNER_CACHE_MAX_ENTRIES = 32
+
+
+def _zeroize(buffer: bytearray) -> None:
+    """Overwrite a key buffer in place."""
+    buffer[:] = bytes(len(buffer))
+
+
+class SignerCache:
+    """Thread-safe LRU of decrypted keys with per-entry TTL and an unlock window."""
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_SIGNER_CACHE_TTL,
+        max_entries: int = DEFAULT_SIGNER_CACHE_MAX_ENTRIES,
+    ):
+        """Initialize a locked (disabled) cache."""
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[bytearray, float]]" = OrderedDict()
+        self._unlocked = False
+        self._unlocked_until: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_unlocked(self) -> bool:
+        """Whether decrypted keys are currently being cached."""
+        with self._lock:
+            return self._is_unlocked()
+
+    def unlock(
+        self,
+        duration: Optional[float] = None,
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ) -> None:
+        """Start caching decrypted keys.
+
+        Args:
+            duration: Seconds until the cache locks itself again.
+                None keeps it unlocked until ``lock()`` is called.
+            ttl: Override the per-entry lifetime in seconds.
+            max_entries: Override the maximum number of cached keys.
+
+        """
+        with self._lock:
+            if ttl is not None:
+                self.ttl = ttl
+            if max_entries is not None:
+                self.max_entries = max_entries
+            self._unlocked = True
+            self._unlocked_until = None if duration is None else time.monotonic() + duration
+            self._evict_over_limit()
+
+    def lock(self) -> None:
+        """Stop caching and wipe every cached key."""
+        with self._lock:
+            self._unlocked = False
+            self._unlocked_until = None
+            self._clear()
+
+    def get(self, address: str) -> Optional[str]:
+        """Return the cached key for *address*, or None on a miss."""
+        with self._lock:
+            if not self._is_unlocked():
+                return None
+            entry = self._entries.get(address.lower())
+            if entry is None:
+                return None
+            buffer, expires_at = entry
+            if time.monotonic() >= expires_at:
+                self._discard(address.lower())
+                return None
+            self._entries.move_to_end(address.lower())
+            RPCMonitor().increment("keys.signer_cache_hit")
+            return buffer.decode()
+
+    def put(self, address: str, private_key: str) -> None:
+        """Cache *private_key* for *address* if the cache is unlocked."""
+        with self._lock:
+            if not self._is_unlocked() or self.max_entries <= 0:
+                return
+            self._discard(address.lower())
+            self._entries[address.lower()] = (
+                bytearray(private_key.encode()),
+                time.monotonic() + self.ttl,
+            )
+            self._evict_over_limit()
+
+    def discard(self, address: str) -> None:
+        """Drop and wipe the cached key for *address*, if any."""
+        with self._lock:
+            self._discard(address.lower())
+
+    def __len__(self) -> int:
+        """Number of cached keys."""
+        with self._lock:
+            return len(self._entries)
+
+    def _is_unlocked(self) -> bool:
+        """Check the unlock window, locking on expiry (caller holds the lock)."""
+        if not self._unlocked:
+            return False
+        if self._unlocked_until is not None and time.monotonic() >= self._unlocked_until:
+            self._unlocked = False
+            self._unlocked_until = None
+            self._clear()
+            return False
+        return True
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            _zeroize(entry[0])
+
+    def _evict_over_limit(self) -> None:
+        while len(self._entries) > max(self.max_entries, 0):
+            _, (buffer, _) = self._entries.popitem(last=False)
+            _zeroize(buffer)
+
+    def _clear(self) -> None:
+        for buffer, _ in self._entries.values():
+            _zeroize(buffer)
+        self._entries.clear()
@@ -1,6 +1,5 @@
 """Wallet module."""
 
-from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Tuple, Union
 
 from web3.types import Wei
@@ -8,7 +7,7 @@ from web3.types import Wei
 from iwa.core.chain import SupportedChain
 from iwa.core.db import init_db
 from iwa.core.keys import EncryptedAccount, KeyStorage
-from iwa.core.models import EthereumAddress, StoredSafeAccount
+from iwa.core.models import Config, EthereumAddress, StoredSafeAccount
 from iwa.core.services import (
     AccountService,
     BalanceService,
@@ -50,6 +49,13 @@ class Wallet:
         )
         self.plugin_service = PluginService()
 
+        core_config = Config().core
+        if core_config and core_config.signer_cache_enabled:
+            self.key_storage.unlock(
+                ttl=core_config.signer_cache_ttl,
+                max_entries=core_config.signer_cache_max_entries,
+            )
+
         init_db()
 
     @property
@@ -73,37 +79,27 @@ class Wallet:
         if not token_names:
             return accounts_data, None
 
-        token_balances = {addr: {} for addr in accounts_data.keys()}
-
-        def fetch_balance(addr, t_name):
-            try:
-                if t_name == "native":
-                    return (
-                        addr,
-                        t_name,
-                        self.balance_service.get_native_balance_eth(addr, chain_name),
-                    )
-                else:
-                    return (
-                        addr,
-                        t_name,
-                        self.balance_service.get_erc20_balance_eth(addr, t_name, chain_name),
-                    )
-            except Exception as e:
-                logger.error(f"Error fetching {t_name} balance for {addr}: {e}")
-                return addr, t_name, 0.0
-
-        # Use ThreadPoolExecutor for parallel balance fetching
-        # Limited to 4 workers to avoid overwhelming RPC endpoints
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            tasks = []
-            for addr in accounts_data.keys():
-                for t_name in token_names:
-                    tasks.append(executor.submit(fetch_balance, addr, t_name))
-
-            for future in tasks:
-                addr, t_name, bal = future.result()
-                token_balances[addr][t_name] = bal
+        # Batched reads: one JSON-RPC batch for native balances and one
+        # Multicall3 call for ERC20 balances, regardless of account count
+        token_balances = self.balance_service.get_balances_eth(
+            list(accounts_data.keys()), token_names, chain_name
+        )
+
+        return accounts_data, token_balances
+
+    async def get_accounts_balances_async(
+        self, chain_name: str, token_names: Optional[list[str]] = None
+    ) -> Tuple[dict, Optional[dict]]:
+        """Async version of ``get_accounts_balances`` for the web server."""
+        accounts_data = self.account_service.get_account_data()
+        token_names = token_names or []
+
+        if not token_names:
+            return accounts_data, None
+
+        token_balances = await self.balance_service.get_balances_eth_async(
+            list(accounts_data.keys()), token_names, chain_name
+        )
 
         return accounts_data, token_balances
 
@@ -830,37 +830,16 @@ def _register_rewards_query_tools(mcp: FastMCP) -> None:
 
         """
         import datetime
-        from collections import defaultdict
 
-        from iwa.core.db import SentTransaction
+        from iwa.core import rewards_rollup
 
         if year == 0:
             year = datetime.datetime.now().year
 
-        year_start = datetime.datetime(year, 1, 1)
-        year_end = datetime.datetime(year + 1, 1, 1)
-
-        claims = SentTransaction.select().where(
-            SentTransaction.tags.contains("olas_claim_rewards")
-            & (SentTransaction.timestamp >= year_start)
-            & (SentTransaction.timestamp < year_end)
-        )
-
-        total_olas = 0.0
-        total_eur = 0.0
-        total_claims = 0
-        monthly = defaultdict(lambda: {"olas": 0.0, "eur": 0.0, "claims": 0})
-
-        for tx in claims:
-            olas_amount = float(tx.amount_wei or 0) / 1e18
-            eur_value = tx.value_eur or 0.0
-            total_olas += olas_amount
-            total_eur += eur_value
-            total_claims += 1
-            m = tx.timestamp.month
-            monthly[m]["olas"] += olas_amount
-            monthly[m]["eur"] += eur_value
-            monthly[m]["claims"] += 1
+        monthly = rewards_rollup.monthly_totals(year)
+        total_olas = sum(data["olas"] for data in monthly.values())
+        total_eur = sum(data["eur"] for data in monthly.values())
+        total_claims = sum(data["claims"] for data in monthly.values())
 
         months = []
         for m in range(1, 13):
@@ -900,24 +879,11 @@ def _register_rewards_detail_tools(mcp: FastMCP) -> None:
         import datetime
         from collections import defaultdict
 
-        from iwa.core.db import SentTransaction
+        from iwa.core import rewards_rollup
 
         if year == 0:
             year = datetime.datetime.now().year
 
-        year_start = datetime.datetime(year, 1, 1)
-        year_end = datetime.datetime(year + 1, 1, 1)
-
-        claims = list(
-            SentTransaction.select()
-            .where(
-                SentTransaction.tags.contains("olas_claim_rewards")
-                & (SentTransaction.timestamp >= year_start)
-                & (SentTransaction.timestamp < year_end)
-            )
-            .order_by(SentTransaction.timestamp.asc())
-        )
-
         trader_data = defaultdict(
             lambda: {
                 "total_olas": 0.0,
@@ -929,18 +895,15 @@ def _register_rewards_detail_tools(mcp: FastMCP) -> None:
             }
         )
 
-        for tx in claims:
-            olas_amount = float(tx.amount_wei or 0) / 1e18
-            eur_value = tx.value_eur or 0.0
-            trader = tx.to_tag or tx.to_address or "unknown"
-            m = tx.timestamp.month
+        for row in rewards_rollup.trader_month_totals(year):
+            trader = row.tag or row.account or "unknown"
             td = trader_data[trader]
-            td["total_olas"] += olas_amount
-            td["total_eur"] += eur_value
-            td["total_claims"] += 1
-            td["months"][m]["olas"] += olas_amount
-            td["months"][m]["eur"] += eur_value
-            td["months"][m]["claims"] += 1
+            td["total_olas"] += row.olas
+            td["total_eur"] += row.eur
+            td["total_claims"] += row.claims
+            td["months"][row.month]["olas"] += row.olas
+            td["months"][row.month]["eur"] += row.eur
+            td["months"][row.month]["claims"] += row.claims
 
         traders = []
         for name, td in sorted(
@@ -1,5 +1,6 @@
 """Gnosis Safe interaction."""
 
+from threading import Lock
 from typing import Callable, Dict, Optional
 
 from safe_eth.eth import EthereumClient
@@ -12,45 +13,48 @@ from iwa.core.utils import configure_logger
 
 logger = configure_logger()
 
-# Shared EthereumClient cache to prevent FD leaks
-# Limited to MAX_CACHED_CLIENTS to avoid unbounded growth during RPC rotations
+# One EthereumClient per chain, routed through the chain's ChainInterface
 _ethereum_client_cache: Dict[str, EthereumClient] = {}
-MAX_CACHED_CLIENTS = 3  # Keep only recent clients to limit FD usage
-
-
-def _cleanup_old_clients(keep_url: str) -> None:
-    """Remove oldest cached clients to stay under limit."""
-    global _ethereum_client_cache
-    while len(_ethereum_client_cache) >= MAX_CACHED_CLIENTS:
-        # Remove oldest entry (first key in dict, preserves insertion order in Python 3.7+)
-        for old_url in list(_ethereum_client_cache.keys()):
-            if old_url != keep_url:
-                old_client = _ethereum_client_cache.pop(old_url)
-                # Try to close any underlying HTTP session
-                if hasattr(old_client, "w3") and hasattr(old_client.w3, "provider"):
-                    provider = old_client.w3.provider
-                    if hasattr(provider, "_request_kwargs"):
-                        session = provider._request_kwargs.get("session")
-                        if session and hasattr(session, "close"):
-                            try:
-                                session.close()
-                            except Exception:
-                                pass
-                logger.debug(f"Evicted EthereumClient for {old_url} from cache")
-                break
-
-
-def get_ethereum_client(rpc_url: str) -> EthereumClient:
-    """Get a cached EthereumClient for the given RPC URL.
-
-    Reuses existing clients to prevent file descriptor exhaustion.
-    Limited to MAX_CACHED_CLIENTS to prevent unbounded cache growth
-    during RPC rotations.
+_ethereum_client_lock = Lock()
+
+
+def get_ethereum_client(chain_name: str) -> EthereumClient:
+    """Get the shared EthereumClient for *chain_name*.
+
+    The client's web3 providers and batch session send everything through
+    the chain's ChainInterface, so Safe traffic shares its rate limiter,
+    retries, RPC rotation, health scores and connection pool. RPC rotation
+    happens underneath, so one client per chain is enough.
     """
-    if rpc_url not in _ethereum_client_cache:
-        _cleanup_old_clients(rpc_url)
-        _ethereum_client_cache[rpc_url] = EthereumClient(rpc_url)
-    return _ethereum_client_cache[rpc_url]
+    chain_name = chain_name.lower()
+    with _ethereum_client_lock:
+        if chain_name not in _ethereum_client_cache:
+            from iwa.core.chain import ChainInterfaces
+
+            _ethereum_client_cache[chain_name] = _build_ethereum_client(
+                ChainInterfaces().get(chain_name)
+            )
+        return _ethereum_client_cache[chain_name]
+
+
+def _build_ethereum_client(chain_interface) -> EthereumClient:
+    """Build an EthereumClient whose traffic goes through *chain_interface*."""
+    from iwa.core.chain.provider import ChainInterfaceProvider, ChainInterfaceSession
+
+    client = EthereumClient(chain_interface.current_rpc)
+
+    for w3 in (client.w3, client.slow_w3):
+        provider = ChainInterfaceProvider(chain_interface)
+        provider.global_ccip_read_enabled = w3.provider.global_ccip_read_enabled
+        w3.provider = provider
+
+    # Raw batch requests (e.g. Safe.retrieve_all_info) post through a session
+    client.http_session.close()
+    session = ChainInterfaceSession(chain_interface)
+    client.http_session = session
+    for manager in (client.erc20, client.erc721, client.tracing, client.batch_call_manager):
+        manager.http_session = session
+    return client
 
 
 class SafeMultisig:
@@ -81,10 +85,7 @@ class SafeMultisig:
             raise ValueError(f"Safe account is not deployed on chain: {chain_name}")
 
         if ethereum_client is None:
-            from iwa.core.chain import ChainInterfaces
-
-            chain_interface = ChainInterfaces().get(chain_name.lower())
-            ethereum_client = get_ethereum_client(chain_interface.current_rpc)
+            ethereum_client = get_ethereum_client(chain_name)
 
         self.multisig = Safe(safe_account.address, ethereum_client)
         self.ethereum_client = ethereum_client
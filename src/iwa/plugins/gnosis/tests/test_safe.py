@@ -4,13 +4,9 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from iwa.core.chain.provider import ChainInterfaceProvider, ChainInterfaceSession
 from iwa.core.models import StoredSafeAccount
-from iwa.plugins.gnosis.safe import (
-    MAX_CACHED_CLIENTS,
-    SafeMultisig,
-    _ethereum_client_cache,
-    get_ethereum_client,
-)
+from iwa.plugins.gnosis.safe import SafeMultisig, get_ethereum_client
 
 
 @pytest.fixture
@@ -108,80 +104,49 @@ def test_send_tx(safe_account, mock_settings, mock_safe_eth):
 
 
 class TestEthereumClientCache:
-    """Tests for EthereumClient caching to prevent FD exhaustion."""
-
-    def setup_method(self):
-        """Clear cache before each test."""
-        _ethereum_client_cache.clear()
-
-    def test_cache_reuses_client(self):
-        """Test that the same RPC URL returns the same cached client."""
-        with patch("iwa.plugins.gnosis.safe.EthereumClient") as mock_client_cls:
-            mock_client_cls.return_value = MagicMock()
-
-            client1 = get_ethereum_client("https://rpc1.example.com")
-            client2 = get_ethereum_client("https://rpc1.example.com")
+    """Tests for the shared per-chain EthereumClient."""
+
+    def test_client_is_shared_per_chain(self):
+        """One client is built per chain and reused across RPC rotations."""
+        with (
+            patch("iwa.core.chain.ChainInterfaces") as mock_ci_cls,
+            patch("iwa.plugins.gnosis.safe.EthereumClient") as mock_client_cls,
+        ):
+            chain_interface = mock_ci_cls.return_value.get.return_value
+            chain_interface.current_rpc = "https://rpc1.example.com"
+            client1 = get_ethereum_client("gnosis")
+            chain_interface.current_rpc = "https://rpc2.example.com"
+            client2 = get_ethereum_client("Gnosis")
 
             assert client1 is client2
-            # Should only create one instance
             assert mock_client_cls.call_count == 1
 
-    def test_cache_different_urls(self):
-        """Test that different URLs create different clients."""
-        with patch("iwa.plugins.gnosis.safe.EthereumClient") as mock_client_cls:
-            mock_client_cls.side_effect = lambda url: MagicMock(url=url)
-
-            client1 = get_ethereum_client("https://rpc1.example.com")
-            client2 = get_ethereum_client("https://rpc2.example.com")
-
-            assert client1 is not client2
-            assert mock_client_cls.call_count == 2
-
-    def test_cache_limit_enforced(self):
-        """Test that cache is limited to MAX_CACHED_CLIENTS."""
-        with patch("iwa.plugins.gnosis.safe.EthereumClient") as mock_client_cls:
-            # Create mock clients with closeable sessions
-            def create_mock_client(url):
-                client = MagicMock(url=url)
-                client.w3 = MagicMock()
-                client.w3.provider = MagicMock()
-                client.w3.provider._request_kwargs = {"session": MagicMock()}
-                return client
-
-            mock_client_cls.side_effect = create_mock_client
-
-            # Create more clients than the limit
-            urls = [f"https://rpc{i}.example.com" for i in range(MAX_CACHED_CLIENTS + 2)]
-            for url in urls:
-                get_ethereum_client(url)
-
-            # Cache should not exceed limit
-            assert len(_ethereum_client_cache) <= MAX_CACHED_CLIENTS
-
-    def test_cache_evicts_oldest(self):
-        """Test that oldest entries are evicted when limit is reached."""
-        with patch("iwa.plugins.gnosis.safe.EthereumClient") as mock_client_cls:
-
-            def create_mock_client(url):
-                client = MagicMock(url=url)
-                client.w3 = MagicMock()
-                client.w3.provider = MagicMock()
-                client.w3.provider._request_kwargs = {"session": MagicMock()}
-                return client
-
-            mock_client_cls.side_effect = create_mock_client
-
-            # Fill cache to limit
-            first_url = "https://first.example.com"
-            get_ethereum_client(first_url)
-            for i in range(1, MAX_CACHED_CLIENTS):
-                get_ethereum_client(f"https://rpc{i}.example.com")
-
-            assert first_url in _ethereum_client_cache
-
-            # Add one more - should evict the first
-            get_ethereum_client("https://new.example.com")
-
-            # First URL should be evicted
-            assert first_url not in _ethereum_client_cache
-            assert "https://new.example.com" in _ethereum_client_cache
+    def test_client_traffic_goes_through_chain_interface(self):
+        """Web3 requests and raw batch posts use the ChainInterface."""
+        chain_interface = MagicMock()
+        chain_interface.chain.name = "Gnosis"
+        chain_interface.current_rpc = "https://rpc1.example.com"
+        chain_interface.with_retry.side_effect = lambda operation, **kwargs: operation()
+        chain_interface.web3.provider.make_request.return_value = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": "0x64",
+        }
+
+        with patch("iwa.core.chain.ChainInterfaces") as mock_ci_cls:
+            mock_ci_cls.return_value.get.return_value = chain_interface
+            client = get_ethereum_client("gnosis")
+
+        assert isinstance(client.w3.provider, ChainInterfaceProvider)
+        assert client.w3.eth.block_number == 100
+        chain_interface.web3.provider.make_request.assert_called_once_with(
+            "eth_blockNumber", ()
+        )
+        chain_interface.rate_limiter.acquire.assert_called()
+
+        assert isinstance(client.batch_call_manager.http_session, ChainInterfaceSession)
+        chain_interface.session.post.return_value.status_code = 200
+        client.http_session.post(client.ethereum_node_url, json=[], timeout=5)
+        chain_interface.session.post.assert_called_once_with(
+            "https://rpc1.example.com", json=[], timeout=5
+        )
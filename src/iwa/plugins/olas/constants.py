@@ -956,6 +956,24 @@ def get_staking_contracts(
     return results
 
 
+# Lowercased address -> contracts at that address (one per chain), built once
+# for O(1) lookups by address
+STAKING_CONTRACTS_BY_ADDRESS: Dict[str, List[StakingContractInfo]] = {}
+for _contract in STAKING_CONTRACTS:
+    STAKING_CONTRACTS_BY_ADDRESS.setdefault(str(_contract.address).lower(), []).append(_contract)
+del _contract
+
+
+def get_staking_contract_info(
+    address: str, chain: Optional[str] = None
+) -> Optional[StakingContractInfo]:
+    """Look up a staking contract by address (case-insensitive), optionally on *chain*."""
+    for info in STAKING_CONTRACTS_BY_ADDRESS.get(str(address).lower(), []):
+        if chain is None or info.chain == chain:
+            return info
+    return None
+
+
 # ---------------------------------------------------------------------------
 # Backward-compatibility shim
 # ---------------------------------------------------------------------------
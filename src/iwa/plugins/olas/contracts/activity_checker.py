@@ -8,7 +8,7 @@ The liveness check (isRatioPass) verifies that the service is making enough mech
 requests relative to the time elapsed since the last checkpoint.
 """
 
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 
 from iwa.core.constants import DEFAULT_MECH_CONTRACT_ADDRESS
 from iwa.core.types import EthereumAddress
@@ -60,16 +60,21 @@ class ActivityCheckerContract(ContractInstance):
                 - mech_requests_count: Total mech requests made
 
         """
-        nonces = self.contract.functions.getMultisigNonces(multisig).call()
+        nonces = self.call("getMultisigNonces", multisig)
         return (nonces[0], nonces[1])
 
+    def _has_function(self, name: str) -> bool:
+        """Whether this checker version exposes the view function *name*."""
+        return getattr(self.contract.functions, name, None) is not None
+
     @property
     def mech_marketplace(self) -> Optional[EthereumAddress]:
         """Get the mech marketplace address."""
         if self._mech_marketplace is None:
             try:
-                mech_mp_function = getattr(self.contract.functions, "mechMarketplace", None)
-                self._mech_marketplace = mech_mp_function().call() if mech_mp_function else None
+                self._mech_marketplace = (
+                    self.call("mechMarketplace") if self._has_function("mechMarketplace") else None
+                )
             except Exception:
                 self._mech_marketplace = None
         return self._mech_marketplace
@@ -79,10 +84,9 @@ class ActivityCheckerContract(ContractInstance):
         """Get the agent mech address."""
         if self._agent_mech is None:
             try:
-                agent_mech_function = getattr(self.contract.functions, "agentMech", None)
                 self._agent_mech = (
-                    agent_mech_function().call()
-                    if agent_mech_function
+                    self.call("agentMech")
+                    if self._has_function("agentMech")
                     else DEFAULT_MECH_CONTRACT_ADDRESS
                 )
             except Exception:
@@ -94,11 +98,26 @@ class ActivityCheckerContract(ContractInstance):
         """Get the liveness ratio."""
         if self._liveness_ratio is None:
             try:
-                self._liveness_ratio = self.contract.functions.livenessRatio().call()
+                self._liveness_ratio = self.call("livenessRatio")
             except Exception:
                 self._liveness_ratio = 0
         return self._liveness_ratio
 
+    def queue_liveness_ratio(self, batch) -> Callable[[], None]:
+        """Queue ``livenessRatio`` on a caller-owned ``MulticallBatch`` unless cached.
+
+        Returns:
+            A function that caches the loaded ratio once *batch* has run.
+
+        """
+        handle = batch.add(self, "livenessRatio") if self._liveness_ratio is None else None
+
+        def store() -> None:
+            if handle is not None and handle.success:
+                self._liveness_ratio = handle.value
+
+        return store
+
     def is_ratio_pass(
         self,
         current_nonces: Tuple[int, int],
@@ -34,15 +34,20 @@ import math
 import time
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+from hexbytes import HexBytes
 from loguru import logger
 
 from iwa.core.contracts.contract import ContractInstance
+from iwa.core.log_indexer import LogSubscription, get_log_indexer
 from iwa.core.types import EthereumAddress
 from iwa.plugins.olas.contracts.activity_checker import ActivityCheckerContract
 from iwa.plugins.olas.contracts.base import OLAS_ABI_PATH
 
+# Events read by get_checkpoint_events, indexed together in one subscription
+CHECKPOINT_EVENTS = ("Checkpoint", "ServiceInactivityWarning", "ServicesEvicted")
+
 
 class StakingState(Enum):
     """Enum representing the staking state of a service."""
@@ -138,7 +143,71 @@ class StakingContract(ContractInstance):
             For liveness tracking, we use mech_requests_count (index 1).
 
         """
-        result = self.call("getServiceInfo", service_id)
+        info, _ = self.read_service_status(service_id)
+        return info
+
+    def read_service_status(
+        self, service_id: int, multisig: Optional[EthereumAddress] = None
+    ) -> Tuple[Dict, int]:
+        """Read a service's staking info and the current epoch in one Multicall3 batch.
+
+        The batch holds ``getServiceInfo``, ``getNextRewardCheckpointTimestamp``,
+        ``tsCheckpoint``, ``epochCounter``, the uncached contract parameters
+        and, when *multisig* is given, the activity checker's
+        ``getMultisigNonces`` and ``livenessRatio``. Without *multisig* (or
+        on first use, when the activity checker address is not known yet) the
+        nonces take a second batch.
+
+        Args:
+            service_id: The service ID to query.
+            multisig: The service's multisig, if known.
+
+        Returns:
+            Tuple of (``get_service_info`` dict, epoch counter).
+
+        """
+        from iwa.core.contracts.multicall import MulticallBatch
+
+        checker = self.activity_checker if self._activity_checker_address else None
+        batch = MulticallBatch(self.chain_name)
+        store = self.queue_contract_params(batch)
+        service_info = batch.add(self, "getServiceInfo", service_id)
+        next_checkpoint = batch.add(self, "getNextRewardCheckpointTimestamp")
+        ts_checkpoint = batch.add(self, "tsCheckpoint")
+        epoch = batch.add(self, "epochCounter")
+        nonces = None
+        store_ratio = None
+        if checker is not None and multisig:
+            nonces = batch.add(checker, "getMultisigNonces", multisig)
+            store_ratio = checker.queue_liveness_ratio(batch)
+        batch.execute()
+        store()
+        if ts_checkpoint.success:
+            self._store_ts_checkpoint(ts_checkpoint.value)
+        if store_ratio is not None:
+            store_ratio()
+
+        info = self.unpack_service_info(service_info.value)
+        if nonces is not None and nonces.success and str(multisig).lower() == str(info[0]).lower():
+            current_nonces = tuple(nonces.value[:2])
+        else:
+            # Get current nonces from activity checker: (safe_nonce, mech_requests)
+            current_nonces = self.activity_checker.get_multisig_nonces(info[0])
+        epoch_end = datetime.fromtimestamp(next_checkpoint.value, tz=timezone.utc)
+        return self.build_service_info(info, current_nonces, epoch_end), epoch.value
+
+    @staticmethod
+    def unpack_service_info(result: Any) -> tuple:
+        """Normalize a raw ``getServiceInfo`` result into its six struct fields.
+
+        Returns:
+            Tuple of (multisig, owner, nonces_on_last_checkpoint, ts_start,
+            accrued_reward, inactivity).
+
+        Raises:
+            ValueError: If the result does not have the expected shape.
+
+        """
         # Handle potential nested tuple if web3 returns [(struct)]
         if (
             isinstance(result, (list, tuple))
@@ -148,23 +217,38 @@ class StakingContract(ContractInstance):
             result = result[0]
 
         try:
-            (
-                multisig_address,
-                owner_address,
-                nonces_on_last_checkpoint,
-                ts_start,
-                accrued_reward,
-                inactivity,
-            ) = result
+            multisig, owner, nonces, ts_start, accrued_reward, inactivity = result
         except ValueError as e:
             # Try to log useful info if unpacking fails
             logger.error(
                 f"[Staking] Unpacking failed. Result type: {type(result)}, Result: {result}"
             )
             raise e
+        return multisig, owner, nonces, ts_start, accrued_reward, inactivity
+
+    def build_service_info(
+        self, service_info: tuple, current_nonces: Tuple[int, int], epoch_end: datetime
+    ) -> Dict:
+        """Derive the ``get_service_info`` dict from already fetched values.
 
-        # Get current nonces from activity checker: (safe_nonce, mech_requests)
-        current_nonces = self.activity_checker.get_multisig_nonces(multisig_address)
+        Lets batched readers (e.g. the service fleet snapshot) fetch
+        ``getServiceInfo``, ``getMultisigNonces`` and the next checkpoint
+        timestamp in bulk and still get the same result.
+
+        Args:
+            service_info: Output of ``unpack_service_info``.
+            current_nonces: Current (safe_nonce, mech_requests) of the multisig.
+            epoch_end: Start of the next epoch.
+
+        """
+        (
+            multisig_address,
+            owner_address,
+            nonces_on_last_checkpoint,
+            ts_start,
+            accrued_reward,
+            inactivity,
+        ) = service_info
         current_safe_nonce, current_mech_requests = current_nonces
 
         # Last checkpoint nonces are also (safe_nonce, mech_requests)
@@ -175,7 +259,6 @@ class StakingContract(ContractInstance):
         mech_requests_this_epoch = current_mech_requests - last_mech_requests
 
         required_requests = self.get_required_requests()
-        epoch_end = self.get_next_epoch_start()
         remaining_seconds = (epoch_end - datetime.now(timezone.utc)).total_seconds()
 
         # Check liveness ratio using activity checker
@@ -235,9 +318,12 @@ class StakingContract(ContractInstance):
                 return ts
 
         # Fetch new value
-        ts = self.call("tsCheckpoint")
-        self._contract_params_cache[cache_key] = ts
-        self._contract_params_cache[f"{cache_key}_last_checked"] = now
+        return self._store_ts_checkpoint(self.call("tsCheckpoint"))
+
+    def _store_ts_checkpoint(self, ts: int) -> int:
+        """Cache a freshly read ``tsCheckpoint`` value."""
+        self._contract_params_cache["ts_checkpoint"] = ts
+        self._contract_params_cache["ts_checkpoint_last_checked"] = time.time()
         return ts
 
     def clear_epoch_cache(self) -> None:
@@ -266,6 +352,38 @@ class StakingContract(ContractInstance):
             (time_diff * self.activity_checker.liveness_ratio) / 1e18 + requests_safety_margin
         )
 
+    # Immutable contract parameters that can be warmed in a single multicall
+    CONTRACT_PARAMS = (
+        "livenessPeriod",
+        "rewardsPerSecond",
+        "maxNumServices",
+        "minStakingDeposit",
+        "minStakingDuration",
+        "stakingToken",
+    )
+
+    def queue_contract_params(self, batch) -> Callable[[], None]:
+        """Queue the uncached contract parameters on a caller-owned ``MulticallBatch``.
+
+        Returns:
+            A function that caches the loaded values once *batch* has run.
+
+        """
+        missing = [p for p in self.CONTRACT_PARAMS if p not in self._contract_params_cache]
+        handles = {param: batch.add(self, param) for param in missing}
+        checker = None
+        if self._activity_checker_address is None:
+            checker = batch.add(self, "activityChecker")
+
+        def store() -> None:
+            for param, handle in handles.items():
+                if handle.success:
+                    self._contract_params_cache[param] = handle.value
+            if checker is not None and checker.success:
+                self._activity_checker_address = checker.value
+
+        return store
+
     @property
     def activity_checker_address_value(self) -> EthereumAddress:
         """Get the activity checker address."""
@@ -496,80 +614,40 @@ class StakingContract(ContractInstance):
         )
         return tx
 
-    def _fetch_events_chunked(
-        self,
-        event_type: str,
-        from_block: int,
-        to_block: int,
-        chunk_size: int = 500,
-    ) -> List:
-        """Fetch events in chunks to handle RPC block range limits.
+    def _get_events(
+        self, event_types: tuple, from_block: int, to_block: Optional[int] = None
+    ) -> Dict[str, List]:
+        """Decoded events of *event_types* in a block range, via the log indexer.
 
-        Uses eth_getLogs (universally supported) instead of eth_newFilter
-        which many RPCs don't support or expire quickly.
-
-        All RPC calls go through chain_interface.with_retry() so that
-        failures trigger automatic RPC rotation.
-
-        Args:
-            event_type: Name of the event (Checkpoint, ServiceInactivityWarning, etc.)
-            from_block: Starting block number.
-            to_block: Ending block number.
-            chunk_size: Max blocks per request (default 500).
+        All event types share one indexed subscription, so a block range is
+        fetched from the RPC once and later calls are served from the store.
 
         Returns:
-            List of event log entries.
+            Dict mapping each event type to its events, oldest first.
 
         """
-        # Verify event exists in ABI (use contract property for fresh provider)
-        if getattr(self.contract.events, event_type, None) is None:
-            logger.debug(f"Event {event_type} not found in contract ABI")
-            return []
-
-        all_logs: List = []
-        current_from = from_block
-
-        while current_from <= to_block:
-            current_to = min(current_from + chunk_size - 1, to_block)
-
-            try:
-
-                def do_get_logs(fr=current_from, to=current_to):
-                    # Re-evaluate self.contract each retry for fresh provider
-                    evt = getattr(self.contract.events, event_type)
-                    return list(evt.get_logs(from_block=fr, to_block=to))
-
-                logs = self.chain_interface.with_retry(
-                    do_get_logs,
-                    operation_name=f"get_logs {event_type} [{current_from}-{current_to}]",
-                )
-                all_logs.extend(logs)
-            except Exception as e:
-                error_msg = str(e).lower()
-                # If range too large, try smaller chunks
-                if any(
-                    signal in error_msg
-                    for signal in ("range", "limit", "10000", "too large", "413")
-                ):
-                    if chunk_size > 100:
-                        logger.debug(
-                            "Block range too large, retrying with smaller chunks"
-                        )
-                        smaller_logs = self._fetch_events_chunked(
-                            event_type, current_from, current_to, chunk_size // 2
-                        )
-                        all_logs.extend(smaller_logs)
-                    else:
-                        logger.warning(
-                            f"Cannot fetch {event_type} events for blocks "
-                            f"{current_from}-{current_to}: {e}"
-                        )
-                else:
-                    logger.warning(f"Error fetching {event_type} events: {e}")
-
-            current_from = current_to + 1
-
-        return all_logs
+        events_by_topic = {}
+        for event_type in event_types:
+            event = getattr(self.contract.events, event_type, None)
+            if event is None:
+                logger.debug(f"Event {event_type} not found in contract ABI")
+                continue
+            events_by_topic[HexBytes(event.topic)] = (event_type, event)
+
+        result: Dict[str, List] = {event_type: [] for event_type in event_types}
+        if not events_by_topic:
+            return result
+
+        subscription = LogSubscription(
+            name="staking_events",
+            addresses=(self.address,),
+            topics=(tuple(events_by_topic),),
+        )
+        logs = get_log_indexer(self.chain_name).get_logs(subscription, from_block, to_block)
+        for log in logs:
+            event_type, event = events_by_topic[HexBytes(log["topics"][0])]
+            result[event_type].append(event.process_log(log))
+        return result
 
     def get_checkpoint_events(
         self, from_block: int, to_block: Optional[int] = None
@@ -579,7 +657,8 @@ class StakingContract(ContractInstance):
         Retrieves Checkpoint, ServiceInactivityWarning, and ServicesEvicted events
         to determine which services received rewards and which got warnings.
 
-        Uses chunked fetching to handle RPCs that limit block ranges.
+        Events come from the persistent log indexer, so overlapping windows
+        only fetch the blocks not seen before.
 
         Args:
             from_block: Starting block number.
@@ -606,10 +685,10 @@ class StakingContract(ContractInstance):
         }
 
         try:
+            events = self._get_events(CHECKPOINT_EVENTS, from_block, to_block)
+
             # Get Checkpoint events
-            checkpoint_logs = self._fetch_events_chunked(
-                "Checkpoint", from_block, to_block
-            )
+            checkpoint_logs = events["Checkpoint"]
 
             if checkpoint_logs:
                 # Take the most recent checkpoint
@@ -625,18 +704,14 @@ class StakingContract(ContractInstance):
                     result["rewarded_services"][sid] = reward
 
             # Get ServiceInactivityWarning events
-            warning_logs = self._fetch_events_chunked(
-                "ServiceInactivityWarning", from_block, to_block
-            )
+            warning_logs = events["ServiceInactivityWarning"]
             for log in warning_logs:
                 service_id = log.args.get("serviceId")
                 if service_id is not None:
                     result["inactivity_warnings"].append(service_id)
 
             # Get ServicesEvicted events
-            evicted_logs = self._fetch_events_chunked(
-                "ServicesEvicted", from_block, to_block
-            )
+            evicted_logs = events["ServicesEvicted"]
             for log in evicted_logs:
                 evicted_ids = log.args.get("serviceIds", [])
                 result["evicted_services"].extend(evicted_ids)
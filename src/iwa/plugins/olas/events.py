@@ -1,9 +1,24 @@
 """Event-based cache invalidation for Olas contracts."""
 
+from eth_abi import decode
+from hexbytes import HexBytes
 from loguru import logger
 
 from iwa.core.contracts.cache import ContractCache
 from iwa.plugins.olas.contracts.staking import StakingContract
+from iwa.plugins.olas.staking_availability import StakingAvailabilitySnapshot
+from iwa.plugins.olas.staking_locator import StakingLocator
+
+# Events that move a service in or out of a staking contract. The first three
+# index the serviceId; ServicesEvicted carries the ids in its data.
+SERVICE_MOVED_EVENTS = [
+    "ServiceStaked(uint256,uint256,address,address,uint256[])",
+    "ServiceUnstaked(uint256,uint256,address,address,uint256[],uint256,uint256)",
+    "ServiceForceUnstaked(uint256,uint256,address,address,uint256[],uint256,uint256)",
+]
+SERVICES_EVICTED_EVENT = "ServicesEvicted(uint256,uint256[],address[],address[],uint256[])"
+SERVICES_EVICTED_DATA = ["uint256[]", "address[]", "address[]", "uint256[]"]
+CHECKPOINT_EVENT = "Checkpoint(uint256,uint256,uint256[],uint256[],uint256)"
 
 
 class OlasEventInvalidator:
@@ -55,35 +70,29 @@ class OlasEventInvalidator:
         self.running = False
 
     def _monitor_loop(self):
-        """Main monitoring loop."""
-        import time
-
+        """Main monitoring loop, woken by the chain's shared head tracker."""
         try:
             last_block = self.web3.eth.block_number
         except Exception:
             last_block = 0
 
+        head_tracker = self.chain_interface.head_tracker
         while self.running:
             try:
-                current_block = self.web3.eth.block_number
+                current_block = head_tracker.wait_for_new_head(last_block, timeout=10)
 
-                if current_block > last_block:
+                if current_block is not None and current_block > last_block:
                     self._check_events(last_block + 1, current_block)
+                    self._check_service_moves(last_block + 1, current_block)
                     last_block = current_block
 
             except Exception as e:
                 logger.error(f"Error in OlasEventInvalidator: {e}")
 
-            time.sleep(10)  # check every 10 seconds
-
     def _check_events(self, from_block: int, to_block: int):
         """Check for relevant events in the block range."""
-        # Cap range
-        if to_block - from_block > 100:
-            from_block = to_block - 100
-
         # We care about Checkpoint events on StakingContracts
-        # Event signature for Checkpoint: Checkpoint(uint256,uint256,uint256,uint256,uint256,uint256,uint256,uint256)
+        # Event signature for Checkpoint: Checkpoint(uint256,uint256,uint256[],uint256[],uint256)
         # Actually easier to use the contract instance to get the topic or event object
 
         # Need ABI for this. Let's assume we can get it from a dummy contract instance
@@ -100,17 +109,15 @@ class OlasEventInvalidator:
                 StakingContract, self.staking_addresses[0], self.chain_name
             )
 
-            logs = self.web3.eth.get_logs(
+            # Chunked to each RPC's learned range limit, so a long pause
+            # (e.g. laptop sleep) is caught up instead of truncated
+            logs = self.chain_interface.get_logs_ranged(
                 {
-                    "fromBlock": from_block,
-                    "toBlock": to_block,
                     "address": self.staking_addresses,
-                    "topics": [
-                        self.web3.keccak(
-                            text="Checkpoint(uint256,uint256,uint256,uint256,uint256,uint256,uint256,uint256)"
-                        ).hex()
-                    ],
-                }
+                    "topics": [self._topic(CHECKPOINT_EVENT)],
+                },
+                from_block,
+                to_block,
             )
 
             # If we used the contract event object to filter, it handles the topic generation:
@@ -138,5 +145,53 @@ class OlasEventInvalidator:
                     instance.clear_epoch_cache()
                     logger.debug(f"Cleared epoch cache for {addr}")
 
+                # Rewards paid out and services may have been evicted
+                StakingAvailabilitySnapshot().invalidate(self.chain_name)
+
         except Exception as e:
             logger.warning(f"Failed to check logs in invalidator: {e}")
+
+    def _check_service_moves(self, from_block: int, to_block: int):
+        """Forget the cached staking location of services that were (un)staked or evicted."""
+        if not self.staking_addresses:
+            return
+
+        evicted_topic = self._topic(SERVICES_EVICTED_EVENT)
+        try:
+            logs = self.chain_interface.get_logs_ranged(
+                {
+                    "address": self.staking_addresses,
+                    "topics": [
+                        [self._topic(event) for event in SERVICE_MOVED_EVENTS] + [evicted_topic]
+                    ],
+                },
+                from_block,
+                to_block,
+            )
+
+            locator = StakingLocator()
+            for log in logs:
+                if self._topic_hex(log["topics"][0]) == evicted_topic:
+                    service_ids = decode(SERVICES_EVICTED_DATA, HexBytes(log["data"]))[0]
+                else:
+                    service_ids = [int(self._topic_hex(log["topics"][1]), 16)]
+                for service_id in service_ids:
+                    logger.debug(f"Service {service_id} moved on {log['address']}")
+                    locator.forget(self.chain_name, service_id)
+
+            if logs:
+                # Slots changed
+                StakingAvailabilitySnapshot().invalidate(self.chain_name)
+
+        except Exception as e:
+            logger.warning(f"Failed to check staking moves in invalidator: {e}")
+
+    def _topic(self, signature: str) -> str:
+        """Topic 0 of the event *signature*, as 0x-prefixed hex."""
+        return self._topic_hex(self.web3.keccak(text=signature))
+
+    @staticmethod
+    def _topic_hex(topic) -> str:
+        """Normalize a topic (bytes or hex string) to lowercase 0x-prefixed hex."""
+        value = topic.hex() if isinstance(topic, (bytes, bytearray)) else str(topic)
+        return "0x" + value.lower().removeprefix("0x")
@@ -0,0 +1,330 @@
+"""Dashboard snapshot of every OLAS service on a chain.
+
+Reading one service's dashboard through ``ServiceManager`` costs a dozen
+sequential RPCs (registry state, staking state, service info, activity
+nonces, epoch data, balances), so listing 25 services one by one takes over
+a minute. ``ServiceFleetSnapshot`` reads the whole fleet instead, grouped by
+contract:
+
+1. One Multicall3 batch with ``getService`` for every service, plus the
+   staking parameters, epoch data, ``getStakingState`` and
+   ``getServiceInfo`` of every staking contract in use.
+2. One Multicall3 batch with ``getMultisigNonces`` for every staked service.
+
+Balances are read concurrently in their own batches. Results are stored in
+the same ``response_cache`` entries ``ServiceManager`` uses, so a per-service
+read right after a fleet load is served from cache, and cache invalidations
+after stake/unstake apply to both paths.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from iwa.core.contracts.cache import ContractCache
+from iwa.core.contracts.multicall import MulticallBatch, MulticallCall
+from iwa.core.models import Config, StoredAccount
+from iwa.core.wallet import Wallet
+from iwa.plugins.olas.contracts.service import ServiceState
+from iwa.plugins.olas.contracts.staking import StakingContract, StakingState
+from iwa.plugins.olas.models import OlasConfig, Service, StakingStatus
+from iwa.plugins.olas.service_manager import ServiceManager
+from iwa.web.cache import CacheTTL, response_cache
+
+BALANCE_TOKENS = ["native", "OLAS"]
+REGISTRY_STATE_INDEX = 6  # Position of the state in ServiceRegistry.getService
+
+
+def service_roles(key_storage, service: Service) -> List[Tuple[str, str, Optional[StoredAccount]]]:
+    """List (role, address, stored account) of *service*, including owner_signer.
+
+    When the owner is a Safe, its first signer is listed as ``owner_signer``
+    right before the owner.
+    """
+    roles = []
+    for role, address in [
+        ("agent", service.agent_address),
+        ("safe", str(service.multisig_address) if service.multisig_address else None),
+        ("owner", service.service_owner_address),
+    ]:
+        if not address:
+            continue
+        stored = key_storage.find_stored_account(address)
+        if role == "owner" and stored and getattr(stored, "signers", None):
+            signer = stored.signers[0]
+            roles.append(("owner_signer", signer, key_storage.find_stored_account(signer)))
+        roles.append((role, address, stored))
+    return roles
+
+
+@dataclass
+class ServiceSnapshot:
+    """Dashboard data of one service."""
+
+    key: str
+    service: Service
+    state: str = "UNKNOWN"
+    staking_status: Optional[StakingStatus] = None
+
+
+@dataclass
+class _StakingReads:
+    """Queued reads shared by every service of one staking contract."""
+
+    contract: StakingContract
+    epoch: MulticallCall
+    next_checkpoint: MulticallCall
+
+
+@dataclass
+class _ServiceReads:
+    """Queued reads of one service."""
+
+    entry: ServiceSnapshot
+    registry: MulticallCall
+    staking: Optional[_StakingReads] = None
+    staking_state: Optional[MulticallCall] = None
+    service_info: Optional[MulticallCall] = None
+    info: Optional[tuple] = None
+    nonces: Optional[MulticallCall] = None
+
+    @property
+    def is_staked(self) -> bool:
+        """Whether the configured staking contract reports the service as staked."""
+        return (
+            self.staking_state is not None
+            and self.staking_state.success
+            and StakingState(self.staking_state.value) == StakingState.STAKED
+        )
+
+
+class ServiceFleetSnapshot:
+    """Load the state, staking status and balances of many services at once.
+
+    Usage::
+
+        snapshot = ServiceFleetSnapshot(wallet, "gnosis").load()
+        for key, entry in snapshot.services.items():
+            entry.state, entry.staking_status
+
+    """
+
+    def __init__(self, wallet: Wallet, chain_name: str):
+        """Initialize an empty snapshot for *chain_name*."""
+        self.wallet = wallet
+        self.chain_name = chain_name.lower()
+        self.services: Dict[str, ServiceSnapshot] = {}
+        self.balances: Dict[str, Dict[str, Optional[float]]] = {}
+
+    @staticmethod
+    def configured_services(chain_name: str) -> Dict[str, Service]:
+        """Services configured in the OLAS plugin for *chain_name*, by service key."""
+        config = Config()
+        if "olas" not in config.plugins:
+            return {}
+        olas_config = OlasConfig.model_validate(config.plugins["olas"])
+        return {
+            key: service
+            for key, service in olas_config.services.items()
+            if service.chain_name == chain_name
+        }
+
+    def load(
+        self,
+        services: Optional[Dict[str, Service]] = None,
+        force_refresh: bool = False,
+        include_balances: bool = True,
+    ) -> "ServiceFleetSnapshot":
+        """Read every service's dashboard data.
+
+        Args:
+            services: Services to load by key (default: all configured on the chain).
+            force_refresh: Bypass the response cache.
+            include_balances: Also read native and OLAS balances of the
+                service accounts into ``balances``.
+
+        Returns:
+            This snapshot, filled in.
+
+        """
+        if services is None:
+            services = self.configured_services(self.chain_name)
+        self.services = {key: ServiceSnapshot(key, service) for key, service in services.items()}
+        if not self.services:
+            return self
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            balances = pool.submit(self._read_balances) if include_balances else None
+
+            pending = []
+            for entry in self.services.values():
+                if force_refresh:
+                    response_cache.invalidate(f"service_state:{entry.key}")
+                    response_cache.invalidate(f"staking_status:{entry.key}")
+                state = response_cache.get(f"service_state:{entry.key}", CacheTTL.SERVICE_STATE)
+                status = response_cache.get(
+                    f"staking_status:{entry.key}", CacheTTL.STAKING_STATUS
+                )
+                if state is not None and status is not None:
+                    entry.state, entry.staking_status = state, status
+                else:
+                    pending.append(entry)
+
+            if pending:
+                self._read_onchain(pending)
+                for entry in pending:
+                    response_cache.set(f"service_state:{entry.key}", entry.state)
+                    if entry.staking_status is not None:
+                        response_cache.set(f"staking_status:{entry.key}", entry.staking_status)
+
+            if balances is not None:
+                self.balances = balances.result()
+        return self
+
+    def _read_balances(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """Native and OLAS balances of every service account in one batched read."""
+        addresses = list(
+            dict.fromkeys(
+                address
+                for entry in self.services.values()
+                for _, address, _ in service_roles(self.wallet.key_storage, entry.service)
+            )
+        )
+        if not addresses:
+            return {}
+        try:
+            return self.wallet.balance_service.get_balances_eth(
+                addresses, BALANCE_TOKENS, self.chain_name
+            )
+        except Exception as e:
+            logger.error(f"Could not read service balances on {self.chain_name}: {e}")
+            return {}
+
+    def _read_onchain(self, entries: List[ServiceSnapshot]) -> None:
+        """Fill in state and staking status of *entries* with two multicalls."""
+        manager = ServiceManager(self.wallet)
+        manager.init_contracts(self.chain_name)
+
+        reads = self._read_services(manager, entries)
+        self._read_activity_nonces(reads)
+
+        for service_reads in reads:
+            entry = service_reads.entry
+            if service_reads.registry.success:
+                entry.state = ServiceState(service_reads.registry.value[REGISTRY_STATE_INDEX]).name
+            entry.staking_status = self._staking_status(manager, service_reads)
+
+    def _read_services(
+        self, manager: ServiceManager, entries: List[ServiceSnapshot]
+    ) -> List[_ServiceReads]:
+        """Round 1: registry state, staking contract data and service info."""
+        batch = MulticallBatch(self.chain_name)
+        contracts: Dict[str, Optional[_StakingReads]] = {}
+        stores = []
+        reads = []
+        for entry in entries:
+            service = entry.service
+            service_reads = _ServiceReads(
+                entry, batch.add(manager.registry, "getService", service.service_id)
+            )
+            reads.append(service_reads)
+            if not service.staking_contract_address:
+                continue
+
+            address = str(service.staking_contract_address)
+            if address.lower() not in contracts:
+                contracts[address.lower()] = self._queue_staking_reads(batch, address, stores)
+            staking = contracts[address.lower()]
+            if staking is None:
+                continue
+            service_reads.staking = staking
+            service_reads.staking_state = batch.add(
+                staking.contract, "getStakingState", service.service_id
+            )
+            service_reads.service_info = batch.add(
+                staking.contract, "getServiceInfo", service.service_id
+            )
+        batch.execute()
+        for store in stores:
+            store()
+        return reads
+
+    def _read_activity_nonces(self, reads: List[_ServiceReads]) -> None:
+        """Round 2: activity nonces of every staked multisig."""
+        batch = MulticallBatch(self.chain_name)
+        for service_reads in reads:
+            if service_reads.is_staked:
+                try:
+                    staking = service_reads.staking.contract
+                    service_reads.info = staking.unpack_service_info(
+                        service_reads.service_info.value
+                    )
+                    service_reads.nonces = batch.add(
+                        staking.activity_checker, "getMultisigNonces", service_reads.info[0]
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to get service info for {service_reads.entry.key}: {e}")
+        batch.execute()
+
+    def _queue_staking_reads(
+        self, batch: MulticallBatch, address: str, stores: list
+    ) -> Optional[_StakingReads]:
+        """Queue the reads shared by all services of one staking contract."""
+        try:
+            staking = ContractCache().get_contract(
+                StakingContract, address, chain_name=self.chain_name
+            )
+        except Exception as e:
+            logger.error(f"Failed to load staking contract {address}: {e}")
+            return None
+        stores.append(staking.queue_contract_params(batch))
+        return _StakingReads(
+            staking,
+            epoch=batch.add(staking, "epochCounter"),
+            next_checkpoint=batch.add(staking, "getNextRewardCheckpointTimestamp"),
+        )
+
+    def _staking_status(self, manager: ServiceManager, reads: _ServiceReads) -> StakingStatus:
+        """Build one service's StakingStatus from its batched reads."""
+        service = reads.entry.service
+        address = service.staking_contract_address
+        if not address:
+            return StakingStatus(is_staked=False, staking_state="NOT_STAKED")
+
+        if reads.staking_state is None or not reads.staking_state.success:
+            return StakingStatus(
+                is_staked=False, staking_state="ERROR", staking_contract_address=address
+            )
+
+        staking = reads.staking.contract
+        staking_state = StakingState(reads.staking_state.value)
+        if staking_state != StakingState.STAKED:
+            # Service not found in configured contract — scan known contracts
+            mismatch = manager.detect_staking_mismatch(service.service_id, str(address))
+            return StakingStatus(
+                is_staked=False,
+                staking_state=staking_state.name,
+                staking_contract_address=address,
+                activity_checker_address=staking.activity_checker_address,
+                liveness_ratio=staking.activity_checker.liveness_ratio,
+                **mismatch,
+            )
+
+        try:
+            epoch_end = datetime.fromtimestamp(reads.staking.next_checkpoint.value, tz=timezone.utc)
+            current_nonces = tuple(reads.nonces.value[:2])
+            info = staking.build_service_info(reads.info, current_nonces, epoch_end)
+            return manager.build_staked_status(
+                staking, str(address), info, reads.staking.epoch.value
+            )
+        except Exception as e:
+            logger.error(f"Failed to get service info for {reads.entry.key}: {e}")
+            return StakingStatus(
+                is_staked=True,
+                staking_state=staking_state.name,
+                staking_contract_address=address,
+            )
+
@@ -64,7 +64,7 @@ def _make_manager_for_service(service):
     wallet = Wallet()
     manager = ServiceManager(wallet)
     manager.service = service
-    manager._init_contracts(service.chain_name)
+    manager.init_contracts(service.chain_name)
     return manager
 
 
@@ -387,14 +387,14 @@ def _register_staking_query_tools(mcp: FastMCP) -> None:
             chain: Blockchain name (e.g. 'gnosis').
 
         Returns:
-            Dictionary with list of staking contracts.
+            Dictionary with list of staking contracts, including slot usage,
+            balance, minimum deposit and staking token when known.
 
         """
-        from iwa.plugins.olas.constants import OLAS_TRADER_STAKING_CONTRACTS
+        from iwa.plugins.olas.staking_availability import StakingAvailabilitySnapshot
 
-        contracts = OLAS_TRADER_STAKING_CONTRACTS.get(chain, {})
         result = [
-            {"name": name, "address": str(addr)} for name, addr in contracts.items()
+            availability.to_dict() for availability in StakingAvailabilitySnapshot().get(chain)
         ]
         return {"contracts": result, "chain": chain}
 
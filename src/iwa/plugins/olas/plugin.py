@@ -85,8 +85,7 @@ class OlasPlugin(Plugin):
             except ValueError:
                 return None, None  # Chain not supported/configured
 
-            # Reuse cached EthereumClient to prevent FD exhaustion
-            ethereum_client = get_ethereum_client(chain_interface.current_rpc)
+            ethereum_client = get_ethereum_client(chain_name)
             safe = Safe(safe_address, ethereum_client)
             owners = safe.retrieve_owners()
             return owners, True
@@ -96,14 +95,10 @@ class OlasPlugin(Plugin):
 
     def _resolve_staking_name(self, address: str, chain_name: str) -> str | None:
         """Resolve staking contract address to human-readable name."""
-        from iwa.plugins.olas.constants import OLAS_TRADER_STAKING_CONTRACTS
-
-        chain_contracts = OLAS_TRADER_STAKING_CONTRACTS.get(chain_name, {})
-        addr_lower = address.lower()
-        for name, contract_addr in chain_contracts.items():
-            if str(contract_addr).lower() == addr_lower:
-                return name
-        return None
+        from iwa.plugins.olas.constants import get_staking_contract_info
+
+        info = get_staking_contract_info(address, chain=chain_name)
+        return info.name if info else None
 
     def _display_service_table(self, console: Console, service, index: int) -> None:
         """Display a single discovered service as a Rich table."""
@@ -1,81 +1,118 @@
-"""ServiceManager base class."""
+"""ServiceManager base class and the per-chain protocol contract pool."""
 
+import time
+from dataclasses import dataclass
+from threading import Lock
 from typing import Dict, Optional
 
 from loguru import logger
 
-from iwa.core.chain import ChainInterfaces
+from iwa.core.chain import ChainInterface, ChainInterfaces
 from iwa.core.contracts.cache import ContractCache
 from iwa.core.models import Config
 from iwa.core.wallet import Wallet
 from iwa.plugins.olas.constants import OLAS_CONTRACTS
-from iwa.plugins.olas.contracts.service import ServiceManagerContract, ServiceRegistryContract
+from iwa.plugins.olas.contracts.service import (
+    ServiceManagerContract,
+    ServiceRegistryContract,
+    ServiceRegistryTokenUtilityContract,
+)
 from iwa.plugins.olas.models import OlasConfig
 from iwa.web.cache import CacheTTL, response_cache
 
 
-class ServiceManagerBase:
-    """Base class for ServiceManager."""
+@dataclass(frozen=True)
+class ChainContext:
+    """OLAS protocol contracts of one chain, shared by every ServiceManager."""
 
-    def __init__(self, wallet: Wallet, service_key: Optional[str] = None):
-        """Initialize ServiceManager.
+    chain_name: str
+    chain_interface: ChainInterface
+    registry: ServiceRegistryContract
+    manager: ServiceManagerContract
+    token_utility: Optional[ServiceRegistryTokenUtilityContract]
+    created_at: float
+    manager_confirmed: bool = True  # False if registry.manager() could not be read
 
-        Args:
-            wallet: The wallet instance for signing transactions.
-            service_key: Optional key (chain_name:service_id) to select a specific service.
-                        If not provided, service operations require explicit service selection.
 
-        """
-        self.wallet = wallet
-        self.global_config = Config()
+class ChainContextPool:
+    """Singleton pool of resolved protocol contracts, one context per chain.
 
-        self.olas_config = self.global_config.plugins.get("olas")
-        if isinstance(self.olas_config, dict):
-            self.olas_config = OlasConfig(**self.olas_config)
-            self.global_config.plugins["olas"] = self.olas_config
-        elif self.olas_config is None:
-            self.olas_config = OlasConfig()
-            self.global_config.plugins["olas"] = self.olas_config
+    Resolving a chain's contracts costs a ``registry.manager()`` RPC, which
+    every ServiceManager used to repeat. The pool resolves it once and keeps
+    the context for ``ttl`` seconds (the manager only changes on a protocol
+    upgrade), so managers created per request or per worker borrow warm
+    contracts instead. A context built on the configured manager because
+    ``registry.manager()`` failed is only kept for ``FALLBACK_TTL`` seconds.
+    """
 
-        # Get service by key if provided
-        self.service = None
-        if service_key and ":" in service_key:
-            chain_name, service_id = service_key.split(":", 1)
-            self.service = self.olas_config.get_service(chain_name, int(service_id))
+    _instance = None
+    _lock = Lock()
 
-        # Initialize contracts (default to gnosis)
-        service_chain = getattr(self.service, "chain_name", "gnosis")
-        chain_name = service_chain if isinstance(service_chain, str) else "gnosis"
-        self._init_contracts(chain_name)
+    DEFAULT_TTL = 24 * 3600
+    FALLBACK_TTL = 60  # Retry registry.manager() soon after it failed
 
-        # Initialize TransferService from wallet
-        self.transfer_service = self.wallet.transfer_service
+    def __new__(cls) -> "ChainContextPool":
+        """Ensure singleton instance."""
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(ChainContextPool, cls).__new__(cls)
+                cls._instance._contexts: Dict[str, ChainContext] = {}
+                cls._instance.ttl = cls.DEFAULT_TTL
+        return cls._instance
 
-    def _init_contracts(self, chain_name: str) -> None:
-        """Initialize contracts for the given chain."""
-        # OPTIMIZATION: Skip if already initialized for this chain
-        if getattr(self, "chain_name", None) == chain_name.lower() and hasattr(self, "registry"):
-            return
+    def get(self, chain_name: str) -> ChainContext:
+        """Get the context of *chain_name*, resolving it on first use or expiry.
+
+        Raises:
+            ValueError: If the chain has no OLAS protocol contracts.
+
+        """
+        chain_name = chain_name.lower()
+        with self._lock:
+            context = self._contexts.get(chain_name)
+            if context is not None:
+                ttl = self.ttl if context.manager_confirmed else self.FALLBACK_TTL
+                if time.time() - context.created_at < ttl:
+                    return context
+
+        # Resolve outside the lock: it may wait on an RPC
+        context = self._resolve(chain_name)
+        with self._lock:
+            self._contexts[chain_name] = context
+        return context
 
+    def invalidate(self, chain_name: Optional[str] = None) -> None:
+        """Drop the context of *chain_name*, or of every chain."""
+        with self._lock:
+            if chain_name is None:
+                self._contexts.clear()
+            else:
+                self._contexts.pop(chain_name.lower(), None)
+
+    def _resolve(self, chain_name: str) -> ChainContext:
+        """Build the context of *chain_name* from constants and the registry."""
         chain_interface = ChainInterfaces().get(chain_name)
 
         # Get protocol contracts from plugin-local constants
-        protocol_contracts = OLAS_CONTRACTS.get(chain_name.lower(), {})
+        protocol_contracts = OLAS_CONTRACTS.get(chain_name, {})
         registry_address = protocol_contracts.get("OLAS_SERVICE_REGISTRY")
         manager_address = protocol_contracts.get("OLAS_SERVICE_MANAGER")
+        utility_address = protocol_contracts.get("OLAS_SERVICE_REGISTRY_TOKEN_UTILITY")
 
         if not registry_address or not manager_address:
             raise ValueError(f"OLAS contracts not found for chain: {chain_name}")
 
-        self.registry = ContractCache().get_contract(
+        cache = ContractCache()
+        registry = cache.get_contract(
             ServiceRegistryContract, registry_address, chain_name=chain_name
         )
 
         # On some chains (Base, etc.), the ServiceRegistry's manager is the
         # ContractManager (a proxy), not the ServiceManager directly.
         # Query on-chain to use the correct address.
+        manager_confirmed = True
         try:
-            actual_manager = self.registry.call("manager")
+            actual_manager = registry.call("manager")
             if (
                 isinstance(actual_manager, str)
                 and actual_manager.startswith("0x")
@@ -87,16 +124,82 @@ class ServiceManagerBase:
                 )
                 manager_address = actual_manager
         except Exception:
+            manager_confirmed = False
             logger.debug("[SM-INIT] Could not query registry.manager(), using config")
 
-        self.manager = ContractCache().get_contract(
+        manager = cache.get_contract(
             ServiceManagerContract, manager_address, chain_name=chain_name
         )
-        logger.debug(f"[SM-INIT] ServiceManager initialized. Chain: {chain_name}")
-        logger.debug(f"[SM-INIT] Registry Address: {self.registry.address}")
-        logger.debug(f"[SM-INIT] Manager Address: {self.manager.address}")
-        self.chain_interface = chain_interface
-        self.chain_name = chain_name.lower()
+        token_utility = (
+            cache.get_contract(
+                ServiceRegistryTokenUtilityContract, str(utility_address), chain_name=chain_name
+            )
+            if utility_address
+            else None
+        )
+        logger.debug(f"[SM-INIT] Contracts resolved. Chain: {chain_name}")
+        logger.debug(f"[SM-INIT] Registry Address: {registry.address}")
+        logger.debug(f"[SM-INIT] Manager Address: {manager.address}")
+        return ChainContext(
+            chain_name=chain_name,
+            chain_interface=chain_interface,
+            registry=registry,
+            manager=manager,
+            token_utility=token_utility,
+            created_at=time.time(),
+            manager_confirmed=manager_confirmed,
+        )
+
+
+class ServiceManagerBase:
+    """Base class for ServiceManager."""
+
+    def __init__(self, wallet: Wallet, service_key: Optional[str] = None):
+        """Initialize ServiceManager.
+
+        Args:
+            wallet: The wallet instance for signing transactions.
+            service_key: Optional key (chain_name:service_id) to select a specific service.
+                        If not provided, service operations require explicit service selection.
+
+        """
+        self.wallet = wallet
+        self.global_config = Config()
+
+        self.olas_config = self.global_config.plugins.get("olas")
+        if isinstance(self.olas_config, dict):
+            self.olas_config = OlasConfig(**self.olas_config)
+            self.global_config.plugins["olas"] = self.olas_config
+        elif self.olas_config is None:
+            self.olas_config = OlasConfig()
+            self.global_config.plugins["olas"] = self.olas_config
+
+        # Get service by key if provided
+        self.service = None
+        if service_key and ":" in service_key:
+            chain_name, service_id = service_key.split(":", 1)
+            self.service = self.olas_config.get_service(chain_name, int(service_id))
+
+        # Initialize contracts (default to gnosis)
+        service_chain = getattr(self.service, "chain_name", "gnosis")
+        chain_name = service_chain if isinstance(service_chain, str) else "gnosis"
+        self.init_contracts(chain_name)
+
+        # Initialize TransferService from wallet
+        self.transfer_service = self.wallet.transfer_service
+
+    def init_contracts(self, chain_name: str) -> None:
+        """Borrow the protocol contracts of the given chain from the pool."""
+        # OPTIMIZATION: Skip if already initialized for this chain
+        if getattr(self, "chain_name", None) == chain_name.lower() and hasattr(self, "registry"):
+            return
+
+        context = ChainContextPool().get(chain_name)
+        self.registry = context.registry
+        self.manager = context.manager
+        self.token_utility = context.token_utility
+        self.chain_interface = context.chain_interface
+        self.chain_name = context.chain_name
 
     def _save_config(self) -> None:
         """Persist configuration to config.yaml."""
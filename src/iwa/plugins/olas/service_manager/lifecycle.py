@@ -67,7 +67,6 @@ from web3.types import Wei
 
 from iwa.core.chain import ChainInterfaces
 from iwa.core.constants import NATIVE_CURRENCY_ADDRESS, ZERO_ADDRESS
-from iwa.core.contracts.cache import ContractCache
 from iwa.core.types import EthereumAddress
 from iwa.core.utils import get_tx_hash
 from iwa.plugins.olas.constants import (
@@ -509,13 +508,9 @@ class LifecycleManagerMixin:
             The agent bond in wei, or None if the query fails.
 
         """
-        from iwa.plugins.olas.contracts.service import ServiceRegistryTokenUtilityContract
-
         try:
-            protocol_contracts = OLAS_CONTRACTS.get(self.chain_name.lower(), {})
-            utility_address = protocol_contracts.get("OLAS_SERVICE_REGISTRY_TOKEN_UTILITY")
-
-            if not utility_address:
+            token_utility = getattr(self, "token_utility", None)
+            if token_utility is None:
                 logger.warning("[ACTIVATE] Token Utility address not found for chain")
                 return None
 
@@ -527,13 +522,6 @@ class LifecycleManagerMixin:
                 return None
             agent_id = agent_ids[0]
 
-            # Use the ServiceRegistryTokenUtilityContract with official ABI
-            token_utility = ContractCache().get_contract(
-                ServiceRegistryTokenUtilityContract,
-                address=str(utility_address),
-                chain_name=self.chain_name,
-            )
-
             bond = token_utility.get_agent_bond(self.service.service_id, agent_id)
 
             logger.debug(
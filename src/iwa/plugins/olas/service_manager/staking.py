@@ -53,9 +53,11 @@ from web3 import Web3
 from iwa.core.contracts.cache import ContractCache
 from iwa.core.types import EthereumAddress
 from iwa.core.utils import get_tx_hash
-from iwa.plugins.olas.constants import CHECKPOINT_GRACE_PERIOD
+from iwa.plugins.olas.constants import CHECKPOINT_GRACE_PERIOD, get_staking_contract_info
 from iwa.plugins.olas.contracts.staking import StakingContract, StakingState
 from iwa.plugins.olas.models import StakingStatus
+from iwa.plugins.olas.staking_availability import StakingAvailabilitySnapshot
+from iwa.plugins.olas.staking_locator import StakingLocator
 from iwa.web.cache import CacheTTL, response_cache
 
 
@@ -161,7 +163,7 @@ class StakingManagerMixin:
 
         if not is_staked:
             # Service not found in configured contract — scan known contracts
-            mismatch = self._detect_staking_mismatch(service_id, staking_address)
+            mismatch = self.detect_staking_mismatch(service_id, staking_address)
             return StakingStatus(
                 is_staked=False,
                 staking_state=staking_state.name,
@@ -173,11 +175,10 @@ class StakingManagerMixin:
 
         # Get detailed service info
         try:
-            info = staking.get_service_info(service_id)
-            # Get current epoch number
-            epoch_number = staking.get_epoch_counter()
-            # Identify contract name
-            staking_name = self._identify_staking_contract_name(staking_address)
+            # Service info, nonces, checkpoint data and epoch in one multicall
+            info, epoch_number = staking.read_service_status(
+                service_id, self.service.multisig_address
+            )
         except Exception as e:
             logger.error(f"Failed to get service info for service {service_id}: {str(e)}")
             import traceback
@@ -189,12 +190,20 @@ class StakingManagerMixin:
                 staking_contract_address=staking_address,
             )
 
+        return self.build_staked_status(staking, staking_address, info, epoch_number)
+
+    def build_staked_status(
+        self, staking: StakingContract, staking_address: str, info: dict, epoch_number: int
+    ) -> StakingStatus:
+        """Assemble the StakingStatus of a staked service from its service info."""
+        staking_name = self._identify_staking_contract_name(staking_address)
+
         # Calculate unstake timing
         unstake_at, ts_start, min_duration = self._calculate_unstake_time(staking, info)
 
         return StakingStatus(
             is_staked=True,
-            staking_state=staking_state.name,
+            staking_state=StakingState.STAKED.name,
             staking_contract_address=staking_address,
             staking_contract_name=staking_name,
             mech_requests_this_epoch=info["mech_requests_this_epoch"],
@@ -220,59 +229,39 @@ class StakingManagerMixin:
 
     def _identify_staking_contract_name(self, staking_address: str) -> Optional[str]:
         """Identify the name of the staking contract from constants."""
-        from iwa.plugins.olas.constants import OLAS_TRADER_STAKING_CONTRACTS
-
-        for chain_cts in OLAS_TRADER_STAKING_CONTRACTS.values():
-            for name, addr in chain_cts.items():
-                if str(addr).lower() == staking_address.lower():
-                    return name
-        return None
+        info = get_staking_contract_info(staking_address)
+        return info.name if info else None
 
-    def _detect_staking_mismatch(
+    def detect_staking_mismatch(
         self, service_id: int, config_address: str
     ) -> dict:
         """Check if a service is staked in a different contract than configured.
 
-        Scans all known staking contracts for the service's chain to find
-        where the service is actually staked. Returns mismatch fields for
-        StakingStatus if found, empty dict otherwise.
+        Looks the service up in all known staking contracts for its chain
+        (one batched read, cached by ``StakingLocator``) to find where it is
+        actually staked. Returns mismatch fields for StakingStatus if found,
+        empty dict otherwise.
 
         This method only logs a warning and reports the mismatch — it does NOT
         auto-correct config.yaml (security: on-chain state should not drive
         config changes without human review).
         """
-        from iwa.plugins.olas.constants import OLAS_TRADER_STAKING_CONTRACTS
-
-        chain_contracts = OLAS_TRADER_STAKING_CONTRACTS.get(self.chain_name, {})
-        if not chain_contracts:
-            return {}
-
-        for contract_name, contract_addr in chain_contracts.items():
-            if str(contract_addr).lower() == config_address.lower():
+        for location in StakingLocator().locate(self.chain_name, service_id):
+            if location.address.lower() == config_address.lower():
                 continue  # Skip the contract we already checked
 
-            try:
-                sc = ContractCache().get_contract(
-                    StakingContract, contract_addr, chain_name=self.chain_name
-                )
-                state = sc.get_staking_state(service_id)
-                if state in (StakingState.STAKED, StakingState.EVICTED):
-                    config_name = self._identify_staking_contract_name(config_address) or config_address
-                    detail = (
-                        f"Service {service_id} is {state.name} in "
-                        f"'{contract_name}' ({contract_addr}) but config "
-                        f"points to '{config_name}' ({config_address})"
-                    )
-                    logger.warning(f"[STAKING MISMATCH] {detail}")
-                    return {
-                        "config_mismatch": True,
-                        "actual_staking_contract_address": EthereumAddress(contract_addr),
-                        "config_mismatch_detail": detail,
-                    }
-            except Exception as e:
-                logger.debug(
-                    f"Could not check contract {contract_name} ({contract_addr}): {e}"
-                )
+            config_name = self._identify_staking_contract_name(config_address) or config_address
+            detail = (
+                f"Service {service_id} is {location.state.name} in "
+                f"'{location.name}' ({location.address}) but config "
+                f"points to '{config_name}' ({config_address})"
+            )
+            logger.warning(f"[STAKING MISMATCH] {detail}")
+            return {
+                "config_mismatch": True,
+                "actual_staking_contract_address": EthereumAddress(location.address),
+                "config_mismatch_detail": detail,
+            }
 
         return {}
 
@@ -614,6 +603,8 @@ class StakingManagerMixin:
         response_cache.invalidate(f"service_state:{self.service.key}")
         response_cache.invalidate(f"staking_status:{self.service.key}")
         response_cache.invalidate(f"balances:{self.service.key}")
+        StakingLocator().forget(self.chain_name, self.service.service_id)
+        StakingAvailabilitySnapshot().invalidate(self.chain_name)
 
         logger.info(f"[STAKE] Service {self.service.service_id} is now STAKED")
         return True
@@ -705,6 +696,8 @@ class StakingManagerMixin:
         response_cache.invalidate(f"service_state:{self.service.key}")
         response_cache.invalidate(f"staking_status:{self.service.key}")
         response_cache.invalidate(f"balances:{self.service.key}")
+        StakingLocator().forget(self.chain_name, self.service.service_id)
+        StakingAvailabilitySnapshot().invalidate(self.chain_name)
 
         logger.info("Service unstaked successfully")
         return True
@@ -810,6 +803,15 @@ class StakingManagerMixin:
                 f"(contract-wide, may include third-party services): {service_ids}"
             )
 
+        # Evicted services moved out of the staked set
+        for event in events:
+            if event["name"] == "ServicesEvicted":
+                for service_id in event["args"].get("serviceIds", []):
+                    StakingLocator().forget(self.chain_name, service_id)
+
+        # Slots and balances changed
+        StakingAvailabilitySnapshot().invalidate(self.chain_name)
+
         # Invalidate staking status cache - epoch info changed
         if self.service:
             response_cache.invalidate(f"staking_status:{self.service.key}")
@@ -0,0 +1,292 @@
+"""Availability of every known staking contract on a chain.
+
+The staking pickers (web, TUI, MCP) show, for each contract, its used and
+maximum slots, OLAS balance, minimum deposit and staking token. Reading them
+per contract and per request takes 20-40 seconds on Gnosis and trips RPC
+rate limits. ``StakingAvailabilitySnapshot`` reads every contract of a chain
+in one Multicall3 batch and keeps the result:
+
+- Immutable parameters (``maxNumServices``, ``minStakingDeposit``,
+  ``stakingToken``) are cached on the shared ``StakingContract`` instances
+  and only read once; each refresh reads ``getServiceIds`` and ``balance``.
+- A background thread refreshes the chains in use every
+  ``refresh_interval`` seconds, so pickers open from memory.
+- Stake, unstake and checkpoint transactions (ours, or seen by
+  ``OlasEventInvalidator``) drop the chain's snapshot; the next reader
+  refreshes it.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from iwa.core.contracts.cache import ContractCache
+from iwa.core.contracts.multicall import MulticallBatch
+from iwa.plugins.olas.contracts.staking import StakingContract
+
+MIN_CONTRACT_BALANCE_WEI = 5000 * 10**18  # 5000 OLAS
+
+
+@dataclass(frozen=True)
+class StakingAvailability:
+    """Slots, balance and requirements of one staking contract.
+
+    Fields that could not be read are ``None``.
+    """
+
+    name: str
+    address: str
+    status: Optional[str] = None
+    used: Optional[int] = None
+    max_services: Optional[int] = None
+    min_staking_deposit: Optional[int] = None
+    staking_token: Optional[str] = None
+    balance: Optional[int] = None
+
+    @property
+    def available_slots(self) -> Optional[int]:
+        """Free slots, if known."""
+        if self.used is None or self.max_services is None:
+            return None
+        return self.max_services - self.used
+
+    def accepts(self, service_bond: Optional[int] = None) -> bool:
+        """Whether a service with *service_bond* can stake here.
+
+        Unknown values do not exclude a contract.
+        """
+        if self.available_slots is not None and self.available_slots <= 0:
+            return False
+        if self.balance is not None and self.balance < MIN_CONTRACT_BALANCE_WEI:
+            return False
+        if (
+            service_bond is not None
+            and self.min_staking_deposit is not None
+            and service_bond < self.min_staking_deposit
+        ):
+            return False
+        return True
+
+    @property
+    def label(self) -> str:
+        """Picker label, e.g. ``Expert 5 (3/20 used · 12,345 OLAS)``."""
+        if self.used is None or self.max_services is None:
+            return self.name
+        balance_olas = self.balance // 10**18 if self.balance else 0
+        return f"{self.name} ({self.used}/{self.max_services} used · {balance_olas:,} OLAS)"
+
+    def to_dict(self) -> dict:
+        """JSON-friendly form used by the web API and MCP tools."""
+        usage = None
+        if self.available_slots is not None:
+            usage = {
+                "used": self.used,
+                "max": self.max_services,
+                "available_slots": self.available_slots,
+                "available": self.available_slots > 0,
+            }
+        return {
+            "name": self.name,
+            "address": self.address,
+            "status": self.status,
+            "usage": usage,
+            "min_staking_deposit": self.min_staking_deposit,
+            "staking_token": self.staking_token,
+            "balance": self.balance,
+        }
+
+
+class StakingAvailabilitySnapshot:
+    """Singleton holding the latest availability snapshot of each chain."""
+
+    _instance = None
+    _lock = Lock()
+
+    DEFAULT_REFRESH_INTERVAL = 300
+
+    def __new__(cls) -> "StakingAvailabilitySnapshot":
+        """Ensure singleton instance."""
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(StakingAvailabilitySnapshot, cls).__new__(cls)
+                cls._instance._snapshots: Dict[str, Tuple[float, List[StakingAvailability]]] = {}
+                cls._instance._refresh_locks: Dict[str, Lock] = {}
+                cls._instance._invalidated_at: Dict[str, float] = {}
+                cls._instance._stop = threading.Event()
+                cls._instance._refresher: Optional[threading.Thread] = None
+                cls._instance.refresh_interval = cls.DEFAULT_REFRESH_INTERVAL
+        return cls._instance
+
+    def get(self, chain_name: str) -> List[StakingAvailability]:
+        """Availability of the known staking contracts of *chain_name*.
+
+        Served from memory while fresh; otherwise read in one batch. The
+        first call also starts the background refresher.
+        """
+        chain_name = chain_name.lower()
+        snapshot = self._fresh(chain_name)
+        if snapshot is None:
+            snapshot = self._refresh(chain_name, reuse_fresh=True)
+        self._start_refresher()
+        return snapshot
+
+    def refresh(self, chain_name: str) -> List[StakingAvailability]:
+        """Read the availability of every known staking contract of *chain_name* now."""
+        return self._refresh(chain_name.lower(), reuse_fresh=False)
+
+    def _refresh(self, chain_name: str, reuse_fresh: bool) -> List[StakingAvailability]:
+        """Read the chain's snapshot, one reader per chain at a time.
+
+        A snapshot stored by another reader while we waited is reused if it
+        was started after our request, or, with *reuse_fresh*, if it is fresh.
+        """
+        with self._lock:
+            refresh_lock = self._refresh_locks.setdefault(chain_name, Lock())
+
+        requested = time.time()
+        with refresh_lock:
+            with self._lock:
+                entry = self._snapshots.get(chain_name)
+            if entry is not None and entry[0] >= requested:
+                return entry[1]
+            if reuse_fresh:
+                snapshot = self._fresh(chain_name)
+                if snapshot is not None:
+                    return snapshot
+
+            started = time.time()
+            snapshot, answered = self._read(chain_name)
+            with self._lock:
+                # A read that overlapped an invalidation may predate the change
+                if answered and started >= self._invalidated_at.get(chain_name, 0):
+                    self._snapshots[chain_name] = (started, snapshot)
+            return snapshot
+
+    def invalidate(self, chain_name: Optional[str] = None) -> None:
+        """Drop the snapshot of *chain_name*, or of every chain."""
+        now = time.time()
+        with self._lock:
+            chains = (
+                set(self._snapshots) | set(self._refresh_locks)
+                if chain_name is None
+                else [chain_name.lower()]
+            )
+            for chain in chains:
+                self._snapshots.pop(chain, None)
+                self._invalidated_at[chain] = now
+
+    def stop(self) -> None:
+        """Stop the background refresher."""
+        self._stop.set()
+        refresher, self._refresher = self._refresher, None
+        if refresher is not None and refresher is not threading.current_thread():
+            refresher.join(timeout=5)
+
+    def _fresh(self, chain_name: str) -> Optional[List[StakingAvailability]]:
+        """The chain's snapshot, unless missing or older than two refresh intervals."""
+        with self._lock:
+            entry = self._snapshots.get(chain_name)
+        # Two intervals: the refresher keeps it younger than that while alive
+        if entry is None or time.time() - entry[0] > 2 * self.refresh_interval:
+            return None
+        return entry[1]
+
+    def _start_refresher(self) -> None:
+        """Start the background refresher if it is not running."""
+        with self._lock:
+            if self._refresher is not None and self._refresher.is_alive():
+                return
+            self._stop = threading.Event()
+            self._refresher = threading.Thread(
+                target=self._refresh_loop, args=(self._stop,), daemon=True
+            )
+            self._refresher.start()
+
+    def _refresh_loop(self, stop: threading.Event) -> None:
+        """Refresh every chain that has been read, once per interval."""
+        while not stop.wait(self.refresh_interval):
+            with self._lock:
+                chains = list(self._refresh_locks)
+            for chain_name in chains:
+                try:
+                    self.refresh(chain_name)
+                except Exception as e:
+                    logger.warning(f"Failed to refresh staking availability on {chain_name}: {e}")
+
+    @staticmethod
+    def _read(chain_name: str) -> Tuple[List[StakingAvailability], bool]:
+        """Read every known staking contract of *chain_name* in one Multicall3 batch.
+
+        Returns:
+            The availability of each contract, and whether the chain answered
+            (any contract read, or no contracts to read). Contracts that
+            failed are retried on the next refresh.
+
+        """
+        from iwa.plugins.olas.constants import (
+            OLAS_TRADER_STAKING_CONTRACTS,
+            get_staking_contract_info,
+        )
+
+        batch = MulticallBatch(chain_name)
+        stores = []
+        reads = []
+        for name, address in OLAS_TRADER_STAKING_CONTRACTS.get(chain_name, {}).items():
+            try:
+                contract = ContractCache().get_contract(
+                    StakingContract, address, chain_name=chain_name
+                )
+            except Exception as e:
+                logger.warning(f"Failed to load staking contract {name} ({address}): {e}")
+                reads.append((name, str(address), None, None, None))
+                continue
+            stores.append(contract.queue_contract_params(batch))
+            reads.append(
+                (
+                    name,
+                    str(address),
+                    contract,
+                    batch.add(contract, "getServiceIds"),
+                    batch.add(contract, "balance"),
+                )
+            )
+
+        try:
+            if len(batch):
+                batch.execute()
+            for store in stores:
+                store()
+        except Exception as e:
+            logger.warning(f"Failed to read staking availability on {chain_name}: {e}")
+            reads = [(name, address, None, None, None) for name, address, *_ in reads]
+
+        snapshot = []
+        answered = not reads
+        for name, address, contract, service_ids, balance in reads:
+            info = get_staking_contract_info(address, chain=chain_name)
+            status = info.status.value if info else None
+            if contract is None or not service_ids.success:
+                snapshot.append(StakingAvailability(name, address, status))
+                continue
+            try:
+                snapshot.append(
+                    StakingAvailability(
+                        name,
+                        address,
+                        status,
+                        used=len(service_ids.value),
+                        max_services=contract.max_num_services,
+                        min_staking_deposit=contract.min_staking_deposit,
+                        staking_token=str(contract.staking_token_address),
+                        balance=balance.value if balance.success else None,
+                    )
+                )
+                answered = True
+            except Exception as e:
+                logger.warning(f"Failed to check availability for {name} ({address}): {e}")
+                snapshot.append(StakingAvailability(name, address, status))
+        return snapshot, answered
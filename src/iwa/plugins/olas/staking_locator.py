@@ -0,0 +1,123 @@
+"""Find which staking contract actually holds a service.
+
+When a service is not staked in the contract its config points to, the
+dashboard looks for it in every known staking contract of the chain. Asking
+each contract in turn costs one RPC per contract, for every such service,
+on every refresh. ``StakingLocator`` asks all of them in one Multicall3
+batch and remembers the answer, including "not found", per service.
+
+An answer only changes when the service is staked, unstaked or evicted.
+Entries are dropped when ``ServiceManager`` stakes or unstakes the service
+and when ``OlasEventInvalidator`` sees a staking event for it; ``ttl`` bounds
+their age when no event watcher is running.
+"""
+
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from iwa.core.contracts.cache import ContractCache
+from iwa.core.contracts.multicall import MulticallBatch
+from iwa.plugins.olas.contracts.staking import StakingContract, StakingState
+
+
+@dataclass(frozen=True)
+class StakingLocation:
+    """A staking contract that holds a service."""
+
+    name: str
+    address: str
+    state: StakingState
+
+
+class StakingLocator:
+    """Singleton cache of the staking contracts holding each service."""
+
+    _instance = None
+    _lock = Lock()
+
+    DEFAULT_TTL = 3600
+
+    def __new__(cls) -> "StakingLocator":
+        """Ensure singleton instance."""
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(StakingLocator, cls).__new__(cls)
+                cls._instance._locations: Dict[
+                    Tuple[str, int], Tuple[float, List[StakingLocation]]
+                ] = {}
+                cls._instance.ttl = cls.DEFAULT_TTL
+        return cls._instance
+
+    def locate(self, chain_name: str, service_id: int) -> List[StakingLocation]:
+        """Known staking contracts of *chain_name* where the service is staked or evicted."""
+        key = (chain_name.lower(), int(service_id))
+        with self._lock:
+            cached = self._locations.get(key)
+            if cached is not None and time.time() - cached[0] < self.ttl:
+                return cached[1]
+
+        # Scan outside the lock: it waits on an RPC
+        locations, complete = self._scan(*key)
+        if complete:
+            with self._lock:
+                self._locations[key] = (time.time(), locations)
+        return locations
+
+    def forget(self, chain_name: Optional[str] = None, service_id: Optional[int] = None) -> None:
+        """Drop the answer for one service, for every service of a chain, or all of them."""
+        with self._lock:
+            if chain_name is None:
+                self._locations.clear()
+            elif service_id is None:
+                chain_name = chain_name.lower()
+                for key in [k for k in self._locations if k[0] == chain_name]:
+                    del self._locations[key]
+            else:
+                self._locations.pop((chain_name.lower(), int(service_id)), None)
+
+    @staticmethod
+    def _scan(chain_name: str, service_id: int) -> Tuple[List[StakingLocation], bool]:
+        """Ask every known staking contract of the chain for the service's state.
+
+        Returns:
+            The contracts holding the service and whether every contract answered.
+
+        """
+        from iwa.plugins.olas.constants import OLAS_TRADER_STAKING_CONTRACTS
+
+        batch = MulticallBatch(chain_name)
+        calls = []
+        complete = True
+        for name, address in OLAS_TRADER_STAKING_CONTRACTS.get(chain_name, {}).items():
+            try:
+                contract = ContractCache().get_contract(
+                    StakingContract, address, chain_name=chain_name
+                )
+            except Exception as e:
+                logger.debug(f"Could not load staking contract {name} ({address}): {e}")
+                complete = False
+                continue
+            calls.append((name, str(address), batch.add(contract, "getStakingState", service_id)))
+        if not calls:
+            return [], complete
+
+        try:
+            batch.execute()
+        except Exception as e:
+            logger.debug(f"Could not scan staking contracts for service {service_id}: {e}")
+            return [], False
+
+        locations = []
+        for name, address, call in calls:
+            if not call.success:
+                logger.debug(f"Could not check contract {name} ({address})")
+                complete = False
+                continue
+            state = StakingState(call.value)
+            if state in (StakingState.STAKED, StakingState.EVICTED):
+                locations.append(StakingLocation(name, address, state))
+        return locations, complete
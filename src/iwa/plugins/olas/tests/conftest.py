@@ -1,6 +1,7 @@
 """Shared fixtures for Olas tests."""
 
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -28,3 +29,25 @@ def mock_olas_config():
         staking_contract_address="0x78731D3Ca6b7E34aC0F824c42a7cC18A495cabaB",
     )
     return OlasConfig(services={"gnosis:1": service})
+
+
+@pytest.fixture
+def serve_fleet():
+    """Serve OlasView's fleet snapshot from canned data instead of the chain.
+
+    Set ``staking_status`` and ``state`` on the yielded object; every service
+    loaded through ``ServiceFleetSnapshot.load`` gets them.
+    """
+    from iwa.plugins.olas.fleet import ServiceFleetSnapshot, ServiceSnapshot
+
+    fleet = SimpleNamespace(staking_status=None, state="DEPLOYED")
+
+    def load(self, services=None, force_refresh=False, include_balances=True):
+        self.services = {
+            key: ServiceSnapshot(key, service, fleet.state, fleet.staking_status)
+            for key, service in (services or {}).items()
+        }
+        return self
+
+    with patch.object(ServiceFleetSnapshot, "load", load):
+        yield fleet
@@ -36,6 +36,9 @@ def checker():
         instance = ActivityCheckerContract(
             EthereumAddress(ADDR_CHECKER), chain_name="gnosis"
         )
+        # Calls go through ContractInstance.call and the chain's retry logic
+        instance.chain_interface = MagicMock()
+        instance.chain_interface.with_retry.side_effect = lambda operation, **kwargs: operation()
         # Expose the mock_contract for test manipulation
         instance._mock_contract = mock_contract
         yield instance
@@ -204,6 +207,22 @@ class TestLivenessRatio:
         result = checker.liveness_ratio
         assert result == 0
 
+    def test_queue_liveness_ratio_stores_batched_value(self, checker):
+        """The ratio read in a caller-owned batch is cached on the checker."""
+        batch = MagicMock()
+        batch.add.return_value = MagicMock(success=True, value=10**15)
+        store = checker.queue_liveness_ratio(batch)
+        batch.add.assert_called_once_with(checker, "livenessRatio")
+        store()
+        assert checker.liveness_ratio == 10**15
+
+    def test_queue_liveness_ratio_skips_cached_value(self, checker):
+        """Nothing is queued once the ratio is known."""
+        checker._liveness_ratio = 10**15
+        batch = MagicMock()
+        checker.queue_liveness_ratio(batch)()
+        batch.add.assert_not_called()
+
 
 class TestIsRatioPass:
     """Test is_ratio_pass method."""
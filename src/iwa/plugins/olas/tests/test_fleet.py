@@ -0,0 +1,149 @@
+"""Tests for the batched OLAS service fleet snapshot."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from iwa.core.contracts.multicall import MulticallCall, MulticallResult
+from iwa.plugins.olas.contracts.staking import StakingContract
+from iwa.plugins.olas.fleet import ServiceFleetSnapshot
+from iwa.plugins.olas.models import Service, StakingStatus
+from iwa.web.cache import response_cache
+
+STAKING = "0x78731D3Ca6b7E34aC0F824c42a7cC18A495cabaB"
+MULTISIG = "0x1111111111111111111111111111111111111111"
+AGENT = "0x2222222222222222222222222222222222222222"
+NEXT_CHECKPOINT = int(time.time()) + 3600
+
+
+class FakeBatch:
+    """MulticallBatch stand-in answering from a table of canned results."""
+
+    executed = []
+
+    def __init__(self, chain_name):
+        self.calls = []
+
+    def __len__(self):
+        return len(self.calls)
+
+    def add(self, contract, method_name, *args, allow_failure=True):
+        call = MulticallCall(contract, method_name, args)
+        self.calls.append(call)
+        return call
+
+    def execute(self):
+        FakeBatch.executed.append([(c.method_name, c.args) for c in self.calls])
+        for call in self.calls:
+            call.result = MulticallResult(success=True, value=self._respond(call))
+
+    @staticmethod
+    def _respond(call):
+        service_id = call.args[0] if call.args else None
+        return {
+            "getService": (0, MULTISIG, b"", 1, 1, 1, 4, [25]),
+            "getStakingState": 1 if service_id in (1, 2) else 0,
+            "getServiceInfo": ((MULTISIG, AGENT, (10, 5), 1000, 10**18, 0),),
+            "getMultisigNonces": [15, 8],
+            "epochCounter": 7,
+            "getNextRewardCheckpointTimestamp": NEXT_CHECKPOINT,
+        }[call.method_name]
+
+
+def _staking():
+    staking = MagicMock()
+    staking.unpack_service_info = StakingContract.unpack_service_info
+    staking.activity_checker_address = STAKING
+    staking.activity_checker.liveness_ratio = 10
+    staking.queue_contract_params.return_value = lambda: None
+    staking.build_service_info.side_effect = lambda info, nonces, epoch_end: {
+        "mech_requests_this_epoch": nonces[1] - info[2][1],
+        "epoch_end_utc": epoch_end,
+    }
+    return staking
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    response_cache.invalidate()
+    FakeBatch.executed = []
+    yield
+    response_cache.invalidate()
+
+
+@pytest.fixture
+def fleet_env():
+    """Patch the fleet's chain access with fakes and yield the fake manager."""
+    staking = _staking()
+    with (
+        patch("iwa.plugins.olas.fleet.MulticallBatch", FakeBatch),
+        patch("iwa.plugins.olas.fleet.ContractCache") as mock_cache,
+        patch("iwa.plugins.olas.fleet.ServiceManager") as mock_sm,
+    ):
+        mock_cache.return_value.get_contract.return_value = staking
+        manager = mock_sm.return_value
+        manager.detect_staking_mismatch.return_value = {}
+        manager.build_staked_status.side_effect = (
+            lambda contract, address, info, epoch: StakingStatus(
+                is_staked=True,
+                staking_state="STAKED",
+                staking_contract_address=address,
+                epoch_number=epoch,
+                mech_requests_this_epoch=info["mech_requests_this_epoch"],
+            )
+        )
+        yield manager
+
+
+def _services(count=3):
+    return {
+        f"gnosis:{i}": Service(
+            service_name=f"Trader {i}",
+            chain_name="gnosis",
+            service_id=i,
+            agent_address=AGENT,
+            multisig_address=MULTISIG,
+            staking_contract_address=STAKING,
+        )
+        for i in range(1, count + 1)
+    }
+
+
+def test_fleet_is_read_in_two_batches(fleet_env, mock_wallet):
+    mock_wallet.key_storage.find_stored_account.return_value = None
+    mock_wallet.balance_service.get_balances_eth.return_value = {AGENT: {"native": 1.0}}
+
+    snapshot = ServiceFleetSnapshot(mock_wallet, "gnosis").load(_services())
+
+    assert len(FakeBatch.executed) == 2
+    first, second = FakeBatch.executed
+    assert [m for m, _ in first].count("getService") == 3
+    assert [m for m, _ in first].count("epochCounter") == 1  # Once per staking contract
+    assert second == [("getMultisigNonces", (MULTISIG,))] * 2  # Staked services only
+
+    staked = snapshot.services["gnosis:1"]
+    assert staked.state == "DEPLOYED"
+    assert staked.staking_status.epoch_number == 7
+    assert staked.staking_status.mech_requests_this_epoch == 3
+    assert snapshot.services["gnosis:3"].staking_status.staking_state == "NOT_STAKED"
+    fleet_env.detect_staking_mismatch.assert_called_once_with(3, STAKING)
+
+    # Every account is read in a single balances call
+    mock_wallet.balance_service.get_balances_eth.assert_called_once()
+    assert snapshot.balances == {AGENT: {"native": 1.0}}
+
+
+def test_cached_services_are_not_read_again(fleet_env, mock_wallet):
+    services = _services()
+    ServiceFleetSnapshot(mock_wallet, "gnosis").load(services, include_balances=False)
+    FakeBatch.executed = []
+
+    snapshot = ServiceFleetSnapshot(mock_wallet, "gnosis").load(services, include_balances=False)
+    assert FakeBatch.executed == []
+    assert snapshot.services["gnosis:2"].staking_status.is_staked
+
+    ServiceFleetSnapshot(mock_wallet, "gnosis").load(
+        services, force_refresh=True, include_balances=False
+    )
+    assert len(FakeBatch.executed) == 2
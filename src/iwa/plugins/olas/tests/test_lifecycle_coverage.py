@@ -347,51 +347,35 @@ class TestGetAgentBondFromTokenUtility:
     """Tests for _get_agent_bond_from_token_utility."""
 
     def test_utility_address_not_found(self, sm):
-        """Lines 494-495: Token Utility address not found for chain."""
+        """Token Utility address not found for chain."""
         sm.service = _make_service()
-        sm.chain_name = "gnosis"
-        with patch(
-            "iwa.plugins.olas.service_manager.lifecycle.OLAS_CONTRACTS", {"gnosis": {}}
-        ):
-            result = sm._get_agent_bond_from_token_utility()
+        sm.token_utility = None
+        result = sm._get_agent_bond_from_token_utility()
         assert result is None
 
     def test_no_agent_ids_in_service(self, sm):
-        """Lines 500-502: no agent_ids in service info."""
+        """No agent_ids in service info."""
         sm.service = _make_service()
-        sm.chain_name = "gnosis"
+        sm.token_utility = MagicMock()
         sm.registry = MagicMock()
         sm.registry.get_service.return_value = {"agent_ids": []}
 
-        with patch(
-            "iwa.plugins.olas.service_manager.lifecycle.OLAS_CONTRACTS",
-            {"gnosis": {"OLAS_SERVICE_REGISTRY_TOKEN_UTILITY": ADDR_UTILITY}},
-        ):
-            result = sm._get_agent_bond_from_token_utility()
+        result = sm._get_agent_bond_from_token_utility()
         assert result is None
+        sm.token_utility.get_agent_bond.assert_not_called()
 
     def test_successful_bond_retrieval(self, sm):
-        """Lines 503-517: successful path through get_agent_bond."""
+        """Successful path through get_agent_bond."""
         sm.service = _make_service()
-        sm.chain_name = "gnosis"
         sm.registry = MagicMock()
         sm.registry.get_service.return_value = {"agent_ids": [25]}
+        sm.token_utility = MagicMock()
+        sm.token_utility.get_agent_bond.return_value = 5000
 
-        mock_utility = MagicMock()
-        mock_utility.get_agent_bond.return_value = 5000
-
-        with patch(
-            "iwa.plugins.olas.service_manager.lifecycle.OLAS_CONTRACTS",
-            {"gnosis": {"OLAS_SERVICE_REGISTRY_TOKEN_UTILITY": ADDR_UTILITY}},
-        ):
-            with patch(
-                "iwa.plugins.olas.service_manager.lifecycle.ContractCache"
-            ) as mock_cache:
-                mock_cache.return_value.get_contract.return_value = mock_utility
-                result = sm._get_agent_bond_from_token_utility()
+        result = sm._get_agent_bond_from_token_utility()
 
         assert result == 5000
-        mock_utility.get_agent_bond.assert_called_once_with(1, 25)
+        sm.token_utility.get_agent_bond.assert_called_once_with(1, 25)
 
 
 # ============================================================================
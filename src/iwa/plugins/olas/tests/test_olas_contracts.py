@@ -15,6 +15,7 @@ from iwa.plugins.olas.contracts.staking import StakingContract
 from iwa.plugins.olas.mech_reference import MECH_ECOSYSTEM
 from iwa.plugins.olas.models import Service
 from iwa.plugins.olas.service_manager import ServiceManager
+from iwa.plugins.olas.service_manager.base import ChainContextPool
 
 VALID_ADDR = "0x1234567890123456789012345678901234567890"
 
@@ -43,7 +44,7 @@ def setup_manager(wallet):
         with patch("iwa.plugins.olas.service_manager.ChainInterfaces") as mock_ci:
             mock_ci.return_value.get.return_value = MagicMock()
             mock_ci.return_value.get_contract_address.return_value = VALID_ADDR
-            with patch.object(ServiceManager, "_init_contracts"):
+            with patch.object(ServiceManager, "init_contracts"):
                 manager = ServiceManager(wallet)
                 manager.registry = MagicMock(name="registry_mock")
                 manager.manager = MagicMock(name="manager_mock")
@@ -184,7 +185,8 @@ def test_service_manager_config_edges(mock_wallet):
                         manager = ServiceManager(mock_wallet, service_key="gnosis:1")
                         assert manager.service is not None
 
-            # hits 78
+            # hits 78 (drop the context resolved above so the constants are re-read)
+            ChainContextPool().invalidate()
             with patch("iwa.plugins.olas.service_manager.base.OLAS_CONTRACTS", {"gnosis": {}}):
                 with pytest.raises(ValueError):
                     ServiceManager(mock_wallet)
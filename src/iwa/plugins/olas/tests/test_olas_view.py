@@ -29,23 +29,22 @@ class OlasTestApp(App):
 
 
 @pytest.mark.asyncio
-async def test_olas_view_initial_load(mock_wallet, mock_olas_config):
+async def test_olas_view_initial_load(mock_wallet, mock_olas_config, serve_fleet):
     """Test OlasView initial loading and rendering."""
     with patch("iwa.core.models.Config") as mock_config_cls:
         mock_config = mock_config_cls.return_value
         mock_config.plugins = {"olas": mock_olas_config.model_dump()}
 
         with (
-            patch("iwa.plugins.olas.service_manager.ServiceManager") as mock_sm_cls,
+            patch("iwa.plugins.olas.service_manager.ServiceManager"),
             patch("iwa.core.pricing.PriceService") as mock_price_cls,
         ):
-            mock_sm = mock_sm_cls.return_value
             # Default mock return value to avoid TypeErrors in background thread
-            mock_sm.get_staking_status.return_value = StakingStatus(
+            serve_fleet.staking_status = StakingStatus(
                 is_staked=False, staking_state="NOT_STAKED", remaining_epoch_seconds=3600
             )
 
-            mock_sm.get_staking_status.return_value = StakingStatus(
+            serve_fleet.staking_status = StakingStatus(
                 is_staked=True,
                 staking_state="STAKED",
                 staking_contract_address="0x389B46c259631Acd6a69Bde8B6cEe218230bAE8C",
@@ -56,7 +55,7 @@ async def test_olas_view_initial_load(mock_wallet, mock_olas_config):
                 epoch_number=1,
                 unstake_available_at="2025-12-24T12:00:00Z",
             )
-            mock_sm.get_service_state.return_value = "DEPLOYED"
+            serve_fleet.state = "DEPLOYED"
             mock_price_cls.return_value.get_token_price.return_value = 1.23
 
             app = OlasTestApp(mock_wallet)
@@ -75,7 +74,7 @@ async def test_olas_view_initial_load(mock_wallet, mock_olas_config):
 
 
 @pytest.mark.asyncio
-async def test_olas_view_chain_change(mock_wallet, mock_olas_config):
+async def test_olas_view_chain_change(mock_wallet, mock_olas_config, serve_fleet):
     """Test changing chain in OlasView."""
     with patch("iwa.core.models.Config") as mock_config_cls:
         mock_config = mock_config_cls.return_value
@@ -88,10 +87,10 @@ async def test_olas_view_chain_change(mock_wallet, mock_olas_config):
         ):
             mock_sm = mock_sm_cls.return_value
             mock_sm.get_services_full.return_value = []
-            mock_sm.get_staking_status.return_value = StakingStatus(
+            serve_fleet.staking_status = StakingStatus(
                 is_staked=False, staking_state="NOT_STAKED", remaining_epoch_seconds=3600
             )
-            mock_sm.get_service_state.return_value = "DEPLOYED"
+            serve_fleet.state = "DEPLOYED"
             app = OlasTestApp(mock_wallet)
             async with app.run_test() as pilot:
                 view = app.query_one(OlasView)
@@ -126,24 +125,23 @@ async def test_olas_view_chain_change(mock_wallet, mock_olas_config):
 
 
 @pytest.mark.asyncio
-async def test_olas_view_actions(mock_wallet, mock_olas_config):
+async def test_olas_view_actions(mock_wallet, mock_olas_config, serve_fleet):
     """Test button actions in OlasView."""
     with patch("iwa.core.models.Config") as mock_config_cls:
         mock_config = mock_config_cls.return_value
         mock_config.plugins = {"olas": mock_olas_config.model_dump()}
 
         with (
-            patch("iwa.plugins.olas.service_manager.ServiceManager") as mock_sm_cls,
+            patch("iwa.plugins.olas.service_manager.ServiceManager"),
             patch("iwa.core.pricing.PriceService"),
         ):
-            mock_sm = mock_sm_cls.return_value
-            mock_sm.get_staking_status.return_value = StakingStatus(
+            serve_fleet.staking_status = StakingStatus(
                 is_staked=True,
                 staking_state="STAKED",
                 accrued_reward_wei=10**18,
                 remaining_epoch_seconds=0,  # Checkpoint pending
             )
-            mock_sm.get_service_state.return_value = "DEPLOYED"
+            serve_fleet.state = "DEPLOYED"
 
             app = OlasTestApp(mock_wallet)
             async with app.run_test() as pilot:
@@ -170,21 +168,22 @@ async def test_olas_view_actions(mock_wallet, mock_olas_config):
 
 
 @pytest.mark.asyncio
-async def test_olas_view_create_service(mock_wallet, mock_olas_config):
+async def test_olas_view_create_service(
+    mock_wallet, mock_olas_config, serve_fleet, serve_staking_availability
+):
     """Test clicking Create Service button."""
     with patch("iwa.core.models.Config") as mock_config_cls:
         mock_config = mock_config_cls.return_value
         mock_config.plugins = {"olas": mock_olas_config.model_dump()}
 
         with (
-            patch("iwa.plugins.olas.service_manager.ServiceManager") as mock_sm_cls,
+            patch("iwa.plugins.olas.service_manager.ServiceManager"),
             patch("iwa.core.pricing.PriceService"),
         ):
-            mock_sm = mock_sm_cls.return_value
-            mock_sm.get_staking_status.return_value = StakingStatus(
+            serve_fleet.staking_status = StakingStatus(
                 is_staked=False, staking_state="NOT_STAKED"
             )
-            mock_sm.get_service_state.return_value = "DEPLOYED"
+            serve_fleet.state = "DEPLOYED"
 
             app = OlasTestApp(mock_wallet)
             async with app.run_test() as pilot:
@@ -207,21 +206,20 @@ async def test_olas_view_create_service(mock_wallet, mock_olas_config):
 
 
 @pytest.mark.asyncio
-async def test_olas_view_fund_service(mock_wallet, mock_olas_config):
+async def test_olas_view_fund_service(mock_wallet, mock_olas_config, serve_fleet):
     """Test showing fund service modal."""
     with patch("iwa.core.models.Config") as mock_config_cls:
         mock_config = mock_config_cls.return_value
         mock_config.plugins = {"olas": mock_olas_config.model_dump()}
 
         with (
-            patch("iwa.plugins.olas.service_manager.ServiceManager") as mock_sm_cls,
+            patch("iwa.plugins.olas.service_manager.ServiceManager"),
             patch("iwa.core.pricing.PriceService"),
         ):
-            mock_sm = mock_sm_cls.return_value
-            mock_sm.get_staking_status.return_value = StakingStatus(
+            serve_fleet.staking_status = StakingStatus(
                 is_staked=False, staking_state="NOT_STAKED"
             )
-            mock_sm.get_service_state.return_value = "DEPLOYED"
+            serve_fleet.state = "DEPLOYED"
 
             app = OlasTestApp(mock_wallet)
             async with app.run_test() as pilot:
@@ -64,7 +64,7 @@ async def wait_for_workers(view, pilot):
 
 
 @pytest.mark.asyncio
-async def test_olas_view_actions_suite(mock_wallet, mock_olas_config):
+async def test_olas_view_actions_suite(mock_wallet, mock_olas_config, serve_fleet):
     """Unified test for OlasView actions with robust mocking and synchronization."""
     with patch("iwa.core.models.Config") as mock_conf_cls:
         mock_conf = mock_conf_cls.return_value
@@ -77,7 +77,7 @@ async def test_olas_view_actions_suite(mock_wallet, mock_olas_config):
         ):
             mock_sm = mock_sm_cls.return_value
             # Default staking status to avoid TypeErrors during cards rendering
-            mock_sm.get_staking_status.return_value = StakingStatus(
+            serve_fleet.staking_status = StakingStatus(
                 is_staked=True,
                 staking_state="STAKED",
                 remaining_epoch_seconds=3600,
@@ -4,11 +4,12 @@ from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
+from iwa.plugins.olas.staking_availability import StakingAvailability
 from iwa.plugins.olas.tui.olas_view import OlasView
 
 
 @pytest.mark.asyncio
-async def test_olas_view_modal_callbacks_full(mock_wallet):
+async def test_olas_view_modal_callbacks_full(mock_wallet, serve_staking_availability):
     """Test OlasView modal callbacks directly for coverage."""
     # Patch ServiceManager globally for the view init
     with patch("iwa.plugins.olas.service_manager.ServiceManager"):
@@ -92,6 +93,7 @@ async def test_olas_view_modal_callbacks_full(mock_wallet):
 
             # 3. Stake Service callback
             view._chain = "gnosis"
+            serve_staking_availability.append(StakingAvailability(name="test", address="0x1"))
             with patch(
                 "iwa.plugins.olas.constants.OLAS_TRADER_STAKING_CONTRACTS",
                 {"gnosis": {"test": "0x1"}},
@@ -6,10 +6,11 @@ import pytest
 
 from iwa.core.models import StoredAccount
 from iwa.core.wallet import Wallet
-from iwa.plugins.olas.contracts.service import ServiceState
+from iwa.plugins.olas.contracts.service import ServiceRegistryContract, ServiceState
 from iwa.plugins.olas.contracts.staking import StakingState
 from iwa.plugins.olas.models import OlasConfig, Service
 from iwa.plugins.olas.service_manager import ServiceManager
+from iwa.plugins.olas.service_manager.base import ChainContextPool
 
 # Valid test addresses (checksummed)
 TEST_MULTISIG_ADDR = "0x5555555555555555555555555555555555555555"
@@ -1021,3 +1022,56 @@ def test_activate_registration_token_service_approves_token_utility(service_mana
 
     # Verify approval was called
     mock_wallet.transfer_service.approve_erc20.assert_called()
+
+
+def test_managers_share_the_chain_context(mock_wallet, mock_olas_config):
+    """The registry's manager is resolved once per chain, not per ServiceManager."""
+    on_chain_manager = "0x52370eE170c0E2767B32687166791973a0dE7966"
+    with (
+        patch("iwa.plugins.olas.service_manager.base.Config") as mock_config_cls,
+        patch("iwa.plugins.olas.service_manager.base.ContractCache") as mock_cache,
+        patch("iwa.plugins.olas.service_manager.base.ChainInterfaces"),
+    ):
+        mock_config_cls.return_value.plugins = {"olas": mock_olas_config}
+        registry = MagicMock()
+        registry.call.return_value = on_chain_manager
+        mock_cache.return_value.get_contract.side_effect = lambda cls, address, chain_name: (
+            registry if cls is ServiceRegistryContract else MagicMock(address=address)
+        )
+
+        first = ServiceManager(mock_wallet)
+        second = ServiceManager(mock_wallet)
+
+        registry.call.assert_called_once_with("manager")
+        assert first.manager is second.manager
+        assert first.manager.address == on_chain_manager
+        assert first.token_utility is second.token_utility is not None
+
+        ChainContextPool().invalidate("gnosis")
+        ServiceManager(mock_wallet)
+        assert registry.call.call_count == 2
+
+
+def test_fallback_manager_context_expires_early(mock_wallet, mock_olas_config):
+    """A context built on the configured manager is retried after FALLBACK_TTL."""
+    with (
+        patch("iwa.plugins.olas.service_manager.base.Config") as mock_config_cls,
+        patch("iwa.plugins.olas.service_manager.base.ContractCache") as mock_cache,
+        patch("iwa.plugins.olas.service_manager.base.ChainInterfaces"),
+        patch("iwa.plugins.olas.service_manager.base.time") as mock_time,
+    ):
+        mock_config_cls.return_value.plugins = {"olas": mock_olas_config}
+        registry = MagicMock()
+        registry.call.side_effect = Exception("RPC down")
+        mock_cache.return_value.get_contract.side_effect = lambda cls, address, chain_name: (
+            registry if cls is ServiceRegistryContract else MagicMock(address=address)
+        )
+        mock_time.time.return_value = 1000.0
+
+        ServiceManager(mock_wallet)
+        ServiceManager(mock_wallet)
+        assert registry.call.call_count == 1
+
+        mock_time.time.return_value = 1000.0 + ChainContextPool.FALLBACK_TTL
+        ServiceManager(mock_wallet)
+        assert registry.call.call_count == 2
@@ -172,9 +172,8 @@ def test_sm_get_staking_status_with_full_info(mock_wallet):
         mock_staking.get_staking_state.return_value = StakingState.STAKED
         mock_staking.activity_checker_address = VALID_ADDR
         mock_staking.activity_checker.liveness_ratio = 10
-        mock_staking.get_epoch_counter.return_value = 5
         mock_staking.min_staking_duration = 86400
-        mock_staking.get_service_info.return_value = {
+        service_info = {
             "ts_start": 1000,
             "mech_requests_this_epoch": 3,
             "required_mech_requests": 5,
@@ -189,6 +188,7 @@ def test_sm_get_staking_status_with_full_info(mock_wallet):
             "current_mech_requests": 50,
             "last_checkpoint_mech_requests": 47,
         }
+        mock_staking.read_service_status.return_value = (service_info, 5)
 
         with (
             patch(
@@ -0,0 +1,191 @@
+"""Tests for the staking contract availability snapshot."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from iwa.core.contracts.multicall import MulticallCall, MulticallResult
+from iwa.plugins.olas.staking_availability import (
+    StakingAvailability,
+    StakingAvailabilitySnapshot,
+)
+
+OPEN = "0x389B46C259631Acd6a69Bde8B6cEe218230bAE8C"  # Hobbyist 1 Legacy (100 OLAS)
+FULL = "0x1111111111111111111111111111111111111111"
+OLAS = "0xcE11e14225575945b8E6Dc0D4F2dD4C570f79d9f"
+
+CONTRACTS = {"gnosis": {"Open": OPEN, "Full": FULL}}
+
+
+class FakeContract:
+    """StakingContract stand-in that caches its immutable params like the real one."""
+
+    PARAMS = ("maxNumServices", "minStakingDeposit", "stakingToken")
+
+    def __init__(self, address):
+        self.address = address
+        self.params = {}
+
+    def queue_contract_params(self, batch):
+        handles = {p: batch.add(self, p) for p in self.PARAMS if p not in self.params}
+
+        def store():
+            for param, handle in handles.items():
+                self.params[param] = handle.value
+
+        return store
+
+    @property
+    def max_num_services(self):
+        return self.params["maxNumServices"]
+
+    @property
+    def min_staking_deposit(self):
+        return self.params["minStakingDeposit"]
+
+    @property
+    def staking_token_address(self):
+        return self.params["stakingToken"]
+
+
+class FakeBatch:
+    """MulticallBatch stand-in answering from ``chain`` by (address, method)."""
+
+    chain = {}
+    executed = []
+
+    def __init__(self, chain_name):
+        self.calls = []
+
+    def __len__(self):
+        return len(self.calls)
+
+    def add(self, contract, method_name, *args, allow_failure=True):
+        call = MulticallCall(contract, method_name, args)
+        self.calls.append(call)
+        return call
+
+    def execute(self):
+        FakeBatch.executed.append([c.method_name for c in self.calls])
+        for call in self.calls:
+            value = FakeBatch.chain[(call.contract.address, call.method_name)]
+            call.result = MulticallResult(success=value is not None, value=value)
+
+
+@pytest.fixture
+def onchain():
+    """Patch the snapshot's chain access; yields the (address, method) -> value table."""
+    FakeBatch.chain = {
+        (OPEN, "getServiceIds"): [1, 2],
+        (OPEN, "balance"): 10**22,
+        (OPEN, "maxNumServices"): 10,
+        (OPEN, "minStakingDeposit"): 50 * 10**18,
+        (OPEN, "stakingToken"): OLAS,
+        (FULL, "getServiceIds"): [1, 2, 3],
+        (FULL, "balance"): 10**22,
+        (FULL, "maxNumServices"): 3,
+        (FULL, "minStakingDeposit"): 50 * 10**18,
+        (FULL, "stakingToken"): OLAS,
+    }
+    FakeBatch.executed = []
+    contracts = {address: FakeContract(address) for address in (OPEN, FULL)}
+    with (
+        patch("iwa.plugins.olas.staking_availability.MulticallBatch", FakeBatch),
+        patch("iwa.plugins.olas.staking_availability.ContractCache") as mock_cache,
+        patch("iwa.plugins.olas.constants.OLAS_TRADER_STAKING_CONTRACTS", CONTRACTS),
+    ):
+        mock_cache.return_value.get_contract.side_effect = (
+            lambda cls, address, chain_name: contracts[address]
+        )
+        yield FakeBatch.chain
+
+
+def test_all_contracts_are_read_in_one_batch(onchain):
+    snapshot = StakingAvailabilitySnapshot().get("gnosis")
+
+    assert len(FakeBatch.executed) == 1
+    open_, full = snapshot
+    assert open_.to_dict() == {
+        "name": "Open",
+        "address": OPEN,
+        "status": "active",
+        "usage": {"used": 2, "max": 10, "available_slots": 8, "available": True},
+        "min_staking_deposit": 50 * 10**18,
+        "staking_token": OLAS,
+        "balance": 10**22,
+    }
+    assert full.status is None  # Not in the registry
+    assert full.to_dict()["usage"]["available"] is False
+
+    # Served from memory until invalidated; immutable params are not read again
+    assert StakingAvailabilitySnapshot().get("GNOSIS") == snapshot
+    assert len(FakeBatch.executed) == 1
+
+    onchain[(OPEN, "getServiceIds")] = [1, 2, 3]
+    StakingAvailabilitySnapshot().invalidate("gnosis")
+    assert StakingAvailabilitySnapshot().get("gnosis")[0].used == 3
+    assert sorted(FakeBatch.executed[1]) == ["balance"] * 2 + ["getServiceIds"] * 2
+
+
+def test_read_overlapping_an_invalidation_is_not_kept(onchain):
+    snapshot = StakingAvailabilitySnapshot()
+    original_read = snapshot._read
+
+    def read_then_invalidate(chain_name):
+        result = original_read(chain_name)
+        snapshot.invalidate(chain_name)  # e.g. a stake landed during the read
+        return result
+
+    with patch.object(snapshot, "_read", side_effect=read_then_invalidate):
+        snapshot.get("gnosis")
+
+    snapshot.get("gnosis")
+    assert len(FakeBatch.executed) == 2
+
+
+def test_unreadable_contracts_are_listed_without_data(onchain):
+    onchain[(FULL, "getServiceIds")] = None
+
+    open_, full = StakingAvailabilitySnapshot().get("gnosis")
+
+    assert open_.used == 2
+    assert full.to_dict()["usage"] is None
+    assert full.accepts(service_bond=0)  # Unknown values do not exclude it
+    assert full.label == "Full"
+
+
+def test_failed_read_is_not_cached(onchain):
+    onchain[(OPEN, "getServiceIds")] = None
+    onchain[(FULL, "getServiceIds")] = None
+
+    StakingAvailabilitySnapshot().get("gnosis")
+    StakingAvailabilitySnapshot().get("gnosis")
+
+    assert len(FakeBatch.executed) == 2
+
+
+def test_background_refresher_rereads_chains_in_use(onchain):
+    snapshot = StakingAvailabilitySnapshot()
+    snapshot.refresh_interval = 0.01
+    try:
+        snapshot.get("gnosis")
+        deadline = time.time() + 2
+        while len(FakeBatch.executed) < 3 and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        snapshot.stop()
+        snapshot.refresh_interval = StakingAvailabilitySnapshot.DEFAULT_REFRESH_INTERVAL
+
+    assert len(FakeBatch.executed) >= 3
+
+
+def test_accepts_and_label():
+    availability = StakingAvailability(
+        "Expert", OPEN, used=3, max_services=20, min_staking_deposit=10**21, balance=12345 * 10**18
+    )
+
+    assert availability.label == "Expert (3/20 used · 12,345 OLAS)"
+    assert availability.accepts(service_bond=10**21)
+    assert not availability.accepts(service_bond=10**20)
+    assert not StakingAvailability("Poor", OPEN, balance=10**18).accepts()
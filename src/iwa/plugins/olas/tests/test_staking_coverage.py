@@ -22,6 +22,7 @@ from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
+from iwa.plugins.olas.constants import STAKING_CONTRACTS
 from iwa.plugins.olas.contracts.service import ServiceState
 from iwa.plugins.olas.contracts.staking import StakingContract, StakingState
 from iwa.plugins.olas.models import Service
@@ -176,22 +177,15 @@ class TestIdentifyStakingContractName:
     def test_name_found(self, mock_wallet):
         """Cover line 221: matching address returns name."""
         sm = _make_sm(mock_wallet)
+        info = STAKING_CONTRACTS[0]
 
-        with patch(
-            "iwa.plugins.olas.constants.OLAS_TRADER_STAKING_CONTRACTS",
-            {"gnosis": {"Expert 1": VALID_ADDR}},
-        ):
-            assert sm._identify_staking_contract_name(VALID_ADDR) == "Expert 1"
+        assert sm._identify_staking_contract_name(str(info.address).lower()) == info.name
 
     def test_name_not_found(self, mock_wallet):
         """Cover line 222: no match returns None."""
         sm = _make_sm(mock_wallet)
 
-        with patch(
-            "iwa.plugins.olas.constants.OLAS_TRADER_STAKING_CONTRACTS",
-            {"gnosis": {"Expert 1": VALID_ADDR_2}},
-        ):
-            assert sm._identify_staking_contract_name(VALID_ADDR_3) is None
+        assert sm._identify_staking_contract_name(VALID_ADDR_3) is None
 
 
 # ============================================================================
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, mock_open, patch
 
 from eth_account import Account
 
+from iwa.core.contracts.multicall import MulticallBatch
 from iwa.plugins.olas.contracts.service import (
     ServiceManagerContract,
     ServiceRegistryContract,
@@ -269,7 +270,11 @@ def test_staking_contract(tmp_path):  # noqa: C901
                 except Exception:
                     pass
 
-                info = staking.get_service_info(1)
+                # Answer the batched reads with the per-call mock
+                with patch.object(
+                    MulticallBatch, "_execute_chunk", MulticallBatch._execute_sequential
+                ):
+                    info = staking.get_service_info(1)
                 assert info["owner_address"] == VALID_ADDR_3
                 assert "remaining_epoch_seconds" in info
                 assert info["remaining_epoch_seconds"] > 0
@@ -312,6 +317,8 @@ def test_get_checkpoint_events():
                 mock_call_base.side_effect = init_side_effect
 
                 staking = StakingContract(VALID_ADDR_1)
+                events = {}
+                staking._get_events = MagicMock(return_value=events)
 
                 # Test 1: Checkpoint event with rewarded services
                 mock_checkpoint_log = MagicMock()
@@ -322,12 +329,12 @@ def test_get_checkpoint_events():
                 }
                 mock_checkpoint_log.blockNumber = 999
 
-                mock_contract.events.Checkpoint.get_logs.return_value = [mock_checkpoint_log]
+                events["Checkpoint"] = [mock_checkpoint_log]
 
                 # No warnings or evictions
-                mock_contract.events.ServiceInactivityWarning.get_logs.return_value = []
+                events["ServiceInactivityWarning"] = []
 
-                mock_contract.events.ServicesEvicted.get_logs.return_value = []
+                events["ServicesEvicted"] = []
 
                 result = staking.get_checkpoint_events(from_block=900, to_block=1000)
 
@@ -371,6 +378,8 @@ def test_get_checkpoint_events_with_warnings():
                 mock_call_base.side_effect = init_side_effect
 
                 staking = StakingContract(VALID_ADDR_1)
+                events = {}
+                staking._get_events = MagicMock(return_value=events)
 
                 # Checkpoint event
                 mock_checkpoint_log = MagicMock()
@@ -381,7 +390,7 @@ def test_get_checkpoint_events_with_warnings():
                 }
                 mock_checkpoint_log.blockNumber = 999
 
-                mock_contract.events.Checkpoint.get_logs.return_value = [mock_checkpoint_log]
+                events["Checkpoint"] = [mock_checkpoint_log]
 
                 # Inactivity warnings
                 mock_warning_log_1 = MagicMock()
@@ -389,12 +398,12 @@ def test_get_checkpoint_events_with_warnings():
                 mock_warning_log_2 = MagicMock()
                 mock_warning_log_2.args = {"serviceId": 103}
 
-                mock_contract.events.ServiceInactivityWarning.get_logs.return_value = [
+                events["ServiceInactivityWarning"] = [
                     mock_warning_log_1,
                     mock_warning_log_2,
                 ]
 
-                mock_contract.events.ServicesEvicted.get_logs.return_value = []
+                events["ServicesEvicted"] = []
 
                 result = staking.get_checkpoint_events(from_block=900)
 
@@ -436,6 +445,8 @@ def test_get_checkpoint_events_with_evictions():
                 mock_call_base.side_effect = init_side_effect
 
                 staking = StakingContract(VALID_ADDR_1)
+                events = {}
+                staking._get_events = MagicMock(return_value=events)
 
                 # Checkpoint event
                 mock_checkpoint_log = MagicMock()
@@ -446,16 +457,16 @@ def test_get_checkpoint_events_with_evictions():
                 }
                 mock_checkpoint_log.blockNumber = 888
 
-                mock_contract.events.Checkpoint.get_logs.return_value = [mock_checkpoint_log]
+                events["Checkpoint"] = [mock_checkpoint_log]
 
                 # No warnings
-                mock_contract.events.ServiceInactivityWarning.get_logs.return_value = []
+                events["ServiceInactivityWarning"] = []
 
                 # Evictions
                 mock_evicted_log = MagicMock()
                 mock_evicted_log.args = {"serviceIds": [101, 104]}
 
-                mock_contract.events.ServicesEvicted.get_logs.return_value = [mock_evicted_log]
+                events["ServicesEvicted"] = [mock_evicted_log]
 
                 result = staking.get_checkpoint_events(from_block=800)
 
@@ -498,13 +509,15 @@ def test_get_checkpoint_events_no_events():
                 mock_call_base.side_effect = init_side_effect
 
                 staking = StakingContract(VALID_ADDR_1)
+                events = {}
+                staking._get_events = MagicMock(return_value=events)
 
                 # No checkpoint events
-                mock_contract.events.Checkpoint.get_logs.return_value = []
+                events["Checkpoint"] = []
 
-                mock_contract.events.ServiceInactivityWarning.get_logs.return_value = []
+                events["ServiceInactivityWarning"] = []
 
-                mock_contract.events.ServicesEvicted.get_logs.return_value = []
+                events["ServicesEvicted"] = []
 
                 result = staking.get_checkpoint_events(from_block=900)
 
@@ -549,10 +562,8 @@ def test_get_checkpoint_events_handles_exceptions():
 
                 staking = StakingContract(VALID_ADDR_1)
 
-                # Checkpoint get_logs raises an exception
-                mock_contract.events.Checkpoint.get_logs.side_effect = Exception(
-                    "RPC error"
-                )
+                # Fetching the events raises an exception
+                staking._get_events = MagicMock(side_effect=Exception("RPC error"))
 
                 result = staking.get_checkpoint_events(from_block=900)
 
@@ -561,172 +572,3 @@ def test_get_checkpoint_events_handles_exceptions():
                 assert result["rewarded_services"] == {}
                 assert result["inactivity_warnings"] == []
                 assert result["evicted_services"] == []
-
-
-def test_fetch_events_chunked_splits_large_range():
-    """Test that _fetch_events_chunked splits large block ranges into chunks."""
-    with patch("builtins.open", side_effect=side_effect_open):
-        with patch("iwa.core.contracts.contract.ChainInterfaces") as mock_interfaces:
-            mock_chain = MagicMock()
-            mock_chain.with_retry.side_effect = lambda fn, **kw: fn()
-            mock_interfaces.return_value.get.return_value = mock_chain
-
-            mock_web3 = MagicMock()
-            mock_chain.web3 = mock_web3
-            mock_chain.web3._web3 = mock_web3
-            mock_web3.eth.block_number = 2000
-
-            mock_contract = MagicMock()
-            mock_web3.eth.contract.return_value = mock_contract
-
-            mock_contract.functions.agentMech.return_value.call.return_value = VALID_ADDR_2
-            mock_contract.functions.livenessRatio.return_value.call.return_value = 10**18
-
-            with patch(
-                "iwa.plugins.olas.contracts.staking.ContractInstance.call"
-            ) as mock_call_base:
-
-                def init_side_effect(method, *args):
-                    if method == "activityChecker":
-                        return VALID_ADDR_4
-                    if method == "stakingToken":
-                        return VALID_ADDR_2
-                    return 0
-
-                mock_call_base.side_effect = init_side_effect
-
-                staking = StakingContract(VALID_ADDR_1)
-
-                # Track calls to get_logs
-                call_ranges = []
-
-                def track_get_logs_calls(from_block, to_block):
-                    call_ranges.append((from_block, to_block))
-                    return []
-
-                mock_contract.events.Checkpoint.get_logs.side_effect = (
-                    track_get_logs_calls
-                )
-
-                # Fetch 1200 blocks with chunk_size=500 -> should make 3 calls
-                staking._fetch_events_chunked("Checkpoint", 0, 1199, chunk_size=500)
-
-                assert len(call_ranges) == 3
-                assert call_ranges[0] == (0, 499)
-                assert call_ranges[1] == (500, 999)
-                assert call_ranges[2] == (1000, 1199)
-
-
-def test_fetch_events_chunked_retries_with_smaller_chunks():
-    """Test that _fetch_events_chunked retries with smaller chunks on range error."""
-    with patch("builtins.open", side_effect=side_effect_open):
-        with patch("iwa.core.contracts.contract.ChainInterfaces") as mock_interfaces:
-            mock_chain = MagicMock()
-            mock_chain.with_retry.side_effect = lambda fn, **kw: fn()
-            mock_interfaces.return_value.get.return_value = mock_chain
-
-            mock_web3 = MagicMock()
-            mock_chain.web3 = mock_web3
-            mock_chain.web3._web3 = mock_web3
-            mock_web3.eth.block_number = 1000
-
-            mock_contract = MagicMock()
-            mock_web3.eth.contract.return_value = mock_contract
-
-            mock_contract.functions.agentMech.return_value.call.return_value = VALID_ADDR_2
-            mock_contract.functions.livenessRatio.return_value.call.return_value = 10**18
-
-            with patch(
-                "iwa.plugins.olas.contracts.staking.ContractInstance.call"
-            ) as mock_call_base:
-
-                def init_side_effect(method, *args):
-                    if method == "activityChecker":
-                        return VALID_ADDR_4
-                    if method == "stakingToken":
-                        return VALID_ADDR_2
-                    return 0
-
-                mock_call_base.side_effect = init_side_effect
-
-                staking = StakingContract(VALID_ADDR_1)
-
-                call_count = [0]
-
-                def fail_then_succeed(from_block, to_block):
-                    call_count[0] += 1
-                    # First call fails with range error, subsequent calls succeed
-                    if call_count[0] == 1:
-                        raise Exception("block range too large")
-                    return []
-
-                mock_contract.events.Checkpoint.get_logs.side_effect = (
-                    fail_then_succeed
-                )
-
-                # Should retry with smaller chunks
-                result = staking._fetch_events_chunked(
-                    "Checkpoint", 0, 499, chunk_size=500
-                )
-
-                # First call fails, then retries with chunk_size=250 (2 calls)
-                assert call_count[0] >= 2
-                assert result == []
-
-
-def test_fetch_events_chunked_aggregates_results():
-    """Test that _fetch_events_chunked aggregates events from all chunks."""
-    with patch("builtins.open", side_effect=side_effect_open):
-        with patch("iwa.core.contracts.contract.ChainInterfaces") as mock_interfaces:
-            mock_chain = MagicMock()
-            mock_chain.with_retry.side_effect = lambda fn, **kw: fn()
-            mock_interfaces.return_value.get.return_value = mock_chain
-
-            mock_web3 = MagicMock()
-            mock_chain.web3 = mock_web3
-            mock_chain.web3._web3 = mock_web3
-            mock_web3.eth.block_number = 1000
-
-            mock_contract = MagicMock()
-            mock_web3.eth.contract.return_value = mock_contract
-
-            mock_contract.functions.agentMech.return_value.call.return_value = VALID_ADDR_2
-            mock_contract.functions.livenessRatio.return_value.call.return_value = 10**18
-
-            with patch(
-                "iwa.plugins.olas.contracts.staking.ContractInstance.call"
-            ) as mock_call_base:
-
-                def init_side_effect(method, *args):
-                    if method == "activityChecker":
-                        return VALID_ADDR_4
-                    if method == "stakingToken":
-                        return VALID_ADDR_2
-                    return 0
-
-                mock_call_base.side_effect = init_side_effect
-
-                staking = StakingContract(VALID_ADDR_1)
-
-                chunk_num = [0]
-
-                def return_different_events(from_block, to_block):
-                    chunk_num[0] += 1
-                    # Each chunk returns a different event
-                    event = MagicMock()
-                    event.args = {"serviceId": 100 + chunk_num[0]}
-                    return [event]
-
-                mock_contract.events.ServiceInactivityWarning.get_logs.side_effect = (
-                    return_different_events
-                )
-
-                # Fetch 600 blocks with chunk_size=200 -> 3 chunks
-                result = staking._fetch_events_chunked(
-                    "ServiceInactivityWarning", 0, 599, chunk_size=200
-                )
-
-                # Should have 3 events aggregated
-                assert len(result) == 3
-                service_ids = [e.args["serviceId"] for e in result]
-                assert service_ids == [101, 102, 103]
@@ -4,9 +4,11 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from iwa.core.contracts.multicall import MulticallCall, MulticallResult
 from iwa.plugins.olas.contracts.staking import StakingState
 from iwa.plugins.olas.models import Service
 from iwa.plugins.olas.service_manager import ServiceManager
+from iwa.plugins.olas.staking_locator import StakingLocator
 
 ADDR_CONFIG = "0x78731D3Ca6b7E34aC0F824c42a7cC18A495cabaB"
 ADDR_ACTUAL = "0x1111111111111111111111111111111111111111"
@@ -52,86 +54,89 @@ def _make_sm(mock_wallet, **service_kwargs):
         return sm
 
 
+class FakeBatch:
+    """MulticallBatch stand-in answering getStakingState from ``states`` by address."""
+
+    states = {}
+    executed = 0
+
+    def __init__(self, chain_name):
+        self.calls = []
+
+    def add(self, contract, method_name, *args, allow_failure=True):
+        call = MulticallCall(contract, method_name, args)
+        self.calls.append(call)
+        return call
+
+    def execute(self):
+        FakeBatch.executed += 1
+        for call in self.calls:
+            state = FakeBatch.states.get(call.contract.address, StakingState.NOT_STAKED)
+            if isinstance(state, Exception):
+                call.result = MulticallResult(success=False, value=None)
+            else:
+                call.result = MulticallResult(success=True, value=state.value)
+
+
+@pytest.fixture
+def onchain():
+    """Patch the locator's chain access; yields the per-address state table."""
+    FakeBatch.states = {}
+    FakeBatch.executed = 0
+    with (
+        patch("iwa.plugins.olas.staking_locator.MulticallBatch", FakeBatch),
+        patch("iwa.plugins.olas.staking_locator.ContractCache") as mock_cache,
+        patch("iwa.plugins.olas.constants.OLAS_TRADER_STAKING_CONTRACTS", KNOWN_CONTRACTS),
+    ):
+        mock_cache.return_value.get_contract.side_effect = (
+            lambda cls, address, **kw: MagicMock(address=address)
+        )
+        yield FakeBatch.states
+
+
 class TestDetectStakingMismatch:
-    """Tests for _detect_staking_mismatch method."""
+    """Tests for detect_staking_mismatch method."""
 
-    @patch(
-        "iwa.plugins.olas.service_manager.staking.ContractCache",
-    )
-    @patch(
-        "iwa.plugins.olas.constants.OLAS_TRADER_STAKING_CONTRACTS",
-        KNOWN_CONTRACTS,
-    )
-    def test_mismatch_detected_staked_elsewhere(self, mock_cache_cls, mock_wallet):
+    def test_mismatch_detected_staked_elsewhere(self, onchain, mock_wallet):
         """Service is STAKED in a different contract than configured."""
         sm = _make_sm(mock_wallet)
+        onchain[ADDR_ACTUAL] = StakingState.STAKED
 
-        mock_contract = MagicMock()
-        mock_contract.get_staking_state.return_value = StakingState.STAKED
-        mock_cache_cls.return_value.get_contract.return_value = mock_contract
-
-        result = sm._detect_staking_mismatch(42, ADDR_CONFIG)
+        result = sm.detect_staking_mismatch(42, ADDR_CONFIG)
 
         assert result["config_mismatch"] is True
         assert str(result["actual_staking_contract_address"]).lower() == ADDR_ACTUAL.lower()
         assert "42" in result["config_mismatch_detail"]
         assert "STAKED" in result["config_mismatch_detail"]
+        assert "Contract B" in result["config_mismatch_detail"]
 
-    @patch(
-        "iwa.plugins.olas.service_manager.staking.ContractCache",
-    )
-    @patch(
-        "iwa.plugins.olas.constants.OLAS_TRADER_STAKING_CONTRACTS",
-        KNOWN_CONTRACTS,
-    )
-    def test_mismatch_detected_evicted_elsewhere(self, mock_cache_cls, mock_wallet):
+    def test_mismatch_detected_evicted_elsewhere(self, onchain, mock_wallet):
         """Service is EVICTED in a different contract than configured."""
         sm = _make_sm(mock_wallet)
+        onchain[ADDR_OTHER] = StakingState.EVICTED
 
-        mock_contract = MagicMock()
-        mock_contract.get_staking_state.return_value = StakingState.EVICTED
-        mock_cache_cls.return_value.get_contract.return_value = mock_contract
-
-        result = sm._detect_staking_mismatch(42, ADDR_CONFIG)
+        result = sm.detect_staking_mismatch(42, ADDR_CONFIG)
 
         assert result["config_mismatch"] is True
         assert "EVICTED" in result["config_mismatch_detail"]
 
-    @patch(
-        "iwa.plugins.olas.service_manager.staking.ContractCache",
-    )
-    @patch(
-        "iwa.plugins.olas.constants.OLAS_TRADER_STAKING_CONTRACTS",
-        KNOWN_CONTRACTS,
-    )
-    def test_no_mismatch_not_found_anywhere(self, mock_cache_cls, mock_wallet):
+    def test_no_mismatch_not_found_anywhere(self, onchain, mock_wallet):
         """Service is NOT_STAKED in all known contracts — no mismatch."""
         sm = _make_sm(mock_wallet)
 
-        mock_contract = MagicMock()
-        mock_contract.get_staking_state.return_value = StakingState.NOT_STAKED
-        mock_cache_cls.return_value.get_contract.return_value = mock_contract
-
-        result = sm._detect_staking_mismatch(42, ADDR_CONFIG)
+        result = sm.detect_staking_mismatch(42, ADDR_CONFIG)
 
         assert result == {}
 
-    @patch(
-        "iwa.plugins.olas.service_manager.staking.ContractCache",
-    )
-    @patch(
-        "iwa.plugins.olas.constants.OLAS_TRADER_STAKING_CONTRACTS",
-        KNOWN_CONTRACTS,
-    )
-    def test_rpc_error_skips_contract(self, mock_cache_cls, mock_wallet):
-        """RPC error when checking a contract should not crash, just skip."""
+    def test_rpc_error_skips_contract(self, onchain, mock_wallet):
+        """A failed read of one contract should not crash, just skip it."""
         sm = _make_sm(mock_wallet)
+        onchain[ADDR_ACTUAL] = Exception("reverted")
+        onchain[ADDR_OTHER] = StakingState.STAKED
 
-        mock_cache_cls.return_value.get_contract.side_effect = Exception("RPC timeout")
-
-        result = sm._detect_staking_mismatch(42, ADDR_CONFIG)
+        result = sm.detect_staking_mismatch(42, ADDR_CONFIG)
 
-        assert result == {}
+        assert str(result["actual_staking_contract_address"]).lower() == ADDR_OTHER.lower()
 
     @patch(
         "iwa.plugins.olas.constants.OLAS_TRADER_STAKING_CONTRACTS",
@@ -141,7 +146,7 @@ class TestDetectStakingMismatch:
         """No known contracts for the chain — returns empty dict."""
         sm = _make_sm(mock_wallet)
 
-        result = sm._detect_staking_mismatch(42, ADDR_CONFIG)
+        result = sm.detect_staking_mismatch(42, ADDR_CONFIG)
 
         assert result == {}
 
@@ -153,38 +158,59 @@ class TestDetectStakingMismatch:
         """Empty contracts dict for the chain — returns empty dict."""
         sm = _make_sm(mock_wallet)
 
-        result = sm._detect_staking_mismatch(42, ADDR_CONFIG)
+        result = sm.detect_staking_mismatch(42, ADDR_CONFIG)
 
         assert result == {}
 
-    @patch(
-        "iwa.plugins.olas.service_manager.staking.ContractCache",
-    )
-    @patch(
-        "iwa.plugins.olas.constants.OLAS_TRADER_STAKING_CONTRACTS",
-        KNOWN_CONTRACTS,
-    )
-    def test_skips_configured_contract(self, mock_cache_cls, mock_wallet):
-        """Should skip the configured contract address (already checked by caller)."""
+    def test_skips_configured_contract(self, onchain, mock_wallet):
+        """An eviction from the configured contract is not a mismatch."""
+        sm = _make_sm(mock_wallet)
+        onchain[ADDR_CONFIG] = StakingState.EVICTED
+
+        assert sm.detect_staking_mismatch(42, ADDR_CONFIG) == {}
+
+    def test_all_contracts_are_read_in_one_batch_and_cached(self, onchain, mock_wallet):
+        """The scan is one multicall, reused until the service moves."""
+        sm = _make_sm(mock_wallet)
+
+        # Not-found answers are cached too
+        assert sm.detect_staking_mismatch(42, ADDR_CONFIG) == {}
+        assert sm.detect_staking_mismatch(42, ADDR_CONFIG) == {}
+        assert FakeBatch.executed == 1
+
+        # The service got staked: its entry is forgotten and read again
+        onchain[ADDR_ACTUAL] = StakingState.STAKED
+        StakingLocator().forget("gnosis", 42)
+        first = sm.detect_staking_mismatch(42, ADDR_CONFIG)
+        assert first["config_mismatch"] is True
+        assert sm.detect_staking_mismatch(42, ADDR_CONFIG) == first
+        assert FakeBatch.executed == 2
+
+    def test_partial_scan_is_not_cached(self, onchain, mock_wallet):
+        """A scan with failed reads is retried on the next call."""
         sm = _make_sm(mock_wallet)
+        onchain[ADDR_ACTUAL] = Exception("reverted")
 
-        call_count = 0
+        sm.detect_staking_mismatch(42, ADDR_CONFIG)
+        sm.detect_staking_mismatch(42, ADDR_CONFIG)
 
-        def mock_get_contract(cls, addr, **kw):
-            nonlocal call_count
-            call_count += 1
-            # Should never be called for ADDR_CONFIG
-            assert str(addr).lower() != ADDR_CONFIG.lower()
-            mock = MagicMock()
-            mock.get_staking_state.return_value = StakingState.NOT_STAKED
-            return mock
+        assert FakeBatch.executed == 2
 
-        mock_cache_cls.return_value.get_contract.side_effect = mock_get_contract
+    def test_scan_with_unloadable_contract_is_not_cached(self, onchain, mock_wallet):
+        """A contract that could not be loaded leaves the scan partial."""
+        sm = _make_sm(mock_wallet)
+
+        def get_contract(cls, address, **kw):
+            if address == ADDR_ACTUAL:
+                raise ValueError("ABI not found")
+            return MagicMock(address=address)
 
-        sm._detect_staking_mismatch(42, ADDR_CONFIG)
+        with patch("iwa.plugins.olas.staking_locator.ContractCache") as mock_cache:
+            mock_cache.return_value.get_contract.side_effect = get_contract
+            sm.detect_staking_mismatch(42, ADDR_CONFIG)
+            sm.detect_staking_mismatch(42, ADDR_CONFIG)
 
-        # Should have checked Contract B and Contract C, but not Contract A
-        assert call_count == 2
+        assert FakeBatch.executed == 2
 
 
 class TestFetchStakingStatusMismatch:
@@ -193,11 +219,7 @@ class TestFetchStakingStatusMismatch:
     @patch(
         "iwa.plugins.olas.service_manager.staking.ContractCache",
     )
-    @patch(
-        "iwa.plugins.olas.constants.OLAS_TRADER_STAKING_CONTRACTS",
-        KNOWN_CONTRACTS,
-    )
-    def test_status_includes_mismatch_when_not_staked(self, mock_cache_cls, mock_wallet):
+    def test_status_includes_mismatch_when_not_staked(self, mock_cache_cls, onchain, mock_wallet):
         """When service is NOT_STAKED in config contract but STAKED elsewhere."""
         sm = _make_sm(mock_wallet)
 
@@ -206,17 +228,10 @@ class TestFetchStakingStatusMismatch:
         mock_config_contract.get_staking_state.return_value = StakingState.NOT_STAKED
         mock_config_contract.activity_checker_address = ADDR_OTHER
         mock_config_contract.activity_checker.liveness_ratio = 1000
+        mock_cache_cls.return_value.get_contract.return_value = mock_config_contract
 
-        # Mock the actual contract returning STAKED
-        mock_actual_contract = MagicMock()
-        mock_actual_contract.get_staking_state.return_value = StakingState.STAKED
-
-        def get_contract(cls, addr, **kw):
-            if str(addr).lower() == ADDR_CONFIG.lower():
-                return mock_config_contract
-            return mock_actual_contract
-
-        mock_cache_cls.return_value.get_contract.side_effect = get_contract
+        # The actual contract reports STAKED
+        onchain[ADDR_ACTUAL] = StakingState.STAKED
 
         status = sm._fetch_staking_status_impl()
 
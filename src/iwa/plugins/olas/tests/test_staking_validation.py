@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from iwa.core.contracts.multicall import MulticallBatch
 from iwa.plugins.olas.contracts.staking import StakingContract
 
 
@@ -25,21 +26,19 @@ def mock_staking():
 def test_staking_get_service_info_nested_tuple(mock_staking):
     """Test get_service_info with nested tuple result from web3."""
     nested_result = (("0xMultisig", "0xOwner", (1, 2), 1000, 500, 0),)
-    mock_staking.call.side_effect = (
-        ["0x1"]  # activityChecker
-        + [nested_result]  # getServiceInfo
-        + [2000] * 5  # getNextRewardCheckpointTimestamp and any others
-    )
+    values = {"activityChecker": "0x1", "getServiceInfo": nested_result}
 
     # Re-init to trigger calls
     with (
         patch("iwa.plugins.olas.contracts.staking.ActivityCheckerContract"),
         patch("iwa.core.contracts.contract.ChainInterfaces") as mock_ci,
+        # Answer the batched reads one call at a time
+        patch.object(MulticallBatch, "_execute_chunk", MulticallBatch._execute_sequential),
     ):
         mock_ci.get_instance.return_value.web3.eth.contract.return_value = MagicMock()
         staking = StakingContract("0x78731D3Ca6b7E34aC0F824c42a7cC18A495cabaB", "gnosis")
-        # Update call on the new instance
-        staking.call = MagicMock(side_effect=mock_staking.call.side_effect)
+        # getNextRewardCheckpointTimestamp and any others
+        staking.call = MagicMock(side_effect=lambda method, *args: values.get(method, 2000))
         staking.activity_checker.get_multisig_nonces.return_value = (1, 3)
         staking.get_required_requests = MagicMock(return_value=5)
 
@@ -106,6 +106,7 @@ class OlasView(Static):
         self._wallet = wallet
         self._chain = "gnosis"
         self._services_data = []
+        self._balances: dict = {}  # Prefetched by load_services, by address
         self._loading = False  # Guard against duplicate worker execution
 
     def compose(self) -> ComposeResult:
@@ -187,8 +188,8 @@ class OlasView(Static):
 
         try:
             from iwa.core.models import Config
+            from iwa.plugins.olas.fleet import ServiceFleetSnapshot
             from iwa.plugins.olas.models import OlasConfig
-            from iwa.plugins.olas.service_manager import ServiceManager
 
             config = Config()
 
@@ -214,14 +215,18 @@ class OlasView(Static):
                 self._loading = False
                 return
 
-            # Fetch data in background thread (network calls)
-            services_data = []
-            for service_key, service in services:
-                manager = ServiceManager(self._wallet)
-                manager.service = service
-                staking_status = manager.get_staking_status()
-                service_state = manager.get_service_state()
-                services_data.append((service_key, service, staking_status, service_state))
+            # Fetch data in background thread: the whole fleet in a few batched reads
+            snapshot = ServiceFleetSnapshot(self._wallet, self._chain).load(dict(services))
+            self._balances = snapshot.balances
+            services_data = [
+                (
+                    service_key,
+                    service,
+                    snapshot.services[service_key].staking_status,
+                    snapshot.services[service_key].state,
+                )
+                for service_key, service in services
+            ]
 
             # Fetch OLAS price
             olas_price = None
@@ -417,6 +422,9 @@ class OlasView(Static):
         """Get balance for an address."""
         if not self._wallet:
             return "-"
+        prefetched = self._balances.get(address, {}).get(token)
+        if prefetched is not None:
+            return f"{prefetched:.4f}"
         try:
             if token == "native":
                 bal = self._wallet.get_native_balance_eth(address, self._chain)
@@ -542,50 +550,17 @@ class OlasView(Static):
     def _get_compatible_staking_contracts(
         self, contracts_dict: dict, service_bond: Optional[int]
     ) -> List[tuple]:
-        """Filter staking contracts based on bond requirements and slots."""
-        import json
-
-        from iwa.core.chain import ChainInterfaces
-        from iwa.plugins.olas.contracts.base import OLAS_ABI_PATH
+        """Filter staking contracts based on bond requirements, slots and balance.
 
-        w3 = ChainInterfaces().get(self._chain).web3
-        with open(OLAS_ABI_PATH / "staking.json", "r") as f:
-            abi = json.load(f)
+        Contracts that could not be checked are included.
+        """
+        from iwa.plugins.olas.staking_availability import StakingAvailabilitySnapshot
 
-        filtered_contracts = []
-        for name, addr in contracts_dict.items():
-            try:
-                contract = w3.eth.contract(address=str(addr), abi=abi)
-                min_deposit = contract.functions.minStakingDeposit().call()
-
-                # Skip if service bond is too low
-                if service_bond is not None and service_bond < min_deposit:
-                    continue
-
-                # Check available slots
-                service_ids = contract.functions.getServiceIds().call()
-                max_services = contract.functions.maxNumServices().call()
-                available_slots = max_services - len(service_ids)
-
-                if available_slots <= 0:
-                    continue
-
-                # Check contract OLAS balance (skip if < 5000 OLAS)
-                min_balance_wei = 5000 * 10**18
-                try:
-                    balance_wei = contract.functions.balance().call()
-                    if balance_wei < min_balance_wei:
-                        continue
-                except Exception:
-                    pass  # If we can't check balance, include it
-
-                used = len(service_ids)
-                bal_olas = balance_wei // 10**18 if balance_wei else 0
-                filtered_contracts.append((f"{name} ({used}/{max_services} used · {bal_olas:,} OLAS)", str(addr)))
-            except Exception:
-                # If we can't check, include it
-                filtered_contracts.append((name, str(addr)))
-        return filtered_contracts
+        return [
+            (availability.label, availability.address)
+            for availability in StakingAvailabilitySnapshot().get(self._chain)
+            if availability.name in contracts_dict and availability.accepts(service_bond)
+        ]
 
     def _show_stake_contracts_modal(
         self, filtered_contracts: List[tuple], service_key: str
@@ -686,49 +661,16 @@ class OlasView(Static):
 
     def _fetch_create_service_options(self) -> List[tuple]:
         """Fetch staking contracts with available slots for creation modal."""
-        staking_contracts = []
         try:
-            import json
+            from iwa.plugins.olas.staking_availability import StakingAvailabilitySnapshot
 
-            from iwa.core.chain import ChainInterfaces
-            from iwa.plugins.olas.constants import OLAS_TRADER_STAKING_CONTRACTS
-            from iwa.plugins.olas.contracts.base import OLAS_ABI_PATH
-
-            contracts_dict = OLAS_TRADER_STAKING_CONTRACTS.get(self._chain, {})
-
-            # Load ABI and check slots for each contract
-            w3 = ChainInterfaces().get(self._chain).web3
-            with open(OLAS_ABI_PATH / "staking.json", "r") as f:
-                abi = json.load(f)
-
-            for name, addr in contracts_dict.items():
-                try:
-                    contract = w3.eth.contract(address=str(addr), abi=abi)
-                    service_ids = contract.functions.getServiceIds().call()
-                    max_services = contract.functions.maxNumServices().call()
-                    available_slots = max_services - len(service_ids)
-
-                    if available_slots <= 0:
-                        continue
-
-                    # Check contract OLAS balance (skip if < 5000 OLAS)
-                    min_balance_wei = 5000 * 10**18
-                    try:
-                        balance_wei = contract.functions.balance().call()
-                        if balance_wei < min_balance_wei:
-                            continue
-                    except Exception:
-                        pass  # If we can't check balance, include it
-
-                    used = len(service_ids)
-                    bal_olas = balance_wei // 10**18 if balance_wei else 0
-                    staking_contracts.append((f"{name} ({used}/{max_services} used · {bal_olas:,} OLAS)", str(addr)))
-                except Exception:
-                    # If we can't check, include it without slot info
-                    staking_contracts.append((name, str(addr)))
+            return [
+                (availability.label, availability.address)
+                for availability in StakingAvailabilitySnapshot().get(self._chain)
+                if availability.accepts()
+            ]
         except Exception:
-            pass  # If fetch fails, just use empty list
-        return staking_contracts
+            return []  # If fetch fails, just use empty list
 
     def _handle_create_service_result(self, result: dict) -> None:
         """Handle the result from the create service modal."""
@@ -15,7 +15,7 @@ Usage:
 import json
 import sys
 import time
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -25,8 +25,10 @@ from web3 import Web3
 # Ensure src is in pythonpath
 sys.path.append(str(Path(__file__).resolve().parents[2]))
 
+from iwa.core.chain.log_ranges import BlockRangeSizer, is_range_error
 from iwa.core.constants import SECRETS_PATH
 from iwa.core.db import init_db, log_transaction
+from iwa.core.log_indexer import LogIndexer, LogSubscription
 from iwa.core.models import Config
 from iwa.core.types import EthereumAddress
 from iwa.plugins.olas.models import OlasConfig
@@ -35,7 +37,7 @@ from iwa.plugins.olas.models import OlasConfig
 START_TS = int(datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp())
 # Gnosis block ~Jan 1, 2025 00:00 UTC (conservative estimate)
 START_BLOCK_GNOSIS = 37_700_000
-EVENT_CHUNK_SIZE = 50_000
+EVENT_CHUNK_SIZE = 50_000  # Initial getLogs span; shrinks on range errors
 
 # Staking ABI path
 STAKING_ABI_PATH = Path(__file__).resolve().parents[1] / "plugins" / "olas" / "contracts" / "abis" / "staking.json"
@@ -95,42 +97,73 @@ def load_traders() -> tuple[dict, set]:
     return service_id_map, staking_contracts
 
 
-def fetch_events_chunked(contract, event_name: str, from_block: int, to_block: int, chunk_size: int) -> list:
-    """Fetch events in chunks to handle RPC block range limits."""
-    all_logs = []
-    event = getattr(contract.events, event_name)
-    current_from = from_block
+def get_logs_with_rotation(web3_list: list[Web3], params: dict) -> list:
+    """eth_getLogs with backoff, rotating across RPCs on transient errors.
 
-    while current_from <= to_block:
-        current_to = min(current_from + chunk_size - 1, to_block)
-        for attempt in range(5):
-            try:
-                logs = event.get_logs(from_block=current_from, to_block=current_to)
-                all_logs.extend(logs)
-                current_from = current_to + 1
-                break
-            except Exception as e:
-                error_msg = str(e).lower()
-                # Block range too large → halve and recurse
-                if ("range" in error_msg or "limit" in error_msg or "10000" in error_msg) and chunk_size > 500:
-                    logger.debug(f"Block range too large ({chunk_size}), halving...")
-                    half_logs = fetch_events_chunked(contract, event_name, current_from, current_to, chunk_size // 2)
-                    all_logs.extend(half_logs)
-                    current_from = current_to + 1
-                    break
-                # Rate limit or transient error → retry with backoff
-                if attempt < 4:
-                    wait = min(2 ** attempt, 16)
-                    logger.debug(f"Retry {attempt + 1}/5 for {event_name} ({current_from}-{current_to}), waiting {wait}s: {e}")
-                    time.sleep(wait)
-                else:
-                    logger.error(f"FAILED after 5 attempts for {event_name} ({current_from}-{current_to}): {e}")
-                    current_from = current_to + 1
+    Range errors are raised straight away so the log indexer can shrink the range.
+    """
+    for attempt in range(5):
+        w3 = web3_list[attempt % len(web3_list)]
+        try:
+            return w3.eth.get_logs(params)
+        except Exception as e:
+            if is_range_error(e) or attempt == 4:
+                raise
+            wait = min(2 ** attempt, 16)
+            logger.debug(
+                f"Retry {attempt + 1}/5 for logs ({params['fromBlock']}-{params['toBlock']}), "
+                f"waiting {wait}s: {e}"
+            )
+            time.sleep(wait)
+    return []
+
+
+def fetch_reward_claimed_events(
+    web3_list: list[Web3], abi: list, staking_contracts: set, from_block: int, to_block: int
+) -> list:
+    """RewardClaimed events of all staking contracts, as (staking address, event) pairs.
+
+    Goes through the persistent log indexer, so an interrupted run resumes
+    from the last indexed block and reruns only fetch the new blocks.
+    """
+    if not staking_contracts:
+        return []
+    addresses = tuple(sorted(staking_contracts))
+    event = web3_list[0].eth.contract(address=EthereumAddress(addresses[0]), abi=abi).events.RewardClaimed
+    indexer = LogIndexer(
+        "gnosis",
+        get_logs=lambda params: get_logs_with_rotation(web3_list, params),
+        get_block_number=lambda: web3_list[0].eth.block_number,
+        sizer=BlockRangeSizer(initial=EVENT_CHUNK_SIZE),
+    )
+    subscription = LogSubscription(
+        name="backfill_reward_claimed", addresses=addresses, topics=(event.topic,)
+    )
+    logs = indexer.get_logs(subscription, from_block, to_block)
+    return [(log["address"], event.process_log(log)) for log in logs]
+
+
+def fetch_historical_prices(start: date, end: date) -> dict[str, float]:
+    """Get OLAS/EUR daily prices for the days from *start* to *end* (inclusive).
+
+    Prices come from the persistent daily price store, which fetches
+    missing days from CoinGecko once. Days it cannot provide (e.g. beyond
+    the API's history window) fall back to DeFiLlama.
+    """
+    from iwa.core.pricing import PriceService
 
-    return all_logs
+    prices = PriceService().get_prices("autonolas", start, end + timedelta(days=1), "eur")
+    date_prices = {day.isoformat(): price for day, price in prices.items()}
 
+    total_days = (end - start).days + 1
+    if len(date_prices) < total_days:
+        logger.info(f"{total_days - len(date_prices)} days missing from the price store")
+        for date_str, price in fetch_defillama_prices().items():
+            date_prices.setdefault(date_str, price)
+    return date_prices
 
-def fetch_historical_prices() -> dict[str, float]:
+
+def fetch_defillama_prices() -> dict[str, float]:
     """Fetch OLAS/EUR daily prices from DeFiLlama (free, no API key).
 
     Uses the /chart endpoint for OLAS on Gnosis chain with daily granularity.
@@ -153,7 +186,7 @@ def fetch_historical_prices() -> dict[str, float]:
 
     if not prices_list:
         logger.error(f"No price data from DeFiLlama. Response: {data}")
-        sys.exit(1)
+        return {}
 
     # Get current EUR/USD rate for conversion
     # DeFiLlama returns EURT price in USD (e.g., 1 EURT = $1.08)
@@ -246,15 +279,10 @@ def main() -> None:
     logger.info(f"Block range: {start_block} → {latest_block} ({latest_block - start_block} blocks)")
 
     # ── Step 2: Fetch RewardClaimed events ──────────────────────────
-    all_events = []
-    for addr in sorted(staking_contracts):
-        logger.info(f"Querying RewardClaimed from {addr}...")
-        contract = web3.eth.contract(address=EthereumAddress(addr), abi=abi)
-        events = fetch_events_chunked(contract, "RewardClaimed", start_block, latest_block, EVENT_CHUNK_SIZE)
-
-        our_events = [(addr, ev) for ev in events if ev.args.serviceId in service_id_map]
-        logger.info(f"  Found {len(events)} total events, {len(our_events)} for our traders")
-        all_events.extend(our_events)
+    logger.info(f"Querying RewardClaimed from {len(staking_contracts)} staking contracts...")
+    events = fetch_reward_claimed_events(web3_list, abi, staking_contracts, start_block, latest_block)
+    all_events = [(addr, ev) for addr, ev in events if ev.args.serviceId in service_id_map]
+    logger.info(f"  Found {len(events)} total events, {len(all_events)} for our traders")
 
     logger.info(f"Total events to process: {len(all_events)}")
 
@@ -267,7 +295,8 @@ def main() -> None:
     block_ts = get_block_timestamps(web3_list, unique_blocks)
 
     # ── Step 4: Fetch historical prices ─────────────────────────────
-    date_prices = fetch_historical_prices()
+    claim_days = [ts.date() for ts in block_ts.values()]
+    date_prices = fetch_historical_prices(min(claim_days), max(claim_days))
 
     # ── Step 5: Insert into DB ──────────────────────────────────────
     inserted = 0
@@ -10,6 +10,9 @@ if TYPE_CHECKING:
     from iwa.tui.app import IwaApp
 
 
+HEAD_WAIT_TIMEOUT = 5.0  # Max seconds between checks of the running flag
+
+
 class MonitorWorker:
     """Worker to run the EventMonitor."""
 
@@ -20,21 +23,27 @@ class MonitorWorker:
         self._running = False
 
     async def run(self):
-        """Run the monitor loop."""
+        """Run the monitor loop, woken by the chain's shared head tracker."""
         self._running = True
         self.monitor.running = True
         logger.info(f"Starting MonitorWorker for {self.monitor.chain_name}")
 
-        while self._running:
-            try:
-                # Run check_activity in a thread to avoid blocking the async loop
-                # since web3 calls are synchronous
-                await asyncio.to_thread(self.monitor.check_activity)
-            except Exception as e:
-                logger.error(f"Error in MonitorWorker: {e}")
-
-            # Non-blocking sleep
-            await asyncio.sleep(6)
+        heads, unsubscribe = self.monitor.chain_interface.head_tracker.subscribe_async()
+        try:
+            while self._running:
+                try:
+                    head = await asyncio.wait_for(heads.get(), timeout=HEAD_WAIT_TIMEOUT)
+                except asyncio.TimeoutError:
+                    continue  # Re-check _running
+
+                try:
+                    # Run check_activity in a thread to avoid blocking the async loop
+                    # since web3 calls are synchronous
+                    await asyncio.to_thread(self.monitor.check_activity, head)
+                except Exception as e:
+                    logger.error(f"Error in MonitorWorker: {e}")
+        finally:
+            unsubscribe()
 
     def stop(self):
         """Stop the worker."""
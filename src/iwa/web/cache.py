@@ -3,7 +3,7 @@
 import os
 import time
 from threading import Lock
-from typing import Any, Callable, Dict, Optional, TypeVar
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
 
 from loguru import logger
 
@@ -134,6 +134,31 @@ class ResponseCache:
         self.set(key, value)
         return value
 
+    async def get_or_compute_async(
+        self,
+        key: str,
+        compute_fn: Callable[[], Awaitable[T]],
+        ttl_seconds: int = 60,
+    ) -> T:
+        """Async version of ``get_or_compute`` for coroutine producers.
+
+        Args:
+            key: Cache key.
+            compute_fn: Coroutine function to compute the value if not cached.
+            ttl_seconds: Time-to-live in seconds.
+
+        Returns:
+            Cached or computed value.
+
+        """
+        cached = self.get(key, ttl_seconds)
+        if cached is not None:
+            return cached
+
+        value = await compute_fn()
+        self.set(key, value)
+        return value
+
 
 # Singleton accessor
 response_cache = ResponseCache()
@@ -5,7 +5,6 @@ from typing import Optional
 
 from fastapi import Header, HTTPException, Security
 from fastapi.security import APIKeyHeader
-from loguru import logger
 
 from iwa.core.wallet import Wallet
 
@@ -90,19 +89,11 @@ async def verify_auth(
 
 
 def get_config():
-    """Dependency to provide the Config object."""
-    import yaml
+    """Dependency to provide the Config object.
 
-    from iwa.core.constants import CONFIG_PATH
+    Config is a process-wide singleton that re-reads config.yaml only when
+    the file changes, so this is cheap enough to run on every request.
+    """
     from iwa.core.models import Config
 
-    if not CONFIG_PATH.exists():
-        return Config()
-
-    try:
-        with open(CONFIG_PATH, "r") as f:
-            data = yaml.safe_load(f) or {}
-        return Config(**data)
-    except Exception as e:
-        logger.error(f"Error loading config: {e}")
-        return Config()
+    return Config()
@@ -23,7 +23,7 @@ limiter = Limiter(key_func=get_remote_address)
     summary="Get accounts",
     description="Retrieve all stored accounts and their balances for the specified chain.",
 )
-def get_accounts(
+async def get_accounts(
     chain: str = "gnosis",
     tokens: str = None,
     refresh: bool = False,
@@ -58,9 +58,10 @@ def get_accounts(
     if refresh:
         response_cache.invalidate(cache_key)
 
-    def fetch_accounts():
+    async def fetch_accounts():
         try:
-            accounts_data, balances = wallet.get_accounts_balances(
+            # Async path: balance reads don't hold a threadpool worker
+            accounts_data, balances = await wallet.get_accounts_balances_async(
                 chain, token_names
             )
 
@@ -83,7 +84,7 @@ def get_accounts(
             logger.error(f"Error fetching accounts: {e}")
             raise HTTPException(status_code=500, detail=str(e)) from None
 
-    return response_cache.get_or_compute(
+    return await response_cache.get_or_compute_async(
         cache_key, fetch_accounts, CacheTTL.BALANCES
     )
 
@@ -1,5 +1,6 @@
 """Olas Services Router."""
 
+import asyncio
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -189,7 +190,7 @@ def deploy_service(
 
         manager = ServiceManager(wallet)
         manager.service = service
-        manager._init_contracts(service.chain_name)
+        manager.init_contracts(service.chain_name)
 
         # Get current state
         current_state = manager.get_service_state()
@@ -246,76 +247,55 @@ def deploy_service(
         raise HTTPException(status_code=400, detail=str(e)) from None
 
 
+def _service_balance_roles(service) -> list:
+    """List (role, address, stored account) of a service, including owner_signer."""
+    from iwa.plugins.olas.fleet import service_roles
+
+    return service_roles(wallet.key_storage, service)
+
+
 def _resolve_service_accounts(service) -> dict:
     """Resolve basic accounts info including owner_signer if applicable."""
-    accounts = {}
-    for role, addr in [
-        ("agent", service.agent_address),
-        ("safe", str(service.multisig_address) if service.multisig_address else None),
-        ("owner", service.service_owner_address),
-    ]:
-        if addr:
-            stored = wallet.key_storage.find_stored_account(addr)
-            # If this role is 'owner' and it's a Safe, add owner_signer role
-            if role == "owner" and stored and hasattr(stored, "signers") and stored.signers:
-                signer_addr = stored.signers[0]
-                signer_stored = wallet.key_storage.find_stored_account(signer_addr)
-                accounts["owner_signer"] = {
-                    "address": signer_addr,
-                    "tag": signer_stored.tag if signer_stored else None,
-                    "native": None,
-                    "olas": None,
-                }
-
-            accounts[role] = {
-                "address": addr,
-                "tag": stored.tag if stored else None,
-                "native": None,
-                "olas": None,
-            }
-    return accounts
+    return {
+        role: {
+            "address": addr,
+            "tag": stored.tag if stored else None,
+            "native": None,
+            "olas": None,
+        }
+        for role, addr, stored in _service_balance_roles(service)
+    }
 
 
-def _resolve_service_balances(service, chain: str) -> dict:
-    """Resolve detailed balances including owner_signer."""
+def _format_service_balances(roles: list, amounts: dict) -> dict:
+    """Format native and OLAS balances of each role for the API response."""
     balances = {}
-    for role, addr in [
-        ("agent", service.agent_address),
-        ("safe", str(service.multisig_address) if service.multisig_address else None),
-        ("owner", service.service_owner_address),
-    ]:
-        if addr:
-            native_bal = wallet.get_native_balance_eth(addr, chain)
-            olas_bal = wallet.balance_service.get_erc20_balance_wei(addr, "OLAS", chain)
-            olas_bal_eth = float(olas_bal) / 1e18 if olas_bal else 0
-            stored = wallet.key_storage.find_stored_account(addr)
-
-            # If this role is 'owner' and it's a Safe, resolve owner_signer
-            if role == "owner" and stored and hasattr(stored, "signers") and stored.signers:
-                signer_addr = stored.signers[0]
-                s_native = wallet.get_native_balance_eth(signer_addr, chain)
-                s_olas_wei = wallet.balance_service.get_erc20_balance_wei(
-                    signer_addr, "OLAS", chain
-                )
-                s_olas = float(s_olas_wei) / 1e18 if s_olas_wei else 0
-                s_stored = wallet.key_storage.find_stored_account(signer_addr)
-                balances["owner_signer"] = {
-                    "address": signer_addr,
-                    "tag": s_stored.tag if s_stored else None,
-                    "native": f"{s_native:.2f}" if s_native else "0.00",
-                    "olas": f"{s_olas:.2f}",
-                }
-
-            balances[role] = {
-                "address": addr,
-                "tag": stored.tag if stored else None,
-                "native": f"{native_bal:.2f}" if native_bal else "0.00",
-                "olas": f"{olas_bal_eth:.2f}",
-            }
+    for role, addr, stored in roles:
+        native_bal = amounts.get(addr, {}).get("native")
+        olas_bal = amounts.get(addr, {}).get("OLAS") or 0
+        balances[role] = {
+            "address": addr,
+            "tag": stored.tag if stored else None,
+            "native": f"{native_bal:.2f}" if native_bal else "0.00",
+            "olas": f"{olas_bal:.2f}",
+        }
     return balances
 
 
-def _get_balances_cached(
+async def _resolve_service_balances(service, chain: str) -> dict:
+    """Resolve detailed balances including owner_signer.
+
+    All native and OLAS balances are read in one batched round trip.
+    """
+    roles = _service_balance_roles(service)
+    addresses = list(dict.fromkeys(addr for _, addr, _ in roles))
+    amounts = await wallet.balance_service.get_balances_eth_async(
+        addresses, ["native", "OLAS"], chain
+    )
+    return _format_service_balances(roles, amounts)
+
+
+async def _get_balances_cached(
     service_key: str, service, chain: str, force_refresh: bool = False
 ) -> dict:
     """Get service balances with caching to prevent excessive RPC calls."""
@@ -324,14 +304,27 @@ def _get_balances_cached(
     if force_refresh:
         response_cache.invalidate(cache_key)
 
-    def fetch_balances():
-        return _resolve_service_balances(service, chain)
+    async def fetch_balances():
+        return await _resolve_service_balances(service, chain)
 
-    return response_cache.get_or_compute(
+    return await response_cache.get_or_compute_async(
         cache_key, fetch_balances, CacheTTL.BALANCES
     )
 
 
+def _get_service_status(service, force_refresh: bool) -> tuple:
+    """Read service state and staking status through ServiceManager's caches."""
+    from iwa.plugins.olas.service_manager import ServiceManager
+
+    manager = ServiceManager(wallet)
+    manager.service = service
+    manager.init_contracts(service.chain_name)
+    return (
+        manager.get_service_state(force_refresh=force_refresh),
+        manager.get_staking_status(force_refresh=force_refresh),
+    )
+
+
 def _staking_status_to_dict(status) -> Optional[dict]:
     """Convert StakingStatus dataclass to dict for JSON serialization."""
     if not status:
@@ -393,7 +386,7 @@ def get_olas_services_basic(
             try:
                 manager = ServiceManager(wallet)
                 manager.service = service
-                manager._init_contracts(service.chain_name)
+                manager.init_contracts(service.chain_name)
                 state = manager.get_service_state(force_refresh=refresh)
             except Exception as e:
                 logger.warning(f"Could not get state for {service_key}: {e}")
@@ -430,7 +423,7 @@ def get_olas_services_basic(
     summary="Get Service Details",
     description="Get detailed status, balances, and staking info for a specific Olas service.",
 )
-def get_olas_service_details(
+async def get_olas_service_details(
     service_key: str,
     refresh: bool = False,
     auth: bool = Depends(verify_auth),
@@ -444,8 +437,6 @@ def get_olas_service_details(
 
     """
     try:
-        from iwa.plugins.olas.service_manager import ServiceManager
-
         config = Config()
         if "olas" not in config.plugins:
             raise HTTPException(status_code=404, detail="Olas plugin not configured")
@@ -459,15 +450,12 @@ def get_olas_service_details(
         service = olas_config.services[service_key]
         chain = service.chain_name
 
-        # Use ServiceManager with built-in caching
-        manager = ServiceManager(wallet)
-        manager.service = service
-        manager._init_contracts(service.chain_name)
-
-        # Get data with force_refresh if requested
-        service_state = manager.get_service_state(force_refresh=refresh)
-        staking_status = manager.get_staking_status(force_refresh=refresh)
-        balances = _get_balances_cached(service_key, service, chain, refresh)
+        # ServiceManager is sync, so it runs in a worker thread while the
+        # balances are awaited on the event loop
+        (service_state, staking_status), balances = await asyncio.gather(
+            asyncio.to_thread(_get_service_status, service, refresh),
+            _get_balances_cached(service_key, service, chain, refresh),
+        )
 
         return {
             "key": service_key,
@@ -488,7 +476,7 @@ def get_olas_service_details(
     summary="Get All Services",
     description="Get comprehensive list of Olas services with full details.",
 )
-def get_olas_services(
+async def get_olas_services(
     chain: str = "gnosis",
     refresh: bool = False,
     auth: bool = Depends(verify_auth),
@@ -505,20 +493,37 @@ def get_olas_services(
         raise HTTPException(status_code=400, detail="Invalid chain name")
 
     try:
-        basic = get_olas_services_basic(chain, refresh, auth)
-        result = []
-        for svc in basic:
-            try:
-                details = get_olas_service_details(svc["key"], refresh, auth)
-                # Merge details into basic info
-                svc["staking"] = details["staking"]
-                svc["accounts"] = details["accounts"]
-                result.append(svc)
-            except Exception as e:
-                logger.error(f"Failed to get details for {svc['key']}: {e}")
-                result.append(svc)  # Return basic info if details fail
-
-        return result
+        # The whole fleet is read in two multicalls plus one balances batch
+        return await asyncio.to_thread(_load_services_full, chain, refresh)
     except Exception as e:
         logger.error(f"Error getting Olas services: {e}")
         raise HTTPException(status_code=500, detail=str(e)) from None
+
+
+def _load_services_full(chain: str, refresh: bool) -> list:
+    """Build the full services list of *chain* from one fleet snapshot."""
+    from iwa.plugins.olas.fleet import ServiceFleetSnapshot
+
+    snapshot = ServiceFleetSnapshot(wallet, chain).load(force_refresh=refresh)
+
+    result = []
+    for service_key, entry in snapshot.services.items():
+        service = entry.service
+        if snapshot.balances:
+            roles = _service_balance_roles(service)
+            accounts = _format_service_balances(roles, snapshot.balances)
+            response_cache.set(f"balances:{service_key}:{chain}", accounts)
+        else:
+            accounts = _resolve_service_accounts(service)  # Balances unavailable
+        result.append(
+            {
+                "key": service_key,
+                "name": service.service_name,
+                "service_id": service.service_id,
+                "chain": service.chain_name,
+                "state": entry.state,
+                "accounts": accounts,
+                "staking": _staking_status_to_dict(entry.staking_status),
+            }
+        )
+    return result
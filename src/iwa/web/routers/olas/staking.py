@@ -1,5 +1,6 @@
 """Olas Staking Router."""
 
+import asyncio
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Request
@@ -9,6 +10,10 @@ from slowapi.util import get_remote_address
 
 from iwa.core.models import Config
 from iwa.plugins.olas.models import OlasConfig
+from iwa.plugins.olas.staking_availability import (
+    MIN_CONTRACT_BALANCE_WEI,
+    StakingAvailabilitySnapshot,
+)
 from iwa.web.dependencies import get_config, verify_auth, wallet
 
 router = APIRouter(tags=["olas"])
@@ -20,7 +25,7 @@ limiter = Limiter(key_func=get_remote_address)
     summary="Get Staking Contracts",
     description="Get the list of available OLAS staking contracts for a specific chain.",
 )
-def get_staking_contracts(
+async def get_staking_contracts(
     chain: str = "gnosis",
     service_key: Optional[str] = None,
     auth: bool = Depends(verify_auth),  # noqa: B008
@@ -33,18 +38,17 @@ def get_staking_contracts(
         raise HTTPException(status_code=400, detail="Invalid chain name")
 
     try:
-        from iwa.core.chain import ChainInterfaces
-        from iwa.plugins.olas.constants import OLAS_TRADER_STAKING_CONTRACTS
-
-        contracts = OLAS_TRADER_STAKING_CONTRACTS.get(chain, {})
-
-        # Get service bond and token if filtered
-        service_bond, service_token = _get_service_filter_info(service_key)
-
-        # Get correct interface from singleton manager
-        interface = ChainInterfaces().get(chain)
+        # Get service bond and token if filtered (sync ServiceManager, off the loop)
+        service_bond, service_token = (
+            await asyncio.to_thread(_get_service_filter_info, service_key)
+            if service_key
+            else (None, None)
+        )
 
-        results = _fetch_all_contracts(contracts, interface)
+        # Served from the background-refreshed snapshot; a cold or invalidated
+        # chain is read in one multicall, off the loop
+        snapshot = await asyncio.to_thread(StakingAvailabilitySnapshot().get, chain)
+        results = [availability.to_dict() for availability in snapshot]
         filtered_results = _filter_contracts(results, service_bond, service_token)
 
         # Return with filter metadata so frontend can explain filtering
@@ -125,74 +129,6 @@ def _get_service_filter_info(service_key: Optional[str]) -> tuple[Optional[int],
     return service_bond, service_token
 
 
-def _check_availability(name, address, interface):
-    """Check availability of a single staking contract."""
-    # Import at module level would cause circular import, but we can cache it
-    # The import is cached by Python after first call so this is efficient
-    from iwa.core.contracts.cache import ContractCache
-    from iwa.plugins.olas.contracts.staking import StakingContract
-
-    try:
-        # Use ContractCache to benefit from shared instances and property caching
-        contract = ContractCache().get_contract(
-            StakingContract, address, chain_name=interface.chain.name
-        )
-
-        # StakingContract uses .call() which handles with_retry and rotation
-        # Use properties instead of .call() to leverage caching
-        service_ids = contract.call("getServiceIds")
-        max_services = contract.max_num_services
-        min_deposit = contract.min_staking_deposit
-        staking_token = contract.staking_token_address
-        used = len(service_ids)
-
-        return {
-            "name": name,
-            "address": address,
-            "usage": {
-                "used": used,
-                "max": max_services,
-                "available_slots": max_services - used,
-                "available": used < max_services,
-            },
-            "min_staking_deposit": min_deposit,
-            "staking_token": staking_token,
-            "balance": contract.balance,
-        }
-    except Exception as e:
-        logger.warning(f"Failed to check availability for {name} ({address}): {e}")
-        return {
-            "name": name,
-            "address": address,
-            "usage": None,  # Could not verify
-            "min_staking_deposit": None,
-        }
-
-
-def _fetch_all_contracts(contracts: dict, interface) -> list:
-    """Fetch availability for all contracts using threads.
-
-    Note: Using limited parallelism (2 workers) to avoid overwhelming RPC
-    endpoints with parallel requests that cause 429 rate limit errors.
-    The RPC rotation mechanism is global but Contract objects are thread-local,
-    so excessive parallelism leads to stale providers being used.
-    """
-    from concurrent.futures import ThreadPoolExecutor
-
-    results = []
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        futures = [
-            executor.submit(_check_availability, name, addr, interface)
-            for name, addr in contracts.items()
-        ]
-        for future in futures:
-            results.append(future.result())
-    return results
-
-
-MIN_CONTRACT_BALANCE_WEI = 5000 * 10**18  # 5000 OLAS
-
-
 def _filter_contracts(
     results: list, service_bond: Optional[int], service_token: Optional[str]
 ) -> list:
@@ -9,7 +9,10 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 
+from iwa.core import rewards_rollup
 from iwa.core.db import SentTransaction
+from iwa.core.rewards_rollup import CLAIM_TAG, in_period, tagged
+from iwa.core.types import EthereumAddress
 from iwa.web.dependencies import verify_auth, wallet
 
 router = APIRouter(prefix="/api/rewards", tags=["rewards"])
@@ -67,7 +70,11 @@ def _wei_to_olas(amount_wei: Optional[int]) -> float:
 
 def _build_tag_map(claims) -> dict:
     """Build address→tag lookup for claims missing to_tag."""
-    addresses = {tx.to_address for tx in claims if not tx.to_tag and tx.to_address}
+    return _lookup_tags({tx.to_address for tx in claims if not tx.to_tag and tx.to_address})
+
+
+def _lookup_tags(addresses: set) -> dict:
+    """Resolve wallet tags for *addresses*, skipping unknown ones."""
     if not addresses:
         return {}
     tag_map: dict[str, str] = {}
@@ -88,24 +95,22 @@ def _resolve_trader_name(tx, tag_map: dict) -> str:
 
 def _query_claims(year: int, month: Optional[int] = None):
     """Query claim transactions for a given year (and optional month)."""
-    year_start = datetime.datetime(year, 1, 1)
-    year_end = datetime.datetime(year + 1, 1, 1)
+    return (
+        SentTransaction.select()
+        .where(tagged(CLAIM_TAG) & in_period(year, month))
+        .order_by(SentTransaction.timestamp.asc())
+    )
 
-    query = SentTransaction.tags.contains("olas_claim_rewards") & (
-        SentTransaction.timestamp >= year_start
-    ) & (SentTransaction.timestamp < year_end)
 
-    if month and 1 <= month <= 12:
-        month_start = datetime.datetime(year, month, 1)
-        if month == 12:
-            month_end = datetime.datetime(year + 1, 1, 1)
-        else:
-            month_end = datetime.datetime(year, month + 1, 1)
-        query = query & (SentTransaction.timestamp >= month_start) & (
-            SentTransaction.timestamp < month_end
-        )
+def _query_monthly_claim_totals(year: int, month: Optional[int] = None) -> dict[int, dict]:
+    """Claim totals per month from the rewards rollup.
 
-    return SentTransaction.select().where(query).order_by(SentTransaction.timestamp.asc())
+    Returns {month_num: {"olas": float, "eur": float, "claims": int}}.
+    """
+    return {
+        m: {"olas": data["olas"], "eur": data["eur"], "claims": data["claims"]}
+        for m, data in rewards_rollup.monthly_totals(year, month).items()
+    }
 
 
 def _fetch_safe_creation_date(safe_address: str) -> Optional[str]:
@@ -175,55 +180,58 @@ def _get_trader_start_dates() -> dict[str, datetime.date]:
 def _get_avg_xdai_eur(year: int, month: int) -> float:
     """Get average xDAI/EUR price for a given month.
 
-    Uses CoinGecko market_chart/range for past months,
-    falls back to current spot price for the current month.
+    Closed days come from the persistent daily price store (fetched from
+    CoinGecko once); a month with no closed day yet uses the spot price.
     """
     from iwa.core.pricing import PriceService
 
-    today = datetime.date.today()
     m_start = datetime.date(year, month, 1)
     m_end = (
         datetime.date(year + 1, 1, 1)
         if month == 12
         else datetime.date(year, month + 1, 1)
     )
-
-    # Current or future month: use spot price
-    if m_start >= today.replace(day=1):
-        try:
-            return PriceService().get_token_price("dai", "eur") or 1.0
-        except Exception:
-            return 1.0
-
-    # Past month: query CoinGecko for daily prices
-    try:
-        import requests as req
-
-        from_ts = int(datetime.datetime(year, month, 1).timestamp())
-        to_ts = int(datetime.datetime.combine(
-            min(m_end, today), datetime.time()
-        ).timestamp())
-        url = "https://api.coingecko.com/api/v3/coins/dai/market_chart/range"
-        resp = req.get(
-            url,
-            params={"vs_currency": "eur", "from": from_ts, "to": to_ts},
-            timeout=10,
-        )
-        if resp.status_code == 200:
-            prices = resp.json().get("prices", [])
-            if prices:
-                avg = sum(p[1] for p in prices) / len(prices)
-                return avg
-    except Exception:
-        pass
-
-    # Fallback to spot
     try:
-        return PriceService().get_token_price("dai", "eur") or 1.0
+        return PriceService().get_avg_price("dai", m_start, m_end, "eur") or 1.0
     except Exception:
         return 1.0
 
 
+def _mech_costs_by_trader(
+    year: int, month: int, trader_starts: dict[str, datetime.date]
+) -> tuple[dict[str, float], bool]:
+    """Mech costs (EUR) per trader multisig for one month.
+
+    Returns (costs, final): final is True once the month is over, so its
+    average xDAI/EUR price (and therefore the costs) can no longer change.
+    """
+    today = datetime.date.today()
+    m_start = datetime.date(year, month, 1)
+    m_end = (
+        datetime.date(year + 1, 1, 1)
+        if month == 12
+        else datetime.date(year, month + 1, 1)
+    )
+    effective_end = min(
+        m_end, today + datetime.timedelta(days=1)
+    )
+    if effective_end <= m_start:
+        return {}, False
+
+    trader_days = {}
+    for addr, start_date in trader_starts.items():
+        active_from = max(start_date, m_start)
+        if active_from < effective_end:
+            trader_days[addr] = (effective_end - active_from).days
+
+    xdai_eur = _get_avg_xdai_eur(year, month)
+    costs = {
+        addr: days * DAILY_MECH_COST_XDAI * xdai_eur
+        for addr, days in trader_days.items()
+    }
+    return costs, m_end <= today
+
+
 def _calculate_mech_costs(
     year: int, month: Optional[int] = None
 ) -> tuple[float, dict[int, float]]:
@@ -233,71 +241,44 @@ def _calculate_mech_costs(
     Trader start dates come from their Safe multisig deployment date.
     xDAI/EUR conversion uses the monthly average rate.
 
+    Closed months are computed once and stored in the rewards rollup;
+    only months that are still open are recomputed.
+
     Returns (total_cost_eur, {month_num: cost_eur}).
     """
     trader_starts = _get_trader_start_dates()
     if not trader_starts:
         return 0.0, {}
 
-    today = datetime.date.today()
-    monthly_costs: dict[int, float] = {}
     months_range = (
         range(month, month + 1) if month else range(1, 13)
     )
+    final_months = rewards_rollup.mech_final_months(year)
 
     for m in months_range:
-        m_start = datetime.date(year, m, 1)
-        m_end = (
-            datetime.date(year + 1, 1, 1)
-            if m == 12
-            else datetime.date(year, m + 1, 1)
-        )
-        effective_end = min(
-            m_end, today + datetime.timedelta(days=1)
-        )
-        if effective_end <= m_start:
-            monthly_costs[m] = 0.0
+        if m in final_months:
             continue
+        costs, final = _mech_costs_by_trader(year, m, trader_starts)
+        rewards_rollup.set_mech_costs(year, m, costs, final)
 
-        trader_days = 0
-        for start_date in trader_starts.values():
-            active_from = max(start_date, m_start)
-            if active_from >= effective_end:
-                continue
-            trader_days += (effective_end - active_from).days
-
-        xdai_eur = _get_avg_xdai_eur(year, m)
-        monthly_costs[m] = (
-            trader_days * DAILY_MECH_COST_XDAI * xdai_eur
-        )
-
-    total = sum(monthly_costs.values())
-    return total, monthly_costs
+    totals = rewards_rollup.monthly_totals(year, month)
+    monthly_costs = {
+        m: totals.get(m, {}).get("mech_cost_eur", 0.0) for m in months_range
+    }
+    return sum(monthly_costs.values()), monthly_costs
 
 
 def _query_gas_costs(year: int, month: Optional[int] = None) -> float:
     """Sum gas costs (EUR) for claim and checkpoint transactions."""
-    year_start = datetime.datetime(year, 1, 1)
-    year_end = datetime.datetime(year + 1, 1, 1)
-
-    query = (
-        (
-            SentTransaction.tags.contains("olas_claim_rewards")
-            | SentTransaction.tags.contains("olas_call_checkpoint")
-        )
-        & (SentTransaction.timestamp >= year_start)
-        & (SentTransaction.timestamp < year_end)
-    )
+    return sum(_query_monthly_gas_costs(year, month).values())
 
-    if month and 1 <= month <= 12:
-        month_start = datetime.datetime(year, month, 1)
-        month_end = datetime.datetime(year + 1, 1, 1) if month == 12 else datetime.datetime(year, month + 1, 1)
-        query = query & (SentTransaction.timestamp >= month_start) & (SentTransaction.timestamp < month_end)
 
-    total = 0.0
-    for tx in SentTransaction.select().where(query):
-        total += tx.gas_value_eur or 0.0
-    return total
+def _query_monthly_gas_costs(year: int, month: Optional[int] = None) -> dict[int, float]:
+    """Gas costs (EUR) of claims and checkpoints per month."""
+    return {
+        m: data["gas_eur"]
+        for m, data in rewards_rollup.monthly_totals(year, month).items()
+    }
 
 
 def _query_eure_withdrawn(year: int, month: Optional[int] = None) -> float:
@@ -305,39 +286,15 @@ def _query_eure_withdrawn(year: int, month: Optional[int] = None) -> float:
 
     Matches both EURe contract variants (bridged and Monerium native).
     """
-    master_addr = str(wallet.master_account.address).lower()
-
-    # Match token field: symbol "EURE" or known contract addresses
-    eure_bridged = "0xcB444e90D8198415266c6a2724b7900fb12FC56E".lower()
-    eure_monerium = "0x420CA0f9B9b604cE0fd9C18EF134C705e5Fa3430".lower()
-
-    year_start = datetime.datetime(year, 1, 1)
-    year_end = datetime.datetime(year + 1, 1, 1)
-
-    query = (
-        (SentTransaction.timestamp >= year_start)
-        & (SentTransaction.timestamp < year_end)
-    )
-
-    if month and 1 <= month <= 12:
-        month_start = datetime.datetime(year, month, 1)
-        month_end = (
-            datetime.datetime(year + 1, 1, 1) if month == 12
-            else datetime.datetime(year, month + 1, 1)
-        )
-        query = query & (SentTransaction.timestamp >= month_start) & (
-            SentTransaction.timestamp < month_end
-        )
+    master_addr = str(wallet.master_account.address)
+    # Rollup accounts are stored as logged, so match every spelling
+    master_variants = {master_addr, master_addr.lower()}
+    try:
+        master_variants.add(str(EthereumAddress(master_addr)))
+    except ValueError:
+        pass
 
-    total = 0.0
-    for tx in SentTransaction.select().where(query):
-        token_lower = (tx.token or "").lower()
-        if token_lower not in ("eure", eure_bridged, eure_monerium):
-            continue
-        if tx.from_address and tx.from_address.lower() == master_addr:
-            amount = int(tx.amount_wei or 0)
-            total += amount / 1e18
-    return total
+    return rewards_rollup.eure_withdrawn(list(master_variants), year, month)
 
 
 def _validate_year_month(year: int, month: Optional[int] = None) -> int:
@@ -396,25 +353,11 @@ def get_summary(
 ):
     """Get rewards summary aggregated by month with costs and net profit."""
     year = _validate_year_month(year, month)
-    claims = _query_claims(year, month)
-
-    total_olas = 0.0
-    total_eur = 0.0
-    total_claims = 0
-    monthly = defaultdict(lambda: {"olas": 0.0, "eur": 0.0, "claims": 0})
-
-    for tx in claims:
-        olas_amount = _wei_to_olas(tx.amount_wei)
-        eur_value = tx.value_eur or 0.0
-
-        total_olas += olas_amount
-        total_eur += eur_value
-        total_claims += 1
+    monthly = _query_monthly_claim_totals(year, month)
 
-        m = tx.timestamp.month
-        monthly[m]["olas"] += olas_amount
-        monthly[m]["eur"] += eur_value
-        monthly[m]["claims"] += 1
+    total_olas = sum(data["olas"] for data in monthly.values())
+    total_eur = sum(data["eur"] for data in monthly.values())
+    total_claims = sum(data["claims"] for data in monthly.values())
 
     # Mech request costs: estimated from active trader-days
     mech_total, mech_monthly = _calculate_mech_costs(year, month)
@@ -485,53 +428,62 @@ def get_by_trader(
 ):
     """Per-trader rewards breakdown with monthly detail."""
     year = _validate_year_month(year, month)
-    claims = list(_query_claims(year, month))
-    tag_map = _build_tag_map(claims)
+    rollup_rows = rewards_rollup.trader_month_totals(year, month)
+    claims = list(
+        _query_claims(year, month).select(
+            SentTransaction.timestamp,
+            SentTransaction.amount_wei,
+            SentTransaction.value_eur,
+            SentTransaction.to_address,
+            SentTransaction.to_tag,
+        )
+    )
+    tag_map = _lookup_tags(
+        {row.account for row in rollup_rows if not row.tag}
+        | {tx.to_address for tx in claims if not tx.to_tag and tx.to_address}
+    )
 
-    # Per-trader monthly data
+    # Per-trader monthly data, read from the rollup
     trader_data = defaultdict(lambda: {
         "total_olas": 0.0,
         "total_eur": 0.0,
         "total_claims": 0,
         "months": defaultdict(lambda: {"olas": 0.0, "eur": 0.0, "claims": 0}),
-        "prices": [],
+        "price_sum": 0.0,
+        "price_count": 0,
     })
 
+    for row in rollup_rows:
+        trader = row.tag or tag_map.get(row.account, row.account) or "unknown"
+        td = trader_data[trader]
+        td["total_olas"] += row.olas
+        td["total_eur"] += row.eur
+        td["total_claims"] += row.claims
+        td["months"][row.month]["olas"] += row.olas
+        td["months"][row.month]["eur"] += row.eur
+        td["months"][row.month]["claims"] += row.claims
+        td["price_sum"] += row.price_sum
+        td["price_count"] += row.price_count
+
     # Cumulative time series (all traders combined, by claim order)
     cumulative_series = []
     running_olas = 0.0
     running_eur = 0.0
 
     for tx in claims:
-        olas_amount = _wei_to_olas(tx.amount_wei)
-        eur_value = tx.value_eur or 0.0
-        price = tx.price_eur
-        trader = _resolve_trader_name(tx, tag_map)
-        month = tx.timestamp.month
-
-        td = trader_data[trader]
-        td["total_olas"] += olas_amount
-        td["total_eur"] += eur_value
-        td["total_claims"] += 1
-        td["months"][month]["olas"] += olas_amount
-        td["months"][month]["eur"] += eur_value
-        td["months"][month]["claims"] += 1
-        if price is not None:
-            td["prices"].append(price)
-
-        running_olas += olas_amount
-        running_eur += eur_value
+        running_olas += _wei_to_olas(tx.amount_wei)
+        running_eur += tx.value_eur or 0.0
         cumulative_series.append({
             "date": tx.timestamp.isoformat(),
             "olas": round(running_olas, OLAS_DISPLAY_DECIMALS),
             "eur": round(running_eur, EUR_VALUE_DECIMALS),
-            "trader": trader,
+            "trader": _resolve_trader_name(tx, tag_map),
         })
 
     # Build response
     traders = []
     for name, td in sorted(trader_data.items(), key=lambda x: -x[1]["total_eur"]):
-        avg_price = sum(td["prices"]) / len(td["prices"]) if td["prices"] else None
+        avg_price = td["price_sum"] / td["price_count"] if td["price_count"] else None
         months = []
         for m in range(1, 13):
             md = td["months"].get(m, {"olas": 0.0, "eur": 0.0, "claims": 0})
@@ -572,33 +524,52 @@ def export_rewards(
     claims = list(_query_claims(year, month))
     tag_map = _build_tag_map(claims)
 
-    # Compute costs and totals for the summary section
+    # Costs and withdrawals for the summary section come from the rollup
     mech_total, mech_monthly = _calculate_mech_costs(year, month)
-    gas_costs = _query_gas_costs(year, month)
-    total_costs = mech_total + gas_costs
+    gas_monthly = _query_monthly_gas_costs(year, month)
     eure_withdrawn = _query_eure_withdrawn(year, month)
 
+    def lines():
+        totals = {"olas": 0.0, "eur": 0.0}
+        yield from _claim_csv_lines(claims, tag_map, totals)
+        yield from _summary_csv_lines(
+            year, totals, mech_total, mech_monthly, gas_monthly, eure_withdrawn
+        )
+
+    suffix = f"_{month:02d}" if month else ""
+    filename = f"olas_rewards_{year}{suffix}.csv"
+
+    return StreamingResponse(
+        lines(),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+def _csv_line(values: list) -> str:
+    """Format one CSV row."""
     output = io.StringIO()
-    writer = csv.writer(output)
+    csv.writer(output).writerow(values)
+    return output.getvalue()
+
 
-    # --- Section 1: Individual claims ---
-    writer.writerow([
+def _claim_csv_lines(claims, tag_map: dict, totals: dict):
+    """Yield the header and one CSV row per claim, accumulating *totals*."""
+    yield _csv_line([
         "Date", "Service", "Chain", "Tx Hash", "Explorer Link",
         "OLAS Amount", "EUR Price", "EUR Value",
     ])
 
-    total_olas = 0.0
-    total_eur = 0.0
     for tx in claims:
         olas_amount = _wei_to_olas(tx.amount_wei)
         # Round price to display precision, then derive EUR value so columns
         # are arithmetically consistent (OLAS * Price = Value in the CSV).
         displayed_price = round(tx.price_eur, EUR_PRICE_DECIMALS) if tx.price_eur else 0.0
         eur_value = round(olas_amount * displayed_price, EUR_VALUE_DECIMALS)
-        total_olas += olas_amount
-        total_eur += eur_value
+        totals["olas"] += olas_amount
+        totals["eur"] += eur_value
         explorer_url = f"{GNOSIS_EXPLORER}{tx.tx_hash}" if tx.chain == "gnosis" else ""
-        writer.writerow([
+        yield _csv_line([
             tx.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
             _resolve_trader_name(tx, tag_map),
             tx.chain,
@@ -609,41 +580,39 @@ def export_rewards(
             f"{eur_value:.{EUR_VALUE_DECIMALS}f}" if eur_value else "",
         ])
 
-    # --- Section 2: Tax summary (as CSV comments for parser compatibility) ---
+
+def _summary_csv_lines(
+    year: int,
+    totals: dict,
+    mech_total: float,
+    mech_monthly: dict[int, float],
+    gas_monthly: dict[int, float],
+    eure_withdrawn: float,
+):
+    """Yield the tax summary and monthly cost breakdown (as CSV comments for parser compatibility)."""
+    gas_costs = sum(gas_monthly.values())
+    total_costs = mech_total + gas_costs
+    total_eur = totals["eur"]
     net_taxable = total_eur - total_costs
 
-    def _comment(text: str) -> None:
-        output.write(f"# {text}\n")
-
-    output.write("#\n")
-    _comment("TAX SUMMARY")
-    _comment(f"Gross rewards (rendimiento íntegro): {total_eur:.{EUR_VALUE_DECIMALS}f} EUR")
-    _comment(f"Total OLAS claimed: {total_olas:.{OLAS_DISPLAY_DECIMALS}f}")
-    _comment(f"Mech request costs: -{mech_total:.{EUR_VALUE_DECIMALS}f} EUR")
-    _comment(f"Gas costs (claims + checkpoints): -{gas_costs:.{EUR_VALUE_DECIMALS}f} EUR")
-    _comment(f"Total deductible costs: -{total_costs:.{EUR_VALUE_DECIMALS}f} EUR")
-    _comment(f"Net taxable income (rendimiento neto): {net_taxable:.{EUR_VALUE_DECIMALS}f} EUR")
-    _comment(f"EURe withdrawn to bank: {eure_withdrawn:.{EUR_VALUE_DECIMALS}f} EUR")
-    output.write("#\n")
-
-    # --- Section 3: Monthly cost breakdown ---
-    _comment("MONTHLY COST BREAKDOWN")
-    _comment("Month | Mech Costs (EUR) | Gas Costs (EUR) | Total (EUR)")
+    yield "#\n"
+    yield "# TAX SUMMARY\n"
+    yield f"# Gross rewards (rendimiento íntegro): {total_eur:.{EUR_VALUE_DECIMALS}f} EUR\n"
+    yield f"# Total OLAS claimed: {totals['olas']:.{OLAS_DISPLAY_DECIMALS}f}\n"
+    yield f"# Mech request costs: -{mech_total:.{EUR_VALUE_DECIMALS}f} EUR\n"
+    yield f"# Gas costs (claims + checkpoints): -{gas_costs:.{EUR_VALUE_DECIMALS}f} EUR\n"
+    yield f"# Total deductible costs: -{total_costs:.{EUR_VALUE_DECIMALS}f} EUR\n"
+    yield f"# Net taxable income (rendimiento neto): {net_taxable:.{EUR_VALUE_DECIMALS}f} EUR\n"
+    yield f"# EURe withdrawn to bank: {eure_withdrawn:.{EUR_VALUE_DECIMALS}f} EUR\n"
+    yield "#\n"
+
+    yield "# MONTHLY COST BREAKDOWN\n"
+    yield "# Month | Mech Costs (EUR) | Gas Costs (EUR) | Total (EUR)\n"
     for m in sorted(mech_monthly.keys()):
-        m_gas = _query_gas_costs(year, m)
+        m_gas = gas_monthly.get(m, 0.0)
         m_total = mech_monthly[m] + m_gas
         month_name = datetime.datetime(year, m, 1).strftime("%B")
-        _comment(
-            f"{month_name} | {mech_monthly[m]:.{EUR_VALUE_DECIMALS}f}"
-            f" | {m_gas:.{EUR_VALUE_DECIMALS}f} | {m_total:.{EUR_VALUE_DECIMALS}f}"
+        yield (
+            f"# {month_name} | {mech_monthly[m]:.{EUR_VALUE_DECIMALS}f}"
+            f" | {m_gas:.{EUR_VALUE_DECIMALS}f} | {m_total:.{EUR_VALUE_DECIMALS}f}\n"
         )
-
-    output.seek(0)
-    suffix = f"_{month:02d}" if month else ""
-    filename = f"olas_rewards_{year}{suffix}.csv"
-
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
@@ -72,6 +72,30 @@ class TransactionRequest(BaseModel):
         return v
 
 
+def _get_token_decimals(chain: str, tokens: set) -> dict:
+    """Resolve decimals for the given token names/addresses with one batched read."""
+    from iwa.core.chain import ChainInterfaces
+    from iwa.core.contracts.token_registry import TokenRegistry
+
+    addresses = {}
+    try:
+        chain_interface = ChainInterfaces().get(chain)
+        for token in tokens:
+            if token and token.lower() not in ["native", "native currency"]:
+                token_address = chain_interface.chain.get_token_address(token)
+                if token_address:
+                    addresses[token] = token_address
+        metadata = TokenRegistry().prefetch(chain, addresses.values())
+    except Exception:
+        return {}  # Callers default to 18 if we can't get decimals
+
+    return {
+        token: metadata[address.lower()].decimals
+        for token, address in addresses.items()
+        if address.lower() in metadata
+    }
+
+
 @router.get(
     "/transactions",
     summary="Get Transactions",
@@ -82,7 +106,7 @@ def get_transactions(chain: str = "gnosis", auth: bool = Depends(verify_auth)):
     if not chain.replace("-", "").isalnum():
         raise HTTPException(status_code=400, detail="Invalid chain name")
     chain = chain.lower()
-    recent = (
+    recent = list(
         SentTransaction.select()
         .where(
             (SentTransaction.chain == chain)
@@ -91,23 +115,12 @@ def get_transactions(chain: str = "gnosis", auth: bool = Depends(verify_auth)):
         .order_by(SentTransaction.timestamp.desc())
     )
 
+    decimals_by_token = _get_token_decimals(chain, {tx.token for tx in recent})
+
     result = []
     for tx in recent:
-        # Get token decimals for proper display
-        token_decimals = 18  # Default for native
-        if tx.token and tx.token.lower() not in ["native", "native currency"]:
-            try:
-                from iwa.core.chain import ChainInterfaces
-                from iwa.core.contracts.erc20 import ERC20Contract
-
-                chain_interface = ChainInterfaces().get(chain)
-                if chain_interface:
-                    token_address = chain_interface.chain.get_token_address(tx.token)
-                    if token_address:
-                        erc20 = ERC20Contract(token_address, chain)
-                        token_decimals = erc20.decimals
-            except Exception:
-                pass  # Default to 18 if we can't get decimals
+        # Default to 18 for native (or if we can't get decimals)
+        token_decimals = decimals_by_token.get(tx.token, 18)
 
         amount_display = float(tx.amount_wei or 0) / (10**token_decimals)
 
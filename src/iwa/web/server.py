@@ -105,6 +105,7 @@ async def lifespan(app: FastAPI):
     except asyncio.CancelledError:
         pass
     logger.info("Shutting down...")
+    await ChainInterfaces().close_all_async()
 
 
 app = FastAPI(title="IWA Web UI", version="0.1.0", lifespan=lifespan)
@@ -0,0 +1,150 @@
+"""Tests for the async RPC read path (AsyncChainInterface and friends)."""
+
+import time
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
+
+import pytest
+from web3 import AsyncHTTPProvider
+
+from iwa.core.chain import AsyncChainInterface, ChainInterface, SupportedChain
+from iwa.core.chain.rate_limiter import RPCRateLimiter
+from iwa.core.contracts.multicall import MulticallBatch
+
+ADDR = "0x1234567890123456789012345678901234567890"
+
+
+@pytest.fixture
+def ci():
+    chain = MagicMock(spec=SupportedChain)
+    chain.name = "AsyncChain"
+    chain.rpcs = ["https://rpc1.example.com", "https://rpc2.example.com"]
+    chain.chain_id = 1
+    chain.tokens = {}
+    type(chain).rpc = PropertyMock(return_value=chain.rpcs[0])
+    return ChainInterface(chain)
+
+
+def _ok(value):
+    return {"jsonrpc": "2.0", "id": 0, "result": value}
+
+
+def _err(message, code=-32000):
+    return {"jsonrpc": "2.0", "id": 0, "error": {"code": code, "message": message}}
+
+
+@pytest.mark.asyncio
+async def test_acquire_async_waits_for_refill():
+    limiter = RPCRateLimiter(rate=20.0, burst=1)
+    assert await limiter.acquire_async(timeout=1.0)
+
+    start = time.monotonic()
+    assert await limiter.acquire_async(timeout=1.0)
+    assert time.monotonic() - start >= 0.03
+
+    limiter.trigger_backoff(seconds=5.0)
+    assert not await limiter.acquire_async(timeout=0.1)
+
+
+@pytest.mark.asyncio
+async def test_async_batch_shares_rotation_with_sync_interface(ci):
+    async def fake_batch(provider, requests):
+        if provider.endpoint_uri == "https://rpc1.example.com":
+            return [_ok("0x1"), _err("rate limit exceeded", code=-32005)]
+        return [_ok("0x1"), _ok("0x2")]
+
+    async_ci = AsyncChainInterface(ci)
+    with (
+        patch.object(AsyncHTTPProvider, "make_batch_request", autospec=True, side_effect=fake_batch),
+        patch("iwa.core.chain.async_interface.asyncio.sleep", new=AsyncMock()),
+    ):
+        balances = await async_ci.get_native_balances_wei([ADDR, ADDR])
+
+    assert balances == [1, 2]
+    # The 429 rotated the shared sync interface, not a private copy
+    assert ci.current_rpc_index == 1
+    assert async_ci.web3.provider.endpoint_uri == "https://rpc2.example.com"
+
+
+@pytest.mark.asyncio
+async def test_async_batch_rejected_falls_back_to_sequential(ci):
+    rejected = _err("batch requests are not supported", code=-32600)
+    async_ci = AsyncChainInterface(ci)
+    with (
+        patch.object(
+            AsyncHTTPProvider, "make_batch_request", new=AsyncMock(return_value=rejected)
+        ) as mock_batch,
+        patch.object(
+            AsyncHTTPProvider,
+            "make_request",
+            new=AsyncMock(side_effect=[_ok("0xa"), _ok("0xb"), _ok("0xc")]),
+        ),
+    ):
+        assert await async_ci.batch([("eth_blockNumber", []), ("eth_chainId", [])]) == [
+            "0xa",
+            "0xb",
+        ]
+        # Remembered on the sync interface, so neither path retries the batch
+        assert not ci.accepts_batches(0)
+        assert await async_ci.batch([("eth_blockNumber", [])]) == ["0xc"]
+
+    assert mock_batch.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_multicall_execute_async_falls_back_to_individual_calls():
+    multicall = MagicMock()
+    multicall.call_async = AsyncMock(side_effect=Exception("execution reverted"))
+    token = MagicMock()
+    token.call_async = AsyncMock(side_effect=[10, Exception("boom")])
+
+    with (
+        patch("iwa.core.contracts.multicall.Multicall3Contract", return_value=multicall),
+        patch.object(MulticallBatch, "_encode_calls", return_value=[]),
+    ):
+        batch = MulticallBatch("gnosis")
+        ok = batch.add(token, "totalSupply")
+        bad = batch.add(token, "decimals")
+        await batch.execute_async()
+
+    assert ok.value == 10
+    assert bad.success is False
+    assert "boom" in bad.result.error
+
+
+@pytest.mark.asyncio
+async def test_get_balances_eth_async():
+    from iwa.core.models import Token
+    from iwa.core.services.balance import BalanceService
+
+    token_address = "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"
+    account_service = MagicMock()
+    account_service.get_token_address.side_effect = lambda name, chain: (
+        token_address if name == "OLAS" else None
+    )
+    service = BalanceService(MagicMock(), account_service)
+
+    async_ci = MagicMock()
+    async_ci.get_native_balances_wei = AsyncMock(return_value=[10**18, None])
+
+    async def fake_execute(self):
+        for call in self._calls:
+            call.result = MagicMock(success=True, value=2 * 10**18)
+
+    with (
+        patch("iwa.core.services.balance.ChainInterfaces") as mock_chains,
+        patch("iwa.core.services.balance.TokenRegistry") as mock_registry,
+        patch.object(MulticallBatch, "execute_async", fake_execute),
+        patch("iwa.core.contracts.contract.ChainInterfaces"),
+    ):
+        mock_chains.return_value.get_async.return_value = async_ci
+        mock_registry.return_value.get.return_value = Token(
+            address=token_address, symbol="OLAS", decimals=18
+        )
+        balances = await service.get_balances_eth_async(
+            [ADDR, token_address], ["native", "OLAS", "UNKNOWN"], "gnosis"
+        )
+
+    assert balances[ADDR] == {"native": 1.0, "OLAS": 2.0, "UNKNOWN": None}
+    assert balances[token_address]["native"] == 0.0
+    # Known metadata is used directly; nothing is fetched in a worker thread
+    mock_registry.return_value.prefetch.assert_not_called()
@@ -44,6 +44,8 @@ def _fresh_config(config_path):
         "_plugin_models": {},
         "_path": None,
         "_storage_format": None,
+        "_file_stamp": None,
+        "_reload_listeners": [],
     })
     with patch("iwa.core.constants.CONFIG_PATH", config_path):
         config._try_load()
@@ -379,6 +381,68 @@ class TestRegisterPluginConfigSaveReduction:
         assert plugin.new_field == "default_value"  # new field gets model default
 
 
+# ---------------------------------------------------------------------------
+# Test: mtime-based reload
+# ---------------------------------------------------------------------------
+
+
+def _write_config(config_path, plugin_data):
+    ryaml = YAML()
+    with config_path.open("w") as f:
+        ryaml.dump({"core": {"whitelist": {}}, "plugins": {"test": plugin_data}}, f)
+
+
+class TestConfigReload:
+    """Tests that Config re-reads config.yaml only when the file changes."""
+
+    def test_reload_only_when_file_changes(self, tmp_path):
+        config_path = tmp_path / "config.yaml"
+        _write_config(config_path, {"services": {}, "enabled": True})
+        config = _fresh_config(config_path)
+        reloads = []
+        config.add_reload_listener(reloads.append)
+
+        with patch("iwa.core.constants.CONFIG_PATH", config_path):
+            config.register_plugin_config("test", SimplePluginConfig)
+            plugin = config.get_plugin_config("test")
+            assert config.reload_if_changed() is False
+
+            _write_config(config_path, {"services": {"svc1": "data"}, "enabled": False})
+            assert config.reload_if_changed() is True
+            assert config.reload_if_changed() is False
+
+        # Updated in place: references taken before the reload see new values
+        assert config.get_plugin_config("test") is plugin
+        assert plugin.services == {"svc1": "data"}
+        assert plugin.enabled is False
+        assert reloads == [config]
+
+    def test_own_save_does_not_trigger_reload(self, tmp_path):
+        config_path = tmp_path / "config.yaml"
+        _write_config(config_path, {"services": {}, "enabled": True})
+        config = _fresh_config(config_path)
+
+        with patch("iwa.core.constants.CONFIG_PATH", config_path):
+            config.register_plugin_config("test", SimplePluginConfig)
+            config.get_plugin_config("test").enabled = False
+            config.save_config()
+            assert config.reload_if_changed() is False
+
+    def test_unparseable_file_keeps_current_values(self, tmp_path):
+        config_path = tmp_path / "config.yaml"
+        _write_config(config_path, {"services": {"svc1": "data"}, "enabled": True})
+        config = _fresh_config(config_path)
+
+        with patch("iwa.core.constants.CONFIG_PATH", config_path):
+            config.register_plugin_config("test", SimplePluginConfig)
+            config_path.write_text("plugins: [unclosed\n")
+            assert config.reload_if_changed() is False
+            # The broken file is not re-parsed until it changes again
+            assert config.reload_if_changed() is False
+
+        assert config.get_plugin_config("test").services == {"svc1": "data"}
+
+
 # ---------------------------------------------------------------------------
 # Test: StorableModel.save_yaml atomic write
 # ---------------------------------------------------------------------------
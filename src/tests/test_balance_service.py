@@ -141,3 +141,33 @@ def test_balance_service_with_wallet(mock_account_service):
     service = BalanceService(mock_wallet, mock_account_service)
 
     assert service.key_storage == mock_wallet.key_storage
+
+
+def test_get_balances_eth_batches_reads(balance_service, mock_chain_interfaces):
+    """Native balances use one RPC batch and token balances one multicall."""
+    from iwa.core.models import Token
+
+    gnosis_interface = mock_chain_interfaces.get.return_value
+    gnosis_interface.get_native_balances_wei.return_value = [2 * 10**18, None]
+    token = Token(address="0x" + "11" * 20, symbol="OLAS", decimals=18)
+
+    handles = [
+        MagicMock(success=True, value=5 * 10**18),
+        MagicMock(success=False),
+    ]
+    with (
+        patch("iwa.core.services.balance.TokenRegistry") as mock_registry,
+        patch("iwa.core.services.balance.MulticallBatch") as mock_batch,
+        patch("iwa.core.services.balance.ERC20Contract"),
+    ):
+        mock_registry.return_value.prefetch.return_value = {"0xtokenaddress": token}
+        mock_batch.return_value.add.side_effect = handles
+
+        balances = balance_service.get_balances_eth(["0xA", "0xB"], ["native", "OLAS"], "gnosis")
+
+    assert balances == {
+        "0xA": {"native": 2, "OLAS": 5.0},
+        "0xB": {"native": 0.0, "OLAS": 0.0},
+    }
+    gnosis_interface.get_native_balances_wei.assert_called_once_with(["0xA", "0xB"])
+    mock_batch.return_value.execute.assert_called_once()
@@ -141,6 +141,15 @@ class TestInitBlockTracking:
                 ):
                     ci.init_block_tracking()
                     assert ci._initial_block == 12345
+                    # Calling it again does not register a second subscription
+                    ci.init_block_tracking()
+
+        # Passive: checking the limit never starts the head watcher by itself
+        assert len(ci.head_tracker._passive) == 1
+        assert ci.head_tracker._thread is None
+
+        ci.close()
+        assert not ci.head_tracker._passive
 
     def test_vnet_found_lowercase_fallback(self, mock_web3):
         """init_block_tracking tries lowercase chain name if exact name not found."""
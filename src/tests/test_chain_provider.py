@@ -0,0 +1,68 @@
+"""Tests for the ChainInterface-backed web3 provider and batch session."""
+
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from iwa.core.chain.errors import RPCBatchError
+from iwa.core.chain.interface import ChainInterface
+from iwa.core.chain.provider import ChainInterfaceProvider, ChainInterfaceSession
+
+
+def _chain_interface():
+    ci = MagicMock()
+    ci.chain.name = "Gnosis"
+    ci.current_rpc = "https://rpc1.example.com"
+    ci.with_retry.side_effect = lambda operation, **kwargs: operation()
+    ci.is_retryable_batch_error.side_effect = (
+        lambda error: ChainInterface._is_rate_limit_error(ci, error)
+    )
+    return ci
+
+
+def test_rate_limit_error_object_goes_to_retry():
+    ci = _chain_interface()
+    ci.web3.provider.make_request.return_value = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "error": {"code": -32005, "message": "Too Many Requests"},
+    }
+
+    with pytest.raises(RPCBatchError):
+        ChainInterfaceProvider(ci).make_request("eth_call", [{}, "latest"])
+    ci.rate_limiter.acquire.assert_called_once()
+    ci.health_tracker.record_success.assert_not_called()
+
+
+def test_revert_is_returned_to_web3():
+    ci = _chain_interface()
+    response = {"jsonrpc": "2.0", "id": 1, "error": {"code": 3, "message": "execution reverted"}}
+    ci.web3.provider.make_request.return_value = response
+
+    assert ChainInterfaceProvider(ci).make_request("eth_call", [{}, "latest"]) == response
+    ci.health_tracker.record_success.assert_called_once()
+
+
+def test_sends_are_not_retried():
+    ci = _chain_interface()
+    ci.web3.provider.make_request.return_value = {"jsonrpc": "2.0", "id": 1, "result": "0x"}
+
+    ChainInterfaceProvider(ci).make_request("eth_sendRawTransaction", ["0xsigned"])
+    assert ci.with_retry.call_args.kwargs["max_retries"] == 0
+
+    ChainInterfaceProvider(ci).make_request("eth_getBalance", ["0x0", "latest"])
+    assert ci.with_retry.call_args.kwargs["max_retries"] is None
+
+
+def test_session_posts_to_current_rpc_and_raises_on_429():
+    ci = _chain_interface()
+    ci.current_rpc = "https://rpc2.example.com"
+    ci.session.post.return_value.status_code = 429
+    ci.session.post.return_value.raise_for_status.side_effect = requests.HTTPError("429")
+
+    with pytest.raises(requests.HTTPError):
+        ChainInterfaceSession(ci).post("https://stale.example.com", json=[{"id": 1}], timeout=5)
+    ci.session.post.assert_called_once_with(
+        "https://rpc2.example.com", json=[{"id": 1}], timeout=5
+    )
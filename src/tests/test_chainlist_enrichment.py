@@ -12,6 +12,7 @@ from iwa.core.chainlist import (
     _normalize_url,
     probe_rpc,
 )
+from iwa.core.models import CoreConfig
 
 
 @pytest.fixture(autouse=True)
@@ -340,8 +341,7 @@ class TestChainlistEnrichmentConfigFlag:
         chain.rpc = "https://rpc1.example.com"
         chain.chain_id = 100
 
-        mock_core = MagicMock()
-        mock_core.chainlist_enrichment = False
+        mock_core = CoreConfig().model_copy(update={"chainlist_enrichment": False})
 
         with patch("iwa.core.chain.interface.Config") as mock_config_cls:
             mock_config_cls.return_value.core = mock_core
@@ -362,14 +362,15 @@ class TestChainlistEnrichmentConfigFlag:
         chain.rpc = "https://rpc1.example.com"
         chain.chain_id = 100
 
-        mock_core = MagicMock()
-        mock_core.chainlist_enrichment = True
+        mock_core = CoreConfig().model_copy(update={"chainlist_enrichment": True})
 
         with patch("iwa.core.chain.interface.Config") as mock_config_cls:
             mock_config_cls.return_value.core = mock_core
             with patch("iwa.core.chainlist.ChainlistRPC") as mock_cl_cls:
                 mock_cl = mock_cl_cls.return_value
                 mock_cl.get_validated_rpcs.return_value = ["https://extra.example.com"]
+                mock_cl.probe_results = {}
+                mock_cl.get_wss_rpcs.return_value = []
                 ChainInterface(chain)
 
         # chainlist_enrichment=True → ChainlistRPC was called
@@ -480,13 +481,21 @@ class TestEnrichFromChainlist:
                 "https://extra1.example.com",
                 "https://extra2.example.com",
             ]
-            ChainInterface(chain)
+            mock_cl.probe_results = {"https://extra1.example.com": (120.0, 1000)}
+            mock_cl.get_wss_rpcs.return_value = [
+                "wss://ws.example.com",
+                "wss://ws.example.com/${INFURA_API_KEY}",
+            ]
+            ci = ChainInterface(chain)
 
         assert len(chain.rpcs) == 3
         assert "https://extra1.example.com" in chain.rpcs
         assert "https://extra2.example.com" in chain.rpcs
         # Original RPC stays first
         assert chain.rpcs[0] == "https://rpc1.example.com"
+        # Probe latencies seed RPC health; templated WSS URLs are dropped
+        assert ci.health_tracker.best_head() == 1000
+        assert ci.wss_rpcs == ["wss://ws.example.com"]
 
     @patch("iwa.core.chain.interface.Web3")
     def test_survives_fetch_failure(self, mock_web3):
@@ -19,8 +19,8 @@ def clean_abi_cache():
 def mock_chain_interface():
     with patch("iwa.core.contracts.contract.ChainInterfaces") as mock:
         mock_ci = mock.return_value.get.return_value
-        # contract.py now uses web3._web3.eth.contract directly for RPC rotation compatibility
-        mock_ci.web3._web3.eth.contract.return_value = MagicMock()
+        # Contracts are bound to the RateLimitedWeb3 wrapper (web3.eth.contract)
+        mock_ci.web3.eth.contract.return_value = MagicMock()
         yield mock_ci
 
 
@@ -31,6 +31,13 @@ def mock_abi_file():
         yield
 
 
+def _swap_web3(chain_interface):
+    """Give *chain_interface* a new Web3 wrapper that builds contracts the same way."""
+    factory = chain_interface.web3.eth.contract
+    chain_interface.web3 = MagicMock()
+    chain_interface.web3.eth.contract = factory
+
+
 class MockContract(ContractInstance):
     name = "test_contract"
     abi_path = Path("test.json")
@@ -235,15 +242,17 @@ def test_call_reevaluates_contract_on_retry(mock_chain_interface, mock_abi_file)
             mock.functions.testFunc.return_value.call.return_value = "success"
         return mock
 
-    mock_chain_interface.web3._web3.eth.contract.side_effect = counting_contract_factory
+    mock_chain_interface.web3.eth.contract.side_effect = counting_contract_factory
 
-    # Implement with_retry that actually retries on 429
+    # Implement with_retry that actually retries on 429, replacing the chain's
+    # Web3 wrapper in between so a stale contract would be noticed
     def real_with_retry(fn, max_retries=6, operation_name="operation"):
         for attempt in range(max_retries + 1):
             try:
                 return fn()
             except Exception as e:
                 if "429" in str(e) and attempt < max_retries:
+                    _swap_web3(mock_chain_interface)
                     continue
                 raise
 
@@ -283,7 +292,7 @@ def test_call_uses_fresh_provider_after_rotation(mock_chain_interface, mock_abi_
         provider_versions.append(current_provider_version[0])
         return mock
 
-    mock_chain_interface.web3._web3.eth.contract.side_effect = mock_contract_factory
+    mock_chain_interface.web3.eth.contract.side_effect = mock_contract_factory
 
     # Simulate RPC rotation by incrementing provider version
     def simulate_rotation():
@@ -344,9 +353,9 @@ def test_call_with_429_triggers_retry_with_new_contract(mock_chain_interface, mo
         contract_call_count[0] += 1
         return result
 
-    mock_chain_interface.web3._web3.eth.contract.side_effect = mock_contract_factory
+    mock_chain_interface.web3.eth.contract.side_effect = mock_contract_factory
 
-    # Implement with_retry that actually retries
+    # Implement with_retry that actually retries (with a new Web3 wrapper)
     def real_with_retry(fn, max_retries=6, operation_name="operation"):
         last_error = None
         for attempt in range(max_retries + 1):
@@ -355,6 +364,7 @@ def test_call_with_429_triggers_retry_with_new_contract(mock_chain_interface, mo
             except Exception as e:
                 last_error = e
                 if "429" in str(e) and attempt < max_retries:
+                    _swap_web3(mock_chain_interface)
                     continue  # Retry
                 raise
         raise last_error
@@ -369,3 +379,20 @@ def test_call_with_429_triggers_retry_with_new_contract(mock_chain_interface, mo
     assert contract_call_count[0] == 2, (
         f"Expected 2 contract creations, got {contract_call_count[0]}"
     )
+
+
+def test_contract_cached_per_web3_wrapper(mock_chain_interface, mock_abi_file):
+    """The web3 Contract is built once per RateLimitedWeb3 wrapper."""
+    contract = MockContract("0x78731D3Ca6b7E34aC0F824c42a7cC18A495cabaB", "gnosis")
+    factory = mock_chain_interface.web3.eth.contract
+    factory.side_effect = lambda address, abi: MagicMock()
+
+    first = contract.contract
+    assert contract.contract is first
+    assert factory.call_count == 1
+
+    _swap_web3(mock_chain_interface)
+    second = contract.contract
+    assert second is not first
+    assert factory.call_count == 2
+    assert contract.contract is second
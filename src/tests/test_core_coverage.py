@@ -827,7 +827,7 @@ class TestTransferBaseGetTokenPriceInfo:
             patch("iwa.core.services.transfer.base.ChainInterfaces") as mock_ci_cls,
         ):
             mock_ps = mock_ps_cls.return_value
-            mock_ps.get_token_price.return_value = 2.5
+            mock_ps.get_price_at.return_value = 2.5
 
             mock_chain = mock_ci_cls.return_value.get.return_value
             mock_chain.chain.get_token_address.return_value = ADDR_A
@@ -844,7 +844,7 @@ class TestTransferBaseGetTokenPriceInfo:
             patch("iwa.core.services.transfer.base.ChainInterfaces"),
         ):
             mock_ps = mock_ps_cls.return_value
-            mock_ps.get_token_price.return_value = 1.0
+            mock_ps.get_price_at.return_value = 1.0
 
             price, value = transfer_service._get_token_price_info("NATIVE", 10**18, "gnosis")
             assert price == 1.0
@@ -860,7 +860,7 @@ class TestTransferBaseGetTokenPriceInfo:
         """Test price info when price service returns None."""
         with patch("iwa.core.services.transfer.base.PriceService") as mock_ps_cls:
             mock_ps = mock_ps_cls.return_value
-            mock_ps.get_token_price.return_value = None
+            mock_ps.get_price_at.return_value = None
 
             price, value = transfer_service._get_token_price_info("OLAS", 10**18, "gnosis")
             assert price is None
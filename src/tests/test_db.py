@@ -59,6 +59,13 @@ def test_init_db():
     with (
         patch("iwa.core.db.db") as mock_db,
         patch("iwa.core.db.SentTransaction") as mock_model,
+        patch("iwa.core.db.TransactionTag") as mock_tag_model,
+        patch("iwa.core.db.RewardsRollup") as mock_rollup,
+        patch("iwa.core.db.RewardsRollupMonth") as mock_rollup_month,
+        patch("iwa.core.db.DailyPrice") as mock_daily_price,
+        patch("iwa.core.db.IndexedLog") as mock_indexed_log,
+        patch("iwa.core.db.LogCheckpoint") as mock_log_checkpoint,
+        patch("iwa.core.db.MonitorCheckpoint") as mock_monitor_checkpoint,
         patch("iwa.core.db.migrate") as mock_migrate,
         patch("iwa.core.db.SqliteMigrator"),
     ):
@@ -67,7 +74,19 @@ def test_init_db():
         init_db()
 
         mock_db.connect.assert_called_once()
-        mock_db.create_tables.assert_called_with([mock_model], safe=True)
+        mock_db.create_tables.assert_called_with(
+            [
+                mock_model,
+                mock_tag_model,
+                mock_rollup,
+                mock_rollup_month,
+                mock_daily_price,
+                mock_indexed_log,
+                mock_log_checkpoint,
+                mock_monitor_checkpoint,
+            ],
+            safe=True,
+        )
         assert mock_migrate.call_count >= 1
 
 
@@ -178,3 +197,43 @@ def test_run_migrations_add_tags():
         run_migrations(columns)
 
         assert mock_migrate.called
+
+
+def test_run_migrations_backfills_amount_and_tag_table(isolate_test_database):
+    """Test the aggregation migration backfills legacy rows and creates indexes."""
+    from iwa.core.db import SentTransaction, TransactionTag, run_migrations
+
+    test_db = isolate_test_database
+    SentTransaction.create(
+        tx_hash="0xaa",
+        from_address="0xFrom",
+        to_address="0xTo",
+        token="OLAS",
+        amount_wei="2000",
+        chain="gnosis",
+        tags='["olas_claim_rewards", "staking_reward"]',
+    )
+    test_db.execute_sql("ALTER TABLE senttransaction DROP COLUMN amount_wei_real")
+    test_db.execute_sql("DROP INDEX senttransaction_chain_timestamp")
+
+    run_migrations([c.name for c in test_db.get_columns("senttransaction")])
+
+    assert SentTransaction.get_by_id("0xaa").amount_wei_real == 2000.0
+    assert {(t.tx_hash, t.tag) for t in TransactionTag.select()} == {
+        ("0xaa", "olas_claim_rewards"),
+        ("0xaa", "staking_reward"),
+    }
+    index_names = {i.name for i in test_db.get_indexes("senttransaction")}
+    assert "senttransaction_chain_timestamp" in index_names
+    assert "senttransaction_from_address_timestamp" in index_names
+
+
+def test_log_transaction_mirrors_tags():
+    """Test log_transaction keeps transaction_tag in sync with merged tags."""
+    from iwa.core.db import TransactionTag
+
+    log_transaction("0xbb", "0xFrom", "0xTo", "OLAS", 5, "gnosis", tags=["a"])
+    log_transaction("0xbb", "0xFrom", "0xTo", "OLAS", 5, "gnosis", tags=["b"])
+
+    tags = {t.tag for t in TransactionTag.select().where(TransactionTag.tx_hash == "0xbb")}
+    assert tags == {"a", "b"}
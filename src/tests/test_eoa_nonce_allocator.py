@@ -0,0 +1,216 @@
+"""Tests for EOANonceAllocator and pipelined sign_and_send."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from web3.exceptions import Web3RPCError
+
+from iwa.core.services.safe import NonceAllocatorBlockedError
+from iwa.core.services.transaction import EOANonceAllocator, TransactionService
+
+
+def _chain_interface(pending=5, latest=None):
+    ci = MagicMock()
+    ci.with_retry.side_effect = lambda op, **kwargs: op()
+
+    def get_transaction_count(address, block_identifier="latest"):
+        if block_identifier == "pending":
+            return pending
+        return pending if latest is None else latest
+
+    ci.web3.eth.get_transaction_count.side_effect = get_transaction_count
+    return ci
+
+
+def test_allocate_is_monotonic_and_fetches_once():
+    ci = _chain_interface(pending=5)
+    allocator = EOANonceAllocator(ci, "0xSigner")
+
+    assert [allocator.allocate() for _ in range(3)] == [5, 6, 7]
+    assert ci.web3.eth.get_transaction_count.call_count == 1
+    assert allocator.stats()["in_flight_count"] == 3
+
+    for n in (5, 6, 7):
+        allocator.release(n)
+    assert allocator.stats()["in_flight_count"] == 0
+
+
+def test_refetch_never_reuses_broadcast_nonce():
+    # RPC lags behind: it still reports 5 although 5 and 6 were broadcast
+    ci = _chain_interface(pending=5)
+    allocator = EOANonceAllocator(ci, "0xSigner")
+    for n in (allocator.allocate(), allocator.allocate()):
+        allocator.register_broadcast(n, f"0x{n}")
+    failed = allocator.allocate()  # 7, never broadcast
+    allocator.release(failed)
+    allocator.invalidate("broadcast failed")
+
+    assert allocator.allocate() == 7
+    assert allocator.stats()["refetch_count"] == 2
+
+
+def test_invalidate_fills_gap_once_drained():
+    ci = _chain_interface(pending=5)
+    allocator = EOANonceAllocator(ci, "0xSigner")
+    n = allocator.allocate()
+    allocator.release(n)
+    allocator.invalidate("never mined")
+
+    assert allocator.allocate() == 5
+
+
+def test_gap_threshold_blocks_allocation():
+    ci = _chain_interface(pending=9, latest=5)
+    allocator = EOANonceAllocator(ci, "0xSigner", gap_alert_threshold=2)
+
+    with pytest.raises(NonceAllocatorBlockedError):
+        allocator.allocate()
+    assert allocator.stats()["in_flight_count"] == 0
+
+
+def test_sign_and_send_broadcasts_before_previous_receipt():
+    """A second TX from the same EOA goes out while the first awaits its receipt."""
+    ci = _chain_interface(pending=5)
+    ci.web3.eth.send_raw_transaction.side_effect = lambda raw: raw
+    first_sent = threading.Event()
+    second_sent = threading.Event()
+
+    key_storage = MagicMock()
+    key_storage.sign_transaction.side_effect = lambda tx, signer: MagicMock(
+        raw_transaction=bytes([tx["nonce"]])
+    )
+
+    def wait_for_receipt(tx_hash):
+        if tx_hash == bytes([5]):
+            first_sent.set()
+            # Only resolves once the next nonce has been broadcast
+            assert second_sent.wait(5)
+        else:
+            second_sent.set()
+        return MagicMock(status=1)
+
+    ci.web3.eth.wait_for_transaction_receipt.side_effect = wait_for_receipt
+
+    account_service = MagicMock()
+    account_service.resolve_account.return_value = MagicMock(address="0xSigner")
+    svc = TransactionService(key_storage, account_service)
+    results = []
+
+    with (
+        patch("iwa.core.services.transaction.ChainInterfaces") as mock_ci,
+        patch.object(svc, "_log_successful_transaction"),
+    ):
+        mock_ci.return_value.get.return_value = ci
+        t = threading.Thread(target=lambda: results.append(svc.sign_and_send({"to": "0xA"}, "s")))
+        t.start()
+        assert first_sent.wait(5)
+        results.append(svc.sign_and_send({"to": "0xB"}, "s"))
+        t.join(5)
+
+    assert [ok for ok, _ in results] == [True, True]
+    sent = [c.args[0] for c in ci.web3.eth.send_raw_transaction.call_args_list]
+    assert sent == [bytes([5]), bytes([6])]
+    assert svc.get_nonce_allocator("0xSigner", "gnosis").stats()["in_flight_count"] == 0
+    ci.wait_for_no_pending_tx.assert_not_called()
+
+
+def test_allocator_is_shared_across_services():
+    first = TransactionService(MagicMock(), MagicMock())
+    second = TransactionService(MagicMock(), MagicMock())
+    ci = _chain_interface()
+
+    allocator = first.get_nonce_allocator("0xSigner", "gnosis", ci)
+    assert second.get_nonce_allocator("0XSIGNER", "gnosis") is allocator
+
+
+def test_nonce_too_low_refetches_and_resends():
+    """A nonce used by another sender is replaced with a fresh one, not given up on."""
+    ci = _chain_interface()
+    pending = iter([5, 8])
+    ci.web3.eth.get_transaction_count.side_effect = lambda *args: next(pending)
+    ci.web3.eth.send_raw_transaction.side_effect = [
+        Web3RPCError("nonce too low: next nonce 8, tx nonce 5"),
+        b"\x08",
+    ]
+    ci.web3.eth.wait_for_transaction_receipt.return_value = MagicMock(status=1)
+
+    key_storage = MagicMock()
+    key_storage.sign_transaction.side_effect = lambda tx, signer: MagicMock(
+        raw_transaction=bytes([tx["nonce"]])
+    )
+    account_service = MagicMock()
+    account_service.resolve_account.return_value = MagicMock(address="0xSigner")
+    svc = TransactionService(key_storage, account_service)
+
+    with (
+        patch("iwa.core.services.transaction.ChainInterfaces") as mock_ci,
+        patch.object(svc, "_log_successful_transaction"),
+    ):
+        mock_ci.return_value.get.return_value = ci
+        ok, _ = svc.sign_and_send({"to": "0xA"}, "s")
+
+    assert ok
+    sent = [c.args[0] for c in ci.web3.eth.send_raw_transaction.call_args_list]
+    assert sent == [bytes([5]), bytes([8])]
+    stats = svc.get_nonce_allocator("0xSigner", "gnosis").stats()
+    assert stats["in_flight_count"] == 0
+    assert stats["next_nonce"] == 9
+
+
+def test_failed_send_hands_its_nonce_to_the_next_sender():
+    """A nonce that never went out is reused by a sender waiting on the address lock."""
+    ci = _chain_interface(pending=5)
+    first_sending = threading.Event()
+    second_sent = threading.Event()
+
+    def send_raw_transaction(raw):
+        if not first_sending.is_set():
+            first_sending.set()
+            time.sleep(0.2)  # Let the second sender queue up on the address lock
+            raise ConnectionError("connection reset")
+        second_sent.set()
+        return raw
+
+    ci.web3.eth.send_raw_transaction.side_effect = send_raw_transaction
+    ci.web3.eth.wait_for_transaction_receipt.return_value = MagicMock(status=1)
+
+    key_storage = MagicMock()
+    key_storage.sign_transaction.side_effect = lambda tx, signer: MagicMock(
+        raw_transaction=bytes([tx["nonce"]])
+    )
+    account_service = MagicMock()
+    account_service.resolve_account.return_value = MagicMock(address="0xSigner")
+    svc = TransactionService(key_storage, account_service)
+
+    # Hold the failed sender in invalidate(): a sender that got in meanwhile
+    # would broadcast past the abandoned nonce
+    allocator = svc.get_nonce_allocator("0xSigner", "gnosis", ci)
+    invalidate = allocator.invalidate
+
+    def slow_invalidate(reason="unspecified"):
+        second_sent.wait(0.5)
+        invalidate(reason)
+
+    results = []
+    with (
+        patch("iwa.core.services.transaction.ChainInterfaces") as mock_ci,
+        patch.object(svc, "_log_successful_transaction"),
+        patch.object(allocator, "invalidate", side_effect=slow_invalidate),
+    ):
+        mock_ci.return_value.get.return_value = ci
+        t = threading.Thread(target=lambda: results.append(svc.sign_and_send({"to": "0xA"}, "s")))
+        t.start()
+        assert first_sending.wait(5)
+        second = threading.Thread(
+            target=lambda: results.append(svc.sign_and_send({"to": "0xB"}, "s"))
+        )
+        second.start()
+        t.join(5)
+        second.join(5)
+
+    assert sorted(ok for ok, _ in results) == [False, True]
+    sent = [c.args[0] for c in ci.web3.eth.send_raw_transaction.call_args_list]
+    assert sent == [bytes([5]), bytes([5])]
+    assert allocator.stats()["in_flight_count"] == 0
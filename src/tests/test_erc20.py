@@ -3,6 +3,14 @@ from unittest.mock import patch
 import pytest
 
 from iwa.core.contracts.erc20 import ERC20Contract
+from iwa.core.models import Token
+
+TOKEN_METADATA = Token(
+    address="0x78731D3Ca6b7E34aC0F824c42a7cC18A495cabaB",
+    symbol="TEST",
+    name="Test Token",
+    decimals=18,
+)
 
 
 @pytest.fixture
@@ -11,6 +19,10 @@ def mock_contract_instance():
         patch("iwa.core.contracts.contract.ContractInstance.__init__", return_value=None),
         patch("iwa.core.contracts.contract.ContractInstance.call") as mock_call,
         patch("iwa.core.contracts.contract.ContractInstance.prepare_transaction") as mock_prep,
+        patch(
+            "iwa.core.contracts.token_registry.TokenRegistry.get_or_fetch",
+            return_value=TOKEN_METADATA,
+        ),
     ):
         mock_call.side_effect = lambda method, *args: {
             "decimals": 18,
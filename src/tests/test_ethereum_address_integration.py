@@ -271,8 +271,8 @@ class TestEventMonitorAddresses:
             mock_block = MagicMock()
             mock_block.transactions = [mock_tx]
             mock_block.timestamp = 1234567890
-            mock_chain.web3.eth.get_block.return_value = mock_block
-            mock_chain.web3.eth.get_logs.return_value = []
+            mock_chain.get_blocks.return_value = [mock_block]
+            mock_chain.get_logs_ranged.return_value = []
 
             results = []
             monitor.callback = lambda txs: results.extend(txs)
@@ -2,7 +2,7 @@
 
 import time
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 # Valid Ethereum addresses for testing
 ADDR_STAKING_1 = "0x389B46C259631Acd6a69Bde8B6cEe218230bAE8C"
@@ -132,61 +132,57 @@ class TestStartStop(unittest.TestCase):
 class TestMonitorLoop(unittest.TestCase):
     """Tests for _monitor_loop."""
 
+    @staticmethod
+    def _heads(inv, *heads):
+        """Feed *heads* from the head tracker, then stop the loop."""
+        remaining = list(heads)
+
+        def wait_for_new_head(after, timeout):
+            if not remaining:
+                inv.running = False
+                return None
+            head = remaining.pop(0)
+            if isinstance(head, Exception):
+                raise head
+            return head
+
+        inv.chain_interface.head_tracker.wait_for_new_head.side_effect = wait_for_new_head
+
     def test_loop_exits_when_running_set_to_false(self):
         """The loop should exit promptly after running is cleared."""
         inv = _build_invalidator()
         inv.web3.eth.block_number = 100
+        self._heads(inv)
 
-        call_count = 0
-
-        def fake_sleep(seconds):
-            nonlocal call_count
-            call_count += 1
-            # After first sleep, stop the loop
-            inv.running = False
-
-        with patch("time.sleep", side_effect=fake_sleep):
-            inv.running = True
-            inv._monitor_loop()
+        inv.running = True
+        inv._monitor_loop()
 
-        self.assertGreaterEqual(call_count, 1)
+        inv.chain_interface.head_tracker.wait_for_new_head.assert_called_once_with(100, timeout=10)
 
     def test_loop_calls_check_events_on_new_blocks(self):
-        """When block number advances, _check_events should be called."""
+        """When a new head arrives, _check_events should cover the gap."""
         inv = _build_invalidator()
-
-        # Simulate block advancing: initial=100, then 105
-        block_values = [100, 105]
-        block_iter = iter(block_values)
-        type(inv.web3.eth).block_number = property(
-            lambda self: next(block_iter)
-        )
-
+        inv.web3.eth.block_number = 100
         inv._check_events = MagicMock()
+        self._heads(inv, 105, 107)
 
-        def fake_sleep(seconds):
-            inv.running = False
-
-        with patch("time.sleep", side_effect=fake_sleep):
-            inv.running = True
-            inv._monitor_loop()
+        inv.running = True
+        inv._monitor_loop()
 
-        inv._check_events.assert_called_once_with(101, 105)
+        self.assertEqual(
+            inv._check_events.call_args_list,
+            [call(101, 105), call(106, 107)],
+        )
 
     def test_loop_does_not_call_check_events_when_no_new_blocks(self):
-        """If block number doesn't advance, _check_events should not be called."""
+        """If no new head arrives, _check_events should not be called."""
         inv = _build_invalidator()
-
-        type(inv.web3.eth).block_number = property(lambda self: 100)
-
+        inv.web3.eth.block_number = 100
         inv._check_events = MagicMock()
+        self._heads(inv, None, 100)
 
-        def fake_sleep(seconds):
-            inv.running = False
-
-        with patch("time.sleep", side_effect=fake_sleep):
-            inv.running = True
-            inv._monitor_loop()
+        inv.running = True
+        inv._monitor_loop()
 
         inv._check_events.assert_not_called()
 
@@ -194,25 +190,15 @@ class TestMonitorLoop(unittest.TestCase):
         """If getting initial block_number fails, last_block defaults to 0."""
         inv = _build_invalidator()
 
-        # First call (initial) raises, second call in loop returns 50
-        calls = [0]
-
         def block_number_getter(self):
-            calls[0] += 1
-            if calls[0] == 1:
-                raise ConnectionError("RPC down")
-            return 50
+            raise ConnectionError("RPC down")
 
         type(inv.web3.eth).block_number = property(block_number_getter)
-
         inv._check_events = MagicMock()
+        self._heads(inv, 50)
 
-        def fake_sleep(seconds):
-            inv.running = False
-
-        with patch("time.sleep", side_effect=fake_sleep):
-            inv.running = True
-            inv._monitor_loop()
+        inv.running = True
+        inv._monitor_loop()
 
         # last_block was 0, current=50, so check_events(1, 50)
         inv._check_events.assert_called_once_with(1, 50)
@@ -220,25 +206,14 @@ class TestMonitorLoop(unittest.TestCase):
     def test_loop_handles_exception_during_iteration(self):
         """Exceptions during the loop body should be caught and logged."""
         inv = _build_invalidator()
+        inv.web3.eth.block_number = 100
+        inv._check_events = MagicMock()
+        self._heads(inv, RuntimeError("RPC failure"), 101)
 
-        # First call to block_number succeeds (initial), second raises
-        calls = [0]
-
-        def block_number_getter(self):
-            calls[0] += 1
-            if calls[0] == 1:
-                return 100
-            raise RuntimeError("RPC failure")
-
-        type(inv.web3.eth).block_number = property(block_number_getter)
-
-        def fake_sleep(seconds):
-            inv.running = False
-
-        with patch("time.sleep", side_effect=fake_sleep):
-            inv.running = True
-            inv._monitor_loop()  # Should not raise
+        inv.running = True
+        inv._monitor_loop()  # Should not raise
 
+        inv._check_events.assert_called_once_with(101, 101)
 
 class TestCheckEvents(unittest.TestCase):
     """Tests for _check_events."""
@@ -250,57 +225,45 @@ class TestCheckEvents(unittest.TestCase):
         )
         inv.staking_addresses = []
 
-        # Should not try to call web3.eth.get_logs
+        # Should not try to fetch logs
         inv._check_events(1, 10)
-        inv.web3.eth.get_logs.assert_not_called()
+        inv.chain_interface.get_logs_ranged.assert_not_called()
 
-    def test_caps_block_range_to_100(self):
-        """If to_block - from_block > 100, from_block should be capped."""
+    def test_full_block_range_is_fetched(self):
+        """A long gap is handed to get_logs_ranged whole instead of being truncated."""
         inv = _build_invalidator()
-        inv.web3.eth.get_logs.return_value = []
+        inv.chain_interface.get_logs_ranged.return_value = []
 
         inv._check_events(0, 200)
 
-        # from_block should have been adjusted to 200 - 100 = 100
-        filter_arg = inv.web3.eth.get_logs.call_args[0][0]
-        self.assertEqual(filter_arg["fromBlock"], 100)
-        self.assertEqual(filter_arg["toBlock"], 200)
-
-    def test_normal_block_range_not_capped(self):
-        """A normal range (<= 100 blocks) should remain as-is."""
-        inv = _build_invalidator()
-        inv.web3.eth.get_logs.return_value = []
-
-        inv._check_events(50, 100)
-
-        filter_arg = inv.web3.eth.get_logs.call_args[0][0]
-        self.assertEqual(filter_arg["fromBlock"], 50)
-        self.assertEqual(filter_arg["toBlock"], 100)
+        _, from_block, to_block = inv.chain_interface.get_logs_ranged.call_args[0]
+        self.assertEqual(from_block, 0)
+        self.assertEqual(to_block, 200)
 
     def test_passes_staking_addresses_in_filter(self):
         """The filter should include all staking addresses."""
         inv = _build_invalidator()
-        inv.web3.eth.get_logs.return_value = []
+        inv.chain_interface.get_logs_ranged.return_value = []
 
         inv._check_events(10, 20)
 
-        filter_arg = inv.web3.eth.get_logs.call_args[0][0]
+        filter_arg = inv.chain_interface.get_logs_ranged.call_args[0][0]
         self.assertEqual(filter_arg["address"], inv.staking_addresses)
 
-    def test_checkpoint_event_topic_uses_keccak(self):
-        """The filter should compute the Checkpoint topic via web3.keccak."""
+    def test_checkpoint_event_topic_is_0x_prefixed_keccak(self):
+        """The filter carries the Checkpoint topic as 0x-prefixed hex, as nodes require."""
+        from web3 import Web3
+
         inv = _build_invalidator()
-        inv.web3.keccak.return_value = MagicMock(hex=MagicMock(return_value="0xabc123"))
-        inv.web3.eth.get_logs.return_value = []
+        inv.web3.keccak = Web3.keccak
+        inv.chain_interface.get_logs_ranged.return_value = []
 
         inv._check_events(10, 20)
 
-        inv.web3.keccak.assert_called_once_with(
-            text="Checkpoint(uint256,uint256,uint256,uint256,uint256,uint256,uint256,uint256)"
-        )
-
-        filter_arg = inv.web3.eth.get_logs.call_args[0][0]
-        self.assertEqual(filter_arg["topics"], ["0xabc123"])
+        expected = Web3.keccak(text="Checkpoint(uint256,uint256,uint256[],uint256[],uint256)")
+        filter_arg = inv.chain_interface.get_logs_ranged.call_args[0][0]
+        self.assertEqual(filter_arg["topics"], ["0x" + expected.hex().removeprefix("0x")])
+        self.assertTrue(filter_arg["topics"][0].startswith("0x"))
 
     def test_invalidates_cache_for_checkpoint_event(self):
         """When a Checkpoint log is found, the cached instance should get clear_epoch_cache called."""
@@ -314,7 +277,7 @@ class TestCheckEvents(unittest.TestCase):
             "address": ADDR_STAKING_1,
             "blockNumber": 42,
         }
-        inv.web3.eth.get_logs.return_value = [log_entry]
+        inv.chain_interface.get_logs_ranged.return_value = [log_entry]
 
         inv._check_events(10, 20)
 
@@ -333,7 +296,7 @@ class TestCheckEvents(unittest.TestCase):
             "address": ADDR_STAKING_1,
             "blockNumber": 42,
         }
-        inv.web3.eth.get_logs.return_value = [log_entry]
+        inv.chain_interface.get_logs_ranged.return_value = [log_entry]
 
         # Should not raise
         inv._check_events(10, 20)
@@ -360,7 +323,7 @@ class TestCheckEvents(unittest.TestCase):
             {"address": ADDR_STAKING_1, "blockNumber": 42},
             {"address": ADDR_STAKING_2, "blockNumber": 43},
         ]
-        inv.web3.eth.get_logs.return_value = logs
+        inv.chain_interface.get_logs_ranged.return_value = logs
 
         inv._check_events(10, 20)
 
@@ -368,9 +331,9 @@ class TestCheckEvents(unittest.TestCase):
         mock_instance_2.clear_epoch_cache.assert_called_once()
 
     def test_handles_get_logs_exception(self):
-        """An exception from web3.eth.get_logs should be caught and logged."""
+        """An exception from get_logs_ranged should be caught and logged."""
         inv = _build_invalidator()
-        inv.web3.eth.get_logs.side_effect = Exception("RPC error")
+        inv.chain_interface.get_logs_ranged.side_effect = Exception("RPC error")
 
         # Should not raise
         inv._check_events(10, 20)
@@ -387,7 +350,7 @@ class TestCheckEvents(unittest.TestCase):
         """_check_events should call get_contract to ensure contract is cached."""
         inv = _build_invalidator()
         inv.web3.keccak.return_value = MagicMock(hex=MagicMock(return_value="0xabc123"))
-        inv.web3.eth.get_logs.return_value = []
+        inv.chain_interface.get_logs_ranged.return_value = []
 
         inv._check_events(10, 20)
 
@@ -397,27 +360,57 @@ class TestCheckEvents(unittest.TestCase):
             StakingContract, inv.staking_addresses[0], "gnosis"
         )
 
-    def test_exact_boundary_100_blocks_not_capped(self):
-        """If range is exactly 100 blocks, from_block should NOT be capped."""
-        inv = _build_invalidator()
-        inv.web3.eth.get_logs.return_value = []
 
-        inv._check_events(100, 200)
+class TestCheckServiceMoves(unittest.TestCase):
+    """Tests for _check_service_moves."""
 
-        filter_arg = inv.web3.eth.get_logs.call_args[0][0]
-        # 200 - 100 == 100, which is NOT > 100, so no capping
-        self.assertEqual(filter_arg["fromBlock"], 100)
+    def setUp(self):
+        from web3 import Web3
 
-    def test_boundary_101_blocks_is_capped(self):
-        """If range is 101 blocks, from_block should be capped."""
-        inv = _build_invalidator()
-        inv.web3.eth.get_logs.return_value = []
+        self.inv = _build_invalidator()
+        self.inv.web3.keccak = Web3.keccak
+
+    def _log(self, signature, topics=(), data=b""):
+        from web3 import Web3
+
+        return {
+            "address": ADDR_STAKING_1,
+            "blockNumber": 15,
+            "topics": [Web3.keccak(text=signature), *topics],
+            "data": data,
+        }
 
-        inv._check_events(99, 200)
+    def test_forgets_staked_unstaked_and_evicted_services(self):
+        from eth_abi import encode
 
-        filter_arg = inv.web3.eth.get_logs.call_args[0][0]
-        # 200 - 99 = 101 > 100, so from_block = 200 - 100 = 100
-        self.assertEqual(filter_arg["fromBlock"], 100)
+        from iwa.plugins.olas.events import SERVICE_MOVED_EVENTS, SERVICES_EVICTED_EVENT
+
+        evicted_data = encode(
+            ["uint256[]", "address[]", "address[]", "uint256[]"], [[7, 8], [], [], []]
+        )
+        self.inv.chain_interface.get_logs_ranged.return_value = [
+            self._log(SERVICE_MOVED_EVENTS[0], [(3).to_bytes(32, "big")]),
+            self._log(SERVICE_MOVED_EVENTS[1], ["0x" + (4).to_bytes(32, "big").hex()]),
+            self._log(SERVICES_EVICTED_EVENT, [(1).to_bytes(32, "big")], evicted_data),
+        ]
+
+        with (
+            patch("iwa.plugins.olas.events.StakingLocator") as mock_locator,
+            patch("iwa.plugins.olas.events.StakingAvailabilitySnapshot") as mock_snapshot,
+        ):
+            self.inv._check_service_moves(10, 20)
+
+        forgotten = [c.args for c in mock_locator.return_value.forget.call_args_list]
+        self.assertEqual(forgotten, [("gnosis", 3), ("gnosis", 4), ("gnosis", 7), ("gnosis", 8)])
+        mock_snapshot.return_value.invalidate.assert_called_once_with("gnosis")
+        topics = self.inv.chain_interface.get_logs_ranged.call_args.args[0]["topics"]
+        self.assertEqual(len(topics[0]), 4)  # One OR-ed topic list
+
+    def test_handles_get_logs_exception(self):
+        self.inv.chain_interface.get_logs_ranged.side_effect = Exception("RPC error")
+
+        # Should not raise
+        self.inv._check_service_moves(10, 20)
 
 
 class TestIntegrationStartStop(unittest.TestCase):
@@ -428,25 +421,23 @@ class TestIntegrationStartStop(unittest.TestCase):
         inv = _build_invalidator()
         inv.web3.eth.block_number = 100
 
-        original_sleep = time.sleep
-
-        def controlled_sleep(seconds):
-            # Use a very short sleep so the test is fast
-            original_sleep(0.01)
+        def quiet_head(after, timeout):
+            # No new head; return quickly so the test is fast
+            time.sleep(0.01)
 
-        with patch("time.sleep", side_effect=controlled_sleep):
-            inv.start()
-            self.assertTrue(inv.running)
+        inv.chain_interface.head_tracker.wait_for_new_head.side_effect = quiet_head
 
-            # Let the thread run briefly
-            original_sleep(0.05)
+        inv.start()
+        self.assertTrue(inv.running)
 
-            inv.stop()
-            self.assertFalse(inv.running)
+        # Let the thread run briefly
+        time.sleep(0.05)
 
-            # Wait for thread to actually exit
-            original_sleep(0.05)
+        inv.stop()
+        self.assertFalse(inv.running)
 
+        # Wait for thread to actually exit
+        time.sleep(0.05)
 
 if __name__ == "__main__":
     unittest.main()
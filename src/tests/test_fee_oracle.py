@@ -0,0 +1,71 @@
+"""Tests for the per-block fee oracle."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from iwa.core.chain.fees import FeeOracle, FeeSnapshot
+from iwa.core.chain.health import RPCHealthTracker
+
+
+def _history(oldest, base_fees, rewards):
+    return {"oldestBlock": oldest, "baseFeePerGas": base_fees, "reward": rewards}
+
+
+def _chain_interface():
+    ci = MagicMock()
+    ci.health_tracker = RPCHealthTracker()
+    ci.web3.eth.fee_history.return_value = _history(100, [1000, 1100], [])
+    ci.web3.eth.max_priority_fee = 3
+    return ci
+
+
+def test_snapshot_is_fetched_once_per_head():
+    ci = _chain_interface()
+    oracle = FeeOracle(ci)
+
+    def slow_history(*args):
+        time.sleep(0.05)
+        return _history(100, [1000, 1100], [])
+
+    ci.web3.eth.fee_history.side_effect = slow_history
+    threads = [threading.Thread(target=oracle.snapshot) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # The default tip is the RPC's eth_maxPriorityFeePerGas suggestion
+    assert oracle.snapshot() == FeeSnapshot(100, 1100, 3)
+    assert ci.web3.eth.fee_history.call_count == 1
+    ci.web3.eth.fee_history.assert_called_with(1, "latest", [])
+    ci.web3.eth.get_block.assert_not_called()
+
+    # A newer head seen on any call invalidates the cached block
+    ci.health_tracker.record_success("https://rpc", 10.0, block=101)
+    ci.web3.eth.fee_history.side_effect = None
+    ci.web3.eth.fee_history.return_value = _history(101, [1100, 1200], [])
+    ci.web3.eth.max_priority_fee = 4
+    assert oracle.snapshot() == FeeSnapshot(101, 1200, 4)
+    assert ci.web3.eth.fee_history.call_count == 2
+
+
+def test_falls_back_to_block_header_without_fee_history():
+    ci = _chain_interface()
+    ci.web3.eth.fee_history.side_effect = ValueError("method not found")
+    ci.web3.eth.get_block.return_value = {"number": 7, "baseFeePerGas": 500}
+    ci.web3.eth.max_priority_fee = 2
+
+    assert FeeOracle(ci).snapshot() == FeeSnapshot(7, 500, 2)
+
+
+def test_priority_fee_percentile_is_median_of_recent_blocks():
+    ci = _chain_interface()
+    oracle = FeeOracle(ci)
+    oracle.snapshot()
+    ci.web3.eth.fee_history.return_value = _history(91, [1] * 11, [[5], [0], [9], [7], [6]])
+
+    assert oracle.priority_fee(90.0) == 6
+    assert oracle.priority_fee(90.0) == 6
+    ci.web3.eth.fee_history.assert_called_with(10, "latest", [90.0])
+    assert ci.web3.eth.fee_history.call_count == 2  # snapshot + one percentile query
@@ -0,0 +1,118 @@
+"""Tests for the shared per-chain head tracker."""
+
+import asyncio
+import itertools
+import time
+from unittest.mock import MagicMock, PropertyMock
+
+import pytest
+
+from iwa.core.chain.heads import HeadTracker
+
+
+def _chain_interface(start=100):
+    """Fake chain interface whose block number advances on every poll."""
+    ci = MagicMock()
+    ci.chain.name = "Gnosis"
+    ci.wss_rpcs = []
+    counter = itertools.count(start)
+    type(ci.web3.eth).block_number = PropertyMock(side_effect=lambda: next(counter))
+    return ci
+
+
+def _wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.005)
+
+
+def test_one_poller_feeds_callbacks_and_waiters():
+    ci = _chain_interface()
+    tracker = HeadTracker(ci, poll_interval=0.01)
+    first, second = [], []
+    unsub_first = tracker.subscribe(first.append)
+    unsub_second = tracker.subscribe(second.append)
+
+    head = tracker.wait_for_new_head(after=102, timeout=2)
+    assert head is not None and head > 102
+    _wait_until(lambda: len(second) >= 3)
+    assert first[:3] == second[:3] == [100, 101, 102]
+    assert tracker.latest >= head
+
+    unsub_first()
+    unsub_second()
+
+
+def test_thread_stops_once_everyone_unsubscribes():
+    tracker = HeadTracker(_chain_interface(), poll_interval=0.01)
+    unsubscribe = tracker.subscribe(lambda head: None)
+    thread = tracker._thread
+    assert thread.is_alive()
+
+    unsubscribe()
+    thread.join(timeout=2)
+    assert not thread.is_alive()
+    assert tracker._thread is None
+
+
+def test_passive_subscriber_only_sees_heads_watched_for_others():
+    tracker = HeadTracker(_chain_interface(), poll_interval=0.01)
+    passive = []
+    unsub_passive = tracker.subscribe(passive.append, passive=True)
+    assert tracker._thread is None
+
+    unsubscribe = tracker.subscribe(lambda head: None)
+    _wait_until(lambda: len(passive) >= 2)
+    thread = tracker._thread
+
+    unsubscribe()
+    thread.join(timeout=2)
+    assert not thread.is_alive()
+    unsub_passive()
+
+
+def test_wait_times_out_without_new_head():
+    ci = MagicMock()
+    ci.chain.name = "Gnosis"
+    ci.wss_rpcs = []
+    ci.web3.eth.block_number = 100
+    tracker = HeadTracker(ci, poll_interval=0.01)
+
+    assert tracker.wait_for_new_head(after=100, timeout=0.1) is None
+
+
+def test_failing_subscriber_does_not_starve_others():
+    tracker = HeadTracker(_chain_interface(), poll_interval=0.01)
+    received = []
+    unsub_bad = tracker.subscribe(MagicMock(side_effect=RuntimeError("boom")))
+    unsub_good = tracker.subscribe(received.append)
+
+    _wait_until(lambda: len(received) >= 2)
+
+    unsub_bad()
+    unsub_good()
+
+
+@pytest.mark.asyncio
+async def test_async_subscribers_get_heads_on_their_queue():
+    tracker = HeadTracker(_chain_interface(), poll_interval=0.01)
+    heads, unsubscribe = tracker.subscribe_async()
+    try:
+        first = await asyncio.wait_for(heads.get(), timeout=2)
+        second = await asyncio.wait_for(heads.get(), timeout=2)
+    finally:
+        unsubscribe()
+    assert second > first
+
+
+def test_block_limit_check_uses_known_head():
+    from iwa.core.chain.interface import ChainInterface
+
+    ci = MagicMock(is_tenderly=True, _initial_block=100)
+    block_number = PropertyMock(return_value=105)
+    type(ci.web3.eth).block_number = block_number
+
+    ChainInterface.check_block_limit(ci, head=110)
+
+    block_number.assert_not_called()
@@ -0,0 +1,142 @@
+"""Tests for hedging slow reads to a second RPC."""
+
+import threading
+import time
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+
+from iwa.core.chain import ChainInterface, SupportedChain
+from iwa.core.models import CoreConfig
+from iwa.core.rpc_monitor import RPCMonitor
+
+PRIMARY = "https://primary.example.com"
+BACKUP = "https://backup.example.com"
+
+
+@pytest.fixture
+def release():
+    event = threading.Event()
+    yield event
+    event.set()  # never leave a stalled primary behind
+
+
+def _make_ci(release, budget, primary_fails=False, primary_threads=None):
+    """Chain whose primary RPC stalls on receipts until *release* (at most 0.3s)."""
+    chain = MagicMock(spec=SupportedChain)
+    chain.name = "HedgeChain"
+    chain.rpcs = [PRIMARY, BACKUP]
+    chain.chain_id = 1
+    chain.tokens = {}
+    type(chain).rpc = PropertyMock(return_value=PRIMARY)
+
+    def web3_for(provider):
+        url = provider.endpoint_uri
+        w3 = MagicMock()
+
+        def get_transaction_receipt(tx_hash):
+            if url == PRIMARY:
+                if primary_threads is not None:
+                    primary_threads.append(threading.current_thread())
+                release.wait(0.3)
+                if primary_fails:
+                    raise RuntimeError("primary unavailable")
+            return {"rpc": url}
+
+        w3.eth.get_transaction_receipt.side_effect = get_transaction_receipt
+        w3.eth.get_transaction_count.side_effect = lambda *a: url
+        return w3
+
+    core = CoreConfig(rpc_read_endpoints=1, rpc_hedge_percentile=0.9, rpc_hedge_budget=budget)
+    core = core.model_copy(update={"chainlist_enrichment": False})
+    with (
+        patch("iwa.core.chain.interface.Config") as mock_config,
+        patch("iwa.core.chain.interface.Web3") as mock_web3,
+    ):
+        mock_config.return_value.core = core
+        mock_web3.side_effect = web3_for
+        mock_web3.HTTPProvider.side_effect = lambda url, **kw: MagicMock(endpoint_uri=url)
+        ci = ChainInterface(chain)
+        ci._get_read_backend(BACKUP)  # create while Web3 is patched
+    return ci
+
+
+def test_failed_slow_read_is_answered_by_hedge(release):
+    ci = _make_ci(release, budget=1.0, primary_fails=True)
+    RPCMonitor().clear()
+
+    with patch.object(ChainInterface, "HEDGE_DEFAULT_DELAY", 0.01):
+        assert ci.web3.eth.get_transaction_receipt("0xabc") == {"rpc": BACKUP}
+
+    counts = RPCMonitor().get_counts()
+    assert counts["hedgechain.hedge"] == counts["hedgechain.hedge_won"] == 1
+    # Nonces are never hedged
+    assert ci.web3.eth.get_transaction_count("0xabc", "pending") == PRIMARY
+
+
+def test_slow_read_returns_hedge_before_primary_finishes(release):
+    ci = _make_ci(release, budget=1.0)
+    RPCMonitor().clear()
+
+    with patch.object(ChainInterface, "HEDGE_DEFAULT_DELAY", 0.01):
+        started = time.monotonic()
+        assert ci.web3.eth.get_transaction_receipt("0xabc") == {"rpc": BACKUP}
+        elapsed = time.monotonic() - started
+
+    # The primary is still stalled: the caller did not wait for it
+    assert elapsed < 0.2
+    assert not release.is_set()
+    counts = RPCMonitor().get_counts()
+    assert counts["hedgechain.hedge"] == counts["hedgechain.hedge_won"] == 1
+
+
+def test_primary_runs_on_caller_thread_when_read_pool_is_full(release):
+    threads = []
+    ci = _make_ci(release, budget=1.0, primary_threads=threads)
+    RPCMonitor().clear()
+
+    with (
+        patch.object(ChainInterface, "HEDGE_DEFAULT_DELAY", 0.01),
+        patch.object(ChainInterface, "_primary_slots", threading.BoundedSemaphore(1)) as slots,
+    ):
+        slots.acquire()
+        assert ci.web3.eth.get_transaction_receipt("0xabc") == {"rpc": PRIMARY}
+
+    assert threads == [threading.current_thread()]
+    counts = RPCMonitor().get_counts()
+    assert counts["hedgechain.hedge"] == 1
+    assert "hedgechain.hedge_won" not in counts
+
+
+def test_hedges_stay_within_budget(release):
+    ci = _make_ci(release, budget=0.5, primary_fails=True)
+    RPCMonitor().clear()
+
+    with patch.object(ChainInterface, "HEDGE_DEFAULT_DELAY", 0.01):
+        # First slow call only earns half a hedge, so the primary's error surfaces
+        with pytest.raises(RuntimeError, match="primary unavailable"):
+            ci.web3.eth.get_transaction_receipt("0x1")
+        assert ci.web3.eth.get_transaction_receipt("0x2") == {"rpc": BACKUP}
+
+    assert RPCMonitor().get_counts()["hedgechain.hedge"] == 1
+
+
+def test_fast_read_is_not_hedged(release):
+    release.set()
+    ci = _make_ci(release, budget=1.0)
+    RPCMonitor().clear()
+
+    with patch.object(ChainInterface, "HEDGE_DEFAULT_DELAY", 0.2):
+        assert ci.web3.eth.get_transaction_receipt("0xabc") == {"rpc": PRIMARY}
+    time.sleep(0.3)  # the cancelled hedge falls due without being sent
+
+    assert "hedgechain.hedge" not in RPCMonitor().get_counts()
+
+
+def test_latency_percentile_sets_hedge_delay(release):
+    ci = _make_ci(release, budget=1.0)
+    assert ci._hedge_delay() == ci.HEDGE_DEFAULT_DELAY
+
+    for ms in range(10, 110, 10):
+        ci._rpc_health.record_success(PRIMARY, float(ms))
+    assert ci._hedge_delay() == pytest.approx(0.1)
@@ -306,14 +306,13 @@ def test_sign_and_send_transaction_success(wallet, mock_key_storage):
 
 def test_get_accounts_balances(wallet, mock_key_storage, mock_chain_interfaces):
     wallet.account_service.get_account_data.return_value = {"0x123": {}}
-    mock_chain_interfaces.get.return_value.get_balance.return_value = 100
-    wallet.balance_service.get_native_balance_eth.return_value = 1.0
+    wallet.balance_service.get_balances_eth.return_value = {"0x123": {"native": 1.0}}
 
     accounts_data, token_balances = wallet.get_accounts_balances("gnosis", ["native"])
 
     assert accounts_data == {"0x123": {}}
     assert token_balances == {"0x123": {"native": 1.0}}
-    wallet.balance_service.get_native_balance_eth.assert_called_with("0x123", "gnosis")
+    wallet.balance_service.get_balances_eth.assert_called_with(["0x123"], ["native"], "gnosis")
 
 
 def test_get_native_balance_eth(wallet, mock_chain_interfaces, mock_balance_service):
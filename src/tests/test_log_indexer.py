@@ -0,0 +1,146 @@
+"""Tests for the persistent log indexer."""
+
+import pytest
+from hexbytes import HexBytes
+from web3 import Web3
+
+from iwa.core.chain.log_ranges import BlockRangeSizer
+from iwa.core.db import IndexedLog
+from iwa.core.log_indexer import LogIndexer, LogSubscription
+from iwa.core.types import EthereumAddress
+
+TOKEN = "0x" + "11" * 20
+TRANSFER_ABI = [
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "name": "from", "type": "address"},
+            {"indexed": True, "name": "to", "type": "address"},
+            {"indexed": False, "name": "value", "type": "uint256"},
+        ],
+        "name": "Transfer",
+        "type": "event",
+    }
+]
+TRANSFER = (
+    Web3().eth.contract(address=EthereumAddress(TOKEN), abi=TRANSFER_ABI).events.Transfer
+)
+
+
+def _log(block, value):
+    return {
+        "address": EthereumAddress(TOKEN),
+        "topics": [
+            HexBytes(TRANSFER.topic),
+            HexBytes("0x" + "00" * 12 + "aa" * 20),
+            HexBytes("0x" + "00" * 12 + "bb" * 20),
+        ],
+        "data": HexBytes(value.to_bytes(32, "big")),
+        "blockNumber": block,
+        "transactionHash": HexBytes(block.to_bytes(32, "big")),
+        "transactionIndex": 0,
+        "blockHash": HexBytes((block + 1).to_bytes(32, "big")),
+        "logIndex": 0,
+    }
+
+
+class FakeChain:
+    """eth_getLogs over one Transfer per block, rejecting spans above max_span."""
+
+    def __init__(self, head=1_000, max_span=None):
+        self.head = head
+        self.max_span = max_span
+        self.calls = []
+        self.fail_from = None
+
+    def get_logs(self, params):
+        start, end = params["fromBlock"], params["toBlock"]
+        self.calls.append((start, end))
+        if self.max_span and end - start + 1 > self.max_span:
+            raise ValueError("query returned more than 10000 results")
+        if self.fail_from is not None and end >= self.fail_from:
+            raise ConnectionError("RPC down")
+        return [_log(b, b * 10) for b in range(start, end + 1)]
+
+
+SUBSCRIPTION = LogSubscription(name="transfers", addresses=(TOKEN,), topics=(TRANSFER.topic,))
+
+
+def _indexer(chain, initial=100):
+    return LogIndexer(
+        "gnosis",
+        get_logs=chain.get_logs,
+        get_block_number=lambda: chain.head,
+        sizer=BlockRangeSizer(initial=initial),
+    )
+
+
+def test_confirmed_blocks_are_fetched_once_and_decodable():
+    chain = FakeChain()
+    indexer = _indexer(chain)
+
+    logs = indexer.get_logs(SUBSCRIPTION, 500, 600)
+    assert [log["blockNumber"] for log in logs] == list(range(500, 601))
+    assert TRANSFER.process_log(logs[0]).args.value == 5_000
+
+    chain.calls.clear()
+    again = indexer.get_logs(SUBSCRIPTION, 550, 600)
+    assert chain.calls == []
+    assert [log["blockNumber"] for log in again] == list(range(550, 601))
+
+
+def test_unconfirmed_blocks_are_served_live_not_stored():
+    chain = FakeChain(head=1_000)
+    indexer = _indexer(chain)
+
+    logs = indexer.get_logs(SUBSCRIPTION, 950)
+    assert [log["blockNumber"] for log in logs] == list(range(950, 1_001))
+    assert indexer.checkpoint(SUBSCRIPTION) == (950, 990)
+    assert IndexedLog.select().count() == 41
+
+
+def test_range_errors_shrink_and_successes_grow_the_span():
+    chain = FakeChain(max_span=30)
+    indexer = _indexer(chain, initial=100)
+
+    logs = indexer.get_logs(SUBSCRIPTION, 0, 199)
+    assert len(logs) == 200
+    assert all(end - start + 1 <= 100 for start, end in chain.calls)
+    assert indexer.sizer.size <= 50  # Grew back from 25 but never far past the RPC limit
+
+
+def test_interrupted_sync_resumes_from_checkpoint():
+    chain = FakeChain()
+    indexer = _indexer(chain)
+    chain.fail_from = 350
+
+    with pytest.raises(ConnectionError):
+        indexer.sync(SUBSCRIPTION, 100, 500)
+    assert indexer.checkpoint(SUBSCRIPTION) == (100, 199)
+
+    chain.fail_from = None
+    chain.calls.clear()
+    indexer.sync(SUBSCRIPTION, 100, 500)
+    assert chain.calls[0][0] == 200
+    assert indexer.checkpoint(SUBSCRIPTION) == (100, 500)
+
+
+def test_earlier_window_is_prepended():
+    chain = FakeChain()
+    indexer = _indexer(chain)
+    indexer.sync(SUBSCRIPTION, 400, 500)
+
+    chain.calls.clear()
+    logs = indexer.get_logs(SUBSCRIPTION, 300, 450)
+    assert all(end < 400 for _, end in chain.calls)
+    assert indexer.checkpoint(SUBSCRIPTION) == (300, 500)
+    assert [log["blockNumber"] for log in logs] == list(range(300, 451))
+
+
+def test_subscription_key_tracks_filter():
+    other_topic = LogSubscription(name="transfers", addresses=(TOKEN,), topics=("0x" + "00" * 32,))
+    same_filter = LogSubscription(
+        name="transfers", addresses=(TOKEN.upper().replace("0X", "0x"),), topics=(TRANSFER.topic,)
+    )
+    assert SUBSCRIPTION.key != other_topic.key
+    assert SUBSCRIPTION.key == same_filter.key
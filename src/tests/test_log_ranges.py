@@ -0,0 +1,118 @@
+"""Tests for per-RPC adaptive eth_getLogs ranges."""
+
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+
+from iwa.core.chain import ChainInterface, SupportedChain
+from iwa.core.chain.log_ranges import BlockRangeSizer, is_range_error
+from iwa.core.models import CoreConfig
+
+RPCS = [
+    "https://primary.example.com",
+    "https://strict.example.com",
+    "https://generous.example.com",
+]
+MAX_SPAN = {RPCS[0]: 2_000, RPCS[1]: 500, RPCS[2]: 10_000}
+
+
+def _web3_for(provider):
+    """Fake Web3 whose eth_getLogs rejects spans above its RPC's limit."""
+    url = provider.endpoint_uri
+    w3 = MagicMock()
+
+    def get_logs(params):
+        start, end = params["fromBlock"], params["toBlock"]
+        if end - start + 1 > MAX_SPAN[url]:
+            raise ValueError(f"exceed maximum block range: {MAX_SPAN[url]}")
+        return [(url, start, end)]
+
+    w3.eth.get_logs.side_effect = get_logs
+    return w3
+
+
+def _chain_interface(read_endpoints):
+    """Yield a ChainInterface over RPCS, keeping Web3 faked for lazily built endpoints."""
+    chain = MagicMock(spec=SupportedChain)
+    chain.name = f"LogRangeChain{read_endpoints}"
+    chain.rpcs = list(RPCS)
+    chain.chain_id = 1
+    chain.tokens = {}
+    type(chain).rpc = PropertyMock(return_value=chain.rpcs[0])
+
+    core = CoreConfig(
+        rpc_read_endpoints=read_endpoints,
+        rpc_rate_limits={url.split("//")[1]: 1_000.0 for url in RPCS},
+    )
+    core = core.model_copy(update={"chainlist_enrichment": False})
+    with (
+        patch("iwa.core.chain.interface.Config") as mock_config,
+        patch("iwa.core.chain.interface.Web3") as mock_web3,
+    ):
+        mock_config.return_value.core = core
+        mock_web3.side_effect = _web3_for
+        mock_web3.HTTPProvider.side_effect = lambda url, **kw: MagicMock(endpoint_uri=url)
+        yield ChainInterface(chain)
+
+
+@pytest.fixture
+def ci():
+    yield from _chain_interface(read_endpoints=3)
+
+
+@pytest.fixture
+def primary_ci():
+    yield from _chain_interface(read_endpoints=1)
+
+
+def _assert_contiguous(chunks, from_block, to_block):
+    ranges = sorted((start, end) for _, start, end in chunks)
+    assert ranges[0][0] == from_block and ranges[-1][1] == to_block
+    assert all(prev[1] + 1 == nxt[0] for prev, nxt in zip(ranges, ranges[1:], strict=False))
+
+
+def test_sizer_doubles_until_first_limit_then_grows_additively():
+    sizer = BlockRangeSizer(initial=100)
+    sizer.record_success(100)
+    assert sizer.size == 200
+
+    assert sizer.record_range_error(200)
+    assert sizer.size == 100
+    sizer.record_success(100)
+    assert sizer.size == 112
+    sizer.record_success(50)  # Partial chunk at the end of a range says nothing
+    assert sizer.size == 112
+
+
+def test_range_errors_are_told_apart_from_rate_limits():
+    assert is_range_error(ValueError("exceed maximum block range: 50000"))
+    assert is_range_error(ValueError("query returned more than 10000 results"))
+    assert not is_range_error(ValueError("429 Too Many Requests"))
+    assert not is_range_error(ValueError("Exceeded the quota usage"))
+
+
+def test_each_read_endpoint_learns_its_own_limit(ci):
+    chunks = ci.get_logs_ranged({"address": "0xabc"}, 0, 199_999)
+
+    _assert_contiguous(chunks, 0, 199_999)
+    assert {url for url, _, _ in chunks} == set(RPCS)
+    assert ci.log_range_sizer(RPCS[1]).size < 600
+    assert ci.log_range_sizer(RPCS[2]).size > 5_000
+
+
+def test_primary_range_error_shrinks_without_rotating(primary_ci, monkeypatch):
+    monkeypatch.setitem(MAX_SPAN, RPCS[0], 100)
+
+    chunks = primary_ci.get_logs_ranged({"address": "0xabc"}, 0, 299)
+
+    _assert_contiguous(chunks, 0, 299)
+    assert {url for url, _, _ in chunks} == {RPCS[0]}
+    assert primary_ci._current_rpc_index == 0
+    assert primary_ci.rpc_health()[RPCS[0]]["errors"] == {}
+
+
+def test_unrecoverable_range_error_propagates(primary_ci, monkeypatch):
+    monkeypatch.setitem(MAX_SPAN, RPCS[0], 0)
+
+    with pytest.raises(ValueError, match="block range"):
+        primary_ci.get_logs_ranged({"address": "0xabc"}, 0, 99)
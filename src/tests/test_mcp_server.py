@@ -688,27 +688,23 @@ class TestGetRewardClaims:
         assert result["year"] == datetime.datetime.now().year
 
 
+def _log_claim(tx_hash, amount_wei, ts, to_tag="trader-1", value_eur=5.0):
+    """Helper to write a claim to the isolated activity database."""
+    from iwa.core.db import log_transaction
+
+    log_transaction(
+        tx_hash, "0xStaking", ADDR_WORKER, "OLAS", amount_wei, "gnosis",
+        to_tag=to_tag, price_eur=0.50, value_eur=value_eur,
+        tags=["olas_claim_rewards"], timestamp=ts,
+    )
+
+
 class TestGetRewardsSummary:
-    @patch("iwa.core.db.SentTransaction")
-    def test_summary(self, mock_tx_cls, mock_wallet):
-        mcp = _make_mcp()
-
-        claims = [
-            _make_claim_tx(
-                5_000_000_000_000_000_000,
-                datetime.datetime(2025, 3, 10),
-                value_eur=2.50,
-            ),
-            _make_claim_tx(
-                15_000_000_000_000_000_000,
-                datetime.datetime(2025, 3, 20),
-                value_eur=7.50,
-            ),
-        ]
+    def test_summary(self, mock_wallet):
+        mcp = _make_mcp()
 
-        mock_tx_cls.tags.contains.return_value = MagicMock()
-        mock_tx_cls.timestamp = _mock_peewee_field()
-        mock_tx_cls.select.return_value.where.return_value = claims
+        _log_claim("0xc1", 5_000_000_000_000_000_000, datetime.datetime(2025, 3, 10), value_eur=2.50)
+        _log_claim("0xc2", 15_000_000_000_000_000_000, datetime.datetime(2025, 3, 20), value_eur=7.50)
 
         tool_fn = _get_tool_fn(mcp, "get_rewards_summary")
         result = tool_fn(year=2025)
@@ -724,39 +720,26 @@ class TestGetRewardsSummary:
 
 
 class TestGetRewardsByTrader:
-    @patch("iwa.core.db.SentTransaction")
-    def test_by_trader(self, mock_tx_cls, mock_wallet):
-        mcp = _make_mcp()
-
-        claims = [
-            _make_claim_tx(
-                10_000_000_000_000_000_000,
-                datetime.datetime(2025, 1, 15),
-                to_tag="trader-A",
-                value_eur=5.0,
-            ),
-            _make_claim_tx(
-                20_000_000_000_000_000_000,
-                datetime.datetime(2025, 1, 20),
-                to_tag="trader-B",
-                value_eur=10.0,
-            ),
-        ]
+    def test_by_trader(self, mock_wallet):
+        mcp = _make_mcp()
 
-        mock_tx_cls.tags.contains.return_value = MagicMock()
-        mock_tx_cls.timestamp = _mock_peewee_field()
-        mock_tx_cls.select.return_value.where.return_value.order_by.return_value = (
-            claims
+        _log_claim(
+            "0xc1", 10_000_000_000_000_000_000, datetime.datetime(2025, 1, 15),
+            to_tag="trader-A", value_eur=5.0,
+        )
+        _log_claim(
+            "0xc2", 20_000_000_000_000_000_000, datetime.datetime(2025, 1, 20),
+            to_tag="trader-A", value_eur=10.0,
         )
 
         tool_fn = _get_tool_fn(mcp, "get_rewards_by_trader")
         result = tool_fn(year=2025)
 
         assert result["year"] == 2025
-        assert len(result["traders"]) == 2
-        # Sorted by total_eur desc, so trader-B first
-        assert result["traders"][0]["name"] == "trader-B"
-        assert result["traders"][0]["total_olas"] == 20.0
+        assert len(result["traders"]) == 1
+        assert result["traders"][0]["name"] == "trader-A"
+        assert result["traders"][0]["total_olas"] == 30.0
+        assert result["traders"][0]["months"][0]["claims"] == 2
 
 
 # --- Tool count integration ---
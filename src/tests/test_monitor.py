@@ -114,8 +114,8 @@ def test_check_activity_new_native_tx(mock_chain_interfaces, mock_callback):
     }
     block.transactions = [tx]
 
-    chain_interface.web3.eth.get_block.return_value = block
-    chain_interface.web3.eth.get_logs.return_value = []  # No logs
+    chain_interface.get_blocks.return_value = [block]
+    chain_interface.get_logs_ranged.return_value = []  # No logs
 
     monitor = EventMonitor(["0x1234567890123456789012345678901234567890"], mock_callback)
     monitor.last_checked_block = 100
@@ -142,7 +142,7 @@ def test_check_activity_hash_in_block(mock_chain_interfaces, mock_callback):
     block = MagicMock()
     block.timestamp = 12345
     block.transactions = [b"hash_bytes"]
-    chain_interface.web3.eth.get_block.return_value = block
+    chain_interface.get_blocks.return_value = [block]
 
     tx_obj = {
         "hash": b"hash_bytes",
@@ -151,7 +151,7 @@ def test_check_activity_hash_in_block(mock_chain_interfaces, mock_callback):
         "value": 100,
     }
     chain_interface.web3.eth.get_transaction.return_value = tx_obj
-    chain_interface.web3.eth.get_logs.return_value = []
+    chain_interface.get_logs_ranged.return_value = []
 
     monitor.check_activity()
 
@@ -162,7 +162,7 @@ def test_check_activity_hash_in_block(mock_chain_interfaces, mock_callback):
 def test_check_activity_logs(mock_chain_interfaces, mock_callback):
     chain_interface = mock_chain_interfaces.get.return_value
     chain_interface.web3.eth.block_number = 101
-    chain_interface.web3.eth.get_block.return_value = MagicMock(transactions=[])
+    chain_interface.get_blocks.return_value = [MagicMock(transactions=[])]
 
     # Mock Log matching address
 
@@ -184,7 +184,7 @@ def test_check_activity_logs(mock_chain_interfaces, mock_callback):
         "address": "0xContractAddr",
     }
 
-    chain_interface.web3.eth.get_logs.side_effect = [[], [log]]  # sent, received
+    chain_interface.get_logs_ranged.side_effect = [[], [log]]  # sent, received
 
     monitor.check_activity()
 
@@ -200,3 +200,63 @@ def test_stop(mock_chain_interfaces, mock_callback):
     monitor.running = True
     monitor.stop()
     assert monitor.running is False
+
+
+def _empty_blocks(block_nums, full_transactions=False):
+    return [MagicMock(transactions=[], timestamp=0) for _ in block_nums]
+
+
+def test_check_activity_catches_up_whole_gap(mock_chain_interfaces, mock_callback):
+    chain_interface = mock_chain_interfaces.get.return_value
+    chain_interface.web3.eth.block_number = 1_200
+    chain_interface.get_blocks.side_effect = _empty_blocks
+    chain_interface.get_logs_ranged.return_value = []
+
+    monitor = EventMonitor(["0x1234567890123456789012345678901234567890"], mock_callback)
+    monitor.last_checked_block = 0
+    monitor.check_activity()
+
+    scanned = sorted(n for call in chain_interface.get_blocks.call_args_list for n in call[0][0])
+    assert scanned == list(range(1, 1_201))
+    assert max(len(call[0][0]) for call in chain_interface.get_blocks.call_args_list) <= 50
+    assert monitor.last_checked_block == 1_200
+    assert monitor.lag_blocks == 0
+
+    # A restarted monitor for the same addresses resumes from the checkpoint
+    chain_interface.web3.eth.block_number = 5_000
+    restarted = EventMonitor(["0x1234567890123456789012345678901234567890"], mock_callback)
+    assert restarted.last_checked_block == 1_200
+
+
+def test_failed_window_is_retried_not_skipped(mock_chain_interfaces, mock_callback):
+    chain_interface = mock_chain_interfaces.get.return_value
+    chain_interface.web3.eth.block_number = 100
+    chain_interface.get_blocks.side_effect = _empty_blocks
+    chain_interface.get_logs_ranged.side_effect = Exception("RPC down")
+
+    monitor = EventMonitor(["0x1234567890123456789012345678901234567890"], mock_callback)
+    monitor.last_checked_block = 90
+    monitor.check_activity()
+
+    assert monitor.last_checked_block == 90
+    assert monitor.lag_blocks == 10
+
+    chain_interface.get_logs_ranged.side_effect = None
+    chain_interface.get_logs_ranged.return_value = []
+    monitor.check_activity()
+    assert monitor.last_checked_block == 100
+
+
+def test_failed_block_is_retried_not_skipped(mock_chain_interfaces, mock_callback):
+    chain_interface = mock_chain_interfaces.get.return_value
+    chain_interface.web3.eth.block_number = 101
+    chain_interface.get_blocks.return_value = [MagicMock(transactions=[b"hash_bytes"])]
+    chain_interface.web3.eth.get_transaction.side_effect = Exception("RPC down")
+    chain_interface.get_logs_ranged.return_value = []
+
+    monitor = EventMonitor(["0x1234567890123456789012345678901234567890"], mock_callback)
+    monitor.last_checked_block = 100
+    monitor.check_activity()
+
+    assert monitor.last_checked_block == 100
+    mock_callback.assert_not_called()
@@ -0,0 +1,88 @@
+"""Tests for spreading read-only calls across several RPCs."""
+
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+from pydantic import ValidationError
+
+from iwa.core.chain import ChainInterface, SupportedChain
+from iwa.core.models import CoreConfig
+
+RPCS = [
+    "https://primary.example.com",
+    "https://read1.example.com",
+    "https://read2.example.com",
+]
+
+
+def _web3_for(provider):
+    """Fake Web3 whose eth calls report which RPC served them."""
+    url = provider.endpoint_uri
+    w3 = MagicMock()
+    w3.eth.get_balance.side_effect = lambda *a, **k: url
+    w3.eth.get_transaction_count.side_effect = lambda *a, **k: url
+    w3.eth.send_raw_transaction.side_effect = lambda *a, **k: url
+    return w3
+
+
+@pytest.fixture
+def ci():
+    chain = MagicMock(spec=SupportedChain)
+    chain.name = "FanoutChain"
+    chain.rpcs = list(RPCS)
+    chain.chain_id = 1
+    chain.tokens = {}
+    type(chain).rpc = PropertyMock(return_value=chain.rpcs[0])
+
+    core = CoreConfig(rpc_read_endpoints=3, rpc_rate_limits={"read2.example.com": 50.0})
+    core = core.model_copy(update={"chainlist_enrichment": False})
+    with (
+        patch("iwa.core.chain.interface.Config") as mock_config,
+        patch("iwa.core.chain.interface.Web3") as mock_web3,
+    ):
+        mock_config.return_value.core = core
+        mock_web3.side_effect = _web3_for
+        mock_web3.HTTPProvider.side_effect = lambda url, **kw: MagicMock(endpoint_uri=url)
+        yield ChainInterface(chain)
+
+
+def test_reads_spread_and_writes_stay_on_primary(ci):
+    served = {ci.web3.eth.get_balance("0xabc") for _ in range(6)}
+    assert served == set(RPCS)
+
+    assert ci.web3.eth.get_transaction_count("0xabc") == RPCS[0]
+    assert ci.web3.eth.send_raw_transaction(b"tx") == RPCS[0]
+
+    # Each endpoint has its own bucket, sized per host when configured
+    assert ci._get_read_backend(RPCS[2]).rate_limiter.rate == 50.0
+    assert ci._get_read_backend(RPCS[1]).rate_limiter.rate == ci.DEFAULT_ENDPOINT_RATE
+
+
+def test_failed_read_endpoint_is_backed_off_and_read_falls_back(ci):
+    ci._get_read_backend(RPCS[1]).eth.get_balance.side_effect = Exception("429 Too Many Requests")
+    ci._read_cursor = 1
+
+    assert ci.web3.eth.get_balance("0xabc") == RPCS[0]
+    assert not ci._is_rpc_healthy(1)
+    assert ci.rpc_health()[RPCS[1]]["errors"] == {"RATE_LIMIT": 1}
+
+    # Reverts are the caller's problem, not the endpoint's
+    ci._get_read_backend(RPCS[2]).eth.get_balance.side_effect = Exception("execution reverted")
+    with pytest.raises(Exception, match="execution reverted"):
+        for _ in range(3):
+            ci.web3.eth.get_balance("0xabc")
+    assert ci._is_rpc_healthy(2)
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {"rpc_read_endpoints": 0},
+        {"rpc_rate_limits": {"read1.example.com": 0}},
+        {"rpc_hedge_percentile": 1.5},
+        {"rpc_hedge_budget": -0.1},
+    ],
+)
+def test_invalid_read_settings_are_rejected_by_the_config(settings):
+    with pytest.raises(ValidationError):
+        CoreConfig(**settings)
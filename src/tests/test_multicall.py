@@ -0,0 +1,225 @@
+"""Tests for the Multicall3 batching engine."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from eth_abi import decode, encode
+from web3 import Web3
+
+from iwa.core.chain.rate_limiter import RateLimitedWeb3, RPCRateLimiter
+from iwa.core.contracts.contract import clear_abi_cache
+from iwa.core.contracts.erc20 import ERC20Contract
+from iwa.core.contracts.multicall import MulticallBatch
+from iwa.core.types import EthereumAddress
+from iwa.plugins.olas.contracts.staking import StakingContract
+
+TOKEN = "0x78731D3Ca6b7E34aC0F824c42a7cC18A495cabaB"
+HOLDER = "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"
+
+
+@pytest.fixture(autouse=True)
+def clean_abi_cache():
+    clear_abi_cache()
+    yield
+    clear_abi_cache()
+
+
+@pytest.fixture
+def chain_interface():
+    """Chain interface backed by a provider-less Web3 (real ABI codec)."""
+    with patch("iwa.core.contracts.contract.ChainInterfaces") as mock_chains:
+        mock_ci = MagicMock()
+        mock_ci.read_endpoint.return_value = None
+        mock_ci.hedging_enabled = False
+        mock_ci.web3 = RateLimitedWeb3(Web3(), RPCRateLimiter(), mock_ci)
+        mock_ci.with_retry.side_effect = lambda fn, **kwargs: fn()
+        mock_chains.return_value.get.return_value = mock_ci
+        yield mock_ci
+
+
+def _aggregate3_response(results):
+    """ABI-encode a Multicall3 aggregate3 return value."""
+    return encode(["(bool,bytes)[]"], [results])
+
+
+def _erc20(chain_interface):
+    # Skip the token metadata lookup done in ERC20Contract.__init__
+    return ERC20Contract.without_metadata(TOKEN, "gnosis")
+
+
+def test_batch_decodes_results_in_order(chain_interface):
+    token = _erc20(chain_interface)
+    w3 = chain_interface.web3._web3
+    w3.eth.call = MagicMock(
+        return_value=_aggregate3_response(
+            [(True, encode(["uint256"], [1234])), (True, encode(["string"], ["OLAS"]))]
+        )
+    )
+
+    with MulticallBatch("gnosis") as batch:
+        balance = batch.add(token, "balanceOf", HOLDER)
+        symbol = batch.add(token, "symbol")
+
+    assert balance.value == 1234
+    assert symbol.value == "OLAS"
+    # Both calls travelled in a single eth_call
+    assert w3.eth.call.call_count == 1
+    assert chain_interface.with_retry.call_count == 1
+
+
+def test_batch_encodes_standard_calldata(chain_interface):
+    token = _erc20(chain_interface)
+    w3 = chain_interface.web3._web3
+    w3.eth.call = MagicMock(return_value=_aggregate3_response([(True, encode(["uint256"], [1]))]))
+
+    with MulticallBatch("gnosis") as batch:
+        batch.add(token, "balanceOf", EthereumAddress(HOLDER))
+
+    data = bytes.fromhex(w3.eth.call.call_args.args[0]["data"].removeprefix("0x"))
+    ((target, allow_failure, call_data),) = decode(["(address,bool,bytes)[]"], data[4:])[0]
+    assert Web3.to_checksum_address(target) == TOKEN
+    assert allow_failure is True
+    assert call_data == Web3.keccak(text="balanceOf(address)")[:4] + encode(["address"], [HOLDER])
+
+
+def test_batch_allow_failure_keeps_other_results(chain_interface):
+    token = _erc20(chain_interface)
+    w3 = chain_interface.web3._web3
+    revert = bytes.fromhex("08c379a0") + encode(["string"], ["nope"])
+    w3.eth.call = MagicMock(
+        return_value=_aggregate3_response([(False, revert), (True, encode(["uint8"], [6]))])
+    )
+
+    batch = MulticallBatch("gnosis")
+    failed = batch.add(token, "balanceOf", HOLDER)
+    decimals = batch.add(token, "decimals")
+    batch.execute()
+
+    assert failed.success is False
+    assert failed.result.error == "nope"
+    assert failed.value_or(0) == 0
+    with pytest.raises(ValueError):
+        _ = failed.value
+    assert decimals.value == 6
+
+
+def test_batch_decodes_addresses_checksummed(chain_interface):
+    with patch.object(StakingContract, "call"):
+        staking = StakingContract(TOKEN, "gnosis")
+    w3 = chain_interface.web3._web3
+    w3.eth.call = MagicMock(
+        return_value=_aggregate3_response([(True, encode(["address"], [HOLDER.lower()]))])
+    )
+
+    results = MulticallBatch("gnosis").execute()
+    assert results == []
+
+    batch = MulticallBatch("gnosis")
+    handle = batch.add(staking, "stakingToken")
+    batch.execute()
+    assert handle.value == HOLDER
+
+
+def test_batch_chunks_large_batches(chain_interface):
+    token = _erc20(chain_interface)
+    w3 = chain_interface.web3._web3
+
+    def fake_call(tx, *args, **kwargs):
+        calldata = bytes.fromhex(tx["data"][2:])
+        # Answer as many results as were requested in this chunk
+        n_calls = int.from_bytes(calldata[4 + 32 : 4 + 64], "big")
+        return _aggregate3_response([(True, encode(["uint256"], [i])) for i in range(n_calls)])
+
+    w3.eth.call = MagicMock(side_effect=fake_call)
+
+    batch = MulticallBatch("gnosis", chunk_size=2)
+    handles = [batch.add(token, "totalSupply") for _ in range(5)]
+    batch.execute()
+
+    assert w3.eth.call.call_count == 3
+    assert [h.value for h in handles] == [0, 1, 0, 1, 0]
+
+
+def test_batch_falls_back_to_individual_calls(chain_interface):
+    token = _erc20(chain_interface)
+    chain_interface.with_retry.side_effect = Exception("execution reverted")
+
+    with patch.object(ERC20Contract, "call", side_effect=[10, Exception("boom")]):
+        batch = MulticallBatch("gnosis")
+        ok = batch.add(token, "totalSupply")
+        bad = batch.add(token, "decimals")
+        batch.execute()
+
+    assert ok.value == 10
+    assert bad.success is False
+    assert "boom" in bad.result.error
+
+
+def test_batch_raises_for_required_call(chain_interface):
+    token = _erc20(chain_interface)
+    chain_interface.with_retry.side_effect = Exception("execution reverted")
+
+    with patch.object(ERC20Contract, "call", side_effect=Exception("boom")):
+        batch = MulticallBatch("gnosis")
+        batch.add(token, "decimals", allow_failure=False)
+        with pytest.raises(ValueError, match="decimals"):
+            batch.execute()
+
+
+def test_value_before_execute_raises(chain_interface):
+    token = _erc20(chain_interface)
+    handle = MulticallBatch("gnosis").add(token, "decimals")
+    with pytest.raises(RuntimeError):
+        _ = handle.value
+
+
+def test_staking_queue_contract_params(chain_interface):
+    with patch.object(StakingContract, "call"):
+        staking = StakingContract(TOKEN, "gnosis")
+    staking._contract_params_cache["livenessPeriod"] = 86400
+    w3 = chain_interface.web3._web3
+    w3.eth.call = MagicMock(
+        return_value=_aggregate3_response(
+            [
+                (True, encode(["uint256"], [10])),  # rewardsPerSecond
+                (True, encode(["uint256"], [20])),  # maxNumServices
+                (True, encode(["uint256"], [30])),  # minStakingDeposit
+                (False, b""),  # minStakingDuration
+                (True, encode(["address"], [HOLDER])),  # stakingToken
+                (True, encode(["address"], [TOKEN])),  # activityChecker
+            ]
+        )
+    )
+
+    batch = MulticallBatch("gnosis")
+    store = staking.queue_contract_params(batch)
+    batch.execute()
+    store()
+
+    assert w3.eth.call.call_count == 1
+    assert staking._contract_params_cache["maxNumServices"] == 20
+    assert staking._contract_params_cache["stakingToken"] == HOLDER
+    assert "minStakingDuration" not in staking._contract_params_cache
+    assert staking._activity_checker_address == TOKEN
+
+    # Nothing left to load except the failed param
+    staking._contract_params_cache["minStakingDuration"] = 0
+    batch = MulticallBatch("gnosis")
+    staking.queue_contract_params(batch)
+    assert len(batch) == 0
+
+
+def test_batch_read_goes_through_rate_limited_eth(chain_interface):
+    """The aggregate3 eth_call is made through RateLimitedEth, not the raw Web3."""
+    token = _erc20(chain_interface)
+    w3 = chain_interface.web3._web3
+    w3.eth.call = MagicMock(
+        return_value=_aggregate3_response([(True, encode(["string"], ["OLAS"]))])
+    )
+
+    with MulticallBatch("gnosis") as batch:
+        symbol = batch.add(token, "symbol")
+
+    assert symbol.value == "OLAS"
+    chain_interface.read_endpoint.assert_called()
+    chain_interface.health_tracker.record_success.assert_called_once()
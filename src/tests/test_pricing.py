@@ -12,10 +12,12 @@ from iwa.core.pricing import _CACHE_TTL, _NEGATIVE_CACHE_TTL, PriceService
 
 @pytest.fixture(autouse=True)
 def clear_price_cache():
-    """Clear the global price cache before each test."""
+    """Clear the global price caches before each test."""
     pricing_module._PRICE_CACHE.clear()
+    pricing_module._RECENT_DAY_CACHE.clear()
     yield
     pricing_module._PRICE_CACHE.clear()
+    pricing_module._RECENT_DAY_CACHE.clear()
 
 
 @pytest.fixture
@@ -425,3 +427,114 @@ def test_get_token_price_stores_none_in_cache(price_service):
     assert result is None
     assert "invalid_token_eur" in pricing_module._PRICE_CACHE
     assert pricing_module._PRICE_CACHE["invalid_token_eur"]["price"] is None
+
+
+# ---- Persistent daily price store ----
+
+
+def _range_response(points):
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = {"prices": points}
+    return response
+
+
+def _ms(day, hour=12):
+    from datetime import timezone
+
+    return datetime(day.year, day.month, day.day, hour, tzinfo=timezone.utc).timestamp() * 1000
+
+
+def test_get_prices_fetches_once_and_fills_gaps(price_service):
+    """Test that past days are fetched in one range request and only real days persisted."""
+    from datetime import date
+
+    from iwa.core.pricing import _stored_prices
+
+    d1, d2, d3 = date(2025, 3, 1), date(2025, 3, 2), date(2025, 3, 3)
+    price_service.session = MagicMock()
+    price_service.session.get.return_value = _range_response(
+        [[_ms(d1, 1), 1.0], [_ms(d1, 13), 2.0], [_ms(d3), 4.0]]
+    )
+
+    prices = price_service.get_prices("dai", d1, date(2025, 3, 4))
+
+    assert prices == {d1: 1.5, d2: 1.5, d3: 4.0}
+    args, kwargs = price_service.session.get.call_args
+    assert args[0].endswith("/coins/dai/market_chart/range")
+
+    # The carried-forward gap is not stored
+    assert _stored_prices("dai", "eur", d1, date(2025, 3, 4)) == {d1: 1.5, d3: 4.0}
+
+    # Stored: a new service instance does not hit the API again
+    other = PriceService()
+    other.session = MagicMock()
+    assert other.get_price_at("dai", d1) == 1.5
+    assert other.get_price_at("dai", d3) == 4.0
+    other.session.get.assert_not_called()
+
+
+def test_get_prices_does_not_store_unsettled_days(price_service):
+    """Test that yesterday's (possibly partial) average is returned but not persisted."""
+    from datetime import timezone
+
+    from iwa.core.pricing import _stored_prices
+
+    today = datetime.now(timezone.utc).date()
+    settled, yesterday = today - timedelta(days=2), today - timedelta(days=1)
+    price_service.session = MagicMock()
+    price_service.session.get.return_value = _range_response(
+        [[_ms(settled), 1.0], [_ms(yesterday, 0), 2.0]]
+    )
+
+    assert price_service.get_prices("dai", settled, today) == {settled: 1.0, yesterday: 2.0}
+    assert _stored_prices("dai", "eur", settled, today) == {settled: 1.0}
+
+
+def test_get_prices_caches_unsettled_days_in_memory(price_service):
+    """Test that unsettled days are served from memory until the cache TTL expires."""
+    from datetime import timezone
+
+    today = datetime.now(timezone.utc).date()
+    settled, yesterday = today - timedelta(days=2), today - timedelta(days=1)
+    price_service.session = MagicMock()
+    price_service.session.get.return_value = _range_response(
+        [[_ms(settled), 1.0], [_ms(yesterday, 0), 2.0]]
+    )
+
+    expected = {settled: 1.0, yesterday: 2.0}
+    assert price_service.get_prices("dai", settled, today) == expected
+    assert price_service.get_prices("dai", settled, today) == expected
+    assert price_service.session.get.call_count == 1
+
+    # Expired: yesterday is fetched again
+    for entry in pricing_module._RECENT_DAY_CACHE.values():
+        entry["timestamp"] -= _CACHE_TTL
+    assert price_service.get_prices("dai", settled, today) == expected
+    assert price_service.session.get.call_count == 2
+
+
+def test_get_prices_failed_fetch_is_not_stored(price_service):
+    """Test that a failed range request is retried on the next call."""
+    from datetime import date
+
+    day = date(2025, 3, 1)
+    price_service.session = MagicMock()
+    price_service.session.get.return_value = MagicMock(status_code=429)
+
+    with patch("iwa.core.pricing.time.sleep"):
+        assert price_service.get_price_at("dai", day) is None
+
+    price_service.session.get.reset_mock(return_value=True)
+    price_service.session.get.return_value = _range_response([[_ms(day), 0.9]])
+    assert price_service.get_price_at("dai", day) == 0.9
+
+
+def test_get_price_at_today_falls_back_to_stored_price(price_service):
+    """Test that today's price falls back to the latest stored day when spot fails."""
+    from datetime import date
+
+    price_service.store_prices("dai", "eur", {date(2025, 1, 1): 0.8, date(2025, 1, 2): 0.85})
+    pricing_module._PRICE_CACHE["dai_eur"] = {"price": None, "timestamp": datetime.now()}
+
+    assert price_service.get_price_at("dai", date.today() + timedelta(days=1)) == 0.85
@@ -8,6 +8,10 @@ from iwa.core.chain.rate_limiter import RateLimitedEth, RateLimitedWeb3, RPCRate
 class MockChainInterface:
     def __init__(self):
         self._handle_rpc_error = MagicMock(return_value={"should_retry": True, "rotated": False})
+        self.read_endpoint = MagicMock(return_value=None)
+        self.hedging_enabled = False
+        self.health_tracker = MagicMock()
+        self.current_rpc = "https://rpc.example.com"
 
 
 class TestRateLimitedEthRetry:
@@ -0,0 +1,112 @@
+"""Tests for the shared receipt tracker."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from web3.exceptions import TimeExhausted
+
+from iwa.core.chain import RateLimitedEth, RPCBatchError
+from iwa.core.chain.receipts import ReceiptTracker
+
+
+def _hash(i):
+    return "0x" + f"{i:064x}"
+
+
+def _raw_receipt(tx_hash, block=5):
+    return {
+        "transactionHash": tx_hash,
+        "blockNumber": hex(block),
+        "status": "0x1",
+        "gasUsed": "0x5208",
+        "logs": [],
+    }
+
+
+@pytest.fixture(autouse=True)
+def fast_poll():
+    with patch.object(ReceiptTracker, "POLL_INTERVAL", 0.01):
+        yield
+
+
+def _chain_interface(mined):
+    """Chain interface whose batch answers receipts for hashes in *mined*."""
+    ci = MagicMock()
+    ci.chain.name = "TrackerChain"
+    ci.web3.eth.block_number = 5
+
+    def batch(requests, allow_failure=False):
+        results = []
+        for method, params in requests:
+            if method == "eth_getBlockReceipts":
+                results.append([_raw_receipt(h) for h in sorted(mined)])
+            else:
+                results.append(_raw_receipt(params[0]) if params[0] in mined else None)
+        return results
+
+    ci.batch.side_effect = batch
+    return ci
+
+
+def test_concurrent_waiters_share_one_polling_loop():
+    mined = set()
+    ci = _chain_interface(mined)
+    tracker = ReceiptTracker(ci)
+    results = {}
+
+    def wait(i):
+        results[i] = tracker.wait(_hash(i), timeout=5)
+
+    threads = [threading.Thread(target=wait, args=(i,)) for i in range(20)]
+    for t in threads:
+        t.start()
+    # Wait until the poller has picked up the last registration, so its next
+    # batch is guaranteed to list every hash
+    while tracker.pending_count < 20 or tracker._recheck:
+        threading.Event().wait(0.01)
+
+    mined.update(_hash(i) for i in range(20))
+    ci.web3.eth.block_number = 6
+    for t in threads:
+        t.join(5)
+
+    assert {r.transactionHash.to_0x_hex() for r in results.values()} == {_hash(i) for i in range(20)}
+    assert results[0].status == 1
+    assert tracker.pending_count == 0
+    # Each check is a single batch covering every outstanding hash
+    assert max(len(call.args[0]) for call in ci.batch.call_args_list) == 20
+
+
+def test_timeout_raises_time_exhausted_and_forgets_hash():
+    tracker = ReceiptTracker(_chain_interface(set()))
+    with pytest.raises(TimeExhausted):
+        tracker.wait(_hash(1), timeout=0.05)
+    assert tracker.pending_count == 0
+
+
+def test_block_receipts_used_for_many_hashes_with_fallback():
+    ci = _chain_interface(set())
+    tracker = ReceiptTracker(ci)
+    hashes = [_hash(i) for i in range(13)]
+    with tracker._lock:
+        for h in hashes:
+            tracker._waiters[h] = MagicMock()
+    tracker._last_head = 5
+
+    ci.batch.side_effect = lambda requests, **kw: [[_raw_receipt(h, 6) for h in hashes[:3]]]
+    tracker._check(6, recheck=False)
+    assert ci.batch.call_args.args[0] == [("eth_getBlockReceipts", ["0x6"])]
+    assert tracker.pending_count == 10
+
+    ci.batch.side_effect = [RPCBatchError({"message": "method not found"}), [None] * 10]
+    tracker._check(7, recheck=False)
+    assert not tracker._block_receipts_supported
+    assert ci.batch.call_args.args[0][0][0] == "eth_getTransactionReceipt"
+
+
+def test_rate_limited_eth_routes_receipt_waits_to_tracker():
+    ci = MagicMock()
+    ci.receipt_tracker = ReceiptTracker(ci)
+    eth = RateLimitedEth(MagicMock(), MagicMock(), ci)
+    assert eth.wait_for_transaction_receipt == ci.receipt_tracker.wait
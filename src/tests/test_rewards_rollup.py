@@ -0,0 +1,60 @@
+"""Tests for the monthly rewards rollup."""
+
+import datetime
+from unittest.mock import patch
+
+import pytest
+
+from iwa.core import rewards_rollup
+from iwa.core.db import RewardsRollupMonth, log_transaction
+
+TRADER = "0xA1A1A1A1A1A1A1A1A1A1A1A1A1A1A1A1A1A1A1A1"
+
+
+def _claim(tx_hash, timestamp, olas, value_eur):
+    log_transaction(
+        tx_hash, "0xStaking", TRADER, "OLAS", int(olas * 10**18), "gnosis",
+        to_tag="trader", price_eur=value_eur / olas, value_eur=value_eur,
+        tags=["olas_claim_rewards"], timestamp=timestamp,
+    )
+
+
+def test_built_month_follows_log_transaction():
+    _claim("0x1", datetime.datetime(2025, 5, 3), 2.0, 1.0)
+    assert rewards_rollup.monthly_totals(2025, 5)[5]["olas"] == pytest.approx(2.0)
+
+    # Later writes update the built month without a rebuild on read
+    _claim("0x2", datetime.datetime(2025, 5, 20), 3.0, 1.5)
+    _claim("0x1", datetime.datetime(2025, 5, 3), 4.0, 2.0)  # upsert replaces the amount
+    with patch.object(rewards_rollup, "refresh_month") as mock_refresh:
+        totals = rewards_rollup.monthly_totals(2025, 5)
+    mock_refresh.assert_not_called()
+
+    assert totals[5]["olas"] == pytest.approx(7.0)
+    assert totals[5]["eur"] == pytest.approx(3.5)
+    assert totals[5]["claims"] == 2
+
+
+def test_unbuilt_months_are_not_touched_on_write():
+    _claim("0x1", datetime.datetime(2025, 7, 1), 1.0, 1.0)
+    assert not RewardsRollupMonth.select().exists()
+
+    rewards_rollup.ensure_rollup(2025)
+    assert RewardsRollupMonth.select().where(RewardsRollupMonth.built).count() == 12
+
+
+def test_closed_month_mech_costs_are_computed_once():
+    from iwa.web.routers import rewards
+
+    starts = {TRADER: datetime.date(2025, 1, 1)}
+    with (
+        patch.object(rewards, "_get_trader_start_dates", return_value=starts),
+        patch.object(rewards, "_get_avg_xdai_eur", return_value=1.0) as mock_price,
+    ):
+        first = rewards._calculate_mech_costs(2025, 2)
+        second = rewards._calculate_mech_costs(2025, 2)
+
+    # 28 trader-days in February 2025
+    expected = 28 * rewards.DAILY_MECH_COST_XDAI
+    assert first == second == (pytest.approx(expected), {2: pytest.approx(expected)})
+    assert mock_price.call_count == 1
@@ -51,6 +51,20 @@ def _make_mock_tx(
     return tx
 
 
+def _log_claim(
+    tx_hash, timestamp, amount_wei, price_eur, value_eur,
+    to_addr="0x2222222222222222222222222222222222222222", to_tag="test_trader",
+):
+    """Write a real claim row to the (isolated) activity database."""
+    from iwa.core.db import log_transaction
+
+    log_transaction(
+        tx_hash, "0xStaking", to_addr, "OLAS", int(amount_wei), "gnosis",
+        to_tag=to_tag, price_eur=price_eur, value_eur=value_eur,
+        tags=["olas_claim_rewards", "staking_reward"], timestamp=timestamp,
+    )
+
+
 def test_get_claims(client):
     mock_txs = [
         _make_mock_tx(tx_hash="0x111", timestamp=datetime.datetime(2026, 1, 10)),
@@ -92,23 +106,13 @@ def test_get_claims_invalid_month(client):
 
 
 def test_get_summary(client):
-    mock_txs = [
-        _make_mock_tx(
-            tx_hash="0xA", timestamp=datetime.datetime(2026, 1, 10), amount_wei="5000000000000000000",
-            price_eur=1.0, value_eur=5.0,
-        ),
-        _make_mock_tx(
-            tx_hash="0xB", timestamp=datetime.datetime(2026, 1, 20), amount_wei="3000000000000000000",
-            price_eur=1.2, value_eur=3.6,
-        ),
-        _make_mock_tx(
-            tx_hash="0xC", timestamp=datetime.datetime(2026, 3, 15), amount_wei="10000000000000000000",
-            price_eur=1.5, value_eur=15.0,
-        ),
-    ]
+    _log_claim("0xA", datetime.datetime(2026, 1, 10), "5000000000000000000", 1.0, 5.0)
+    _log_claim("0xB", datetime.datetime(2026, 1, 20), "3000000000000000000", 1.2, 3.6)
+    _log_claim("0xC", datetime.datetime(2026, 3, 15), "10000000000000000000", 1.5, 15.0)
+    # Outside the requested year
+    _log_claim("0xD", datetime.datetime(2025, 12, 31), "7000000000000000000", 1.0, 7.0)
 
     with (
-        patch("iwa.web.routers.rewards._query_claims", return_value=mock_txs),
         patch("iwa.web.routers.rewards._calculate_mech_costs", return_value=(0.0, {})),
         patch("iwa.web.routers.rewards._query_gas_costs", return_value=0.0),
         patch("iwa.web.routers.rewards._query_eure_withdrawn", return_value=0.0),
@@ -211,7 +215,6 @@ def test_export_csv_with_month(client):
 
 def test_get_summary_empty_year(client):
     with (
-        patch("iwa.web.routers.rewards._query_claims", return_value=[]),
         patch("iwa.web.routers.rewards._calculate_mech_costs", return_value=(0.0, {})),
         patch("iwa.web.routers.rewards._query_gas_costs", return_value=0.0),
         patch("iwa.web.routers.rewards._query_eure_withdrawn", return_value=0.0),
@@ -233,16 +236,10 @@ def test_get_summary_empty_year(client):
 
 def test_get_summary_with_costs(client):
     """Test summary includes mech request costs and gas."""
-    mock_claims = [
-        _make_mock_tx(
-            tx_hash="0xR1", timestamp=datetime.datetime(2026, 2, 10),
-            amount_wei="50000000000000000000", price_eur=0.05, value_eur=2.5,
-        ),
-    ]
+    _log_claim("0xR1", datetime.datetime(2026, 2, 10), "50000000000000000000", 0.05, 2.5)
 
     # Mech costs: 1.0 EUR total, all in February
     with (
-        patch("iwa.web.routers.rewards._query_claims", return_value=mock_claims),
         patch("iwa.web.routers.rewards._calculate_mech_costs", return_value=(1.0, {2: 1.0})),
         patch("iwa.web.routers.rewards._query_gas_costs", return_value=0.1),
     ):
@@ -284,26 +281,21 @@ def test_savings_tax_brackets():
 
 def test_by_trader_breakdown(client):
     """Test per-trader breakdown with multiple traders."""
-    mock_txs = [
-        _make_mock_tx(
-            tx_hash="0xT1A", to_tag="trader_alpha",
-            timestamp=datetime.datetime(2026, 1, 5),
-            amount_wei="8000000000000000000", price_eur=1.0, value_eur=8.0,
-        ),
-        _make_mock_tx(
-            tx_hash="0xT2A", to_tag="trader_beta",
-            timestamp=datetime.datetime(2026, 1, 10),
-            amount_wei="5000000000000000000", price_eur=1.2, value_eur=6.0,
-        ),
-        _make_mock_tx(
-            tx_hash="0xT1B", to_tag="trader_alpha",
-            timestamp=datetime.datetime(2026, 3, 20),
-            amount_wei="12000000000000000000", price_eur=1.5, value_eur=18.0,
-        ),
-    ]
+    alpha, beta = "0xA1A1A1A1A1A1A1A1A1A1A1A1A1A1A1A1A1A1A1A1", "0xB2B2B2B2B2B2B2B2B2B2B2B2B2B2B2B2B2B2B2B2"
+    _log_claim(
+        "0xT1A", datetime.datetime(2026, 1, 5), "8000000000000000000", 1.0, 8.0,
+        to_addr=alpha, to_tag="trader_alpha",
+    )
+    _log_claim(
+        "0xT2A", datetime.datetime(2026, 1, 10), "5000000000000000000", 1.2, 6.0,
+        to_addr=beta, to_tag="trader_beta",
+    )
+    _log_claim(
+        "0xT1B", datetime.datetime(2026, 3, 20), "12000000000000000000", 1.5, 18.0,
+        to_addr=alpha, to_tag="trader_alpha",
+    )
 
-    with patch("iwa.web.routers.rewards._query_claims", return_value=mock_txs):
-        response = client.get("/api/rewards/by-trader?year=2026")
+    response = client.get("/api/rewards/by-trader?year=2026")
 
     assert response.status_code == 200
     data = response.json()
@@ -340,8 +332,7 @@ def test_by_trader_breakdown(client):
 
 def test_by_trader_empty(client):
     """Test per-trader breakdown with no data."""
-    with patch("iwa.web.routers.rewards._query_claims", return_value=[]):
-        response = client.get("/api/rewards/by-trader?year=2026")
+    response = client.get("/api/rewards/by-trader?year=2026")
 
     assert response.status_code == 200
     data = response.json()
@@ -380,28 +371,29 @@ def _make_eure_tx(
     amount_wei="100000000000000000000",  # 100 EURE
     timestamp=None,
 ):
-    """Create a mock EURe withdrawal transaction."""
-    tx = MagicMock()
-    tx.tx_hash = tx_hash
-    tx.from_address = from_address
-    tx.token = token
-    tx.amount_wei = amount_wei
-    tx.timestamp = timestamp or datetime.datetime(2026, 2, 15)
-    tx.tags = '["erc20-transfer", "safe-transaction"]'
-    return tx
-
-
-def _run_query_eure_withdrawn(mock_txs, year=2026, month=None):
-    """Helper to run _query_eure_withdrawn with mocked DB."""
+    """Build the log_transaction kwargs for an EURe withdrawal."""
+    return {
+        "tx_hash": tx_hash,
+        "from_addr": from_address,
+        "to_addr": "0x3333333333333333333333333333333333333333",
+        "token": token,
+        "amount_wei": int(amount_wei),
+        "chain": "gnosis",
+        "timestamp": timestamp or datetime.datetime(2026, 2, 15),
+        "tags": ["erc20-transfer", "safe-transaction"],
+    }
+
+
+def _run_query_eure_withdrawn(txs, year=2026, month=None):
+    """Helper to run _query_eure_withdrawn against the isolated DB."""
+    from iwa.core.db import log_transaction
     from iwa.web.routers.rewards import _query_eure_withdrawn
 
-    with (
-        patch("iwa.web.routers.rewards.wallet") as mock_wallet,
-        patch("iwa.web.routers.rewards.SentTransaction.select") as mock_select,
-    ):
-        mock_wallet.master_account.address = MASTER_ADDR
-        mock_select.return_value.where.return_value = mock_txs
+    for tx in txs:
+        log_transaction(**tx)
 
+    with patch("iwa.web.routers.rewards.wallet") as mock_wallet:
+        mock_wallet.master_account.address = MASTER_ADDR
         return _query_eure_withdrawn(year, month)
 
 
@@ -461,6 +453,10 @@ def test_query_eure_withdrawn_with_month_filter():
     """Test _query_eure_withdrawn applies month filter."""
     mock_txs = [
         _make_eure_tx(token="EURE", amount_wei="40000000000000000000"),
+        _make_eure_tx(
+            tx_hash="0xMar", token="EURE", amount_wei="60000000000000000000",
+            timestamp=datetime.datetime(2026, 3, 1),
+        ),
     ]
     result = _run_query_eure_withdrawn(mock_txs, year=2026, month=2)
     assert result == pytest.approx(40.0, abs=0.01)
@@ -469,7 +465,14 @@ def test_query_eure_withdrawn_with_month_filter():
 def test_query_eure_withdrawn_with_december_filter():
     """Test _query_eure_withdrawn handles December (month=12) edge case."""
     mock_txs = [
-        _make_eure_tx(token="EURE", amount_wei="15000000000000000000"),
+        _make_eure_tx(
+            token="EURE", amount_wei="15000000000000000000",
+            timestamp=datetime.datetime(2026, 12, 31, 23, 59),
+        ),
+        _make_eure_tx(
+            tx_hash="0xNextYear", token="EURE", amount_wei="99000000000000000000",
+            timestamp=datetime.datetime(2027, 1, 1),
+        ),
     ]
     result = _run_query_eure_withdrawn(mock_txs, year=2026, month=12)
     assert result == pytest.approx(15.0, abs=0.01)
@@ -489,15 +492,9 @@ def test_query_eure_withdrawn_case_insensitive():
 
 def test_get_summary_with_eure_withdrawn(client):
     """Test summary endpoint includes EURe withdrawal total."""
-    mock_claims = [
-        _make_mock_tx(
-            tx_hash="0xW1", timestamp=datetime.datetime(2026, 2, 10),
-            amount_wei="50000000000000000000", price_eur=1.0, value_eur=50.0,
-        ),
-    ]
+    _log_claim("0xW1", datetime.datetime(2026, 2, 10), "50000000000000000000", 1.0, 50.0)
 
     with (
-        patch("iwa.web.routers.rewards._query_claims", return_value=mock_claims),
         patch("iwa.web.routers.rewards._calculate_mech_costs", return_value=(10.0, {2: 10.0})),
         patch("iwa.web.routers.rewards._query_gas_costs", return_value=0.5),
         patch("iwa.web.routers.rewards._query_eure_withdrawn", return_value=38.75),
@@ -520,7 +517,6 @@ def test_get_summary_with_eure_withdrawn(client):
 def test_get_summary_eure_irpf_fields_present(client):
     """Test that eure_irpf, eure_net and eure_effective_tax_rate are always in the response."""
     with (
-        patch("iwa.web.routers.rewards._query_claims", return_value=[]),
         patch("iwa.web.routers.rewards._calculate_mech_costs", return_value=(0.0, {})),
         patch("iwa.web.routers.rewards._query_gas_costs", return_value=0.0),
         patch("iwa.web.routers.rewards._query_eure_withdrawn", return_value=0.0),
@@ -538,7 +534,6 @@ def test_get_summary_eure_irpf_progressive_brackets(client):
     """Test eure_irpf uses progressive IRPF brackets (crosses into 21% bracket)."""
     # 10000 EUR withdrawn: 6000*19% + 4000*21% = 1140 + 840 = 1980
     with (
-        patch("iwa.web.routers.rewards._query_claims", return_value=[]),
         patch("iwa.web.routers.rewards._calculate_mech_costs", return_value=(0.0, {})),
         patch("iwa.web.routers.rewards._query_gas_costs", return_value=0.0),
         patch("iwa.web.routers.rewards._query_eure_withdrawn", return_value=10000.0),
@@ -550,3 +545,24 @@ def test_get_summary_eure_irpf_progressive_brackets(client):
     assert data["eure_irpf"] == pytest.approx(1980.0, abs=0.01)
     assert data["eure_net"] == pytest.approx(8020.0, abs=0.01)
     assert data["eure_effective_tax_rate"] == pytest.approx(19.8, abs=0.1)
+
+
+def test_query_gas_costs_sums_tagged_transactions():
+    """Test _query_gas_costs sums claims and checkpoints only, within the period."""
+    from iwa.core.db import log_transaction
+    from iwa.web.routers.rewards import _query_gas_costs
+
+    def log(tx_hash, tags, gas_value_eur, timestamp=datetime.datetime(2026, 4, 2)):
+        log_transaction(
+            tx_hash, "0xFrom", "0xTo", "xDAI", 0, "gnosis",
+            gas_value_eur=gas_value_eur, tags=tags, timestamp=timestamp,
+        )
+
+    log("0xG1", ["olas_claim_rewards"], 0.25)
+    log("0xG2", ["olas_call_checkpoint"], 0.5)
+    log("0xG3", ["erc20-transfer"], 9.0)
+    log("0xG4", ["olas_call_checkpoint"], 7.0, timestamp=datetime.datetime(2025, 4, 2))
+
+    assert _query_gas_costs(2026) == pytest.approx(0.75)
+    assert _query_gas_costs(2026, 4) == pytest.approx(0.75)
+    assert _query_gas_costs(2026, 5) == 0.0
@@ -0,0 +1,106 @@
+"""Tests for JSON-RPC batch requests in ChainInterface."""
+
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+from web3 import HTTPProvider
+
+from iwa.core.chain import ChainInterface, RPCBatchError, SupportedChain
+
+ADDR = "0x1234567890123456789012345678901234567890"
+
+
+@pytest.fixture
+def chain():
+    chain = MagicMock(spec=SupportedChain)
+    chain.name = "BatchChain"
+    chain.rpcs = ["https://rpc1.example.com", "https://rpc2.example.com"]
+    chain.chain_id = 1
+    chain.tokens = {}
+    type(chain).rpc = PropertyMock(return_value=chain.rpcs[0])
+    return chain
+
+
+@pytest.fixture
+def ci(chain):
+    return ChainInterface(chain)
+
+
+def _ok(value):
+    return {"jsonrpc": "2.0", "id": 0, "result": value}
+
+
+def _err(message, code=-32000):
+    return {"jsonrpc": "2.0", "id": 0, "error": {"code": code, "message": message}}
+
+
+def test_batch_chunks_and_preserves_order(ci):
+    ci.BATCH_MAX_SIZE = 2
+    sent = []
+
+    def fake_batch(provider, requests):
+        sent.append(list(requests))
+        return [_ok(hex(int(params[0]))) for _, params in requests]
+
+    with patch.object(HTTPProvider, "make_batch_request", autospec=True, side_effect=fake_batch):
+        results = ci.batch([("eth_test", [str(i)]) for i in range(5)])
+
+    assert results == [hex(i) for i in range(5)]
+    assert [len(chunk) for chunk in sent] == [2, 2, 1]
+
+
+def test_batch_item_error_raises_or_returns_none(ci):
+    response = [_ok("0x1"), _err("execution reverted")]
+    with patch.object(HTTPProvider, "make_batch_request", return_value=response):
+        with pytest.raises(RPCBatchError, match="execution reverted"):
+            ci.batch([("eth_call", []), ("eth_call", [])])
+
+        assert ci.batch([("eth_call", []), ("eth_call", [])], allow_failure=True) == ["0x1", None]
+
+
+def test_batch_item_rate_limit_rotates_and_resends(ci):
+    def fake_batch(provider, requests):
+        if provider.endpoint_uri == "https://rpc1.example.com":
+            return [_ok("0x1"), _err("rate limit exceeded", code=-32005)]
+        return [_ok("0x1"), _ok("0x2")]
+
+    with patch.object(HTTPProvider, "make_batch_request", autospec=True, side_effect=fake_batch):
+        results = ci.batch([("eth_getBalance", [ADDR, "latest"])] * 2)
+
+    assert results == ["0x1", "0x2"]
+    assert ci._current_rpc_index == 1
+    assert not ci._is_rpc_healthy(0)
+
+
+def test_batch_rejected_falls_back_to_sequential(ci):
+    rejected = _err("batch requests are not supported", code=-32600)
+    with (
+        patch.object(HTTPProvider, "make_batch_request", return_value=rejected) as mock_batch,
+        patch.object(HTTPProvider, "make_request", side_effect=[_ok("0xa"), _ok("0xb"), _ok("0xc")]),
+    ):
+        assert ci.batch([("eth_blockNumber", []), ("eth_chainId", [])]) == ["0xa", "0xb"]
+        # The RPC is remembered as batch-incapable: no second batch attempt
+        assert ci.batch([("eth_blockNumber", [])]) == ["0xc"]
+
+    assert mock_batch.call_count == 1
+
+
+def test_get_native_balances_and_blocks(ci):
+    raw_block = {
+        "number": "0x10",
+        "hash": "0x" + "ab" * 32,
+        "parentHash": "0x" + "cd" * 32,
+        "timestamp": "0x5",
+        "transactions": [],
+    }
+    with patch.object(
+        HTTPProvider,
+        "make_batch_request",
+        side_effect=[[_ok("0xde0b6b3a7640000"), _err("execution reverted")], [_ok(raw_block)]],
+    ):
+        assert ci.get_native_balances_wei([ADDR, ADDR]) == [10**18, None]
+        (block,) = ci.get_blocks([16])
+
+    assert block.number == 16
+    assert block.timestamp == 5
+    assert block.transactions == []
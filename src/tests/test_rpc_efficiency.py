@@ -13,11 +13,8 @@ def mock_chain_interface():
         mock_chains.return_value.get.return_value = mock_interface
 
         # Mock web3 and contract
-        mock_web3_backend = MagicMock()
-        mock_interface.web3._web3 = mock_web3_backend
-
         mock_contract = MagicMock()
-        mock_web3_backend.eth.contract.return_value = mock_contract
+        mock_interface.web3.eth.contract.return_value = mock_contract
 
         # Mock with_retry to execute the function
         mock_interface.with_retry.side_effect = lambda func, **kwargs: func()
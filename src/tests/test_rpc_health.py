@@ -0,0 +1,87 @@
+"""Tests for scored RPC selection."""
+
+import time
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+
+from iwa.core.chain import ChainInterface, RateLimitedEth, SupportedChain
+
+RPCS = [
+    "https://rpc1.example.com",
+    "https://rpc2.example.com",
+    "https://rpc3.example.com",
+    "https://rpc4.example.com",
+]
+
+
+@pytest.fixture
+def ci():
+    chain = MagicMock(spec=SupportedChain)
+    chain.name = "HealthChain"
+    chain.rpcs = list(RPCS)
+    chain.chain_id = 1
+    chain.tokens = {}
+    type(chain).rpc = PropertyMock(return_value=chain.rpcs[0])
+    with patch("iwa.core.chain.interface.RateLimitedWeb3", side_effect=lambda w3, rl, c: w3):
+        yield ChainInterface(chain)
+
+
+def test_rotation_prefers_fast_error_free_rpc(ci):
+    health = ci._rpc_health
+    health.record_success(RPCS[1], 900.0)
+    health.record_success(RPCS[2], 80.0)
+    health.record_success(RPCS[3], 50.0)
+    for _ in range(5):
+        health.record_error(RPCS[3], "SERVER_ERROR")
+
+    with patch("iwa.core.chain.interface.time.monotonic", return_value=1000.0):
+        assert ci.rotate_rpc()
+
+    assert ci._current_rpc_index == 2
+
+
+def test_rotation_penalizes_head_lag(ci):
+    ci._rpc_health.record_success(RPCS[1], 100.0, block=1_000)
+    ci._rpc_health.record_success(RPCS[2], 120.0, block=1_020)
+
+    with patch("iwa.core.chain.interface.time.monotonic", return_value=1000.0):
+        assert ci.rotate_rpc()
+
+    assert ci._current_rpc_index == 2
+    assert ci.rpc_health()[RPCS[1]]["head"] == 1_000
+
+
+def test_calls_and_errors_feed_health_and_backed_off_rpcs_are_reprobed(ci):
+    eth = RateLimitedEth(MagicMock(block_number=4_242), MagicMock(), ci)
+    assert eth.block_number == 4_242
+    ci._handle_rpc_error(Exception("429 Too Many Requests"))
+
+    stats = ci.rpc_health()[RPCS[0]]
+    assert stats["head"] == 4_242
+    assert stats["errors"] == {"RATE_LIMIT": 1}
+    assert stats["error_rate"] > 0
+
+    # Backoff over: the next rotation re-probes RPC #0 in the background.
+    # Rotation and reprobe cooldowns run on the real clock, so move past them.
+    ci._rpc_backoff_until.clear()
+    started = []
+    later = time.monotonic() + 10_000.0
+    with (
+        patch("iwa.core.chain.interface.threading.Thread") as mock_thread,
+        patch("iwa.core.chain.interface.time.monotonic", return_value=later),
+    ):
+        mock_thread.return_value.start.side_effect = lambda: started.append(
+            mock_thread.call_args.kwargs["args"]
+        )
+        ci.rotate_rpc()
+    assert started == [([RPCS[0]],)]
+
+    with patch("iwa.core.chainlist.probe_rpc", return_value=(RPCS[0], 40.0, 4_300)):
+        ci.reprobe_rpcs([RPCS[0]])
+    assert ci.rpc_health()[RPCS[0]]["error_rate"] == 0.0
+    assert not ci._rpc_health.needs_probe(RPCS[0])
+
+    with patch("iwa.core.chainlist.probe_rpc", return_value=None):
+        ci.reprobe_rpcs([RPCS[1]])
+    assert not ci._is_rpc_healthy(1)
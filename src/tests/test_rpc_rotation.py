@@ -250,50 +250,55 @@ def test_rotation_applies_to_subsequent_calls():
 
 
 def test_contract_uses_current_provider_after_rotation():
-    """Test that ContractInstance.contract property recreates contract each time.
+    """Test that a cached ContractInstance.contract follows a provider swap.
 
-    This verifies the contract property doesn't cache and always
-    uses the current provider.
+    The Contract is bound to the RateLimitedWeb3 wrapper, so after
+    RateLimitedWeb3.set_backend() the same object sends its eth_calls to the
+    new provider.
     """
-    # This is a simplified test that verifies the contract property
-    # creates a new contract each time it's accessed
-    from pathlib import Path
+    from eth_abi import encode
+    from web3 import Web3
 
+    from iwa.core.chain.rate_limiter import RateLimitedWeb3, RPCRateLimiter
     from iwa.core.contracts.contract import ContractInstance
 
-    # Mock a minimal chain interface
-    mock_web3 = MagicMock()
-    mock_web3._web3.eth.contract = MagicMock()
+    old_backend = Web3()
+    old_backend.eth.call = MagicMock(return_value=encode(["uint256"], [1]))
+    new_backend = Web3()
+    new_backend.eth.call = MagicMock(return_value=encode(["uint256"], [2]))
 
     mock_chain_interface = MagicMock()
-    mock_chain_interface.web3 = mock_web3
-
-    # Create a ContractInstance with mocked dependencies
-    with patch("iwa.core.chain.ChainInterfaces") as mock_interfaces:
-        mock_interfaces.return_value.get.return_value = mock_chain_interface
-
-        # Mock the ABI loading
-        mock_abi = [{"type": "function", "name": "test", "inputs": [], "outputs": []}]
-
-        with patch("builtins.open", MagicMock()):
-            with patch("json.load", return_value=mock_abi):
-                # Need to mock abi_path for ContractInstance
-                with patch.object(ContractInstance, "abi_path", Path("/fake/path.json")):
-                    with patch.object(ContractInstance, "load_error_selectors", return_value={}):
-                        instance = ContractInstance.__new__(ContractInstance)
-                        instance.address = "0x1234567890123456789012345678901234567890"
-                        instance.abi = mock_abi
-                        instance.chain_interface = mock_chain_interface
-                        instance._contract_cache = None
-                        instance.error_selectors = {}
-
-                        # Access contract property twice
-                        # The key test: verify it calls web3._web3.eth.contract each time
-                        _ = instance.contract
-                        _ = instance.contract
-
-                        # Should have called contract() twice (no caching)
-                        assert mock_web3._web3.eth.contract.call_count == 2
+    mock_chain_interface.read_endpoint.return_value = None
+    mock_chain_interface.hedging_enabled = False
+    rl_web3 = RateLimitedWeb3(old_backend, RPCRateLimiter(), mock_chain_interface)
+    mock_chain_interface.web3 = rl_web3
+
+    mock_abi = [
+        {
+            "type": "function",
+            "name": "test",
+            "inputs": [],
+            "outputs": [{"name": "", "type": "uint256"}],
+            "stateMutability": "view",
+        }
+    ]
+    instance = ContractInstance.__new__(ContractInstance)
+    instance.address = "0x1234567890123456789012345678901234567890"
+    instance.abi = mock_abi
+    instance.chain_interface = mock_chain_interface
+    instance._contract_cache = None
+    instance._contract_web3 = None
+    instance.error_selectors = {}
+
+    contract = instance.contract
+    assert contract.functions.test().call() == 1
+
+    # Rotation swaps the backend: the cached contract now reads from it
+    rl_web3.set_backend(new_backend)
+    assert instance.contract is contract
+    assert contract.functions.test().call() == 2
+    assert old_backend.eth.call.call_count == 1
+    assert new_backend.eth.call.call_count == 1
 
 
 def test_single_rpc_no_rotation(multi_rpc_chain):
@@ -5,6 +5,8 @@ from unittest.mock import MagicMock, patch
 import pytest
 from safe_eth.safe.safe_tx import SafeTx
 
+from iwa.core.chain.fees import FeeOracle
+from iwa.core.chain.health import RPCHealthTracker
 from iwa.core.services.safe_executor import (
     MIN_SIGNATURE_LENGTH,
     SAFE_TX_STATS,
@@ -28,6 +30,8 @@ def mock_chain_interface():
     ci._is_rate_limit_error.return_value = False
     ci._is_connection_error.return_value = False
     ci._handle_rpc_error.return_value = {"should_retry": True}
+    ci.health_tracker = RPCHealthTracker()
+    ci.fee_oracle = FeeOracle(ci)
     return ci
 
 
@@ -189,6 +189,25 @@ def _make_safe_service_with_nonce(nonce: int):
     return svc
 
 
+def test_get_safe_nonce_reads_nonce_through_chain_interface():
+    """The Safe nonce is an eth_call on the ChainInterface web3, so it can be hedged."""
+    from iwa.core.models import StoredSafeAccount
+
+    safe_acc = MagicMock(spec=StoredSafeAccount)
+    safe_acc.address = SAFE_ADDR
+    mock_ks = MagicMock()
+    mock_ks.find_stored_account.return_value = safe_acc
+    svc = SafeService(mock_ks, MagicMock())
+
+    with patch("iwa.core.chain.ChainInterfaces") as mock_chains:
+        ci = mock_chains.return_value.get.return_value
+        ci.with_retry.side_effect = lambda op: op()
+        ci.web3.eth.call.return_value = (42).to_bytes(32, "big")
+        assert svc.get_safe_nonce(SAFE_ADDR, CHAIN) == 42
+
+    ci.web3.eth.call.assert_called_once_with({"to": SAFE_ADDR, "data": "0xaffed0e0"})
+
+
 def test_nonce_allocator_sequential():
     """allocate() returns monotonically increasing nonces."""
     from iwa.core.services.safe import NonceAllocator
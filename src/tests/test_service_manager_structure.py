@@ -28,4 +28,4 @@ def test_service_manager_structure():
 
     # Check Base methods
     assert hasattr(sm, "get")
-    assert hasattr(sm, "_init_contracts")
+    assert hasattr(sm, "init_contracts")
@@ -71,7 +71,7 @@ def test_sign_and_send_success(
     assert receipt.status == 1
     mock_key_storage.sign_transaction.assert_called_with(tx, "signer")
     chain_interface.web3.eth.send_raw_transaction.assert_called_with(b"raw_tx")
-    chain_interface.wait_for_no_pending_tx.assert_called_with("0xSigner")
+    chain_interface.wait_for_no_pending_tx.assert_not_called()
 
 
 def test_sign_and_send_retry_on_low_gas(
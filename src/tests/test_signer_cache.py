@@ -0,0 +1,80 @@
+"""Tests for the unlocked signer cache."""
+
+from unittest.mock import patch
+
+import pytest
+
+from iwa.core.keys import KeyStorage
+from iwa.core.rpc_monitor import RPCMonitor
+from iwa.core.signer_cache import SignerCache
+
+ADDR_A = "0x5B38Da6a701c568545dCfcB03FcB875f56beddC4"
+ADDR_B = "0xAb5801a7D398351b8bE11C439e05C5B3259aeC9B"
+ADDR_C = "0x4B20993Bc481177ec7E8f571ceCaE8A9e22C02db"
+
+
+@pytest.fixture
+def clock():
+    """Controllable time.monotonic for the cache module."""
+    now = [1000.0]
+    with patch("iwa.core.signer_cache.time.monotonic", side_effect=lambda: now[0]):
+        yield now
+
+
+def test_locked_cache_stores_nothing():
+    cache = SignerCache()
+    cache.put(ADDR_A, "0xkey")
+    assert cache.get(ADDR_A) is None
+    assert len(cache) == 0
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = SignerCache(ttl=60)
+    cache.unlock()
+    cache.put(ADDR_A, "0xkey")
+    assert cache.get(ADDR_A.lower()) == "0xkey"
+
+    clock[0] += 61
+    assert cache.get(ADDR_A) is None
+    assert len(cache) == 0
+
+
+def test_unlock_window_locks_and_wipes(clock):
+    cache = SignerCache()
+    cache.unlock(duration=30)
+    cache.put(ADDR_A, "0xkey")
+    buffer, _ = cache._entries[ADDR_A.lower()]
+
+    clock[0] += 31
+    assert not cache.is_unlocked
+    assert cache.get(ADDR_A) is None
+    assert buffer == bytearray(len("0xkey"))
+
+
+def test_lru_eviction_zeroizes_oldest():
+    cache = SignerCache(max_entries=2)
+    cache.unlock()
+    cache.put(ADDR_A, "0xaaaa")
+    evicted, _ = cache._entries[ADDR_A.lower()]
+    cache.put(ADDR_B, "0xbbbb")
+    cache.put(ADDR_C, "0xcccc")
+
+    assert cache.get(ADDR_A) is None
+    assert cache.get(ADDR_C) == "0xcccc"
+    assert evicted == bytearray(6)
+
+
+def test_keystorage_decrypts_once_while_unlocked(tmp_path):
+    storage = KeyStorage(tmp_path / "wallet.json", password="test_password")
+    master = storage.get_account("master")
+    RPCMonitor().clear()
+
+    storage.unlock()
+    first = storage.get_signer(master.address)
+    second = storage.get_signer("master")
+    assert first.address == second.address == master.address
+    assert RPCMonitor().get_counts().get("keys.kdf") == 1
+
+    storage.lock()
+    storage.sign_message(b"hello", "master")
+    assert RPCMonitor().get_counts().get("keys.kdf") == 2
@@ -9,6 +9,7 @@ from iwa.plugins.olas.constants import (
     ContractStatus,
     MarketplaceType,
     StakingContractInfo,
+    get_staking_contract_info,
     get_staking_contracts,
 )
 
@@ -157,6 +158,22 @@ class TestGetStakingContracts(unittest.TestCase):
                 self.assertEqual(contract.chain, chain)
 
 
+class TestGetStakingContractInfo(unittest.TestCase):
+    """Tests for get_staking_contract_info()."""
+
+    def test_every_contract_is_found_by_address(self):
+        for c in STAKING_CONTRACTS:
+            self.assertIs(get_staking_contract_info(str(c.address).lower(), chain=c.chain), c)
+            self.assertEqual(get_staking_contract_info(str(c.address).upper()).address, c.address)
+
+    def test_chain_filter(self):
+        c = STAKING_CONTRACTS[0]
+        self.assertIsNone(get_staking_contract_info(str(c.address), chain="no-such-chain"))
+
+    def test_unknown_address(self):
+        self.assertIsNone(get_staking_contract_info("0x" + "00" * 20))
+
+
 class TestBackwardCompat(unittest.TestCase):
     """Tests that OLAS_TRADER_STAKING_CONTRACTS compat shim works."""
 
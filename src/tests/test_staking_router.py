@@ -23,21 +23,6 @@ def mock_dependencies():
         yield
 
 
-def test_check_availability_exception():
-    """Test _check_availability handles contract call failures."""
-    from iwa.web.routers.olas.staking import _check_availability
-
-    mock_interface = MagicMock()
-    mock_interface.chain.name = "gnosis"
-
-    with patch("iwa.plugins.olas.contracts.staking.StakingContract") as mock_contract_cls:
-        mock_contract_cls.side_effect = Exception("Contract error")
-        result = _check_availability("Test", "0xAddr", mock_interface)
-
-    assert result["name"] == "Test"
-    assert result["usage"] is None
-
-
 def test_filter_contracts_no_availability():
     """Test _filter_contracts excludes unavailable contracts."""
     from iwa.web.routers.olas.staking import _filter_contracts
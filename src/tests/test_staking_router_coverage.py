@@ -11,6 +11,8 @@ from unittest.mock import MagicMock, patch
 import pytest
 from fastapi import HTTPException, Request
 
+from iwa.plugins.olas.staking_availability import StakingAvailability
+
 # Valid Ethereum addresses for testing
 ADDR_CONTRACT = "0x78731D3Ca6b7E34aC0F824c42a7cC18A495cabaB"
 ADDR_TOKEN = "0x1111111111111111111111111111111111111111"
@@ -226,35 +228,38 @@ class TestGetServiceFilterInfo:
 class TestGetStakingContracts:
     """Tests for the get_staking_contracts endpoint function."""
 
-    def test_invalid_chain_name(self):
+    @pytest.mark.asyncio
+    async def test_invalid_chain_name(self):
         """Lines 31-33: Invalid chain name raises HTTPException 400."""
         from iwa.web.routers.olas.staking import get_staking_contracts
 
         mock_config = MagicMock()
         with pytest.raises(HTTPException) as exc_info:
-            get_staking_contracts(chain="drop;table", config=mock_config)
+            await get_staking_contracts(chain="drop;table", config=mock_config)
         assert exc_info.value.status_code == 400
         assert exc_info.value.detail == "Invalid chain name"
 
-    def test_invalid_chain_with_special_chars(self):
+    @pytest.mark.asyncio
+    async def test_invalid_chain_with_special_chars(self):
         """Lines 31-33: Chain name with special characters raises HTTPException 400."""
         from iwa.web.routers.olas.staking import get_staking_contracts
 
         mock_config = MagicMock()
         with pytest.raises(HTTPException) as exc_info:
-            get_staking_contracts(chain="gnosis; DROP TABLE", config=mock_config)
+            await get_staking_contracts(chain="gnosis; DROP TABLE", config=mock_config)
         assert exc_info.value.status_code == 400
 
-    def test_exception_in_staking_contracts_returns_empty(self):
+    @pytest.mark.asyncio
+    async def test_exception_in_staking_contracts_returns_empty(self):
         """Lines 62-67: Exception during contract fetching returns empty list."""
         from iwa.web.routers.olas.staking import get_staking_contracts
 
         mock_config = MagicMock()
         with patch(
-            "iwa.core.chain.ChainInterfaces",
+            "iwa.web.routers.olas.staking.StakingAvailabilitySnapshot",
             side_effect=Exception("RPC unavailable"),
         ):
-            result = get_staking_contracts(chain="gnosis", config=mock_config)
+            result = await get_staking_contracts(chain="gnosis", config=mock_config)
         assert result == []
 
 
@@ -970,99 +975,6 @@ class TestCheckpointService:
             assert exc_info.value.status_code == 500
 
 
-# ========================================================================
-# Tests for _check_availability success path (lines 143-160)
-# ========================================================================
-
-
-class TestCheckAvailabilitySuccess:
-    """Tests for _check_availability success path."""
-
-    def test_success_path(self):
-        """Lines 143-160: Successful contract check returns full result."""
-        from iwa.web.routers.olas.staking import _check_availability
-
-        mock_interface = MagicMock()
-        mock_interface.chain.name = "gnosis"
-
-        mock_contract = MagicMock()
-        mock_contract.call.return_value = [1, 2, 3]  # 3 service IDs
-        mock_contract.max_num_services = 10
-        mock_contract.min_staking_deposit = 100
-        mock_contract.staking_token_address = ADDR_TOKEN
-
-        mock_cache = MagicMock()
-        mock_cache.get_contract.return_value = mock_contract
-
-        with (
-            patch(
-                "iwa.core.contracts.cache.ContractCache",
-                return_value=mock_cache,
-            ),
-            patch("iwa.plugins.olas.contracts.staking.StakingContract"),
-        ):
-            result = _check_availability("TestContract", ADDR_CONTRACT, mock_interface)
-
-        assert result["name"] == "TestContract"
-        assert result["address"] == ADDR_CONTRACT
-        assert result["usage"]["used"] == 3
-        assert result["usage"]["max"] == 10
-        assert result["usage"]["available_slots"] == 7
-        assert result["usage"]["available"] is True
-        assert result["min_staking_deposit"] == 100
-        assert result["staking_token"] == ADDR_TOKEN
-
-
-# ========================================================================
-# Tests for _fetch_all_contracts (lines 179-189)
-# ========================================================================
-
-
-class TestFetchAllContracts:
-    """Tests for _fetch_all_contracts function."""
-
-    def test_fetches_contracts_via_threadpool(self):
-        """Lines 179-189: Fetch contracts using ThreadPoolExecutor."""
-        from iwa.web.routers.olas.staking import _fetch_all_contracts
-
-        mock_interface = MagicMock()
-        mock_interface.chain.name = "gnosis"
-
-        contracts = {
-            "Contract A": ADDR_CONTRACT,
-            "Contract B": ADDR_STAKING,
-        }
-
-        mock_result_a = {
-            "name": "Contract A",
-            "address": ADDR_CONTRACT,
-            "usage": {"used": 2, "max": 10, "available_slots": 8, "available": True},
-            "min_staking_deposit": 100,
-        }
-        mock_result_b = {
-            "name": "Contract B",
-            "address": ADDR_STAKING,
-            "usage": {"used": 10, "max": 10, "available_slots": 0, "available": False},
-            "min_staking_deposit": 200,
-        }
-
-        def mock_check_avail(name, addr, interface):
-            if name == "Contract A":
-                return mock_result_a
-            return mock_result_b
-
-        with patch(
-            "iwa.web.routers.olas.staking._check_availability",
-            side_effect=mock_check_avail,
-        ):
-            results = _fetch_all_contracts(contracts, mock_interface)
-
-        assert len(results) == 2
-        names = {r["name"] for r in results}
-        assert "Contract A" in names
-        assert "Contract B" in names
-
-
 # ========================================================================
 # Tests for get_staking_contracts success path (lines 47-51)
 # ========================================================================
@@ -1071,99 +983,82 @@ class TestFetchAllContracts:
 class TestGetStakingContractsSuccess:
     """Tests for get_staking_contracts success path."""
 
-    def test_success_returns_contracts_and_filter_info(self):
+    @pytest.mark.asyncio
+    async def test_success_returns_contracts_and_filter_info(self):
         """Lines 47-60: Success path returns contracts list and filter_info dict."""
         from iwa.web.routers.olas.staking import get_staking_contracts
 
         mock_config = MagicMock()
-        mock_interface = MagicMock()
-        mock_interface.chain.name = "gnosis"
 
-        mock_result = {
-            "name": "TestContract",
-            "address": ADDR_CONTRACT,
-            "usage": {"used": 2, "max": 10, "available_slots": 8, "available": True},
-            "min_staking_deposit": 100,
-            "staking_token": ADDR_TOKEN,
-        }
+        availability = StakingAvailability(
+            "TestContract",
+            ADDR_CONTRACT,
+            "active",
+            used=2,
+            max_services=10,
+            min_staking_deposit=100,
+            staking_token=ADDR_TOKEN,
+            balance=10**22,
+        )
 
         with (
             patch(
-                "iwa.core.chain.ChainInterfaces",
-            ) as mock_chains_cls,
-            patch(
-                "iwa.plugins.olas.constants.OLAS_TRADER_STAKING_CONTRACTS",
-                {"gnosis": {"TestContract": ADDR_CONTRACT}},
-            ),
+                "iwa.web.routers.olas.staking.StakingAvailabilitySnapshot",
+            ) as mock_snapshot_cls,
             patch(
                 "iwa.web.routers.olas.staking._get_service_filter_info",
                 return_value=(None, None),
             ),
-            patch(
-                "iwa.web.routers.olas.staking._fetch_all_contracts",
-                return_value=[mock_result],
-            ),
-            patch(
-                "iwa.web.routers.olas.staking._filter_contracts",
-                return_value=[mock_result],
-            ),
         ):
-            mock_chains_cls.return_value.get.return_value = mock_interface
+            mock_snapshot_cls.return_value.get.return_value = [availability]
 
-            result = get_staking_contracts(chain="gnosis", config=mock_config)
+            result = await get_staking_contracts(chain="gnosis", config=mock_config)
 
+        mock_snapshot_cls.return_value.get.assert_called_once_with("gnosis")
         assert isinstance(result, dict)
         assert "contracts" in result
         assert "filter_info" in result
-        assert len(result["contracts"]) == 1
+        assert result["contracts"] == [availability.to_dict()]
+        assert result["contracts"][0]["usage"]["available_slots"] == 8
         assert result["filter_info"]["total_contracts"] == 1
         assert result["filter_info"]["filtered_count"] == 1
         assert result["filter_info"]["is_filtered"] is False
         assert result["filter_info"]["service_bond"] is None
 
-    def test_success_with_service_key_filter(self):
+    @pytest.mark.asyncio
+    async def test_success_with_service_key_filter(self):
         """Lines 47-60: Success with service_key applies filtering metadata."""
         from iwa.web.routers.olas.staking import get_staking_contracts
 
         mock_config = MagicMock()
-        mock_interface = MagicMock()
 
-        mock_result = {
-            "name": "TestContract",
-            "address": ADDR_CONTRACT,
-            "usage": {"available": True},
-            "min_staking_deposit": 100,
-            "staking_token": ADDR_TOKEN,
-        }
+        compatible = StakingAvailability(
+            "TestContract", ADDR_CONTRACT, min_staking_deposit=100, staking_token=ADDR_TOKEN
+        )
+        bond_too_high = StakingAvailability(
+            "Expensive", ADDR_STAKING, min_staking_deposit=10**19, staking_token=ADDR_TOKEN
+        )
 
         with (
-            patch("iwa.core.chain.ChainInterfaces") as mock_chains_cls,
             patch(
-                "iwa.plugins.olas.constants.OLAS_TRADER_STAKING_CONTRACTS",
-                {"gnosis": {"TestContract": ADDR_CONTRACT}},
-            ),
+                "iwa.web.routers.olas.staking.StakingAvailabilitySnapshot",
+            ) as mock_snapshot_cls,
             patch(
                 "iwa.web.routers.olas.staking._get_service_filter_info",
                 return_value=(10**18, ADDR_TOKEN.lower()),
             ),
-            patch(
-                "iwa.web.routers.olas.staking._fetch_all_contracts",
-                return_value=[mock_result],
-            ),
-            patch(
-                "iwa.web.routers.olas.staking._filter_contracts",
-                return_value=[mock_result],
-            ),
         ):
-            mock_chains_cls.return_value.get.return_value = mock_interface
+            mock_snapshot_cls.return_value.get.return_value = [compatible, bond_too_high]
 
-            result = get_staking_contracts(
+            result = await get_staking_contracts(
                 chain="gnosis", service_key="gnosis:1", config=mock_config
             )
 
         assert result["filter_info"]["is_filtered"] is True
         assert result["filter_info"]["service_bond"] == 10**18
         assert result["filter_info"]["service_bond_olas"] == 1.0
+        assert [c["name"] for c in result["contracts"]] == ["TestContract"]
+        assert result["filter_info"]["total_contracts"] == 2
 
 
 # ========================================================================
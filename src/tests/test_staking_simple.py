@@ -6,6 +6,8 @@ from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
 
+from iwa.core.contracts.multicall import MulticallBatch, MulticallResult
+from iwa.plugins.olas.contracts.activity_checker import ActivityCheckerContract
 from iwa.plugins.olas.contracts.staking import StakingContract, StakingState
 
 ADDR_CONTRACT = "0x78731D3Ca6b7E34aC0F824c42a7cC18A495cabaB"
@@ -451,14 +453,23 @@ class TestIsCheckpointNeeded:
 class TestGetServiceInfo:
     """Test get_service_info method."""
 
+    @staticmethod
+    def _answer(contract, service_info, ts_now):
+        """Answer the batched status reads one call at a time, by method name."""
+        values = {
+            "getServiceInfo": service_info,
+            "getNextRewardCheckpointTimestamp": ts_now + 3600,
+            "tsCheckpoint": ts_now - 500,
+            "epochCounter": 7,
+        }
+        contract.call = MagicMock(side_effect=lambda method, *args: values.get(method, 3600))
+        return patch.object(
+            MulticallBatch, "_execute_chunk", MulticallBatch._execute_sequential
+        )
+
     def test_parses_service_info(self, mock_staking_contract):
         ts_now = int(time.time())
         ts_start = ts_now - 1000
-        ts_checkpoint_val = ts_now - 500
-
-        mock_staking_contract.call = MagicMock(
-            return_value=(ADDR_MULTISIG, ADDR_OWNER, (10, 5), ts_start, 750, 0)
-        )
 
         mock_activity_checker = MagicMock()
         mock_activity_checker.get_multisig_nonces.return_value = (15, 8)
@@ -466,14 +477,10 @@ class TestGetServiceInfo:
         mock_activity_checker.is_ratio_pass.return_value = True
         mock_staking_contract._activity_checker = mock_activity_checker
 
-        with patch.object(mock_staking_contract, "ts_checkpoint", return_value=ts_checkpoint_val):
+        service_info = (ADDR_MULTISIG, ADDR_OWNER, (10, 5), ts_start, 750, 0)
+        with self._answer(mock_staking_contract, service_info, ts_now):
             with patch.object(mock_staking_contract, "get_required_requests", return_value=5):
-                with patch.object(
-                    mock_staking_contract,
-                    "get_next_epoch_start",
-                    return_value=datetime.fromtimestamp(ts_now + 3600, tz=timezone.utc),
-                ):
-                    result = mock_staking_contract.get_service_info(1)
+                result = mock_staking_contract.get_service_info(1)
 
         assert result["multisig_address"] == ADDR_MULTISIG
         assert result["owner_address"] == ADDR_OWNER
@@ -483,28 +490,61 @@ class TestGetServiceInfo:
         assert result["last_checkpoint_mech_requests"] == 5
         assert result["mech_requests_this_epoch"] == 3  # 8 - 5
         assert result["accrued_reward_wei"] == 750
+        assert result["epoch_end_utc"] == datetime.fromtimestamp(ts_now + 3600, tz=timezone.utc)
+        assert mock_staking_contract.ts_checkpoint() == ts_now - 500
 
     def test_handles_nested_tuple_response(self, mock_staking_contract):
         """Test handling of nested tuple response from web3."""
         ts_now = int(time.time())
         ts_start = ts_now - 1000
 
-        # Response wrapped in extra tuple (as sometimes returned by web3)
-        nested_response = [(ADDR_MULTISIG, ADDR_OWNER, (10, 5), ts_start, 750, 0)]
-        mock_staking_contract.call = MagicMock(return_value=nested_response)
-
         mock_activity_checker = MagicMock()
         mock_activity_checker.get_multisig_nonces.return_value = (15, 8)
         mock_activity_checker.is_ratio_pass.return_value = True
         mock_staking_contract._activity_checker = mock_activity_checker
 
-        with patch.object(mock_staking_contract, "ts_checkpoint", return_value=ts_now - 500):
+        # Response wrapped in extra tuple (as sometimes returned by web3)
+        nested_response = [(ADDR_MULTISIG, ADDR_OWNER, (10, 5), ts_start, 750, 0)]
+        with self._answer(mock_staking_contract, nested_response, ts_now):
             with patch.object(mock_staking_contract, "get_required_requests", return_value=5):
-                with patch.object(
-                    mock_staking_contract,
-                    "get_next_epoch_start",
-                    return_value=datetime.fromtimestamp(ts_now + 3600, tz=timezone.utc),
-                ):
-                    result = mock_staking_contract.get_service_info(1)
+                result = mock_staking_contract.get_service_info(1)
 
         assert result["multisig_address"] == ADDR_MULTISIG
+
+    def test_status_reads_share_one_batch(self, mock_staking_contract):
+        """Service info, checkpoint data, epoch and nonces travel in one multicall."""
+        ts_now = int(time.time())
+        checker = MagicMock(address=ADDR_CHECKER, _liveness_ratio=None)
+        checker.queue_liveness_ratio.side_effect = (
+            lambda batch: ActivityCheckerContract.queue_liveness_ratio(checker, batch)
+        )
+        checker.is_ratio_pass.return_value = True
+        mock_staking_contract._activity_checker = checker
+        mock_staking_contract._activity_checker_address = ADDR_CHECKER
+        values = {
+            "getServiceInfo": (ADDR_MULTISIG, ADDR_OWNER, (10, 5), ts_now - 1000, 750, 0),
+            "getNextRewardCheckpointTimestamp": ts_now + 3600,
+            "tsCheckpoint": ts_now - 500,
+            "epochCounter": 7,
+            "getMultisigNonces": [15, 8],
+            "livenessRatio": 10**15,
+        }
+        chunks = []
+
+        def execute_chunk(batch, calls):
+            chunks.append([call.method_name for call in calls])
+            for call in calls:
+                call.result = MulticallResult(True, values.get(call.method_name, 3600))
+
+        with (
+            patch.object(MulticallBatch, "_execute_chunk", execute_chunk),
+            patch.object(mock_staking_contract, "get_required_requests", return_value=5),
+        ):
+            info, epoch = mock_staking_contract.read_service_status(1, ADDR_MULTISIG)
+
+        assert len(chunks) == 1
+        assert {"getServiceInfo", "epochCounter", "getMultisigNonces"} <= set(chunks[0])
+        assert epoch == 7
+        assert info["current_mech_requests"] == 8
+        assert checker._liveness_ratio == 10**15
+        checker.get_multisig_nonces.assert_not_called()
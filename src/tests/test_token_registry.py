@@ -0,0 +1,121 @@
+"""Tests for the persistent ERC20 token metadata registry."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from eth_abi import encode
+from web3 import Web3
+
+from iwa.core.chain.rate_limiter import RateLimitedWeb3, RPCRateLimiter
+from iwa.core.contracts.contract import clear_abi_cache
+from iwa.core.contracts.erc20 import ERC20Contract
+from iwa.core.contracts.token_registry import TokenRegistry
+
+TOKEN = "0x78731D3Ca6b7E34aC0F824c42a7cC18A495cabaB"
+OTHER_TOKEN = "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"
+DEFAULT_TOKEN = "0xe91D153E0b41518A2Ce8Dd3D7944Fa863463a97d"
+
+
+@pytest.fixture(autouse=True)
+def clean_abi_cache():
+    clear_abi_cache()
+    yield
+    clear_abi_cache()
+
+
+@pytest.fixture
+def chain_interface():
+    """Chain interface backed by a provider-less Web3 (real ABI codec)."""
+    with patch("iwa.core.contracts.contract.ChainInterfaces") as mock_chains:
+        mock_ci = MagicMock()
+        mock_ci.read_endpoint.return_value = None
+        mock_ci.hedging_enabled = False
+        mock_ci.web3 = RateLimitedWeb3(Web3(), RPCRateLimiter(), mock_ci)
+        mock_ci.with_retry.side_effect = lambda fn, **kwargs: fn()
+        mock_ci.chain.tokens = {}
+        mock_chains.return_value.get.return_value = mock_ci
+        yield mock_ci
+
+
+def _metadata(decimals, symbol, name):
+    return [
+        (True, encode(["uint8"], [decimals])),
+        (True, encode(["string"], [symbol])),
+        (True, encode(["string"], [name])),
+    ]
+
+
+def _aggregate3_response(results):
+    return encode(["(bool,bytes)[]"], [results])
+
+
+def test_metadata_fetched_once_per_token(chain_interface):
+    w3 = chain_interface.web3._web3
+    w3.eth.call = MagicMock(return_value=_aggregate3_response(_metadata(18, "OLAS", "Autonolas")))
+
+    first = ERC20Contract(TOKEN, "gnosis")
+    second = ERC20Contract(TOKEN, "gnosis")
+
+    assert (first.decimals, first.symbol, first.name) == (18, "OLAS", "Autonolas")
+    assert second.symbol == "OLAS"
+    # decimals, symbol and name travel in one eth_call, and only the first time
+    assert w3.eth.call.call_count == 1
+
+
+def test_registry_persists_to_disk(chain_interface, isolate_token_registry):
+    w3 = chain_interface.web3._web3
+    w3.eth.call = MagicMock(return_value=_aggregate3_response(_metadata(6, "USDC", "USD Coin")))
+
+    ERC20Contract(TOKEN, "gnosis")
+    stored = json.loads(isolate_token_registry.path.read_text())
+    assert stored["gnosis"][TOKEN.lower()] == {"symbol": "USDC", "decimals": 6, "name": "USD Coin"}
+
+    # A fresh process (simulated by dropping memory) reads the file, not the chain
+    isolate_token_registry.clear()
+    token = isolate_token_registry.get("Gnosis", TOKEN)
+    assert token.decimals == 6
+    assert token.address == TOKEN
+    assert w3.eth.call.call_count == 1
+
+
+def test_non_erc20_raises(chain_interface):
+    w3 = chain_interface.web3._web3
+    w3.eth.call = MagicMock(return_value=_aggregate3_response([(False, b"")] * 3))
+
+    with pytest.raises(ValueError, match="ERC20 metadata"):
+        ERC20Contract(TOKEN, "gnosis")
+    assert TokenRegistry().get("gnosis", TOKEN) is None
+
+
+def test_prefetch_batches_and_seeds_default_tokens(chain_interface):
+    chain_interface.chain.tokens = {"WXDAI": DEFAULT_TOKEN}
+    w3 = chain_interface.web3._web3
+    w3.eth.call = MagicMock(
+        return_value=_aggregate3_response(
+            _metadata(18, "OLAS", "Autonolas")
+            + [(False, b"")] * 3  # OTHER_TOKEN is not an ERC20
+            + _metadata(18, "WXDAI", "Wrapped XDAI")
+        )
+    )
+
+    tokens = TokenRegistry().prefetch("gnosis", [TOKEN, OTHER_TOKEN, TOKEN])
+
+    assert set(tokens) == {TOKEN.lower()}
+    assert w3.eth.call.call_count == 1
+    # The chain's default token rode along in the same batch
+    assert TokenRegistry().get("gnosis", DEFAULT_TOKEN).symbol == "WXDAI"
+
+    # Everything cached is served without touching the chain
+    assert TokenRegistry().prefetch("gnosis", [TOKEN, DEFAULT_TOKEN]).keys() == {
+        TOKEN.lower(),
+        DEFAULT_TOKEN.lower(),
+    }
+    assert w3.eth.call.call_count == 1
+
+
+def test_default_tokens_seeded_once_per_chain():
+    registry = TokenRegistry()
+    assert registry._claim_seed("gnosis") is True
+    assert registry._claim_seed("gnosis") is False
+    assert registry._claim_seed("base") is True
@@ -450,16 +450,19 @@ class TestPrepareTransactionFail:
     def test_eoa_prepare_fails(self, mock_chain_interfaces):
         """Line 304: _prepare_transaction returns False for EOA → (False, {})."""
         account_service = MagicMock()
-        eoa = _make_eoa_account()
-        # First call for resolve returns eoa, second call (in _prepare_transaction) returns None
-        account_service.resolve_account.side_effect = [eoa, None]
+        account_service.resolve_account.return_value = _make_eoa_account()
 
         svc = TransactionService(MagicMock(), account_service)
-        tx = {"to": ADDR_B, "value": 0}  # no nonce → triggers resolve inside _prepare
-        success, receipt = svc.sign_and_send(tx, "signer_tag")
+        tx = {"to": ADDR_B, "value": 0}  # no nonce → allocated before _prepare
+        with patch.object(svc, "_prepare_transaction", return_value=False):
+            success, receipt = svc.sign_and_send(tx, "signer_tag")
 
         assert success is False
         assert receipt == {}
+        # The allocated nonce is handed back and refetched next time
+        allocator = svc.get_nonce_allocator(_make_eoa_account().address, "gnosis")
+        assert allocator.stats()["in_flight_count"] == 0
+        assert allocator._invalidated
 
 
 # =============================================================================
@@ -171,7 +171,7 @@ class TestBaseHelpers:
     @patch("iwa.core.services.transfer.base.PriceService")
     def test_get_token_price_info_known_token(self, mock_price, mock_ci, transfer_service):
         """Token price info returns price and value for known tokens."""
-        mock_price.return_value.get_token_price.return_value = 2.0
+        mock_price.return_value.get_price_at.return_value = 2.0
         mock_interface = MagicMock()
         mock_interface.chain.get_token_address.return_value = None
         mock_ci.return_value.get.return_value = mock_interface
@@ -1,6 +1,6 @@
 """Tests for Wallet module."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -67,78 +67,27 @@ def test_get_accounts_balances(wallet, mock_keys_and_services):
         "0x2": {"tag": "two"},
     }
 
-    # Mock balance service
-    mock_bs = mock_keys_and_services["balance_service"].return_value
-    mock_bs.get_native_balance_eth.return_value = 1.0
-    mock_bs.get_erc20_balance_eth.return_value = 2.0
-
     # Test with no token names
     data, balances = wallet.get_accounts_balances("gnosis")
     assert data == {"0x1": {"tag": "one"}, "0x2": {"tag": "two"}}
     assert balances is None
 
-    # Test with token names
-    # Mock ThreadPoolExecutor to run synchronously or just return futures
-    # Since we can't easily suppress the real ThreadPoolExecutor context manager used in the code without patching it,
-    # let's patch it in the test function scope.
-
-    with patch("iwa.core.wallet.ThreadPoolExecutor") as mock_executor:
-        # returns context manager
-        mock_context = MagicMock()
-        mock_executor.return_value.__enter__.return_value = mock_context
-
-        # mock submit to return a future
-        mock_future1 = MagicMock()
-        mock_future1.result.return_value = ("0x1", "native", 1.0)
-
-        mock_future2 = MagicMock()
-        mock_future2.result.return_value = ("0x1", "OLAS", 2.0)
-
-        mock_context.submit.side_effect = [
-            mock_future1,
-            mock_future2,
-            mock_future1,
-            mock_future2,
-        ]  # Just cycling mocks
-
-        # We need to rely on what the code does: it iterates over accounts, then tokens.
-        # 2 accounts * 2 tokens = 4 calls.
-
-        # Simpler approach: let the real ThreadPoolExecutor run but mock the balance service methods which are already mocked.
-        # The issue is the code uses `fetch_balance` inner function.
-        pass
 
-
-# Re-implementing test_get_accounts_balances with delegation verification via patching ThreadPoolExecutor
-# effectively mocking concurrency.
-
-
-def test_get_accounts_balances_concurrency(wallet, mock_keys_and_services):
-    """Test get_accounts_balances concurrency."""
+def test_get_accounts_balances_batched(wallet, mock_keys_and_services):
+    """All (account, token) pairs are delegated to one batched balance read."""
     mock_keys_and_services["account_service"].return_value.get_account_data.return_value = {
         "0x1": {"tag": "one"}
     }
+    mock_bs = mock_keys_and_services["balance_service"].return_value
+    mock_bs.get_balances_eth.return_value = {"0x1": {"native": 1.5, "OLAS": 10.0}}
 
-    with patch("iwa.core.wallet.ThreadPoolExecutor") as mock_executor:
-        mock_context = MagicMock()
-        mock_executor.return_value.__enter__.return_value = mock_context
-
-        mock_future_native = MagicMock()
-        mock_future_native.result.return_value = ("0x1", "native", 1.5)
-
-        mock_future_token = MagicMock()
-        mock_future_token.result.return_value = ("0x1", "OLAS", 10.0)
-
-        # The loop order in wallet.py: for addr in accounts: for t in tokens: submit
-        # so for 1 account and 2 tokens: native, OLAS
-        mock_context.submit.side_effect = [mock_future_native, mock_future_token]
-
-        accounts, balances = wallet.get_accounts_balances("gnosis", ["native", "OLAS"])
+    accounts, balances = wallet.get_accounts_balances("gnosis", ["native", "OLAS"])
 
-        assert accounts == {"0x1": {"tag": "one"}}
-        # balances structure: {addr: {token: val}}
-        assert balances["0x1"]["native"] == 1.5
-        assert balances["0x1"]["OLAS"] == 10.0
+    assert accounts == {"0x1": {"tag": "one"}}
+    # balances structure: {addr: {token: val}}
+    assert balances["0x1"]["native"] == 1.5
+    mock_bs.get_balances_eth.assert_called_once_with(["0x1"], ["native", "OLAS"], "gnosis")
+    mock_bs.get_native_balance_eth.assert_not_called()
 
 
 def test_send_native_transfer(wallet, mock_keys_and_services):
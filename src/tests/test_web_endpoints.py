@@ -62,9 +62,11 @@ def test_get_accounts(client):
     """Cover get_accounts endpoint (lines 191-237)."""
     wallet.key_storage.accounts = {"0x123": MagicMock(tag="test", address="0x123", is_safe=False)}
     # Mock the return value of get_accounts_balances which is unpacked
-    wallet.get_accounts_balances.return_value = (
-        {"0x123": MagicMock(tag="test", is_safe=False)},
-        {"0x123": {"native": 1.0}},
+    wallet.get_accounts_balances_async = AsyncMock(
+        return_value=(
+            {"0x123": MagicMock(tag="test", is_safe=False)},
+            {"0x123": {"native": 1.0}},
+        )
     )
     response = client.get("/api/accounts?chain=gnosis")
     assert response.status_code == 200
@@ -1,6 +1,6 @@
 """Tests for Olas Web API endpoints."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -103,8 +103,11 @@ def test_get_olas_service_details(client, mock_olas_config):
 
         from iwa.web.dependencies import wallet
 
-        wallet.get_native_balance_eth.return_value = 1.0
-        wallet.balance_service.get_erc20_balance_wei.return_value = 10**18
+        wallet.balance_service.get_balances_eth_async = AsyncMock(
+            side_effect=lambda addresses, *args: {
+                addr: {"native": 1.0, "OLAS": 1.0} for addr in addresses
+            }
+        )
         wallet.key_storage.find_stored_account.return_value = MagicMock(tag="test_tag")
 
         response = client.get("/api/olas/services/gnosis:1/details")
@@ -117,28 +120,32 @@ def test_get_olas_service_details(client, mock_olas_config):
 
 def test_get_olas_services_full(client, mock_olas_config):
     """Test /api/olas/services (full) endpoint."""
-    with (
-        patch("iwa.web.routers.olas.services.Config") as mock_config_cls,
-        patch("iwa.plugins.olas.service_manager.ServiceManager") as mock_sm_cls,
-    ):
-        mock_config = mock_config_cls.return_value
-        mock_config.plugins = {"olas": mock_olas_config.model_dump()}
-
-        mock_sm = mock_sm_cls.return_value
-        mock_sm.get_staking_status.return_value = StakingStatus(
-            is_staked=True, staking_state="STAKED"
-        )
-
-        from iwa.web.dependencies import wallet
-
-        wallet.get_native_balance_eth.return_value = 1.0
-        wallet.balance_service.get_erc20_balance_wei.return_value = 10**18
+    from iwa.plugins.olas.fleet import ServiceSnapshot
+    from iwa.web.dependencies import wallet
+
+    service = mock_olas_config.services["gnosis:1"]
+    with patch("iwa.plugins.olas.fleet.ServiceFleetSnapshot") as mock_fleet_cls:
+        snapshot = mock_fleet_cls.return_value.load.return_value
+        snapshot.services = {
+            "gnosis:1": ServiceSnapshot(
+                "gnosis:1",
+                service,
+                state="DEPLOYED",
+                staking_status=StakingStatus(is_staked=True, staking_state="STAKED"),
+            )
+        }
+        snapshot.balances = {service.agent_address: {"native": 1.0, "OLAS": 2.0}}
+        wallet.key_storage.find_stored_account.return_value = None
 
-        response = client.get("/api/olas/services?chain=gnosis")
+        response = client.get("/api/olas/services?chain=gnosis&refresh=true")
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 1
+        assert data[0]["state"] == "DEPLOYED"
         assert data[0]["staking"]["is_staked"] is True
+        assert data[0]["accounts"]["agent"]["olas"] == "2.00"
+        mock_fleet_cls.assert_called_once_with(wallet, "gnosis")
+        mock_fleet_cls.return_value.load.assert_called_once_with(force_refresh=True)
 
 
 def test_olas_actions(client, mock_olas_config):
@@ -184,8 +191,13 @@ def test_olas_actions(client, mock_olas_config):
 # --- Additional tests for uncovered endpoints ---
 
 
-def test_get_staking_contracts(client):
+def test_get_staking_contracts(client, serve_staking_availability):
     """Test /api/olas/staking-contracts endpoint - returns response with contracts and filter_info."""
+    from iwa.plugins.olas.staking_availability import StakingAvailability
+
+    serve_staking_availability.append(
+        StakingAvailability(name="Expert 1", address="0x" + "1" * 40, used=3, max_services=20)
+    )
     response = client.get("/api/olas/staking-contracts?chain=gnosis")
     assert response.status_code == 200
     data = response.json()
@@ -195,6 +207,7 @@ def test_get_staking_contracts(client):
     assert "filter_info" in data
     assert isinstance(data["contracts"], list)
     assert isinstance(data["filter_info"], dict)
+    assert [c["name"] for c in data["contracts"]] == ["Expert 1"]
 
 
 def test_create_service(client, mock_olas_config):
@@ -1,6 +1,6 @@
 """Smoke tests for web API router endpoints — each returns 200 with mocked data."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -78,9 +78,11 @@ def test_rpc_status_endpoint(client):
 
 def test_accounts_endpoint(client):
     """GET /api/accounts returns 200."""
-    wallet.get_accounts_balances.return_value = (
-        {"0xAddr": MagicMock(tag="master")},
-        {"0xAddr": {"native": 1.0}},
+    wallet.get_accounts_balances_async = AsyncMock(
+        return_value=(
+            {"0xAddr": MagicMock(tag="master")},
+            {"0xAddr": {"native": 1.0}},
+        )
     )
     with patch("iwa.web.routers.accounts.ChainInterfaces") as mock_ci:
         mock_ci.return_value.get.return_value.chain.tokens = {"OLAS": "0x1"}
@@ -21,7 +21,8 @@ def client():
     # Patch init_db to prevent real KeyStorage init during lifespan
     with patch("iwa.web.server.init_db"):
         # Also patch ChainInterfaces to avoid block tracking init
-        with patch("iwa.core.chain.ChainInterfaces"):
+        with patch("iwa.core.chain.ChainInterfaces") as mock_chains:
+            mock_chains.return_value.close_all_async = AsyncMock()
             with TestClient(app) as c:
                 yield c
 
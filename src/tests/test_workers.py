@@ -1,6 +1,7 @@
 """Tests for MonitorWorker."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -33,11 +34,24 @@ async def test_monitor_worker_stop():
     mock_monitor.stop.assert_called_once()
 
 
+def _heads(*blocks):
+    """Queue prefilled with *blocks*, as returned by HeadTracker.subscribe_async."""
+    queue = asyncio.Queue()
+    for block in blocks:
+        queue.put_nowait(block)
+    return queue
+
+
 @pytest.mark.asyncio
 async def test_monitor_worker_run():
-    """Test run loop."""
+    """Test run loop checks activity on every new head."""
     mock_monitor = MagicMock()
     mock_monitor.chain_name = "test_chain"
+    unsubscribe = MagicMock()
+    mock_monitor.chain_interface.head_tracker.subscribe_async.return_value = (
+        _heads(100),
+        unsubscribe,
+    )
     mock_app = MagicMock()
     worker = MonitorWorker(mock_monitor, mock_app)
 
@@ -47,18 +61,11 @@ async def test_monitor_worker_run():
 
     mock_monitor.check_activity.side_effect = stop_worker
 
-    # We need to patch asyncio.sleep to avoid waiting
-    with patch("asyncio.sleep", new_callable=AsyncMock):
-        await worker.run()
+    await worker.run()
 
     assert mock_monitor.running
-    # check_activity is called in a thread, so we verify it was called
-    # Since it's run in to_thread, the side_effect happens in the thread
-    # But since we mock check_activity, side_effect executes.
-    # Wait, check_activity is called via asyncio.to_thread(self.monitor.check_activity)
-    # So we should verify check_activity was called.
-
-    mock_monitor.check_activity.assert_called()
+    mock_monitor.check_activity.assert_called_once_with(100)
+    unsubscribe.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -66,6 +73,10 @@ async def test_monitor_worker_run_error():
     """Test run loop handles errors."""
     mock_monitor = MagicMock()
     mock_monitor.chain_name = "test_chain"
+    mock_monitor.chain_interface.head_tracker.subscribe_async.return_value = (
+        _heads(100, 101),
+        MagicMock(),
+    )
     mock_app = MagicMock()
     worker = MonitorWorker(mock_monitor, mock_app)
 
@@ -80,12 +91,10 @@ async def test_monitor_worker_run_error():
     worker._running = True
 
     # Patch asyncio.to_thread to use our side effect
-    # We also patch sleep to be fast
     with patch("asyncio.to_thread", side_effect=side_effect) as mock_to_thread:
-        with patch("asyncio.sleep", new_callable=AsyncMock):
-            await worker.run()
+        await worker.run()
 
     # This verifies passing through error handling
     assert not worker._running
     # Should be called twice (once error, once success/stop)
-    assert mock_to_thread.call_count >= 2
+    assert mock_to_thread.call_count == 2